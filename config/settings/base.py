@@ -30,14 +30,18 @@ INSTALLED_APPS = [
 
 
 MIDDLEWARE = [
+    'court_rules.middleware.MetricsMiddleware',
+    'court_rules.middleware.SqlInstrumentationMiddleware',
     'django.middleware.security.SecurityMiddleware',
     'corsheaders.middleware.CorsMiddleware',
     'django.contrib.sessions.middleware.SessionMiddleware',
     'django.middleware.common.CommonMiddleware',
     'django.middleware.csrf.CsrfViewMiddleware',
     'django.contrib.auth.middleware.AuthenticationMiddleware',
+    'court_rules.middleware.SamplingProfilerMiddleware',
     'django.contrib.messages.middleware.MessageMiddleware',
     'django.middleware.clickjacking.XFrameOptionsMiddleware',
+    'court_rules.middleware.AuditBufferMiddleware',
 ]
 
 
@@ -156,3 +160,77 @@ SERVER_EMAIL = DEFAULT_FROM_EMAIL
 # Email template settings
 EMAIL_TIMEOUT = 10  # seconds
 
+# Outbox worker (`manage.py send_outbox`): attempts per email before it is
+# marked failed; retries back off exponentially from one minute.
+EMAIL_OUTBOX_MAX_ATTEMPTS = 5
+# Reminder dispatcher (`manage.py dispatch_reminders`): delivery attempts per
+# reminder before it is given up; retries back off the same way.
+REMINDER_MAX_ATTEMPTS = 5
+
+
+# ==============================================================================
+# DASHBOARD
+# ==============================================================================
+
+# Serve dashboard counters from the rollup tables. Enable once
+# `manage.py reconcile_dashboard_rollups` has populated them.
+DASHBOARD_ROLLUPS_ENABLED = False
+
+# Seconds to cache per-organization billing dashboard snapshots (0 disables).
+# Snapshots are invalidated whenever a billing record changes.
+BILLING_DASHBOARD_CACHE_TIMEOUT = 0
+
+# Seconds a rendered ICS event is kept in the cache. Fragments are keyed by
+# deadline id and updated_at, so edits never serve a stale event.
+CALENDAR_FRAGMENT_CACHE_TIMEOUT = 60 * 60 * 24 * 7
+
+# ==============================================================================
+# AUDIT LOG
+# ==============================================================================
+
+# Months of audit history kept in the database. Older monthly partitions are
+# moved to gzip'd JSONL files by `manage.py archive_audit_log`.
+AUDIT_LOG_RETENTION_MONTHS = 24
+AUDIT_LOG_ARCHIVE_DIR = BASE_DIR / 'var' / 'audit_archive'
+
+# ==============================================================================
+# SCRAPERS
+# ==============================================================================
+
+# Page bodies, ETag/Last-Modified validators and content hashes shared by the
+# chambers scraper commands, so unchanged pages are neither re-downloaded nor
+# re-parsed.
+SCRAPER_CACHE_DIR = BASE_DIR / 'var' / 'scraper_cache'
+
+# ==============================================================================
+# PERFORMANCE INSTRUMENTATION
+# ==============================================================================
+
+# Fraction of requests (0-1) whose SQL is counted by SqlInstrumentationMiddleware
+# and reported in a Server-Timing header. 0 disables it.
+SQL_INSTRUMENTATION_SAMPLE_RATE = 0.0
+# A sampled request is logged when it is this slow, runs this many queries,
+# or repeats one query template this many times (the N+1 signature).
+SQL_SLOW_REQUEST_MS = 500
+SQL_SLOW_REQUEST_QUERIES = 50
+SQL_REPEATED_QUERY_THRESHOLD = 10
+# JSON-lines slow request log, rotated by size. Each worker process writes
+# its own file with its pid before the suffix: slow_requests.<pid>.jsonl.
+SQL_INSTRUMENTATION_LOG = BASE_DIR / 'var' / 'log' / 'slow_requests.jsonl'
+SQL_INSTRUMENTATION_LOG_MAX_BYTES = 10 * 1024 * 1024
+SQL_INSTRUMENTATION_LOG_BACKUPS = 5
+
+# Fraction of requests (0-1) whose Python stack SamplingProfilerMiddleware
+# samples; staff users can also profile a request by sending PROFILER_HEADER.
+# Collapsed-stack files per route go to PROFILER_DIR; see profile_report.
+PROFILER_SAMPLE_RATE = 0.0
+PROFILER_HEADER = 'X-Profile'
+PROFILER_INTERVAL_MS = 5
+PROFILER_DIR = BASE_DIR / 'var' / 'profiles'
+
+# Prometheus metrics at /metrics, recorded by MetricsMiddleware. Only clients
+# in METRICS_ALLOWED_NETWORKS can scrape it; everyone else gets a 404. Under
+# Gunicorn, the PROMETHEUS_MULTIPROC_DIR environment variable must name an
+# empty directory so that all workers report into one set of metrics.
+METRICS_ENABLED = True
+METRICS_ALLOWED_NETWORKS = ['127.0.0.0/8', '::1/128']
@@ -32,6 +32,23 @@ CACHES = {
 
 SESSION_ENGINE = 'django.contrib.sessions.backends.cache'
 
+DASHBOARD_ROLLUPS_ENABLED = os.getenv('DASHBOARD_ROLLUPS_ENABLED', 'False') == 'True'
+BILLING_DASHBOARD_CACHE_TIMEOUT = int(os.getenv('BILLING_DASHBOARD_CACHE_TIMEOUT', '300'))
+AUDIT_LOG_RETENTION_MONTHS = int(os.getenv('AUDIT_LOG_RETENTION_MONTHS', '24'))
+AUDIT_LOG_ARCHIVE_DIR = os.getenv('AUDIT_LOG_ARCHIVE_DIR', str(AUDIT_LOG_ARCHIVE_DIR))  # noqa: F405
+SCRAPER_CACHE_DIR = os.getenv('SCRAPER_CACHE_DIR', str(SCRAPER_CACHE_DIR))  # noqa: F405
+SQL_INSTRUMENTATION_SAMPLE_RATE = float(os.getenv('SQL_INSTRUMENTATION_SAMPLE_RATE', '0'))
+SQL_SLOW_REQUEST_MS = int(os.getenv('SQL_SLOW_REQUEST_MS', str(SQL_SLOW_REQUEST_MS)))  # noqa: F405
+SQL_INSTRUMENTATION_LOG = os.getenv('SQL_INSTRUMENTATION_LOG', str(SQL_INSTRUMENTATION_LOG))  # noqa: F405
+PROFILER_SAMPLE_RATE = float(os.getenv('PROFILER_SAMPLE_RATE', '0'))
+PROFILER_DIR = os.getenv('PROFILER_DIR', str(PROFILER_DIR))  # noqa: F405
+METRICS_ENABLED = os.getenv('METRICS_ENABLED', 'True') == 'True'
+METRICS_ALLOWED_NETWORKS = [
+    network.strip()
+    for network in os.getenv('METRICS_ALLOWED_NETWORKS', ','.join(METRICS_ALLOWED_NETWORKS)).split(',')  # noqa: F405
+    if network.strip()
+]
+
 CSRF_TRUSTED_ORIGINS = [origin.strip() for origin in os.getenv('CSRF_TRUSTED_ORIGINS', '').split(',') if origin.strip()]
 
 SECURE_PROXY_SSL_HEADER = ('HTTP_X_FORWARDED_PROTO', 'https')
@@ -48,7 +65,10 @@ STATIC_ROOT = BASE_DIR / 'staticfiles'  # noqa: F405
 
 # WhiteNoise for static files
 if 'whitenoise.middleware.WhiteNoiseMiddleware' not in MIDDLEWARE:  # type: ignore # noqa: F405
-    MIDDLEWARE.insert(1, 'whitenoise.middleware.WhiteNoiseMiddleware')  # type: ignore # noqa: F405
+    MIDDLEWARE.insert(  # type: ignore # noqa: F405
+        MIDDLEWARE.index('django.middleware.security.SecurityMiddleware') + 1,  # type: ignore # noqa: F405
+        'whitenoise.middleware.WhiteNoiseMiddleware',
+    )
 
 STATICFILES_STORAGE = 'whitenoise.storage.CompressedManifestStaticFilesStorage'
 
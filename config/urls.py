@@ -5,6 +5,8 @@ from django.contrib import admin
 from django.http import JsonResponse
 from django.urls import include, path
 
+from court_rules.views import metrics
+
 
 def health_check(request):
     """
@@ -17,6 +19,7 @@ def health_check(request):
 
 urlpatterns = [
     path('health/', health_check, name='health_check'),
+    path('metrics', metrics, name='metrics'),
     path('admin/', admin.site.urls),
     path('api/v1/', include('court_rules.api.v1.urls')),
 ]
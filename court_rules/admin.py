@@ -189,9 +189,11 @@ admin.site.register(models.HolidayCalendar)
 admin.site.register(models.Holiday)
 admin.site.register(models.UserNotificationSubscription)
 admin.site.register(models.NotificationLog)
+admin.site.register(models.OutboundEmail)
 admin.site.register(models.AuditLog)
 admin.site.register(models.CasePermission)
 admin.site.register(models.RetrievalRun)
+admin.site.register(models.BackfillCheckpoint)
 
 
 @admin.register(poc_models.PocCourt)
@@ -0,0 +1,63 @@
+"""
+Aggregate serializer fields that list views push down into the queryset.
+
+A serializer declares a count of related rows with ``AnnotatedCountField``.
+Viewsets using ``AnnotatedCountsMixin`` annotate their queryset with one
+correlated subquery per declared field, so a page of results costs no extra
+queries. Instances loaded without the annotation (for example after a
+create) fall back to counting through the related manager.
+"""
+
+from django.db.models import Count, IntegerField, OuterRef, Subquery, Value
+from django.db.models.functions import Coalesce
+from rest_framework import serializers
+
+
+class AnnotatedCountField(serializers.ReadOnlyField):
+    """
+    Read-only count of the rows reachable through reverse relation ``relation``,
+    optionally restricted by ``filters`` (lookups on the related model).
+    """
+
+    def __init__(self, relation, *, filters=None, **kwargs):
+        self.relation = relation
+        self.filters = filters or {}
+        kwargs['read_only'] = True
+        super().__init__(**kwargs)
+
+    def get_attribute(self, instance):
+        if hasattr(instance, self.field_name):
+            return getattr(instance, self.field_name)
+        return getattr(instance, self.relation).filter(**self.filters).count()
+
+    def annotation(self, model):
+        """Expression counting the related rows of each ``model`` row."""
+
+        relation = model._meta.get_field(self.relation)
+        fk_name = relation.field.name
+        counts = (
+            relation.related_model._default_manager.filter(**{fk_name: OuterRef('pk')}, **self.filters)
+            .order_by()
+            .values(fk_name)
+            .annotate(count=Count('*'))
+            .values('count')
+        )
+        return Coalesce(Subquery(counts, output_field=IntegerField()), Value(0))
+
+
+def annotate_counts(queryset, serializer_class):
+    """Annotate ``queryset`` with every AnnotatedCountField declared on ``serializer_class``."""
+
+    annotations = {
+        name: field.annotation(queryset.model)
+        for name, field in getattr(serializer_class, '_declared_fields', {}).items()
+        if isinstance(field, AnnotatedCountField)
+    }
+    return queryset.annotate(**annotations) if annotations else queryset
+
+
+class AnnotatedCountsMixin:
+    """Viewset mixin that annotates the queryset for the active serializer's count fields."""
+
+    def get_queryset(self):
+        return annotate_counts(super().get_queryset(), self.get_serializer_class())
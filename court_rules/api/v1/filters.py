@@ -0,0 +1,53 @@
+"""Query-string filters for API list endpoints."""
+
+import django_filters
+
+from court_rules.models import AuditLog, Deadline
+
+
+class AuditLogFilter(django_filters.FilterSet):
+    """
+    Audit log filters. ``changed_field`` matches entries whose field-level
+    delta contains the field (served by the GIN index on ``changes``);
+    ``actor`` with ``created_after``/``created_before`` uses the
+    (actor_user, created_at) index.
+    """
+
+    changed_field = django_filters.CharFilter(field_name='changes', lookup_expr='has_key')
+    actor = django_filters.UUIDFilter(field_name='actor_user_id')
+    created_after = django_filters.IsoDateTimeFilter(field_name='created_at', lookup_expr='gte')
+    created_before = django_filters.IsoDateTimeFilter(field_name='created_at', lookup_expr='lt')
+    case = django_filters.UUIDFilter(method='filter_case', label='Deadlines of case')
+
+    class Meta:
+        model = AuditLog
+        fields = ['entity_table', 'entity_id', 'action']
+
+    def filter_case(self, queryset, name, value):
+        return queryset.filter(
+            entity_table=Deadline._meta.db_table,
+            entity_id__in=Deadline.objects.filter(case_id=value).values('id'),
+        )
+
+    def case_deadline_ids(self, case_id):
+        if getattr(self, '_case_deadline_ids', None) is None:
+            self._case_deadline_ids = set(Deadline.objects.filter(case_id=case_id).values_list('id', flat=True))
+        return self._case_deadline_ids
+
+    def matches(self, entry) -> bool:
+        """Whether an unsaved (archived) entry passes the bound filters."""
+
+        data = self.form.cleaned_data
+        checks = [
+            ('entity_table', lambda value: entry.entity_table == value),
+            ('entity_id', lambda value: entry.entity_id == value),
+            ('action', lambda value: entry.action == value),
+            ('changed_field', lambda value: value in (entry.changes or {})),
+            ('actor', lambda value: entry.actor_user_id == value),
+            ('created_after', lambda value: entry.created_at >= value),
+            ('created_before', lambda value: entry.created_at < value),
+            ('case', lambda value: (
+                entry.entity_table == Deadline._meta.db_table and entry.entity_id in self.case_deadline_ids(value)
+            )),
+        ]
+        return all(check(data[name]) for name, check in checks if data.get(name) not in (None, ''))
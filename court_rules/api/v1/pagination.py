@@ -0,0 +1,190 @@
+"""
+Keyset (cursor) pagination for large, append-heavy tables.
+
+Pages are addressed by an opaque cursor holding the ordering key of the last
+(or first) row shown, so fetching page N costs one indexed range scan no
+matter how deep it is, and no COUNT(*) runs unless the client asks for an
+approximate total with ``?approximate_count=true``.
+"""
+
+import base64
+import json
+from collections import OrderedDict
+
+from django.core.exceptions import ValidationError
+from django.db import connections
+from django.db.models import F, Q
+from rest_framework.exceptions import NotFound
+from rest_framework.pagination import BasePagination
+from rest_framework.response import Response
+from rest_framework.settings import api_settings
+from rest_framework.utils.urls import replace_query_param
+
+
+def approximate_count(queryset) -> int:
+    """
+    Planner row estimate for ``queryset`` on Postgres (no table scan);
+    an exact count on other databases.
+    """
+    connection = connections[queryset.db]
+    if connection.vendor != 'postgresql':
+        return queryset.count()
+    sql, params = queryset.order_by().values('pk').query.sql_with_params()
+    with connection.cursor() as cursor:
+        cursor.execute(f'EXPLAIN (FORMAT JSON) {sql}', params)
+        plan = cursor.fetchone()[0]
+    if isinstance(plan, str):
+        plan = json.loads(plan)
+    return int(plan[0]['Plan']['Plan Rows'])
+
+
+def _encode_value(value):
+    if value is None:
+        return None
+    if hasattr(value, 'isoformat'):
+        # Full microsecond precision; the keyset comparison needs exact values.
+        return value.isoformat()
+    return str(value)
+
+
+class KeysetPagination(BasePagination):
+    """
+    Cursor pagination over a composite ordering such as ``('due_at', 'id')``.
+    The ordering must end in a unique column. Nulls sort the way Postgres
+    does by default: last when ascending, first when descending.
+    """
+
+    ordering = ('-created_at', 'id')
+    page_size = api_settings.PAGE_SIZE
+    cursor_query_param = 'cursor'
+    count_query_param = 'approximate_count'
+    invalid_cursor_message = 'Invalid cursor'
+
+    def paginate_queryset(self, queryset, request, view=None):
+        self.request = request
+        self.base_url = request.build_absolute_uri()
+        self.keys = [(name.lstrip('-'), name.startswith('-')) for name in self.ordering]
+        self.model = queryset.model
+
+        self.approximate_count = None
+        if request.query_params.get(self.count_query_param, '').lower() in ('1', 'true', 'yes'):
+            self.approximate_count = approximate_count(queryset)
+
+        cursor = self.decode_cursor(request)
+        reverse = bool(cursor and cursor['reverse'])
+        if cursor:
+            queryset = queryset.filter(self.after(cursor['position'], reverse=reverse))
+        queryset = queryset.order_by(*self.order_by(reverse=reverse))
+
+        rows = list(queryset[:self.page_size + 1])
+        has_more = len(rows) > self.page_size
+        rows = rows[:self.page_size]
+        if reverse:
+            rows.reverse()
+
+        self.page = rows
+        if reverse:
+            self.has_next, self.has_previous = bool(rows), has_more
+        else:
+            self.has_next, self.has_previous = has_more, bool(rows and cursor)
+        return rows
+
+    def order_by(self, *, reverse=False):
+        # Nulls last ascending / first descending is symmetric, so reversing
+        # the direction of every key yields exactly the reversed order.
+        expressions = []
+        for name, descending in self.keys:
+            if descending != reverse:
+                expressions.append(F(name).desc(nulls_first=True))
+            else:
+                expressions.append(F(name).asc(nulls_last=True))
+        return expressions
+
+    def after(self, position, *, reverse=False):
+        """Q matching rows strictly after ``position`` in the (possibly reversed) ordering."""
+
+        condition = Q(pk__in=[])
+        equal = Q()
+        for (name, descending), value in zip(self.keys, position):
+            # Nulls trail ascending keys and lead descending ones; reversing flips both.
+            nulls_last = descending == reverse
+            forward_is_greater = descending == reverse
+            if value is None:
+                beyond = Q(pk__in=[]) if nulls_last else Q(**{f'{name}__isnull': False})
+                same = Q(**{f'{name}__isnull': True})
+            else:
+                lookup = 'gt' if forward_is_greater else 'lt'
+                beyond = Q(**{f'{name}__{lookup}': value})
+                if nulls_last:
+                    beyond |= Q(**{f'{name}__isnull': True})
+                same = Q(**{name: value})
+            condition |= equal & beyond
+            equal &= same
+        return condition
+
+    def position_of(self, row):
+        return [getattr(row, name) for name, _ in self.keys]
+
+    def encode_cursor(self, position, *, reverse):
+        payload = {'p': [_encode_value(value) for value in position], 'r': int(reverse)}
+        token = base64.urlsafe_b64encode(json.dumps(payload).encode()).decode()
+        return replace_query_param(self.base_url, self.cursor_query_param, token)
+
+    def decode_cursor(self, request):
+        token = request.query_params.get(self.cursor_query_param)
+        if not token:
+            return None
+        try:
+            payload = json.loads(base64.urlsafe_b64decode(token.encode()).decode())
+            fields = [self.model._meta.get_field(name) for name, _ in self.keys]
+            values = payload['p']
+            if len(values) != len(fields):
+                raise ValueError(token)
+            position = [None if value is None else field.to_python(value) for field, value in zip(fields, values)]
+            return {'position': position, 'reverse': bool(payload['r'])}
+        except (TypeError, ValueError, KeyError, UnicodeDecodeError, ValidationError):
+            raise NotFound(self.invalid_cursor_message)
+
+    def get_next_link(self):
+        if not self.has_next:
+            return None
+        return self.encode_cursor(self.position_of(self.page[-1]), reverse=False)
+
+    def get_previous_link(self):
+        if not self.has_previous:
+            return None
+        return self.encode_cursor(self.position_of(self.page[0]), reverse=True)
+
+    def get_paginated_response(self, data):
+        payload = OrderedDict()
+        if self.approximate_count is not None:
+            payload['approximate_count'] = self.approximate_count
+        payload['next'] = self.get_next_link()
+        payload['previous'] = self.get_previous_link()
+        payload['results'] = data
+        return Response(payload)
+
+    def get_paginated_response_schema(self, schema):
+        return {
+            'type': 'object',
+            'required': ['results'],
+            'properties': {
+                'approximate_count': {'type': 'integer'},
+                'next': {'type': 'string', 'nullable': True, 'format': 'uri'},
+                'previous': {'type': 'string', 'nullable': True, 'format': 'uri'},
+                'results': schema,
+            },
+        }
+
+
+class DeadlinePagination(KeysetPagination):
+    ordering = ('due_at', 'id')
+
+
+class AuditLogPagination(KeysetPagination):
+    ordering = ('-created_at', 'id')
+
+
+class CasePagination(KeysetPagination):
+    ordering = ('-filing_date', 'caption', 'id')
+
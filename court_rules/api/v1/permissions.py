@@ -4,7 +4,7 @@ Custom permission classes for role-based access control.
 
 from rest_framework import permissions
 
-from court_rules.models import UserRole
+from court_rules.models import SubscriptionHistory, UserRole
 
 
 class IsSuperAdmin(permissions.BasePermission):
@@ -229,8 +229,10 @@ class CanViewSubscription(permissions.BasePermission):
             return True
         
         # Firm Admins can only view their own organization's subscription
+        # (and its history entries)
         if request.user.role == UserRole.FIRM_ADMIN:
-            return request.user.organization == obj.organization
+            subscription = obj.subscription if isinstance(obj, SubscriptionHistory) else obj
+            return request.user.organization == subscription.organization
         
         return False
 
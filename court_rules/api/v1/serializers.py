@@ -1,6 +1,7 @@
 from django.utils import timezone
 from rest_framework import serializers
 
+from court_rules.api.v1.annotations import AnnotatedCountField
 from court_rules.models import (
     Case,
     Deadline,
@@ -24,6 +25,50 @@ from court_rules.poc_models import (
     PocRequirement,
     PocRuleNode,
 )
+from court_rules.services.deadline_recompute import computed_due_date
+from court_rules.utils.timezones import zone_or_utc
+
+
+COMPUTATION_INPUTS = ('trigger_date', 'offset_days')
+
+
+def _validate_computation_inputs(attrs, instance=None):
+    """
+    Keep due_at and its computation inputs consistent, so a holiday recompute
+    never overwrites a date someone set by hand. An update that changes
+    due_at alone is a manual override and drops trigger_date and offset_days.
+    Otherwise a due_at sent with the inputs must fall on the computed date.
+    """
+    def current(field, default=None):
+        return attrs[field] if field in attrs else getattr(instance, field, default)
+
+    due_at_edited = 'due_at' in attrs and (instance is None or attrs['due_at'] != instance.due_at)
+    inputs_edited = any(
+        field in attrs and (instance is None or attrs[field] != getattr(instance, field))
+        for field in COMPUTATION_INPUTS
+    )
+    if instance is not None and due_at_edited and not inputs_edited:
+        attrs.update(dict.fromkeys(COMPUTATION_INPUTS))
+        return attrs
+    if not (due_at_edited or inputs_edited):
+        return attrs
+    trigger_date, offset_days = current('trigger_date'), current('offset_days')
+    if trigger_date is None or offset_days is None:
+        return attrs
+
+    holiday_calendar = current('holiday_calendar')
+    expected = computed_due_date(
+        trigger_date=trigger_date,
+        offset_days=offset_days,
+        basis=current('basis', Deadline._meta.get_field('basis').default),
+        calendar_id=holiday_calendar.pk if holiday_calendar else None,
+    )
+    if current('due_at').astimezone(zone_or_utc(current('timezone'))).date() != expected:
+        raise serializers.ValidationError({
+            'due_at': f'Does not fall on the computed due date {expected.isoformat()}. '
+                      'Leave out trigger_date and offset_days to set the due date by hand.',
+        })
+    return attrs
 
 
 class JudgeSerializer(serializers.ModelSerializer):
@@ -114,7 +159,7 @@ class DeadlineSerializer(serializers.ModelSerializer):
     created_by_name = serializers.SerializerMethodField()
     updated_by_name = serializers.SerializerMethodField()
     holiday_calendar_name = serializers.SerializerMethodField()
-    pending_reminders = serializers.SerializerMethodField()
+    pending_reminders = AnnotatedCountField('reminders', filters={'sent': False})
 
     class Meta:
         model = Deadline
@@ -128,6 +173,8 @@ class DeadlineSerializer(serializers.ModelSerializer):
             'basis',
             'holiday_calendar',
             'holiday_calendar_name',
+            'trigger_date',
+            'offset_days',
             'due_at',
             'timezone',
             'owner',
@@ -184,8 +231,8 @@ class DeadlineSerializer(serializers.ModelSerializer):
             raise serializers.ValidationError('Snooze until must be in the future.')
         return value
 
-    def get_pending_reminders(self, obj):
-        return obj.reminders.filter(sent=False).count()
+    def validate(self, attrs):
+        return _validate_computation_inputs(attrs, self.instance)
 
 
 class DeadlineReminderSerializer(serializers.ModelSerializer):
@@ -218,6 +265,8 @@ class DeadlineCreateSerializer(serializers.ModelSerializer):
             'trigger_source_id',
             'basis',
             'holiday_calendar',
+            'trigger_date',
+            'offset_days',
             'due_at',
             'timezone',
             'owner',
@@ -239,7 +288,7 @@ class DeadlineCreateSerializer(serializers.ModelSerializer):
         snooze_until = attrs.get('snooze_until')
         if snooze_until and snooze_until <= timezone.now():
             raise serializers.ValidationError({'snooze_until': 'Snooze until must be in the future.'})
-        return attrs
+        return _validate_computation_inputs(attrs)
 
 
 class RuleSerializer(serializers.ModelSerializer):
@@ -280,6 +329,7 @@ class AuditLogSerializer(serializers.ModelSerializer):
             'action',
             'before',
             'after',
+            'changes',
             'created_at',
         ]
         read_only_fields = fields
@@ -319,7 +369,7 @@ class UserSerializer(serializers.ModelSerializer):
 class OrganizationSerializer(serializers.ModelSerializer):
     """Serializer for Organization (Law Firm / Customer)."""
     
-    user_count = serializers.SerializerMethodField()
+    user_count = AnnotatedCountField('users', filters={'is_active': True})
 
     class Meta:
         model = Organization
@@ -339,9 +389,6 @@ class OrganizationSerializer(serializers.ModelSerializer):
         ]
         read_only_fields = ['id', 'user_count', 'created_at', 'updated_at']
 
-    def get_user_count(self, obj):
-        return obj.users.filter(is_active=True).count()
-
     def validate_state(self, value):
         """Validate US state code (2 letters)."""
         if value and len(value) != 2:
@@ -678,7 +725,6 @@ class PocChangeEventSerializer(serializers.ModelSerializer):
 class SubscriptionSerializer(serializers.ModelSerializer):
     """Serializer for Subscription model."""
     organization_name = serializers.CharField(source='organization.name', read_only=True)
-    active_user_count = serializers.SerializerMethodField()
     can_add_user = serializers.SerializerMethodField()
     is_at_limit = serializers.SerializerMethodField()
 
@@ -702,11 +748,7 @@ class SubscriptionSerializer(serializers.ModelSerializer):
             'created_at',
             'updated_at',
         ]
-        read_only_fields = ['id', 'created_at', 'updated_at']
-
-    def get_active_user_count(self, obj):
-        """Get count of active users."""
-        return obj.get_active_user_count()
+        read_only_fields = ['id', 'active_user_count', 'created_at', 'updated_at']
 
     def get_can_add_user(self, obj):
         """Check if organization can add more users."""
@@ -27,7 +27,13 @@ from court_rules.api.v1.viewsets import (
     obtain_auth_token_email,
 )
 
-from .views_calendar import DeadlineCalendarExportView
+from .views_calendar import (
+    CaseCalendarExportView,
+    DeadlineCalendarExportView,
+    DeadlineCalendarFeedUrlView,
+    DeadlineCalendarFeedView,
+    OrganizationCalendarExportView,
+)
 
 router = DefaultRouter()
 
@@ -68,5 +74,25 @@ urlpatterns = [
         DeadlineCalendarExportView.as_view(),
         name="deadline-calendar-export",
     ),
+    path(
+        "calendar/feed-url/",
+        DeadlineCalendarFeedUrlView.as_view(),
+        name="deadline-calendar-feed-url",
+    ),
+    path(
+        "calendar/feed/<str:token>.ics",
+        DeadlineCalendarFeedView.as_view(),
+        name="deadline-calendar-feed",
+    ),
+    path(
+        "calendar/cases/<uuid:case_id>/deadlines.ics",
+        CaseCalendarExportView.as_view(),
+        name="case-calendar-export",
+    ),
+    path(
+        "calendar/organization/deadlines.ics",
+        OrganizationCalendarExportView.as_view(),
+        name="organization-calendar-export",
+    ),
 ]
 urlpatterns += router.urls
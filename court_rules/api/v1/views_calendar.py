@@ -1,13 +1,70 @@
 # court_rules/api/v1/views_calendar.py
 
-from rest_framework.permissions import IsAuthenticated
+from django.http import Http404, StreamingHttpResponse
+from django.urls import reverse
+from django.utils import timezone
+from django.utils.cache import get_conditional_response, patch_cache_control
+from django.utils.http import http_date, quote_etag
+from rest_framework.permissions import AllowAny, IsAuthenticated
 from rest_framework.response import Response
 from rest_framework.views import APIView
-from django.http import HttpResponse
-from django.utils import timezone
 
 from court_rules.models import Deadline
-from court_rules.services.calendar_export import generate_deadlines_ics
+from court_rules.services.access import scope_cases, scope_deadlines
+from court_rules.services.calendar_export import deadline_feed_validators, iter_deadlines_ics
+from court_rules.utils.tokens import make_calendar_feed_token, resolve_calendar_feed_token
+
+ICS_ITERATOR_CHUNK_SIZE = 500
+
+
+def user_feed_deadlines(user):
+    """Deadlines published in a user's calendar feed."""
+    return Deadline.objects.filter(created_by=user)
+
+
+def _display_name(user):
+    return getattr(user, "email", None) or getattr(user, "username", None) or str(user)
+
+
+def calendar_feed_response(request, deadlines, *, calendar_name, owner_identifier, attachment=True):
+    """
+    Stream ``deadlines`` as ICS, answering 304 when the client's
+    ETag / Last-Modified still match them.
+    """
+    etag, last_modified = deadline_feed_validators(deadlines, scope=calendar_name)
+    etag = quote_etag(etag)
+    last_modified_ts = int(last_modified.timestamp()) if last_modified else None
+
+    response = get_conditional_response(request, etag=etag, last_modified=last_modified_ts)
+    if response is None:
+        response = StreamingHttpResponse(
+            iter_deadlines_ics(
+                deadlines.order_by("due_at", "id").iterator(chunk_size=ICS_ITERATOR_CHUNK_SIZE),
+                calendar_name=calendar_name,
+                owner_identifier=owner_identifier,
+            ),
+            content_type="text/calendar; charset=utf-8",
+        )
+        if attachment:
+            filename = f"precedentum-deadlines-{timezone.now().date().isoformat()}.ics"
+            response["Content-Disposition"] = f'attachment; filename="{filename}"'
+
+    response["ETag"] = etag
+    if last_modified_ts is not None:
+        response["Last-Modified"] = http_date(last_modified_ts)
+    # Clients may keep a copy but must revalidate it on every poll.
+    patch_cache_control(response, private=True, no_cache=True)
+    return response
+
+
+def user_feed_response(request, user, *, attachment=True):
+    return calendar_feed_response(
+        request,
+        user_feed_deadlines(user),
+        calendar_name=f"Precedentum deadlines for {_display_name(user)}",
+        owner_identifier=f"Precedentum User {user.pk}",
+        attachment=attachment,
+    )
 
 
 class DeadlineCalendarExportView(APIView):
@@ -25,28 +82,83 @@ class DeadlineCalendarExportView(APIView):
     permission_classes = [IsAuthenticated]
 
     def get(self, request, *args, **kwargs):
-        user = request.user
-
-        # Adjust this filter to match your data model
-        # Examples:
-        #   deadlines = Deadline.objects.filter(assigned_to=user)
-        #   deadlines = Deadline.objects.filter(owner=user)
-        #   deadlines = Deadline.objects.filter(case__organization=user.organization)
-        deadlines = Deadline.objects.filter(created_by=user).order_by("due_at")
-
-        display_name = getattr(user, "email", None) or getattr(user, "username", None) or str(user)
-        calendar_name = f"Precedentum deadlines for {display_name}"
-        owner_identifier = f"Precedentum User {user.pk}"
-
-        ics_content = generate_deadlines_ics(
-            deadlines,
-            calendar_name=calendar_name,
-            owner_identifier=owner_identifier,
+        return user_feed_response(request, request.user)
+
+
+class DeadlineCalendarFeedUrlView(APIView):
+    """
+    GET /api/v1/calendar/feed-url/
+
+    Returns the signed subscription URL of the authenticated user's deadline
+    feed. Calendar apps poll it without a session; changing the password
+    revokes it.
+    """
+
+    permission_classes = [IsAuthenticated]
+
+    def get(self, request, *args, **kwargs):
+        token = make_calendar_feed_token(request.user)
+        url = request.build_absolute_uri(reverse("deadline-calendar-feed", kwargs={"token": token}))
+        return Response({
+            "url": url,
+            "webcal_url": "webcal://" + url.split("://", 1)[1],
+        })
+
+
+class DeadlineCalendarFeedView(APIView):
+    """
+    GET /api/v1/calendar/feed/<token>.ics
+
+    Subscribable ICS feed authenticated by the signed token in the URL.
+    """
+
+    authentication_classes = []
+    permission_classes = [AllowAny]
+
+    def get(self, request, token, *args, **kwargs):
+        user = resolve_calendar_feed_token(token)
+        if user is None:
+            raise Http404("Unknown calendar feed")
+        return user_feed_response(request, user, attachment=False)
+
+
+class CaseCalendarExportView(APIView):
+    """
+    GET /api/v1/calendar/cases/<case_id>/deadlines.ics
+
+    ICS export of every deadline on one case the user can see.
+    """
+
+    permission_classes = [IsAuthenticated]
+
+    def get(self, request, case_id, *args, **kwargs):
+        case = scope_cases(request.user).filter(pk=case_id).first()
+        if case is None:
+            raise Http404("Case not found")
+        return calendar_feed_response(
+            request,
+            scope_deadlines(request.user).filter(case=case),
+            calendar_name=f"Precedentum deadlines for {case.caption}",
+            owner_identifier=f"Precedentum Case {case.pk}",
         )
 
-        filename = f"precedentum-deadlines-{timezone.now().date().isoformat()}.ics"
 
-        response = HttpResponse(ics_content, content_type="text/calendar; charset=utf-8")
-        response["Content-Disposition"] = f'attachment; filename="{filename}"'
+class OrganizationCalendarExportView(APIView):
+    """
+    GET /api/v1/calendar/organization/deadlines.ics
 
-        return response
\ No newline at end of file
+    ICS export of the deadlines the user can see in their organization.
+    """
+
+    permission_classes = [IsAuthenticated]
+
+    def get(self, request, *args, **kwargs):
+        organization = request.user.organization
+        if organization is None:
+            raise Http404("No organization")
+        return calendar_feed_response(
+            request,
+            scope_deadlines(request.user).filter(case__organization=organization),
+            calendar_name=f"Precedentum deadlines for {organization.name}",
+            owner_identifier=f"Precedentum Organization {organization.pk}",
+        )
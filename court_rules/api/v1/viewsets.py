@@ -1,12 +1,14 @@
+from itertools import islice
+
 from django.contrib.auth import authenticate
-from django.db.models import Q, Count
+from django.db import transaction
 from django.utils import timezone
-from datetime import timedelta
 from rest_framework import mixins, status, viewsets
 from rest_framework.authtoken.models import Token
 from rest_framework.decorators import action, api_view, permission_classes
 from rest_framework.permissions import AllowAny, IsAuthenticated
 from rest_framework.response import Response
+from rest_framework.utils.urls import replace_query_param
 
 from court_rules.models import (
     AuditAction,
@@ -32,9 +34,17 @@ from court_rules.poc_models import (
     PocRequirement,
     PocRuleNode,
 )
+from court_rules.services.access import scope_cases, scope_deadlines
 from court_rules.services.audit import format_deadline_snapshot, record_audit_event
+from court_rules.services.audit_archive import archived_audit_months, iter_archived_audit_log, parse_month
+from court_rules.services.billing import ALL_ORGANIZATIONS, billing_dashboard_snapshot
+from court_rules.services.dashboard import ACTIVITY_RANGES, DEFAULT_ACTIVITY_RANGE, build_dashboard_metrics
+from court_rules.services.licensing import lock_subscription
 from court_rules.utils.email import send_password_reset_email, send_welcome_email, send_access_grant_notification
 from court_rules.utils.tokens import generate_password_reset_token, validate_password_reset_token
+from court_rules.api.v1.annotations import AnnotatedCountsMixin
+from court_rules.api.v1.filters import AuditLogFilter
+from court_rules.api.v1.pagination import AuditLogPagination, CasePagination, DeadlinePagination
 from court_rules.api.v1.serializers import (
     AuditLogSerializer,
     BillingRecordCreateSerializer,
@@ -91,45 +101,25 @@ class CaseViewSet(viewsets.ModelViewSet):
     permission_classes = [IsAuthenticated]
     http_method_names = ['get', 'head', 'options', 'post', 'patch', 'delete']
     filterset_fields = ['status', 'court', 'lead_attorney']
+    pagination_class = CasePagination
     
     def get_queryset(self):
         """
         Filter cases based on user's organization and access grants.
         - Super Admins see all cases
         - Site Admins see all cases in their organization
-        - Other users see cases they own or have been granted access to
+        - Other users see cases they lead, are staffed on, or have been granted access to
+          (resolved through the materialized case_access table)
         """
-        user = self.request.user
-        
-        # Super Admins see everything
-        if user.role == 'super_admin':
-            return Case.objects.select_related('court', 'lead_attorney', 'organization').order_by('-filing_date', 'caption')
-        
-        # Site Admins see all cases in their organization
-        if user.role == 'firm_admin':
-            return Case.objects.select_related('court', 'lead_attorney', 'organization').filter(
-                organization=user.organization
-            ).order_by('-filing_date', 'caption')
-        
-        # Other users see cases they own or have been granted access to
-        from court_rules.models import UserAccessGrant
-        
-        # Get list of users this user can access
-        accessible_users = UserAccessGrant.objects.filter(
-            granted_to=user,
-            is_active=True
-        ).values_list('can_access_user', flat=True)
-        
-        # Include the user themselves and users they have access to
-        accessible_user_ids = list(accessible_users) + [user.id]
-        
-        return Case.objects.select_related('court', 'lead_attorney', 'organization').filter(
-            Q(lead_attorney__id__in=accessible_user_ids) | Q(lead_attorney=user),
-            organization=user.organization
-        ).order_by('-filing_date', 'caption')
+        return scope_cases(self.request.user, super().get_queryset())
 
 
-class DeadlineViewSet(mixins.CreateModelMixin, mixins.UpdateModelMixin, viewsets.ReadOnlyModelViewSet):
+class DeadlineViewSet(
+    AnnotatedCountsMixin,
+    mixins.CreateModelMixin,
+    mixins.UpdateModelMixin,
+    viewsets.ReadOnlyModelViewSet,
+):
     queryset = (
         Deadline.objects.select_related(
             'case',
@@ -145,6 +135,7 @@ class DeadlineViewSet(mixins.CreateModelMixin, mixins.UpdateModelMixin, viewsets
     permission_classes = [IsAuthenticated]
     http_method_names = ['get', 'head', 'options', 'patch', 'post']
     filterset_fields = ['case', 'status', 'owner']
+    pagination_class = DeadlinePagination
     
     def get_queryset(self):
         """
@@ -153,66 +144,11 @@ class DeadlineViewSet(mixins.CreateModelMixin, mixins.UpdateModelMixin, viewsets
         - Site Admins see all deadlines in their organization
         - Other users see deadlines they own or for cases they have access to
         """
-        user = self.request.user
-        
-        # Super Admins see everything
-        if user.role == 'super_admin':
-            return (
-                Deadline.objects.select_related(
-                    'case',
-                    'case__organization',
-                    'holiday_calendar',
-                    'owner',
-                    'created_by',
-                    'updated_by',
-                )
-                .order_by('due_at')
-            )
-        
-        # Site Admins see all deadlines in their organization
-        if user.role == 'firm_admin':
-            return (
-                Deadline.objects.select_related(
-                    'case',
-                    'case__organization',
-                    'holiday_calendar',
-                    'owner',
-                    'created_by',
-                    'updated_by',
-                )
-                .filter(case__organization=user.organization)
-                .order_by('due_at')
-            )
-        
-        # Other users see deadlines they own or for cases they have access to
-        from court_rules.models import UserAccessGrant
-        
-        # Get list of users this user can access
-        accessible_users = UserAccessGrant.objects.filter(
-            granted_to=user,
-            is_active=True
-        ).values_list('can_access_user', flat=True)
-        
-        # Include the user themselves and users they have access to
-        accessible_user_ids = list(accessible_users) + [user.id]
-        
-        return (
-            Deadline.objects.select_related(
-                'case',
-                'case__organization',
-                'holiday_calendar',
-                'owner',
-                'created_by',
-                'updated_by',
-            )
-            .filter(
-                Q(owner__id__in=accessible_user_ids) | Q(owner=user),
-                case__organization=user.organization
-            )
-            .order_by('due_at')
-        )
+        return scope_deadlines(self.request.user, super().get_queryset())
 
+    @transaction.atomic
     def perform_update(self, serializer):
+        # Status changes adjust the dashboard rollups; keep them in the same transaction
         deadline = self.get_object()
         before_snapshot = format_deadline_snapshot(deadline)
         instance = serializer.save(updated_by=self.request.user)
@@ -226,6 +162,7 @@ class DeadlineViewSet(mixins.CreateModelMixin, mixins.UpdateModelMixin, viewsets
             after=after_snapshot,
         )
 
+    @transaction.atomic
     def perform_create(self, serializer):
         instance = serializer.save(created_by=self.request.user, updated_by=self.request.user)
         record_audit_event(
@@ -268,7 +205,49 @@ class AuditLogViewSet(viewsets.ReadOnlyModelViewSet):
     serializer_class = AuditLogSerializer
     permission_classes = [IsAuthenticated]
     http_method_names = ['get', 'head', 'options']
-    filterset_fields = ['entity_table', 'entity_id', 'action']
+    filterset_class = AuditLogFilter
+    pagination_class = AuditLogPagination
+    archive_page_size = 100
+
+    @action(detail=False, methods=['get'], url_path='archives')
+    def archives(self, request):
+        """Months moved out of the database by archive_audit_log."""
+
+        return Response({'months': [f'{month:%Y-%m}' for month in archived_audit_months()]})
+
+    @action(detail=False, methods=['get'], url_path=r'archives/(?P<month>\d{4}-\d{2})')
+    def archived(self, request, month=None):
+        """
+        Entries of an archived month, oldest first, read from the archive file.
+        Accepts the same filters as the list plus ``offset``.
+        """
+        filterset = AuditLogFilter(request.query_params, queryset=AuditLog.objects.none())
+        if not filterset.is_valid():
+            return Response(filterset.errors, status=status.HTTP_400_BAD_REQUEST)
+        try:
+            entries = iter_archived_audit_log(parse_month(month))
+            matching = (entry for entry in entries if filterset.matches(entry))
+            offset = max(int(request.query_params.get('offset', 0)), 0)
+            page = list(islice(matching, offset, offset + self.archive_page_size + 1))
+        except ValueError:
+            return Response({'detail': 'Invalid month or offset'}, status=status.HTTP_400_BAD_REQUEST)
+        except FileNotFoundError:
+            return Response({'detail': 'Month not archived'}, status=status.HTTP_404_NOT_FOUND)
+
+        # Archived rows may name users deleted since; resolve actors in one query.
+        actors = User.objects.in_bulk({entry.actor_user_id for entry in page if entry.actor_user_id})
+        for entry in page:
+            entry.actor_user = actors.get(entry.actor_user_id)
+
+        next_url = None
+        if len(page) > self.archive_page_size:
+            page = page[:self.archive_page_size]
+            next_url = replace_query_param(request.build_absolute_uri(), 'offset', offset + self.archive_page_size)
+        return Response({
+            'month': month,
+            'next': next_url,
+            'results': self.get_serializer(page, many=True).data,
+        })
 
 
 class UserViewSet(viewsets.ReadOnlyModelViewSet):
@@ -333,7 +312,7 @@ class PocChangeEventViewSet(viewsets.ReadOnlyModelViewSet):
     filterset_fields = ['entity_kind', 'entity_id', 'change_type']
 
 
-class OrganizationViewSet(viewsets.ModelViewSet):
+class OrganizationViewSet(AnnotatedCountsMixin, viewsets.ModelViewSet):
     """
     ViewSet for Organization (Customer/Law Firm) management.
     
@@ -362,12 +341,13 @@ class OrganizationViewSet(viewsets.ModelViewSet):
         - Other users see only their organization
         """
         user = self.request.user
+        queryset = super().get_queryset()
         
         if user.role == 'super_admin':
-            return Organization.objects.filter(is_active=True).order_by('name')
+            return queryset
         
         # Other users can only see their own organization
-        return Organization.objects.filter(id=user.organization.id, is_active=True)
+        return queryset.filter(id=user.organization.id)
     
     def perform_destroy(self, instance):
         """Soft delete: Mark organization as inactive instead of deleting."""
@@ -441,20 +421,20 @@ class UserManagementViewSet(viewsets.ModelViewSet):
             target_organization = user.organization
             serializer.validated_data['organization'] = target_organization
         
-        # Check license limit for non-Super Admin organizations
-        if target_organization and role != UserRole.SUPER_ADMIN:
-            try:
-                subscription = target_organization.subscription
-                if not subscription.can_add_user():
+        with transaction.atomic():
+            # Check license limit for non-Super Admin organizations. The subscription
+            # row stays locked until the new user has been counted, so concurrent
+            # creates cannot both take the last seat.
+            if target_organization and role != UserRole.SUPER_ADMIN:
+                subscription = lock_subscription(target_organization)
+                # If no subscription exists, allow creation (for backwards compatibility)
+                if subscription and not subscription.can_add_user():
                     active_count = subscription.get_active_user_count()
                     raise ValidationError({
                         'organization': f"You've reached your user limit ({active_count}/{subscription.licensed_users}). Contact support to add more licenses."
                     })
-            except Subscription.DoesNotExist:
-                # If no subscription exists, allow creation (for backwards compatibility)
-                pass
-        
-        new_user = serializer.save(created_by=user)
+            
+            new_user = serializer.save(created_by=user)
         
         # Send welcome email
         try:
@@ -733,6 +713,9 @@ def dashboard_metrics(request):
     """
     Get dashboard metrics and statistics.
     
+    Query params:
+    - range: activity trend window in days (7, 30, 90 or 365; default 30)
+    
     Returns:
     - upcoming_deadlines: Count of deadlines in next 7/30/60 days
     - overdue_deadlines: Count of overdue deadlines
@@ -740,173 +723,22 @@ def dashboard_metrics(request):
     - cases_by_court: Cases grouped by court
     - recent_activity: Recent updates to cases, rules, and judge procedures
     - deadline_timeline: Deadlines for chart visualization (next 60 days)
-    - activity_trend: Daily activity counts for last 30 days
-    """
-    user = request.user
-    now = timezone.now()
-    
-    # Get user's accessible data based on organization and access grants
-    if user.role == 'super_admin':
-        cases = Case.objects.all()
-        deadlines = Deadline.objects.all()
-    else:
-        # Get cases user has access to (their org + granted access)
-        accessible_user_ids = [user.id]
-        if user.organization:
-            # Add access grants
-            grants = UserAccessGrant.objects.filter(
-                granted_to=user,
-                is_active=True
-            ).values_list('can_access_user_id', flat=True)
-            accessible_user_ids.extend(grants)
-        
-        cases = Case.objects.filter(
-            Q(organization=user.organization) |
-            Q(lead_attorney_id__in=accessible_user_ids)
-        )
-        deadlines = Deadline.objects.filter(case__in=cases)
-    
-    # Upcoming deadlines counts
-    seven_days = now + timedelta(days=7)
-    thirty_days = now + timedelta(days=30)
-    sixty_days = now + timedelta(days=60)
-    
-    upcoming_7_days = deadlines.filter(due_at__gte=now, due_at__lte=seven_days, status='open').count()
-    upcoming_30_days = deadlines.filter(due_at__gte=now, due_at__lte=thirty_days, status='open').count()
-    upcoming_60_days = deadlines.filter(due_at__gte=now, due_at__lte=sixty_days, status='open').count()
-    
-    # Overdue deadlines
-    overdue_count = deadlines.filter(due_at__lt=now, status='open').count()
-    
-    # Cases by status
-    cases_by_status = list(
-        cases.values('status')
-        .annotate(count=Count('id'))
-        .order_by('-count')
-    )
-    
-    # Cases by court
-    cases_by_court = list(
-        cases.values('court__name')
-        .annotate(count=Count('id'))
-        .order_by('-count')
-    )
-    
-    # Deadline timeline (next 60 days for chart)
-    deadline_timeline = []
-    for deadline in deadlines.filter(due_at__gte=now, due_at__lte=sixty_days).order_by('due_at')[:50]:
-        deadline_timeline.append({
-            'id': str(deadline.id),
-            'title': str(deadline),  # Use the __str__ method
-            'due_date': deadline.due_at.isoformat(),
-            'status': deadline.status,
-            'case_name': deadline.case.caption if deadline.case else None,
-        })
-    
-    # Activity trend (last 30 days)
-    thirty_days_ago = now - timedelta(days=30)
-    activity_by_day = []
-    
-    for i in range(30):
-        day = thirty_days_ago + timedelta(days=i)
-        day_start = day.replace(hour=0, minute=0, second=0, microsecond=0)
-        day_end = day_start + timedelta(days=1)
-        
-        # Count activities for this day
-        cases_count = cases.filter(created_at__gte=day_start, created_at__lt=day_end).count()
-        deadlines_count = deadlines.filter(created_at__gte=day_start, created_at__lt=day_end).count()
-        
-        activity_by_day.append({
-            'date': day.strftime('%Y-%m-%d'),
-            'cases': cases_count,
-            'deadlines': deadlines_count,
-            'total': cases_count + deadlines_count,
-        })
-    
-    # Recent activity feed
-    recent_activity = []
-    
-    # Recent cases (last 10)
-    for case in cases.order_by('-created_at')[:10]:
-        recent_activity.append({
-            'type': 'case',
-            'title': f"New case: {case.caption}",
-            'date': case.created_at.isoformat(),
-            'id': str(case.id),
-        })
-    
-    # Recent deadlines (last 10)
-    for deadline in deadlines.order_by('-created_at')[:10]:
-        recent_activity.append({
-            'type': 'deadline',
-            'title': f"Deadline: {deadline.trigger_type} - {deadline.case.caption}",
-            'date': deadline.created_at.isoformat(),
-            'id': str(deadline.id),
-        })
+    - activity_trend: Daily activity counts for the requested range
     
-    # Recently updated rules (last 10)
+    The payload is built from a fixed number of grouped queries regardless of range.
+    """
+    range_param = request.query_params.get('range', DEFAULT_ACTIVITY_RANGE)
     try:
-        from court_rules.poc_models import PocChangeEvent, PocRuleNode, PocJudgeProcNode
-        
-        # Get recent rule changes
-        recent_rule_changes = PocChangeEvent.objects.filter(
-            entity_kind='rule_node'
-        ).select_related().order_by('-detected_at')[:10]
-        
-        for change in recent_rule_changes:
-            try:
-                rule = PocRuleNode.objects.get(id=change.entity_id)
-                title = f"Rule {change.change_type}: {rule.rule_code} - {rule.heading[:50] if rule.heading else 'Court Rule'}"
-            except PocRuleNode.DoesNotExist:
-                title = f"Rule {change.change_type}: ID {change.entity_id}"
-            
-            recent_activity.append({
-                'type': 'rule',
-                'title': title,
-                'date': change.detected_at.isoformat(),
-                'id': str(change.entity_id),
-            })
-        
-        # Recently updated judge procedures (last 10)
-        recent_proc_changes = PocChangeEvent.objects.filter(
-            entity_kind='judge_proc_node'
-        ).select_related().order_by('-detected_at')[:10]
-        
-        for change in recent_proc_changes:
-            try:
-                proc = PocJudgeProcNode.objects.select_related('judge').get(id=change.entity_id)
-                title = f"Procedure {change.change_type}: {proc.judge.display_name} - {proc.heading[:50] if proc.heading else 'Procedure'}"
-            except PocJudgeProcNode.DoesNotExist:
-                title = f"Procedure {change.change_type}: ID {change.entity_id}"
-            
-            recent_activity.append({
-                'type': 'procedure',
-                'title': title,
-                'date': change.detected_at.isoformat(),
-                'id': str(change.entity_id),
-            })
-    except Exception as e:
-        # If there's any error with POC models, just skip this section
-        pass
-    
-    # Sort all activities by date (most recent first) and limit to 20
-    recent_activity.sort(key=lambda x: x['date'], reverse=True)
-    recent_activity = recent_activity[:20]
+        range_days = int(range_param)
+    except (TypeError, ValueError):
+        range_days = None
+    if range_days not in ACTIVITY_RANGES:
+        return Response(
+            {'error': f"range must be one of {', '.join(str(days) for days in ACTIVITY_RANGES)}."},
+            status=status.HTTP_400_BAD_REQUEST
+        )
     
-    return Response({
-        'upcoming_deadlines': {
-            'next_7_days': upcoming_7_days,
-            'next_30_days': upcoming_30_days,
-            'next_60_days': upcoming_60_days,
-        },
-        'overdue_deadlines': overdue_count,
-        'total_active_cases': cases.filter(status='active').count(),
-        'cases_by_status': cases_by_status,
-        'cases_by_court': cases_by_court,
-        'deadline_timeline': deadline_timeline,
-        'activity_trend': activity_by_day,
-        'recent_activity': recent_activity,
-    })
+    return Response(build_dashboard_metrics(request.user, range_days=range_days))
 
 
 # =============================================================================
@@ -1096,52 +928,10 @@ def billing_dashboard(request):
     
     # Filter billing records based on user role
     if user.role == 'super_admin':
-        billing_records = BillingRecord.objects.all()
+        organization_id = ALL_ORGANIZATIONS
     elif user.role == 'firm_admin':
-        billing_records = BillingRecord.objects.filter(subscription__organization=user.organization)
+        organization_id = user.organization_id
     else:
         return Response({'error': 'Unauthorized'}, status=status.HTTP_403_FORBIDDEN)
     
-    # Current month revenue
-    current_month_start = timezone.now().replace(day=1, hour=0, minute=0, second=0, microsecond=0)
-    current_month_revenue = billing_records.filter(
-        billing_period_start__gte=current_month_start
-    ).aggregate(
-        total=Count('id'),
-        billed=Count('amount_billed'),
-    )
-    
-    # Outstanding balance
-    total_outstanding = sum(record.balance_due for record in billing_records if record.balance_due > 0)
-    
-    # Overdue payments
-    today = timezone.now().date()
-    overdue_records = billing_records.filter(
-        payment_status__in=['pending', 'partially_paid'],
-        payment_due_date__lt=today
-    )
-    
-    overdue_list = []
-    for record in overdue_records[:10]:  # Top 10 overdue
-        overdue_list.append({
-            'id': str(record.id),
-            'organization': record.subscription.organization.name,
-            'amount_due': float(record.balance_due),
-            'due_date': record.payment_due_date.isoformat() if record.payment_due_date else None,
-            'billing_period': f"{record.billing_period_start} to {record.billing_period_end}",
-        })
-    
-    # Payment status breakdown
-    status_breakdown = {}
-    for choice_value, choice_label in BillingRecord._meta.get_field('payment_status').choices:
-        count = billing_records.filter(payment_status=choice_value).count()
-        if count > 0:
-            status_breakdown[choice_label] = count
-    
-    return Response({
-        'current_month_records': current_month_revenue['total'],
-        'total_outstanding': float(total_outstanding),
-        'overdue_count': overdue_records.count(),
-        'overdue_records': overdue_list,
-        'payment_status_breakdown': status_breakdown,
-    })
+    return Response(billing_dashboard_snapshot(organization_id))
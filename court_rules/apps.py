@@ -7,4 +7,5 @@ class CourtRulesConfig(AppConfig):
 
     def ready(self):
         # Ensure the POC models are registered so Django sees them
-        from . import poc_models  # noqa: F401
\ No newline at end of file
+        from . import poc_models  # noqa: F401
+        from . import signals  # noqa: F401
\ No newline at end of file
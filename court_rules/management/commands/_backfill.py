@@ -0,0 +1,69 @@
+"""
+Shared base for data-fix commands built on court_rules.services.backfill.
+
+Subclasses return their BackfillPass objects from backfill_passes() and may
+override describe() to label rows in the diff output. Every command gets
+--dry-run, --chunk-size, --throttle and --restart.
+"""
+
+from django.core.management.base import BaseCommand
+
+from court_rules.services.backfill import DEFAULT_CHUNK_SIZE, run_backfill
+
+
+class BackfillCommand(BaseCommand):
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--dry-run',
+            action='store_true',
+            help='Show what would be changed without making changes',
+        )
+        parser.add_argument(
+            '--chunk-size',
+            type=int,
+            default=DEFAULT_CHUNK_SIZE,
+            help='Rows read and written per transaction',
+        )
+        parser.add_argument(
+            '--throttle',
+            type=float,
+            default=0.0,
+            help='Seconds to sleep between chunks',
+        )
+        parser.add_argument(
+            '--restart',
+            action='store_true',
+            help='Ignore saved checkpoints and start from the first row',
+        )
+
+    def backfill_passes(self):
+        raise NotImplementedError
+
+    def describe(self, row):
+        return str(row)
+
+    def show_diff(self, row, diff):
+        for name, (old, new) in diff.items():
+            self.stdout.write(f'  {self.describe(row)} {name}: {old!r} → {new!r}')
+
+    def run_backfills(self, **options):
+        """Run every pass; returns their BackfillResults."""
+
+        results = []
+        for backfill in self.backfill_passes():
+            self.stdout.write(f'\n{backfill.name}...')
+            result = run_backfill(
+                backfill,
+                chunk_size=options['chunk_size'],
+                dry_run=options['dry_run'],
+                throttle=options['throttle'],
+                restart=options['restart'],
+                on_change=self.show_diff,
+            )
+            if result.resumed_after:
+                self.stdout.write(self.style.WARNING(f'  Resumed after {result.resumed_after}'))
+            self.stdout.write(
+                f'  {result.processed} rows in {result.chunks} chunks, {result.changed} changed'
+            )
+            results.append(result)
+        return results
@@ -0,0 +1,162 @@
+"""
+Shared base for the commands that scrape ILND judge chambers pages.
+
+Pages are fetched concurrently through court_rules.services.scraping, each
+subclass extracts the Judge fields it owns from the HTML, and every changed
+judge is written with a single bulk_update at the end. Pages go through the
+shared PageCache: requests are conditional, and a page whose content hash
+this command already processed is neither parsed nor written again.
+"""
+
+import time
+
+from django.core.management.base import BaseCommand
+from django.utils import timezone
+
+from court_rules.models import Judge
+from court_rules.services.page_cache import PageCache
+from court_rules.services.scraping import (
+    DEFAULT_DELAY,
+    DEFAULT_PER_HOST,
+    DEFAULT_RETRIES,
+    DEFAULT_TIMEOUT,
+    DEFAULT_WORKERS,
+    assign_changes,
+    fetch_pages,
+)
+
+BULK_UPDATE_BATCH_SIZE = 200
+
+
+class ChambersScrapeCommand(BaseCommand):
+    """Subclasses implement extract(judge, html) returning the Judge field values found."""
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--dry-run',
+            action='store_true',
+            help='Show what would be changed without actually making changes',
+        )
+        parser.add_argument(
+            '--workers',
+            type=int,
+            default=DEFAULT_WORKERS,
+            help='Pages fetched in parallel',
+        )
+        parser.add_argument(
+            '--per-host',
+            type=int,
+            default=DEFAULT_PER_HOST,
+            help='Maximum concurrent requests to one host',
+        )
+        parser.add_argument(
+            '--delay',
+            type=float,
+            default=DEFAULT_DELAY,
+            help='Minimum seconds between requests to one host',
+        )
+        parser.add_argument(
+            '--retries',
+            type=int,
+            default=DEFAULT_RETRIES,
+            help='Retries for connection errors, 429 and 5xx responses',
+        )
+        parser.add_argument(
+            '--timeout',
+            type=float,
+            default=DEFAULT_TIMEOUT,
+            help='Seconds to wait for each response',
+        )
+        parser.add_argument(
+            '--force',
+            action='store_true',
+            help='Parse every page, even when its content is unchanged since the last run',
+        )
+        parser.add_argument(
+            '--no-cache',
+            action='store_true',
+            help='Bypass the page cache (unconditional downloads, nothing recorded)',
+        )
+
+    def extract(self, judge, html):
+        raise NotImplementedError
+
+    @property
+    def cache_consumer(self):
+        return self.__module__.rsplit('.', 1)[-1]
+
+    def handle(self, *args, **options):
+        dry_run = options['dry_run']
+        if dry_run:
+            self.stdout.write(self.style.WARNING('DRY RUN MODE - No changes will be saved'))
+
+        judges = list(Judge.objects.all().order_by('full_name'))
+        for judge in judges:
+            if not judge.chambers_url:
+                self.stdout.write(self.style.WARNING(f'⚠️  Skipping {judge.full_name} - No chambers URL'))
+        judges = [judge for judge in judges if judge.chambers_url]
+
+        cache = None if options['no_cache'] else PageCache()
+        started = time.monotonic()
+        pages = fetch_pages(
+            [judge.chambers_url for judge in judges],
+            workers=options['workers'],
+            per_host=options['per_host'],
+            delay=options['delay'],
+            retries=options['retries'],
+            timeout=options['timeout'],
+            cache=cache,
+        )
+        fetch_seconds = time.monotonic() - started
+
+        changed = []
+        fields = set()
+        failed = unchanged = 0
+        processed = {}
+        for judge in judges:
+            self.stdout.write(f'\n📋 Processing: {judge.full_name}')
+            self.stdout.write(f'   URL: {judge.chambers_url}')
+            page = pages[judge.chambers_url]
+            if not page.ok:
+                failed += 1
+                self.stdout.write(self.style.ERROR(f'   ❌ Error fetching page: {page.error}'))
+                continue
+            if cache and not options['force'] and cache.unchanged_for(
+                page.url, self.cache_consumer, page.content_hash,
+            ):
+                unchanged += 1
+                self.stdout.write('   ℹ️  Page unchanged since last run')
+                continue
+            try:
+                values = self.extract(judge, page.text)
+            except Exception as e:
+                failed += 1
+                self.stdout.write(self.style.ERROR(f'   ❌ Error processing page: {str(e)}'))
+                continue
+            processed[page.url] = page.content_hash
+
+            names = assign_changes(judge, values)
+            if names:
+                changed.append(judge)
+                fields.update(names)
+                self.stdout.write(self.style.SUCCESS(f'   ✅ Updated {judge.full_name} ({", ".join(names)})'))
+            else:
+                self.stdout.write('   ℹ️  No new information found')
+
+        if changed and not dry_run:
+            now = timezone.now()
+            for judge in changed:
+                judge.updated_at = now
+            Judge.objects.bulk_update(changed, sorted(fields | {'updated_at'}), batch_size=BULK_UPDATE_BATCH_SIZE)
+        if cache and not dry_run:
+            for url, digest in processed.items():
+                cache.mark_processed(url, self.cache_consumer, digest)
+
+        self.stdout.write(self.style.SUCCESS(f'\n{"="*80}'))
+        self.stdout.write(self.style.SUCCESS(
+            f'Processed {len(judges)} judges ({len(pages)} pages fetched in {fetch_seconds:.1f}s, '
+            f'{sum(page.not_modified for page in pages.values())} not modified); '
+            f'updated {len(changed)}, unchanged {unchanged}, failed {failed}'
+        ))
+        if dry_run:
+            self.stdout.write(self.style.WARNING('\nThis was a DRY RUN. Run without --dry-run to apply changes.'))
@@ -6,6 +6,14 @@ import re
 from django.core.management.base import BaseCommand
 from court_rules.models import Judge
 
+# Columns this editor writes; updated_at is listed so auto_now still applies.
+STAFF_FIELDS = [
+    'clerk_name', 'clerk_phone', 'clerk_room',
+    'court_reporter_name', 'court_reporter_phone', 'court_reporter_room',
+    'executive_law_clerk', 'judicial_assistant', 'apprentices', 'additional_staff',
+    'updated_at',
+]
+
 
 def format_phone_number(phone):
     """Format phone number to (999) 999-9999"""
@@ -150,7 +158,7 @@ class Command(BaseCommand):
                 judge.judicial_assistant = judicial_asst
                 judge.apprentices = '\n'.join(law_clerks) if law_clerks else ''
                 judge.additional_staff = '\n'.join(staff_lines)
-                judge.save()
+                judge.save(update_fields=STAFF_FIELDS)
                 
                 # Show summary
                 self.stdout.write(self.style.SUCCESS(f'\n✅ Successfully updated {judge.full_name}'))
@@ -0,0 +1,91 @@
+"""
+Management command to maintain the monthly audit_log partitions.
+
+Usage:
+    python manage.py archive_audit_log
+    python manage.py archive_audit_log --retention-months 12 --dry-run
+    python manage.py archive_audit_log --restore 2024-03
+
+Creates the partitions for the coming months, then detaches every partition
+older than the retention window, writes it to a gzip'd JSONL file in
+AUDIT_LOG_ARCHIVE_DIR and drops it. Run it monthly (e.g. from cron).
+"""
+
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+
+from court_rules.services.audit_archive import (
+    AuditArchiveError,
+    archive_audit_partition,
+    archive_path,
+    ensure_audit_partitions,
+    parse_month,
+    partitioning_supported,
+    partitions_past_retention,
+    restore_audit_partition,
+)
+
+
+class Command(BaseCommand):
+    help = "Create upcoming audit_log partitions and archive those past retention."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--retention-months',
+            type=int,
+            default=settings.AUDIT_LOG_RETENTION_MONTHS,
+            help='Months of audit history to keep in the database',
+        )
+        parser.add_argument(
+            '--months-ahead',
+            type=int,
+            default=3,
+            help='Create partitions this many months ahead',
+        )
+        parser.add_argument(
+            '--archive-dir',
+            default=None,
+            help='Directory for archive files (default: AUDIT_LOG_ARCHIVE_DIR)',
+        )
+        parser.add_argument(
+            '--restore',
+            metavar='YYYY-MM',
+            help='Load an archived month back into the database instead',
+        )
+        parser.add_argument(
+            '--dry-run',
+            action='store_true',
+            help='List the partitions that would be archived without changing anything',
+        )
+
+    def handle(self, *args, **options):
+        if not partitioning_supported():
+            raise CommandError('audit_log partitioning requires PostgreSQL.')
+        directory = options['archive_dir']
+
+        if options['restore']:
+            try:
+                month = parse_month(options['restore'])
+                restored = restore_audit_partition(month, directory=directory)
+            except (ValueError, FileNotFoundError, AuditArchiveError) as exc:
+                raise CommandError(str(exc))
+            self.stdout.write(self.style.SUCCESS(f'Restored {restored} entries for {month:%Y-%m}'))
+            return
+
+        expired = partitions_past_retention(retention_months=options['retention_months'])
+        if options['dry_run']:
+            for month in expired:
+                self.stdout.write(f'  would archive {month:%Y-%m} -> {archive_path(month, directory)}')
+            self.stdout.write(self.style.SUCCESS(f'Partitions past retention: {len(expired)}'))
+            return
+
+        created = ensure_audit_partitions(months_ahead=options['months_ahead'])
+        self.stdout.write(self.style.SUCCESS(f'Partitions created: {len(created)}'))
+
+        for month in expired:
+            try:
+                archived = archive_audit_partition(month, directory=directory)
+            except AuditArchiveError as exc:
+                raise CommandError(str(exc))
+            self.stdout.write(f'  {month:%Y-%m}: {archived} entries -> {archive_path(month, directory)}')
+        self.stdout.write(self.style.SUCCESS(f'Partitions archived: {len(expired)}'))
@@ -0,0 +1,118 @@
+"""
+Management command that benchmarks the chambers page extractor.
+
+Usage:
+    python manage.py benchmark_chambers_extractor
+    python manage.py benchmark_chambers_extractor --repeat 200
+    python manage.py benchmark_chambers_extractor --corpus /path/to/pages --fail-under 95
+
+Runs extract_chambers_staff() over a corpus of saved chambers pages (*.html
+next to an expected.json of the staff each page lists) and reports
+throughput in pages/second and field-level accuracy, listing every field
+that was extracted wrong. Use it to judge parser changes on both speed and
+correctness.
+"""
+
+import json
+import time
+from pathlib import Path
+
+from django.core.management.base import BaseCommand, CommandError
+
+from court_rules.services.chambers import (
+    COURT_REPORTER,
+    COURTROOM_DEPUTY,
+    EXECUTIVE_LAW_CLERK,
+    JUDICIAL_ASSISTANT,
+    LAW_CLERKS,
+    extract_chambers_staff,
+)
+
+DEFAULT_CORPUS = Path(__file__).resolve().parents[2] / 'tests' / 'fixtures' / 'chambers_pages'
+CONTACT_ROLES = (COURT_REPORTER, COURTROOM_DEPUTY, EXECUTIVE_LAW_CLERK, JUDICIAL_ASSISTANT)
+CONTACT_ATTRIBUTES = ('name', 'phone', 'room')
+
+
+def field_values(staff) -> dict:
+    """Flatten a ChambersStaff into {'court_reporter.name': ..., 'law_clerks': [...]}."""
+
+    values = {}
+    for role in CONTACT_ROLES:
+        contact = getattr(staff, role)
+        for attribute in CONTACT_ATTRIBUTES:
+            values[f'{role}.{attribute}'] = getattr(contact, attribute) if contact else ''
+    values[LAW_CLERKS] = list(staff.law_clerks)
+    return values
+
+
+def expected_values(expected: dict) -> dict:
+    values = {}
+    for role in CONTACT_ROLES:
+        contact = expected.get(role) or {}
+        for attribute in CONTACT_ATTRIBUTES:
+            values[f'{role}.{attribute}'] = contact.get(attribute, '')
+    values[LAW_CLERKS] = expected.get(LAW_CLERKS, [])
+    return values
+
+
+class Command(BaseCommand):
+    help = "Benchmark chambers page extraction speed and field accuracy on saved pages."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--corpus',
+            default=str(DEFAULT_CORPUS),
+            help='Directory of saved *.html pages and their expected.json',
+        )
+        parser.add_argument(
+            '--repeat',
+            type=int,
+            default=20,
+            help='Passes over the corpus when timing',
+        )
+        parser.add_argument(
+            '--fail-under',
+            type=float,
+            default=None,
+            help='Exit with an error when field accuracy (percent) is below this',
+        )
+
+    def handle(self, *args, **options):
+        corpus = Path(options['corpus'])
+        try:
+            expected = json.loads((corpus / 'expected.json').read_text(encoding='utf-8'))
+        except FileNotFoundError:
+            raise CommandError(f'No expected.json in {corpus}')
+        pages = {name: (corpus / name).read_text(encoding='utf-8') for name in sorted(expected)}
+        if not pages:
+            raise CommandError(f'No pages listed in {corpus / "expected.json"}')
+
+        correct = total = 0
+        mismatches = []
+        for name, html in pages.items():
+            actual = field_values(extract_chambers_staff(html))
+            for field_name, wanted in expected_values(expected[name]).items():
+                total += 1
+                if actual[field_name] == wanted:
+                    correct += 1
+                else:
+                    mismatches.append((name, field_name, wanted, actual[field_name]))
+
+        repeat = max(options['repeat'], 1)
+        started = time.perf_counter()
+        for _ in range(repeat):
+            for html in pages.values():
+                extract_chambers_staff(html)
+        elapsed = time.perf_counter() - started
+        accuracy = 100.0 * correct / total
+
+        self.stdout.write(self.style.SUCCESS(
+            f'{len(pages)} pages x {repeat}: {len(pages) * repeat / elapsed:.1f} pages/s '
+            f'({1000 * elapsed / (len(pages) * repeat):.2f} ms/page)'
+        ))
+        self.stdout.write(self.style.SUCCESS(f'Field accuracy: {correct}/{total} ({accuracy:.1f}%)'))
+        for name, field_name, wanted, got in mismatches:
+            self.stdout.write(self.style.WARNING(f'  {name} {field_name}: expected {wanted!r}, got {got!r}'))
+
+        if options['fail_under'] is not None and accuracy < options['fail_under']:
+            raise CommandError(f'Field accuracy {accuracy:.1f}% is below {options["fail_under"]}%')
@@ -0,0 +1,82 @@
+"""
+Management command that delivers due deadline reminders.
+
+Usage:
+    python manage.py dispatch_reminders
+    python manage.py dispatch_reminders --once
+    python manage.py dispatch_reminders --batch-size 500 --interval 5 --stats-every 60
+
+Runs until interrupted, claiming due reminders in batches with
+SELECT ... FOR UPDATE SKIP LOCKED, so several worker processes can share
+the queue. Failed deliveries are retried with backoff up to
+REMINDER_MAX_ATTEMPTS. Prints throughput and lag (how late reminders went
+out) every --stats-every seconds.
+"""
+
+import time
+
+from django.core.management.base import BaseCommand
+from django.db import close_old_connections
+
+from court_rules.services.reminders import DEFAULT_BATCH_SIZE, DispatchStats, dispatch_due_reminders, reminder_backlog
+
+
+class Command(BaseCommand):
+    help = "Deliver due deadline reminders (safe to run in several processes)."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--batch-size',
+            type=int,
+            default=DEFAULT_BATCH_SIZE,
+            help='Reminders claimed per transaction',
+        )
+        parser.add_argument(
+            '--interval',
+            type=float,
+            default=10.0,
+            help='Seconds to sleep when no reminder is due',
+        )
+        parser.add_argument(
+            '--stats-every',
+            type=float,
+            default=60.0,
+            help='Seconds between stats lines',
+        )
+        parser.add_argument(
+            '--once',
+            action='store_true',
+            help='Drain the reminders due now, print stats and exit',
+        )
+
+    def handle(self, *args, **options):
+        stats = DispatchStats()
+        last_report = time.monotonic()
+        self.stdout.write(self.style.SUCCESS('Dispatching reminders...'))
+        try:
+            while True:
+                handled = dispatch_due_reminders(batch_size=options['batch_size'], stats=stats)
+                if time.monotonic() - last_report >= options['stats_every']:
+                    self.report(stats)
+                    last_report = time.monotonic()
+                if handled:
+                    continue
+                if options['once']:
+                    break
+                close_old_connections()
+                time.sleep(options['interval'])
+        except KeyboardInterrupt:
+            pass
+        self.report(stats)
+
+    def report(self, stats):
+        backlog = reminder_backlog()
+        channels = ', '.join(f'{channel}={count}' for channel, count in sorted(stats.by_channel.items())) or 'none'
+        self.stdout.write(self.style.SUCCESS(
+            f'Dispatched: {stats.claimed} in {stats.batches} batches ({stats.throughput:.1f}/s); '
+            f'failed: {stats.failed} ({stats.abandoned} given up); channels: {channels}'
+        ))
+        self.stdout.write(self.style.SUCCESS(
+            f'Lag: mean {stats.mean_lag.total_seconds():.1f}s, max {stats.max_lag.total_seconds():.1f}s; '
+            f"backlog: {backlog['pending']} due, oldest {backlog['lag'].total_seconds():.1f}s late"
+        ))
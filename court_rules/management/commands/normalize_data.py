@@ -3,10 +3,19 @@ Management command to normalize/standardize data formats across the database
 - Phone numbers: (999) 999-9999
 - State codes: Valid US states only
 - Zip codes: Valid US zip codes only
+
+Usage:
+    python manage.py normalize_data --dry-run
+    python manage.py normalize_data --chunk-size 1000 --throttle 0.5
+
+Runs as resumable backfills: rows are read in primary-key chunks, only
+changed columns are written, and an interrupted run continues where it
+stopped (--restart starts over).
 """
 import re
-from django.core.management.base import BaseCommand
+from court_rules.management.commands._backfill import BackfillCommand
 from court_rules.models import Judge, Organization, User
+from court_rules.services.backfill import BackfillPass
 
 
 # Valid US state codes
@@ -58,120 +67,101 @@ def validate_zip_code(zip_code):
     return bool(re.match(r'^\d{5}(-\d{4})?$', zip_code))
 
 
-class Command(BaseCommand):
+class Command(BackfillCommand):
     help = 'Normalize data formats: phone numbers, state codes, zip codes'
 
-    def add_arguments(self, parser):
-        parser.add_argument(
-            '--dry-run',
-            action='store_true',
-            help='Show what would be changed without making changes',
+    def backfill_passes(self):
+        return [
+            BackfillPass(
+                name='normalize_data.judges',
+                queryset=Judge.objects.only('full_name', 'contact_phone', 'clerk_phone', 'additional_staff'),
+                fields=['contact_phone', 'clerk_phone', 'additional_staff'],
+                transform=self.normalize_judge,
+            ),
+            BackfillPass(
+                name='normalize_data.organizations',
+                queryset=Organization.objects.only('name', 'phone', 'state', 'zip_code'),
+                fields=['phone', 'state'],
+                transform=self.normalize_organization,
+            ),
+            BackfillPass(
+                name='normalize_data.users',
+                queryset=User.objects.only('email', 'phone'),
+                fields=['phone'],
+                transform=self.normalize_user,
+            ),
+        ]
+
+    def describe(self, row):
+        if isinstance(row, Judge):
+            return row.full_name
+        if isinstance(row, Organization):
+            return row.name
+        return row.email
+
+    def normalize_judge(self, judge):
+        values = {
+            'contact_phone': format_phone_number(judge.contact_phone),
+            'clerk_phone': format_phone_number(judge.clerk_phone),
+        }
+        if judge.additional_staff:
+            # Find and replace phone numbers in the text
+            additional_staff = judge.additional_staff
+            for match in re.findall(r'Phone:\s*([^\n]+)', additional_staff):
+                formatted = format_phone_number(match)
+                if formatted != match:
+                    additional_staff = additional_staff.replace(match, formatted)
+                    self.changes['phone_numbers'] += 1
+            values['additional_staff'] = additional_staff
+        self.changes['phone_numbers'] += sum(
+            values[name] != getattr(judge, name) for name in ('contact_phone', 'clerk_phone')
         )
+        return values
+
+    def normalize_organization(self, org):
+        values = {'phone': format_phone_number(org.phone)}
+        self.changes['phone_numbers'] += values['phone'] != org.phone
+
+        # State code
+        if org.state and not validate_state_code(org.state):
+            self.stdout.write(self.style.ERROR(f'  ⚠️  {org.name} has invalid state: {org.state}'))
+            self.changes['states'] += 1
+        elif org.state:
+            values['state'] = org.state.upper()
+
+        # Zip code
+        if org.zip_code and not validate_zip_code(org.zip_code):
+            self.stdout.write(self.style.ERROR(f'  ⚠️  {org.name} has invalid zip: {org.zip_code}'))
+            self.changes['zip_codes'] += 1
+        return values
+
+    def normalize_user(self, user):
+        formatted = format_phone_number(user.phone)
+        self.changes['phone_numbers'] += formatted != user.phone
+        return {'phone': formatted}
 
     def handle(self, *args, **options):
         dry_run = options['dry_run']
-        
+
         if dry_run:
             self.stdout.write(self.style.WARNING('=== DRY RUN MODE - No changes will be saved ===\n'))
         else:
             self.stdout.write(self.style.SUCCESS('=== Normalizing Data ===\n'))
-        
-        changes = {
+
+        self.changes = {
             'phone_numbers': 0,
             'states': 0,
             'zip_codes': 0,
         }
-        
-        # Normalize Judge phone numbers
-        self.stdout.write('📞 Normalizing Judge phone numbers...')
-        for judge in Judge.objects.all():
-            updated = False
-            
-            # Contact phone
-            if judge.contact_phone:
-                formatted = format_phone_number(judge.contact_phone)
-                if formatted != judge.contact_phone:
-                    self.stdout.write(f'  {judge.full_name}: {judge.contact_phone} → {formatted}')
-                    judge.contact_phone = formatted
-                    updated = True
-                    changes['phone_numbers'] += 1
-            
-            # Clerk phone
-            if judge.clerk_phone:
-                formatted = format_phone_number(judge.clerk_phone)
-                if formatted != judge.clerk_phone:
-                    self.stdout.write(f'  {judge.full_name} (clerk): {judge.clerk_phone} → {formatted}')
-                    judge.clerk_phone = formatted
-                    updated = True
-                    changes['phone_numbers'] += 1
-            
-            # Update additional_staff field to normalize phone numbers in text
-            if judge.additional_staff:
-                original = judge.additional_staff
-                # Find and replace phone numbers in the text
-                phone_pattern = r'Phone:\s*([^\n]+)'
-                matches = re.findall(phone_pattern, judge.additional_staff)
-                for match in matches:
-                    formatted = format_phone_number(match)
-                    if formatted != match:
-                        judge.additional_staff = judge.additional_staff.replace(match, formatted)
-                        updated = True
-                        changes['phone_numbers'] += 1
-            
-            if updated and not dry_run:
-                judge.save()
-        
-        # Normalize Organization data
-        self.stdout.write('\n🏢 Normalizing Organization data...')
-        for org in Organization.objects.all():
-            updated = False
-            
-            # Phone
-            if org.phone:
-                formatted = format_phone_number(org.phone)
-                if formatted != org.phone:
-                    self.stdout.write(f'  {org.name} phone: {org.phone} → {formatted}')
-                    org.phone = formatted
-                    updated = True
-                    changes['phone_numbers'] += 1
-            
-            # State code
-            if org.state and not validate_state_code(org.state):
-                self.stdout.write(self.style.ERROR(f'  ⚠️  {org.name} has invalid state: {org.state}'))
-                changes['states'] += 1
-            elif org.state:
-                org.state = org.state.upper()
-                updated = True
-            
-            # Zip code
-            if org.zip_code and not validate_zip_code(org.zip_code):
-                self.stdout.write(self.style.ERROR(f'  ⚠️  {org.name} has invalid zip: {org.zip_code}'))
-                changes['zip_codes'] += 1
-            
-            if updated and not dry_run:
-                org.save()
-        
-        # Normalize User phone numbers
-        self.stdout.write('\n👤 Normalizing User phone numbers...')
-        for user in User.objects.all():
-            if user.phone:
-                formatted = format_phone_number(user.phone)
-                if formatted != user.phone:
-                    self.stdout.write(f'  {user.email}: {user.phone} → {formatted}')
-                    user.phone = formatted
-                    changes['phone_numbers'] += 1
-                    if not dry_run:
-                        user.save()
-        
+        self.run_backfills(**options)
+
         # Summary
         self.stdout.write('\n' + '=' * 70)
         if dry_run:
             self.stdout.write(self.style.WARNING('DRY RUN COMPLETE - No changes were saved'))
         else:
             self.stdout.write(self.style.SUCCESS('NORMALIZATION COMPLETE'))
-        self.stdout.write(f'  Phone numbers formatted: {changes["phone_numbers"]}')
-        self.stdout.write(f'  Invalid state codes found: {changes["states"]}')
-        self.stdout.write(f'  Invalid zip codes found: {changes["zip_codes"]}')
+        self.stdout.write(f'  Phone numbers formatted: {self.changes["phone_numbers"]}')
+        self.stdout.write(f'  Invalid state codes found: {self.changes["states"]}')
+        self.stdout.write(f'  Invalid zip codes found: {self.changes["zip_codes"]}')
         self.stdout.write('=' * 70)
-
-
@@ -0,0 +1,84 @@
+"""
+Management command to aggregate sampling profiler output across workers.
+
+Usage:
+    python manage.py profile_report
+    python manage.py profile_report --since 1h --top 30
+    python manage.py profile_report --route api:v1:deadline-list --collapsed deadlines.folded
+
+Reads the collapsed-stack files SamplingProfilerMiddleware writes under
+PROFILER_DIR (one per profiled request, from every Gunicorn worker) and lists
+the hottest functions by self samples (time spent in the function itself)
+and inclusive samples (time with the function anywhere on the stack).
+--collapsed writes the merged stacks, rooted at the route, for flamegraph.pl
+or speedscope.
+"""
+
+import re
+from datetime import datetime, timedelta
+from pathlib import Path
+
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+from django.utils import timezone
+
+from court_rules.services.profiling import hottest_functions, read_profiles
+
+SINCE_PATTERN = re.compile(r'^(\d+)([mhd])$')
+SINCE_UNITS = {'m': 'minutes', 'h': 'hours', 'd': 'days'}
+
+
+def parse_since(value):
+    match = SINCE_PATTERN.match(value)
+    if match:
+        return timezone.now() - timedelta(**{SINCE_UNITS[match.group(2)]: int(match.group(1))})
+    try:
+        since = datetime.fromisoformat(value)
+    except ValueError:
+        raise CommandError(f'--since must be a duration like 30m, 6h or 2d, or an ISO datetime: {value!r}')
+    return since if timezone.is_aware(since) else timezone.make_aware(since)
+
+
+class Command(BaseCommand):
+    help = "Report the hottest functions across sampling profiler output from all workers."
+
+    def add_arguments(self, parser):
+        parser.add_argument('--dir', help='Profile directory (default: PROFILER_DIR)')
+        parser.add_argument('--route', help='Only this route name, e.g. api:v1:deadline-list')
+        parser.add_argument('--since', help='Only profiles newer than a duration (30m, 6h, 2d) or ISO datetime')
+        parser.add_argument('--top', type=int, default=20, help='Functions to list (default: 20)')
+        parser.add_argument('--collapsed', help='Also write the merged collapsed stacks to this file')
+
+    def handle(self, *args, **options):
+        directory = Path(options['dir'] or settings.PROFILER_DIR)
+        since = parse_since(options['since']) if options['since'] else None
+        profiles = read_profiles(directory=directory, route=options['route'], since=since)
+
+        if not profiles.files:
+            self.stdout.write(self.style.WARNING(f'No profiles found in {directory}.'))
+            return
+
+        total = profiles.samples
+        self.stdout.write(
+            f'{profiles.files} profiled request(s), {len(profiles.route_requests)} route(s), '
+            f'{total} sample(s) from {len(profiles.workers)} worker(s)'
+        )
+        self.stdout.write('\nRoutes by samples:')
+        for route, samples in profiles.route_samples.most_common(options['top']):
+            self.stdout.write(
+                f'  {samples:>8}  {samples / total:6.1%}  {route} ({profiles.route_requests[route]} request(s))'
+            )
+
+        own, inclusive = hottest_functions(profiles.stacks)
+        for title, counts in (('self', own), ('inclusive', inclusive)):
+            self.stdout.write(f'\nHottest functions ({title}):')
+            for frame, samples in counts.most_common(options['top']):
+                self.stdout.write(f'  {samples:>8}  {samples / total:6.1%}  {frame}')
+
+        if options['collapsed']:
+            output = Path(options['collapsed'])
+            output.write_text(
+                ''.join(f'{stack} {count}\n' for stack, count in profiles.stacks.most_common()),
+                encoding='utf-8',
+            )
+            self.stdout.write(self.style.SUCCESS(f'\nWrote {len(profiles.stacks)} merged stack(s) to {output}'))
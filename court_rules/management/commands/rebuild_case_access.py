@@ -0,0 +1,36 @@
+"""
+Management command to rebuild the materialized case access table.
+
+Usage:
+    python manage.py rebuild_case_access
+    python manage.py rebuild_case_access --batch-size 1000
+
+The case_access table is kept current by model signals. Run this after a
+backfill, a bulk import, or any queryset.update() that bypassed signals.
+"""
+
+from django.core.management.base import BaseCommand
+
+from court_rules.models import CaseAccess
+from court_rules.services.access import REBUILD_BATCH_SIZE, rebuild_case_access
+
+
+class Command(BaseCommand):
+    help = "Rebuild the case_access table from lead attorneys, case teams, case permissions and access grants."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--batch-size',
+            type=int,
+            default=REBUILD_BATCH_SIZE,
+            help='Number of cases recomputed per transaction',
+        )
+
+    def handle(self, *args, **options):
+        self.stdout.write(self.style.SUCCESS('Rebuilding case access table...'))
+
+        added, removed = rebuild_case_access(batch_size=options['batch_size'])
+
+        self.stdout.write(self.style.SUCCESS(f'Rows added: {added}'))
+        self.stdout.write(self.style.SUCCESS(f'Rows removed: {removed}'))
+        self.stdout.write(self.style.SUCCESS(f'Total rows: {CaseAccess.objects.count()}'))
@@ -0,0 +1,42 @@
+"""
+Management command to recompute computed deadlines after calendar changes.
+
+Usage:
+    python manage.py recompute_deadlines --calendar <uuid> --date 2026-02-03
+    python manage.py recompute_deadlines --calendar <uuid> --date 2026-02-03 --date 2026-02-04
+
+Holiday saves and deletes recompute the affected deadlines automatically.
+Run this after changing holidays in bulk (fixtures, SQL imports) or to
+replay a court closure entered outside the app.
+"""
+
+from datetime import date
+
+from django.core.management.base import BaseCommand, CommandError
+
+from court_rules.models import HolidayCalendar
+from court_rules.services.deadline_recompute import affected_deadlines, recompute_for_calendar_change
+
+
+class Command(BaseCommand):
+    help = "Recompute open deadlines whose computation window covers the given calendar days."
+
+    def add_arguments(self, parser):
+        parser.add_argument('--calendar', required=True, help='HolidayCalendar id')
+        parser.add_argument(
+            '--date',
+            dest='dates',
+            action='append',
+            required=True,
+            type=date.fromisoformat,
+            help='Changed day (YYYY-MM-DD); repeatable',
+        )
+
+    def handle(self, *args, **options):
+        if not HolidayCalendar.objects.filter(pk=options['calendar']).exists():
+            raise CommandError(f"Holiday calendar {options['calendar']} not found")
+
+        candidates = affected_deadlines(options['calendar'], options['dates']).count()
+        self.stdout.write(self.style.SUCCESS(f'Deadlines in affected windows: {candidates}'))
+        moved = recompute_for_calendar_change(options['calendar'], options['dates'])
+        self.stdout.write(self.style.SUCCESS(f'Deadlines moved: {moved}'))
@@ -0,0 +1,56 @@
+"""
+Management command to reconcile the dashboard rollup tables with their sources.
+
+Usage:
+    python manage.py reconcile_dashboard_rollups
+    python manage.py reconcile_dashboard_rollups --dry-run
+    python manage.py reconcile_dashboard_rollups --batch-size 20
+
+Rollups are kept current by model signals. Run this once before enabling
+DASHBOARD_ROLLUPS_ENABLED, and after bulk imports or queryset.update() calls
+that bypassed signals. With --dry-run the drift is reported but not fixed.
+"""
+
+from django.core.management.base import BaseCommand
+
+from court_rules.services.rollups import RECONCILE_BATCH_SIZE, reconcile_rollups
+
+
+class Command(BaseCommand):
+    help = "Recompute dashboard deadline/case rollups from the source tables and report drift."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--batch-size',
+            type=int,
+            default=RECONCILE_BATCH_SIZE,
+            help='Number of organizations reconciled per transaction',
+        )
+        parser.add_argument(
+            '--dry-run',
+            action='store_true',
+            help='Report drift without writing any changes',
+        )
+
+    def handle(self, *args, **options):
+        dry_run = options['dry_run']
+        self.stdout.write(self.style.SUCCESS(
+            'Checking dashboard rollups (dry run)...' if dry_run else 'Reconciling dashboard rollups...'
+        ))
+
+        drift = reconcile_rollups(batch_size=options['batch_size'], dry_run=dry_run)
+
+        self.stdout.write(f'Organizations checked: {drift.organizations}')
+        self.stdout.write(
+            f'Deadline rollup rows {"drifted" if dry_run else "fixed"}: {drift.deadline_rows_fixed} '
+            f'(count drift {drift.deadline_count_drift})'
+        )
+        self.stdout.write(
+            f'Case rollup rows {"drifted" if dry_run else "fixed"}: {drift.case_rows_fixed} '
+            f'(count drift {drift.case_count_drift})'
+        )
+        if drift.has_drift:
+            org_labels = ', '.join(str(org_id or 'no organization') for org_id in drift.drifted_organizations)
+            self.stdout.write(self.style.WARNING(f'Drift found in: {org_labels}'))
+        else:
+            self.stdout.write(self.style.SUCCESS('Rollups match the source tables.'))
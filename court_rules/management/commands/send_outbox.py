@@ -0,0 +1,62 @@
+"""
+Management command that delivers queued outbox emails.
+
+Usage:
+    python manage.py send_outbox
+    python manage.py send_outbox --once
+    python manage.py send_outbox --batch-size 200 --interval 2
+
+Runs until interrupted. Each batch is claimed with SELECT ... FOR UPDATE
+SKIP LOCKED and sent over a single backend connection, so several workers
+can run at once.
+"""
+
+import time
+
+from django.core.management.base import BaseCommand
+from django.db import close_old_connections
+
+from court_rules.services.outbox import DEFAULT_BATCH_SIZE, send_outbox_batch
+
+
+class Command(BaseCommand):
+    help = "Send queued emails from the outbox (safe to run in several processes)."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--batch-size',
+            type=int,
+            default=DEFAULT_BATCH_SIZE,
+            help='Emails sent per connection',
+        )
+        parser.add_argument(
+            '--interval',
+            type=float,
+            default=5.0,
+            help='Seconds to sleep when the outbox is empty',
+        )
+        parser.add_argument(
+            '--once',
+            action='store_true',
+            help='Send what is due now and exit',
+        )
+
+    def handle(self, *args, **options):
+        totals = {'claimed': 0, 'sent': 0, 'failed': 0}
+        self.stdout.write(self.style.SUCCESS('Sending outbox...'))
+        try:
+            while True:
+                result = send_outbox_batch(batch_size=options['batch_size'])
+                for key, value in result.items():
+                    totals[key] += value
+                if result['claimed']:
+                    continue
+                if options['once']:
+                    break
+                close_old_connections()
+                time.sleep(options['interval'])
+        except KeyboardInterrupt:
+            pass
+        self.stdout.write(self.style.SUCCESS(
+            f"Emails attempted: {totals['claimed']}; sent: {totals['sent']}; failed permanently: {totals['failed']}"
+        ))
@@ -0,0 +1,44 @@
+"""
+Management command to verify the stored active-seat counters on subscriptions.
+
+Usage:
+    python manage.py verify_seat_counts
+    python manage.py verify_seat_counts --repair
+
+Subscription.active_user_count is kept current by model signals. Drift can
+appear after bulk imports or queryset.update() calls on users; --repair
+resets drifted counters to the actual number of active users.
+"""
+
+from django.core.management.base import BaseCommand
+
+from court_rules.services.licensing import repair_seat_counts, seat_count_drift
+
+
+class Command(BaseCommand):
+    help = "Compare stored subscription seat counters with active users and optionally repair them."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--repair',
+            action='store_true',
+            help='Reset drifted counters to the actual active user count',
+        )
+
+    def handle(self, *args, **options):
+        drift = repair_seat_counts() if options['repair'] else seat_count_drift()
+
+        if not drift:
+            self.stdout.write(self.style.SUCCESS('All subscription seat counters match active users.'))
+            return
+
+        for subscription, actual in drift:
+            self.stdout.write(self.style.WARNING(
+                f'{subscription.organization.name}: stored {subscription.active_user_count}, actual {actual}'
+            ))
+        if options['repair']:
+            self.stdout.write(self.style.SUCCESS(f'Repaired {len(drift)} subscription(s).'))
+        else:
+            self.stdout.write(self.style.WARNING(
+                f'{len(drift)} subscription(s) drifted. Re-run with --repair to fix.'
+            ))
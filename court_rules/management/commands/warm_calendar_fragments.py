@@ -0,0 +1,51 @@
+"""
+Management command to pre-render the cached ICS event fragments.
+
+Usage:
+    python manage.py warm_calendar_fragments
+    python manage.py warm_calendar_fragments --organization <uuid>
+    python manage.py warm_calendar_fragments --since-days 30
+
+Fragments are cached per (deadline id, updated_at) on first export. Warming
+them after a deploy or cache flush keeps the first organization- and
+case-level feed requests cheap.
+"""
+
+from datetime import timedelta
+
+from django.core.management.base import BaseCommand
+from django.utils import timezone
+
+from court_rules.models import Deadline
+from court_rules.services.calendar_export import warm_event_fragments
+
+ITERATOR_CHUNK_SIZE = 500
+
+
+class Command(BaseCommand):
+    help = "Render and cache ICS event fragments for deadlines."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--organization',
+            help='Only warm deadlines of cases in this organization (id)',
+        )
+        parser.add_argument(
+            '--since-days',
+            type=int,
+            default=None,
+            help='Only warm deadlines due within the last N days or later',
+        )
+
+    def handle(self, *args, **options):
+        deadlines = Deadline.objects.all()
+        if options['organization']:
+            deadlines = deadlines.filter(case__organization_id=options['organization'])
+        if options['since_days'] is not None:
+            deadlines = deadlines.filter(due_at__gte=timezone.now() - timedelta(days=options['since_days']))
+
+        self.stdout.write(self.style.SUCCESS('Warming calendar fragments...'))
+        seen, rendered = warm_event_fragments(deadlines.order_by('id').iterator(chunk_size=ITERATOR_CHUNK_SIZE))
+
+        self.stdout.write(self.style.SUCCESS(f'Deadlines checked: {seen}'))
+        self.stdout.write(self.style.SUCCESS(f'Fragments rendered: {rendered}'))
@@ -0,0 +1,179 @@
+"""Request middleware for court_rules."""
+
+import random
+import sys
+import time
+from contextlib import ExitStack
+
+from django.conf import settings
+from django.db import connections
+from rest_framework.exceptions import APIException
+from rest_framework.request import Request
+from rest_framework.settings import api_settings
+
+from court_rules.services.audit import buffered_audit_events
+from court_rules.services.metrics import QueryCounter, observe_request
+from court_rules.services.profiling import StackSampler, write_profile
+from court_rules.services.sql_instrumentation import (
+    QueryRecorder,
+    log_slow_request,
+    server_timing,
+    slow_request_record,
+)
+
+
+class AuditBufferMiddleware:
+    """
+    Buffer the audit entries recorded while handling a request and write the
+    committed ones with a single bulk insert once the response is ready.
+    """
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+
+    def __call__(self, request):
+        with buffered_audit_events():
+            return self.get_response(request)
+
+
+class MetricsMiddleware:
+    """
+    Record every request's latency, status class and SQL query count per
+    route and DRF action for /metrics. Latency is measured until the response
+    is returned, so streamed bodies are timed to their first chunk.
+    """
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+
+    def __call__(self, request):
+        if not settings.METRICS_ENABLED:
+            return self.get_response(request)
+
+        counter = QueryCounter()
+        started = time.perf_counter()
+        with ExitStack() as stack:
+            for alias in connections:
+                stack.enter_context(connections[alias].execute_wrapper(counter))
+            response = self.get_response(request)
+        elapsed = time.perf_counter() - started
+
+        match = request.resolver_match
+        observe_request(
+            route=(match.view_name or match.route) if match else '',
+            action=getattr(request, 'metrics_action', ''),
+            method=request.method,
+            status=response.status_code,
+            seconds=elapsed,
+            queries=counter.queries,
+        )
+        return response
+
+    def process_view(self, request, view_func, view_args, view_kwargs):
+        # Router-generated viewset views map HTTP methods to actions.
+        actions = getattr(view_func, 'actions', None) or {}
+        request.metrics_action = actions.get(request.method.lower(), '')
+
+
+class SqlInstrumentationMiddleware:
+    """
+    Count the SQL queries and SQL time of a sampled fraction of requests
+    (SQL_INSTRUMENTATION_SAMPLE_RATE; 0 turns it off), report them in a
+    Server-Timing header, and log slow, query-heavy or N+1 requests with
+    their worst query templates. Unsampled requests pay one random() call.
+    The running recorder is available to the view as ``request.sql_recorder``.
+
+    Streaming responses (the ICS exports) run most of their queries while
+    the body is iterated, after this middleware has returned and after the
+    headers are sent, so they get neither a Server-Timing header nor a log
+    entry.
+    """
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+
+    def __call__(self, request):
+        rate = settings.SQL_INSTRUMENTATION_SAMPLE_RATE
+        if rate <= 0 or (rate < 1 and random.random() >= rate):
+            return self.get_response(request)
+
+        recorder = request.sql_recorder = QueryRecorder()
+        started = time.perf_counter()
+        with ExitStack() as stack:
+            for alias in connections:
+                stack.enter_context(connections[alias].execute_wrapper(recorder))
+            response = self.get_response(request)
+        elapsed = time.perf_counter() - started
+
+        if response.streaming:
+            return response
+        response['Server-Timing'] = server_timing(recorder, elapsed)
+        threshold = settings.SQL_REPEATED_QUERY_THRESHOLD
+        if (
+            elapsed * 1000 >= settings.SQL_SLOW_REQUEST_MS
+            or recorder.queries >= settings.SQL_SLOW_REQUEST_QUERIES
+            or recorder.repeated(threshold)
+        ):
+            match = request.resolver_match
+            log_slow_request(slow_request_record(
+                recorder,
+                method=request.method,
+                path=request.path,
+                route=(match.view_name or match.route) if match else '',
+                status=response.status_code,
+                total_seconds=elapsed,
+                repeat_threshold=threshold,
+            ))
+        return response
+
+
+class SamplingProfilerMiddleware:
+    """
+    Sample the Python stack of a fraction of requests (PROFILER_SAMPLE_RATE)
+    and of requests from staff users that send the PROFILER_HEADER header,
+    and write each one as a collapsed-stack file under PROFILER_DIR/<route>/.
+    The header is only honoured once the request authenticates as staff, so
+    it must sit after AuthenticationMiddleware; other clients sending it are
+    served without the sampler.
+    """
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+
+    def __call__(self, request):
+        rate = settings.PROFILER_SAMPLE_RATE
+        sampled = rate > 0 and (rate >= 1 or random.random() < rate)
+        if not sampled:
+            header = settings.PROFILER_HEADER
+            if not (header and header in request.headers and self._is_staff(self._authenticate(request))):
+                return self.get_response(request)
+
+        with StackSampler(interval=settings.PROFILER_INTERVAL_MS / 1000, root=sys._getframe()) as sampler:
+            response = self.get_response(request)
+
+        match = request.resolver_match
+        write_profile((match.view_name or match.route) if match else '', sampler.stacks)
+        return response
+
+    @staticmethod
+    def _authenticate(request):
+        """
+        The user the API authenticators resolve for ``request``, without
+        touching request.user. The view authenticates again on its own, so
+        a header request pays for one extra token lookup.
+        """
+        drf_request = Request(request)
+        for authenticator_class in api_settings.DEFAULT_AUTHENTICATION_CLASSES:
+            try:
+                result = authenticator_class().authenticate(drf_request)
+            except APIException:
+                return None
+            if result is not None:
+                return result[0]
+        return None
+
+    @staticmethod
+    def _is_staff(user) -> bool:
+        if user is None or not user.is_authenticated:
+            return False
+        return user.is_staff or user.is_super_admin()
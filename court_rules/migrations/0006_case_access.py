@@ -0,0 +1,29 @@
+# Generated by Django 5.2.6 on 2026-10-18 01:13
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('court_rules', '0005_add_chamber_staff_fields'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='CaseAccess',
+            fields=[
+                ('id', models.BigAutoField(primary_key=True, serialize=False)),
+                ('capability', models.CharField(choices=[('view', 'View'), ('edit', 'Edit'), ('manage_deadlines', 'Manage Deadlines'), ('manage_filings', 'Manage Filings')], max_length=32)),
+                ('case', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='access_entries', to='court_rules.case')),
+                ('user', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='case_access', to=settings.AUTH_USER_MODEL)),
+            ],
+            options={
+                'db_table': 'case_access',
+                'indexes': [models.Index(fields=['user', 'capability', 'case'], name='idx_case_access_user_cap')],
+                'constraints': [models.UniqueConstraint(fields=('user', 'case', 'capability'), name='unique_case_access')],
+            },
+        ),
+    ]
@@ -0,0 +1,51 @@
+# Generated by Django 5.2.6 on 2026-10-18 01:17
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('court_rules', '0006_case_access'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='CaseRollup',
+            fields=[
+                ('id', models.BigAutoField(primary_key=True, serialize=False)),
+                ('day', models.DateField()),
+                ('status', models.CharField(choices=[('open', 'Open'), ('stayed', 'Stayed'), ('closed', 'Closed'), ('appeal', 'Appeal'), ('other', 'Other')], max_length=16)),
+                ('case_count', models.IntegerField(default=0)),
+                ('court', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.CASCADE, related_name='case_rollups', to='court_rules.court')),
+                ('organization', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.CASCADE, related_name='case_rollups', to='court_rules.organization')),
+                ('owner', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.CASCADE, related_name='case_rollups', to=settings.AUTH_USER_MODEL)),
+            ],
+            options={
+                'db_table': 'dashboard_case_rollups',
+                'indexes': [models.Index(fields=['organization', 'day'], name='idx_case_rollup_org_day')],
+                'constraints': [models.UniqueConstraint(fields=('organization', 'owner', 'day', 'status', 'court'), name='unique_case_rollup', nulls_distinct=False)],
+            },
+        ),
+        migrations.CreateModel(
+            name='DeadlineRollup',
+            fields=[
+                ('id', models.BigAutoField(primary_key=True, serialize=False)),
+                ('day', models.DateField()),
+                ('open_count', models.IntegerField(default=0)),
+                ('snoozed_count', models.IntegerField(default=0)),
+                ('done_count', models.IntegerField(default=0)),
+                ('missed_count', models.IntegerField(default=0)),
+                ('created_count', models.IntegerField(default=0)),
+                ('organization', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.CASCADE, related_name='deadline_rollups', to='court_rules.organization')),
+                ('owner', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.CASCADE, related_name='deadline_rollups', to=settings.AUTH_USER_MODEL)),
+            ],
+            options={
+                'db_table': 'dashboard_deadline_rollups',
+                'indexes': [models.Index(fields=['organization', 'day'], name='idx_dl_rollup_org_day')],
+                'constraints': [models.UniqueConstraint(fields=('organization', 'owner', 'day'), name='unique_deadline_rollup', nulls_distinct=False)],
+            },
+        ),
+    ]
@@ -0,0 +1,36 @@
+# Generated by Django 5.2.6 on 2026-10-18 01:20
+
+from django.db import migrations, models
+from django.db.models import Count, IntegerField, OuterRef, Subquery, Value
+from django.db.models.functions import Coalesce
+
+
+def populate_active_user_count(apps, schema_editor):
+    Subscription = apps.get_model('court_rules', 'Subscription')
+    User = apps.get_model('court_rules', 'User')
+    counts = (
+        User.objects.filter(organization_id=OuterRef('organization_id'), is_active=True)
+        .order_by()
+        .values('organization_id')
+        .annotate(count=Count('id'))
+        .values('count')
+    )
+    Subscription.objects.update(
+        active_user_count=Coalesce(Subquery(counts, output_field=IntegerField()), Value(0))
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('court_rules', '0007_dashboard_rollups'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='subscription',
+            name='active_user_count',
+            field=models.PositiveIntegerField(default=0, help_text='Active users in the organization, maintained by court_rules.services.licensing'),
+        ),
+        migrations.RunPython(populate_active_user_count, migrations.RunPython.noop),
+    ]
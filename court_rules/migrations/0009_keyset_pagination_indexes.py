@@ -0,0 +1,25 @@
+# Generated by Django 5.2.6 on 2026-10-18 01:23
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('court_rules', '0008_subscription_active_user_count'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='auditlog',
+            index=models.Index(fields=['-created_at', 'id'], name='idx_audit_created_keyset'),
+        ),
+        migrations.AddIndex(
+            model_name='case',
+            index=models.Index(fields=['-filing_date', 'caption', 'id'], name='idx_case_filing_keyset'),
+        ),
+        migrations.AddIndex(
+            model_name='deadline',
+            index=models.Index(fields=['due_at', 'id'], name='idx_deadline_due_keyset'),
+        ),
+    ]
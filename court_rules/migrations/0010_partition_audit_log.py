@@ -0,0 +1,98 @@
+# Generated by Django 5.2.6 on 2026-10-18 02:10
+
+from datetime import date
+
+import django.contrib.postgres.indexes
+from django.db import migrations
+
+PARTITIONS_AHEAD = 3
+
+
+def _add_months(month, count):
+    index = month.year * 12 + month.month - 1 + count
+    return date(index // 12, index % 12 + 1, 1)
+
+
+def _swap_table(schema_editor, *, partitioned):
+    """
+    Rebuild audit_log as a partitioned (or plain) table with the same columns,
+    indexes and foreign keys, copying the rows across.
+    """
+    if schema_editor.connection.vendor != 'postgresql':
+        return
+    with schema_editor.connection.cursor() as cursor:
+        cursor.execute(
+            "SELECT indexname, indexdef FROM pg_indexes WHERE tablename = 'audit_log' "
+            "AND indexname NOT IN (SELECT conname FROM pg_constraint WHERE conrelid = 'audit_log'::regclass)"
+        )
+        indexes = cursor.fetchall()
+        cursor.execute(
+            "SELECT conname, pg_get_constraintdef(oid) FROM pg_constraint "
+            "WHERE conrelid = 'audit_log'::regclass AND contype = 'f'"
+        )
+        foreign_keys = cursor.fetchall()
+        cursor.execute('SELECT MIN(created_at) FROM audit_log')
+        oldest = cursor.fetchone()[0]
+
+        cursor.execute('ALTER TABLE audit_log RENAME TO audit_log_previous')
+        for name, _ in indexes:
+            cursor.execute(f'DROP INDEX {name}')
+        for name, _ in foreign_keys:
+            cursor.execute(f'ALTER TABLE audit_log_previous DROP CONSTRAINT {name}')
+        cursor.execute(
+            "SELECT conname FROM pg_constraint WHERE conrelid = 'audit_log_previous'::regclass AND contype = 'p'"
+        )
+        cursor.execute(f'ALTER TABLE audit_log_previous DROP CONSTRAINT {cursor.fetchone()[0]}')
+
+        if partitioned:
+            cursor.execute(
+                'CREATE TABLE audit_log (LIKE audit_log_previous INCLUDING DEFAULTS) PARTITION BY RANGE (created_at)'
+            )
+            # The partition key has to be part of the primary key.
+            cursor.execute('ALTER TABLE audit_log ADD CONSTRAINT audit_log_pkey PRIMARY KEY (id, created_at)')
+            cursor.execute('CREATE TABLE audit_log_default PARTITION OF audit_log DEFAULT')
+            month = date.today().replace(day=1)
+            if oldest:
+                month = min(month, oldest.date().replace(day=1))
+            last = _add_months(date.today().replace(day=1), PARTITIONS_AHEAD)
+            while month <= last:
+                upper = _add_months(month, 1)
+                cursor.execute(
+                    f'CREATE TABLE audit_log_p{month.year:04d}_{month.month:02d} PARTITION OF audit_log '
+                    'FOR VALUES FROM (%s) TO (%s)',
+                    [f'{month} 00:00:00+00', f'{upper} 00:00:00+00'],
+                )
+                month = upper
+        else:
+            cursor.execute('CREATE TABLE audit_log (LIKE audit_log_previous INCLUDING DEFAULTS)')
+            cursor.execute('ALTER TABLE audit_log ADD CONSTRAINT audit_log_pkey PRIMARY KEY (id)')
+
+        for name, definition in foreign_keys:
+            cursor.execute(f'ALTER TABLE audit_log ADD CONSTRAINT {name} {definition}')
+        for _, definition in indexes:
+            cursor.execute(definition)
+        cursor.execute('INSERT INTO audit_log SELECT * FROM audit_log_previous')
+        cursor.execute('DROP TABLE audit_log_previous')
+
+
+def partition_audit_log(apps, schema_editor):
+    _swap_table(schema_editor, partitioned=True)
+
+
+def unpartition_audit_log(apps, schema_editor):
+    _swap_table(schema_editor, partitioned=False)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('court_rules', '0009_keyset_pagination_indexes'),
+    ]
+
+    operations = [
+        migrations.RunPython(partition_audit_log, unpartition_audit_log),
+        migrations.AddIndex(
+            model_name='auditlog',
+            index=django.contrib.postgres.indexes.BrinIndex(fields=['created_at'], name='idx_audit_created_brin'),
+        ),
+    ]
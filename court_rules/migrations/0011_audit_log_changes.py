@@ -0,0 +1,49 @@
+# Generated by Django 5.2.6 on 2026-10-18 02:40
+
+import django.contrib.postgres.indexes
+from django.db import migrations, models
+
+BATCH_SIZE = 2000
+
+
+def populate_changes(apps, schema_editor):
+    AuditLog = apps.get_model('court_rules', 'AuditLog')
+    batch = []
+    for entry in AuditLog.objects.filter(changes__isnull=True).only('id', 'before', 'after').iterator(chunk_size=BATCH_SIZE):
+        before, after = entry.before or {}, entry.after or {}
+        entry.changes = {
+            key: [before.get(key), after.get(key)]
+            for key in sorted(before.keys() | after.keys())
+            if before.get(key) != after.get(key)
+        } or None
+        if entry.changes:
+            batch.append(entry)
+        if len(batch) >= BATCH_SIZE:
+            AuditLog.objects.bulk_update(batch, ['changes'])
+            batch = []
+    if batch:
+        AuditLog.objects.bulk_update(batch, ['changes'])
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('court_rules', '0010_partition_audit_log'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='auditlog',
+            name='changes',
+            field=models.JSONField(blank=True, help_text='Changed fields only: {field: [old, new]}', null=True),
+        ),
+        migrations.RunPython(populate_changes, migrations.RunPython.noop),
+        migrations.AddIndex(
+            model_name='auditlog',
+            index=django.contrib.postgres.indexes.GinIndex(fields=['changes'], name='idx_audit_changes_gin'),
+        ),
+        migrations.AddIndex(
+            model_name='auditlog',
+            index=models.Index(fields=['actor_user', '-created_at'], name='idx_audit_actor_created'),
+        ),
+    ]
@@ -0,0 +1,27 @@
+# Generated by Django 5.2.6 on 2026-10-18 01:35
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('court_rules', '0011_audit_log_changes'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='deadline',
+            name='offset_days',
+            field=models.IntegerField(blank=True, help_text='Period length in days of the basis; negative runs backwards', null=True),
+        ),
+        migrations.AddField(
+            model_name='deadline',
+            name='trigger_date',
+            field=models.DateField(blank=True, help_text='Date of the triggering event the period runs from', null=True),
+        ),
+        migrations.AddIndex(
+            model_name='deadline',
+            index=models.Index(fields=['holiday_calendar', 'trigger_date', 'due_at'], name='idx_deadline_calendar_window'),
+        ),
+    ]
@@ -0,0 +1,17 @@
+# Generated by Django 5.2.6 on 2026-10-18 01:38
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('court_rules', '0012_deadline_computation_inputs'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='deadlinereminder',
+            index=models.Index(condition=models.Q(('sent', False)), fields=['notify_at'], name='idx_deadline_reminder_pending'),
+        ),
+    ]
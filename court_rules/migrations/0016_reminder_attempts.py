@@ -0,0 +1,28 @@
+# Generated by Django 5.2.6 on 2026-10-18 02:26
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('court_rules', '0015_backfill_checkpoints'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='deadlinereminder',
+            name='attempts',
+            field=models.PositiveSmallIntegerField(default=0),
+        ),
+        migrations.AddField(
+            model_name='deadlinereminder',
+            name='last_error',
+            field=models.TextField(blank=True),
+        ),
+        migrations.AddField(
+            model_name='deadlinereminder',
+            name='next_attempt_at',
+            field=models.DateTimeField(blank=True, null=True),
+        ),
+    ]
@@ -1,9 +1,11 @@
 import uuid
 from django.contrib.auth.base_user import AbstractBaseUser, BaseUserManager
 from django.contrib.auth.models import PermissionsMixin
+from django.contrib.postgres.indexes import BrinIndex, GinIndex
 from django.core.validators import MinValueValidator, MaxValueValidator
 from django.db import models
 from django.db.models import Q
+from django.utils import timezone
 
 
 class UserManager(BaseUserManager):
@@ -372,6 +374,7 @@ class Case(UUIDModel):
             models.Index(fields=["organization", "status"], name="idx_case_org_status"),
             models.Index(fields=["case_number"], name="idx_case_case_number"),
             models.Index(fields=["court", "status"], name="idx_case_court_status"),
+            models.Index(fields=["-filing_date", "caption", "id"], name="idx_case_filing_keyset"),
         ]
 
     def __str__(self):
@@ -575,6 +578,38 @@ class CasePermission(UUIDModel):
         return f"Permissions for {self.user} on {self.case}"
 
 
+class CaseCapability(models.TextChoices):
+    VIEW = "view", "View"
+    EDIT = "edit", "Edit"
+    MANAGE_DEADLINES = "manage_deadlines", "Manage Deadlines"
+    MANAGE_FILINGS = "manage_filings", "Manage Filings"
+
+
+class CaseAccess(models.Model):
+    """
+    Materialized case access control list.
+    One row per (user, case, capability), derived from Case.lead_attorney,
+    CaseTeam, CasePermission and UserAccessGrant. Maintained by
+    court_rules.services.access; never edit rows by hand.
+    """
+    id = models.BigAutoField(primary_key=True)
+    user = models.ForeignKey(User, on_delete=models.CASCADE, related_name="case_access")
+    case = models.ForeignKey(Case, on_delete=models.CASCADE, related_name="access_entries")
+    capability = models.CharField(max_length=32, choices=CaseCapability.choices)
+
+    class Meta:
+        db_table = "case_access"
+        constraints = [
+            models.UniqueConstraint(fields=["user", "case", "capability"], name="unique_case_access"),
+        ]
+        indexes = [
+            models.Index(fields=["user", "capability", "case"], name="idx_case_access_user_cap"),
+        ]
+
+    def __str__(self):
+        return f"{self.user} can {self.capability} {self.case}"
+
+
 class DocumentSource(models.TextChoices):
     UPLOAD = "upload", "Upload"
     PACER = "pacer", "PACER"
@@ -704,6 +739,8 @@ class Deadline(UUIDModel):
     trigger_source_id = models.UUIDField(null=True, blank=True)
     basis = models.CharField(max_length=32, choices=DeadlineBasis.choices, default=DeadlineBasis.CALENDAR_DAYS)
     holiday_calendar = models.ForeignKey(HolidayCalendar, on_delete=models.SET_NULL, null=True, blank=True, related_name="deadlines")
+    trigger_date = models.DateField(null=True, blank=True, help_text="Date of the triggering event the period runs from")
+    offset_days = models.IntegerField(null=True, blank=True, help_text="Period length in days of the basis; negative runs backwards")
     due_at = models.DateTimeField()
     timezone = models.CharField(max_length=64)
     owner = models.ForeignKey(User, on_delete=models.SET_NULL, null=True, blank=True, related_name="owned_deadlines")
@@ -722,6 +759,8 @@ class Deadline(UUIDModel):
         db_table = "deadlines"
         indexes = [
             models.Index(fields=["case", "due_at"], name="idx_deadline_case_due"),
+            models.Index(fields=["due_at", "id"], name="idx_deadline_due_keyset"),
+            models.Index(fields=["holiday_calendar", "trigger_date", "due_at"], name="idx_deadline_calendar_window"),
         ]
         ordering = ["due_at"]
 
@@ -740,13 +779,22 @@ class DeadlineReminder(UUIDModel):
     deadline = models.ForeignKey(Deadline, on_delete=models.CASCADE, related_name="reminders")
     notify_at = models.DateTimeField()
     channel = models.CharField(max_length=16, choices=ReminderChannel.choices)
+    # ``sent`` means the dispatcher is done with the reminder: delivered
+    # (sent_at is set) or given up after REMINDER_MAX_ATTEMPTS failures.
     sent = models.BooleanField(default=False)
     sent_at = models.DateTimeField(null=True, blank=True)
+    attempts = models.PositiveSmallIntegerField(default=0)
+    last_error = models.TextField(blank=True)
+    # Not claimed before this time: set while a dispatcher delivers the
+    # reminder and as the backoff after a failed attempt.
+    next_attempt_at = models.DateTimeField(null=True, blank=True)
 
     class Meta:
         db_table = "deadline_reminders"
         indexes = [
             models.Index(fields=["notify_at", "sent"], name="idx_deadline_reminder_status"),
+            # Serves the dispatcher's claim query; sent rows drop out of it.
+            models.Index(fields=["notify_at"], condition=Q(sent=False), name="idx_deadline_reminder_pending"),
         ]
         ordering = ["notify_at"]
 
@@ -1005,6 +1053,42 @@ class NotificationLog(UUIDModel):
         return f"Notification via {self.channel} to {self.user}"
 
 
+class OutboundEmail(UUIDModel):
+    """
+    Email queued by court_rules.utils.email and delivered by the send_outbox
+    worker. The body is rendered from ``template_name`` and ``context`` at
+    send time, or taken from ``body`` when there is no template.
+    """
+
+    user = models.ForeignKey(User, on_delete=models.SET_NULL, null=True, blank=True, related_name="outbound_emails")
+    to = models.JSONField(default=list)
+    from_email = models.CharField(max_length=255)
+    subject = models.CharField(max_length=255)
+    template_name = models.CharField(max_length=255, blank=True)
+    context = models.JSONField(default=dict, blank=True)
+    body = models.TextField(blank=True)
+    status = models.CharField(max_length=16, choices=NotificationStatus.choices, default=NotificationStatus.QUEUED)
+    attempts = models.PositiveSmallIntegerField(default=0)
+    last_error = models.TextField(blank=True)
+    available_at = models.DateTimeField(default=timezone.now)
+    created_at = models.DateTimeField(auto_now_add=True)
+    sent_at = models.DateTimeField(null=True, blank=True)
+
+    class Meta:
+        db_table = "email_outbox"
+        indexes = [
+            models.Index(
+                fields=["available_at"],
+                condition=Q(status="queued"),
+                name="idx_email_outbox_queued",
+            ),
+        ]
+        ordering = ["created_at"]
+
+    def __str__(self):
+        return f"{self.subject} to {', '.join(self.to)}"
+
+
 class AuditAction(models.TextChoices):
     CREATE = "create", "Create"
     UPDATE = "update", "Update"
@@ -1013,18 +1097,28 @@ class AuditAction(models.TextChoices):
 
 
 class AuditLog(UUIDModel):
+    """
+    Append-only change history. On Postgres the table is range-partitioned by
+    month on created_at; see court_rules.services.audit_archive.
+    """
+
     actor_user = models.ForeignKey(User, on_delete=models.SET_NULL, null=True, blank=True, related_name="audit_events")
     entity_table = models.CharField(max_length=255)
     entity_id = models.UUIDField()
     action = models.CharField(max_length=32, choices=AuditAction.choices)
     before = models.JSONField(null=True, blank=True)
     after = models.JSONField(null=True, blank=True)
+    changes = models.JSONField(null=True, blank=True, help_text="Changed fields only: {field: [old, new]}")
     created_at = models.DateTimeField(auto_now_add=True)
 
     class Meta:
         db_table = "audit_log"
         indexes = [
             models.Index(fields=["entity_table", "entity_id"], name="idx_audit_entity"),
+            models.Index(fields=["-created_at", "id"], name="idx_audit_created_keyset"),
+            BrinIndex(fields=["created_at"], name="idx_audit_created_brin"),
+            GinIndex(fields=["changes"], name="idx_audit_changes_gin"),
+            models.Index(fields=["actor_user", "-created_at"], name="idx_audit_actor_created"),
         ]
         ordering = ["-created_at"]
 
@@ -1032,6 +1126,70 @@ class AuditLog(UUIDModel):
         return f"{self.action} {self.entity_table}:{self.entity_id}"
 
 
+class DeadlineRollup(models.Model):
+    """
+    Per organization/owner/day deadline counters for the dashboard.
+    Status counters are bucketed by due date; created_count by creation date.
+    Maintained by court_rules.services.rollups.
+    """
+    id = models.BigAutoField(primary_key=True)
+    organization = models.ForeignKey(Organization, on_delete=models.CASCADE, null=True, blank=True, related_name="deadline_rollups")
+    owner = models.ForeignKey(User, on_delete=models.CASCADE, null=True, blank=True, related_name="deadline_rollups")
+    day = models.DateField()
+    open_count = models.IntegerField(default=0)
+    snoozed_count = models.IntegerField(default=0)
+    done_count = models.IntegerField(default=0)
+    missed_count = models.IntegerField(default=0)
+    created_count = models.IntegerField(default=0)
+
+    class Meta:
+        db_table = "dashboard_deadline_rollups"
+        constraints = [
+            models.UniqueConstraint(
+                fields=["organization", "owner", "day"],
+                name="unique_deadline_rollup",
+                nulls_distinct=False,
+            ),
+        ]
+        indexes = [
+            models.Index(fields=["organization", "day"], name="idx_dl_rollup_org_day"),
+        ]
+
+    def __str__(self):
+        return f"Deadline rollup {self.organization_id}/{self.owner_id} on {self.day}"
+
+
+class CaseRollup(models.Model):
+    """
+    Per organization/owner/day case counters split by status and court.
+    Cases are bucketed by creation date; owner is the lead attorney.
+    Maintained by court_rules.services.rollups.
+    """
+    id = models.BigAutoField(primary_key=True)
+    organization = models.ForeignKey(Organization, on_delete=models.CASCADE, null=True, blank=True, related_name="case_rollups")
+    owner = models.ForeignKey(User, on_delete=models.CASCADE, null=True, blank=True, related_name="case_rollups")
+    day = models.DateField()
+    status = models.CharField(max_length=16, choices=CaseStatus.choices)
+    court = models.ForeignKey(Court, on_delete=models.CASCADE, null=True, blank=True, related_name="case_rollups")
+    case_count = models.IntegerField(default=0)
+
+    class Meta:
+        db_table = "dashboard_case_rollups"
+        constraints = [
+            models.UniqueConstraint(
+                fields=["organization", "owner", "day", "status", "court"],
+                name="unique_case_rollup",
+                nulls_distinct=False,
+            ),
+        ]
+        indexes = [
+            models.Index(fields=["organization", "day"], name="idx_case_rollup_org_day"),
+        ]
+
+    def __str__(self):
+        return f"Case rollup {self.organization_id}/{self.owner_id} on {self.day} ({self.status})"
+
+
 class RetrievalRun(UUIDModel):
     case = models.ForeignKey(Case, on_delete=models.SET_NULL, null=True, blank=True, related_name="retrieval_runs")
     query = models.TextField()
@@ -1050,6 +1208,28 @@ class RetrievalRun(UUIDModel):
         return f"Retrieval run for {self.case or 'global'}"
 
 
+class BackfillCheckpoint(models.Model):
+    """
+    Progress of one backfill pass (see court_rules.services.backfill): the
+    last primary key written, saved in the same transaction as each chunk.
+    """
+
+    name = models.CharField(max_length=255, primary_key=True)
+    last_pk = models.CharField(max_length=255, blank=True)
+    processed = models.PositiveIntegerField(default=0)
+    changed = models.PositiveIntegerField(default=0)
+    started_at = models.DateTimeField(default=timezone.now)
+    updated_at = models.DateTimeField(auto_now=True)
+    completed_at = models.DateTimeField(null=True, blank=True)
+
+    class Meta:
+        db_table = "backfill_checkpoints"
+
+    def __str__(self):
+        state = "complete" if self.completed_at else f"after {self.last_pk or 'start'}"
+        return f"{self.name} ({state})"
+
+
 # =============================================================================
 # Subscription Management Models
 # =============================================================================
@@ -1115,6 +1295,10 @@ class Subscription(UUIDModel):
         default=SubscriptionStatus.ACTIVE
     )
     notes = models.TextField(blank=True, help_text="Internal notes about subscription")
+    active_user_count = models.PositiveIntegerField(
+        default=0,
+        help_text="Active users in the organization, maintained by court_rules.services.licensing"
+    )
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
 
@@ -1128,9 +1312,22 @@ class Subscription(UUIDModel):
     def __str__(self):
         return f"Subscription: {self.organization.name} ({self.licensed_users} users)"
 
+    def save(self, **kwargs):
+        """
+        Never write active_user_count back on update. The user signals keep it
+        current with F() updates, and this instance may have been loaded before
+        the latest of them.
+        """
+        if not self._state.adding and not kwargs.get('force_insert'):
+            update_fields = kwargs.get('update_fields')
+            if update_fields is None:
+                update_fields = [field.name for field in self._meta.concrete_fields if not field.primary_key]
+            kwargs['update_fields'] = [name for name in update_fields if name != 'active_user_count']
+        super().save(**kwargs)
+
     def get_active_user_count(self):
-        """Get count of active users in the organization."""
-        return self.organization.users.filter(is_active=True).count()
+        """Get count of active users in the organization (stored counter)."""
+        return self.active_user_count
 
     def is_at_user_limit(self):
         """Check if organization is at or over user limit."""
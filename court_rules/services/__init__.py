@@ -1,8 +1,52 @@
 """Service layer helpers for the court_rules app."""
 
-from .audit import format_deadline_snapshot, record_audit_event
+from .access import (
+    rebuild_case_access,
+    refresh_case_access,
+    refresh_user_access,
+    scope_cases,
+    scope_deadlines,
+)
+from .audit import (
+    buffered_audit_events,
+    flush_audit_events,
+    format_deadline_snapshot,
+    record_audit_event,
+)
+from .audit_archive import archive_audit_partition, ensure_audit_partitions, restore_audit_partition
+from .billing import billing_dashboard_snapshot, build_billing_dashboard
+from .business_days import add_business_days, compile_calendar, count_court_days, roll_forward
+from .dashboard import build_dashboard_metrics
+from .deadline_recompute import recompute_deadlines, recompute_for_calendar_change
+from .licensing import lock_subscription, repair_seat_counts, seat_count_drift
+from .reminders import dispatch_due_reminders
+from .rollups import reconcile_rollups
 
 __all__ = [
+    'add_business_days',
+    'archive_audit_partition',
+    'billing_dashboard_snapshot',
+    'build_billing_dashboard',
+    'buffered_audit_events',
+    'build_dashboard_metrics',
+    'compile_calendar',
+    'count_court_days',
+    'dispatch_due_reminders',
+    'ensure_audit_partitions',
+    'flush_audit_events',
     'format_deadline_snapshot',
+    'lock_subscription',
+    'rebuild_case_access',
+    'recompute_deadlines',
+    'recompute_for_calendar_change',
+    'reconcile_rollups',
     'record_audit_event',
+    'refresh_case_access',
+    'refresh_user_access',
+    'repair_seat_counts',
+    'restore_audit_partition',
+    'roll_forward',
+    'scope_cases',
+    'scope_deadlines',
+    'seat_count_drift',
 ]
@@ -0,0 +1,209 @@
+from __future__ import annotations
+
+from typing import Iterable, Optional
+
+from django.db import transaction
+from django.db.models import Q, QuerySet
+
+from court_rules.models import (
+    Case,
+    CaseAccess,
+    CaseCapability,
+    CasePermission,
+    CaseTeam,
+    CaseTeamRole,
+    Deadline,
+    User,
+    UserAccessGrant,
+    UserRole,
+)
+
+ALL_CAPABILITIES = tuple(CaseCapability.values)
+
+TEAM_ROLE_CAPABILITIES = {
+    CaseTeamRole.OWNER: ALL_CAPABILITIES,
+    CaseTeamRole.CONTRIBUTOR: (
+        CaseCapability.VIEW,
+        CaseCapability.EDIT,
+        CaseCapability.MANAGE_DEADLINES,
+    ),
+    CaseTeamRole.REVIEWER: (CaseCapability.VIEW,),
+}
+
+PERMISSION_FLAG_CAPABILITIES = {
+    'can_view': CaseCapability.VIEW,
+    'can_edit': CaseCapability.EDIT,
+    'can_manage_deadlines': CaseCapability.MANAGE_DEADLINES,
+    'can_manage_filings': CaseCapability.MANAGE_FILINGS,
+}
+
+REBUILD_BATCH_SIZE = 500
+
+
+def accessible_case_ids(user: User, capability: str = CaseCapability.VIEW) -> QuerySet:
+    """Return a subquery of case ids the user holds ``capability`` on."""
+
+    return CaseAccess.objects.filter(user=user, capability=capability).values('case_id')
+
+
+def scope_cases(user: User, queryset: Optional[QuerySet] = None) -> QuerySet:
+    """
+    Restrict a Case queryset to what the user may see.
+    - Super Admins see all cases
+    - Site Admins see all cases in their organization
+    - Other users see cases listed for them in the case_access table
+    """
+    if queryset is None:
+        queryset = Case.objects.all()
+
+    if user.role == UserRole.SUPER_ADMIN:
+        return queryset
+    if user.role == UserRole.FIRM_ADMIN:
+        return queryset.filter(organization=user.organization)
+    return queryset.filter(id__in=accessible_case_ids(user))
+
+
+def scope_deadlines(user: User, queryset: Optional[QuerySet] = None) -> QuerySet:
+    """
+    Restrict a Deadline queryset to what the user may see.
+    - Super Admins see all deadlines
+    - Site Admins see all deadlines in their organization
+    - Other users see deadlines on cases they can view, and deadlines owned by
+      themselves or by users who granted them access
+    """
+    if queryset is None:
+        queryset = Deadline.objects.all()
+
+    if user.role == UserRole.SUPER_ADMIN:
+        return queryset
+    if user.role == UserRole.FIRM_ADMIN:
+        return queryset.filter(case__organization=user.organization)
+    grantor_ids = UserAccessGrant.objects.filter(granted_to=user, is_active=True).values('can_access_user_id')
+    return queryset.filter(
+        Q(case_id__in=accessible_case_ids(user))
+        | (Q(owner=user) | Q(owner_id__in=grantor_ids)) & Q(case__organization=user.organization)
+    )
+
+
+def _desired_rows(case_ids: Iterable) -> set[tuple]:
+    """Compute the (user_id, case_id, capability) rows implied for the given cases."""
+
+    cases = {
+        row['id']: row
+        for row in Case.objects.filter(id__in=list(case_ids)).values('id', 'organization_id', 'lead_attorney_id')
+    }
+    if not cases:
+        return set()
+
+    candidates: set[tuple] = set()
+    cases_by_lead: dict = {}
+    for case in cases.values():
+        if case['lead_attorney_id']:
+            cases_by_lead.setdefault(case['lead_attorney_id'], []).append(case['id'])
+            for capability in ALL_CAPABILITIES:
+                candidates.add((case['lead_attorney_id'], case['id'], capability))
+
+    grants = UserAccessGrant.objects.filter(
+        is_active=True,
+        can_access_user_id__in=list(cases_by_lead),
+    ).values_list('granted_to_id', 'can_access_user_id')
+    for granted_to_id, lead_id in grants:
+        for case_id in cases_by_lead[lead_id]:
+            candidates.add((granted_to_id, case_id, CaseCapability.VIEW))
+
+    for user_id, case_id, role in CaseTeam.objects.filter(case_id__in=list(cases)).values_list('user_id', 'case_id', 'role'):
+        for capability in TEAM_ROLE_CAPABILITIES.get(role, ()):
+            candidates.add((user_id, case_id, capability))
+
+    permission_flags = list(PERMISSION_FLAG_CAPABILITIES)
+    for row in CasePermission.objects.filter(case_id__in=list(cases)).values('user_id', 'case_id', *permission_flags):
+        for flag, capability in PERMISSION_FLAG_CAPABILITIES.items():
+            if row[flag]:
+                candidates.add((row['user_id'], row['case_id'], capability))
+
+    # Access never crosses organizations and inactive users hold nothing.
+    user_orgs = dict(
+        User.objects.filter(
+            id__in={user_id for user_id, _, _ in candidates},
+            is_active=True,
+        ).values_list('id', 'organization_id')
+    )
+    return {
+        (user_id, case_id, capability)
+        for user_id, case_id, capability in candidates
+        if user_id in user_orgs and user_orgs[user_id] == cases[case_id]['organization_id']
+    }
+
+
+def _apply(desired: set[tuple], existing_qs: QuerySet) -> tuple[int, int]:
+    existing = {
+        (user_id, case_id, capability): pk
+        for pk, user_id, case_id, capability in existing_qs.values_list('id', 'user_id', 'case_id', 'capability')
+    }
+    stale_ids = [pk for key, pk in existing.items() if key not in desired]
+    missing = [
+        CaseAccess(user_id=user_id, case_id=case_id, capability=capability)
+        for user_id, case_id, capability in desired
+        if (user_id, case_id, capability) not in existing
+    ]
+    if stale_ids:
+        CaseAccess.objects.filter(id__in=stale_ids).delete()
+    if missing:
+        CaseAccess.objects.bulk_create(missing, ignore_conflicts=True)
+    return len(missing), len(stale_ids)
+
+
+def refresh_case_access(case_ids: Iterable) -> tuple[int, int]:
+    """Recompute ACL rows for the given cases. Returns (added, removed)."""
+
+    case_ids = list(case_ids)
+    if not case_ids:
+        return 0, 0
+    with transaction.atomic():
+        return _apply(
+            _desired_rows(case_ids),
+            CaseAccess.objects.filter(case_id__in=case_ids),
+        )
+
+
+def refresh_user_access(user_ids: Iterable) -> tuple[int, int]:
+    """Recompute ACL rows held by the given users. Returns (added, removed)."""
+
+    user_ids = list(user_ids)
+    if not user_ids:
+        return 0, 0
+
+    granted_leads = UserAccessGrant.objects.filter(granted_to_id__in=user_ids).values('can_access_user_id')
+    case_ids = set(
+        Case.objects.filter(
+            Q(lead_attorney_id__in=user_ids)
+            | Q(lead_attorney_id__in=granted_leads)
+            | Q(team_members__user_id__in=user_ids)
+            | Q(permissions__user_id__in=user_ids)
+        ).values_list('id', flat=True)
+    )
+    case_ids.update(CaseAccess.objects.filter(user_id__in=user_ids).values_list('case_id', flat=True))
+
+    user_id_set = set(user_ids)
+    desired = {row for row in _desired_rows(case_ids) if row[0] in user_id_set}
+    with transaction.atomic():
+        return _apply(desired, CaseAccess.objects.filter(user_id__in=user_ids))
+
+
+def rebuild_case_access(*, batch_size: int = REBUILD_BATCH_SIZE) -> tuple[int, int]:
+    """Recompute the whole ACL table in primary-key batches of cases."""
+
+    added = removed = 0
+    last_id = None
+    while True:
+        batch = Case.objects.order_by('id')
+        if last_id is not None:
+            batch = batch.filter(id__gt=last_id)
+        case_ids = list(batch.values_list('id', flat=True)[:batch_size])
+        if not case_ids:
+            break
+        batch_added, batch_removed = refresh_case_access(case_ids)
+        added += batch_added
+        removed += batch_removed
+        last_id = case_ids[-1]
+    return added, removed
@@ -1,11 +1,93 @@
 from __future__ import annotations
 
-from typing import Any, Optional
+from contextlib import contextmanager
+from contextvars import ContextVar
+from functools import partial
+from typing import Any, Iterator, Optional
 
 from django.db import transaction
 
 from court_rules.models import AuditAction, AuditLog, User
 
+AUDIT_BUFFER_MAX_SIZE = 500
+
+
+class AuditBuffer:
+    """
+    Collects audit entries for one request or command and writes them with
+    bulk_create. Entries only reach the buffer once the transaction they were
+    recorded in commits; entries from rolled-back transactions never arrive.
+    """
+
+    def __init__(self, *, max_size: int = AUDIT_BUFFER_MAX_SIZE):
+        self.max_size = max_size
+        self.entries: list[AuditLog] = []
+
+    def add(self, entry: AuditLog) -> None:
+        self.entries.append(entry)
+        if len(self.entries) >= self.max_size:
+            self.flush()
+
+    def flush(self) -> int:
+        """Write buffered entries in one INSERT. Returns the number written."""
+
+        entries, self.entries = self.entries, []
+        if entries:
+            AuditLog.objects.bulk_create(entries)
+        return len(entries)
+
+
+_active_buffer: ContextVar[Optional[AuditBuffer]] = ContextVar('audit_buffer', default=None)
+
+
+@contextmanager
+def buffered_audit_events(**buffer_kwargs) -> Iterator[AuditBuffer]:
+    """
+    Buffer every record_audit_event() inside the block and flush on exit, or
+    when the enclosing transaction commits if the block exits inside one.
+    Used by AuditBufferMiddleware per request; management commands and jobs
+    can wrap their work the same way and call flush_audit_events() at
+    checkpoints. Nested blocks share the outermost buffer and leave the
+    flush to it.
+    """
+    outer = _active_buffer.get()
+    if outer is not None:
+        yield outer
+        return
+    buffer = AuditBuffer(**buffer_kwargs)
+    token = _active_buffer.set(buffer)
+    try:
+        yield buffer
+    finally:
+        _active_buffer.reset(token)
+        # Still inside a transaction: entries join the buffer when it commits,
+        # so flush after them (or not at all if it rolls back).
+        transaction.on_commit(buffer.flush)
+
+
+def flush_audit_events() -> int:
+    """Write the committed entries buffered so far. Returns the number written."""
+
+    buffer = _active_buffer.get()
+    return buffer.flush() if buffer else 0
+
+
+def compute_changes(
+    before: Optional[dict[str, Any]],
+    after: Optional[dict[str, Any]],
+) -> dict[str, list[Any]]:
+    """
+    Field-level delta between two snapshots: ``{field: [old, new]}`` for every
+    key whose value differs. A missing snapshot counts as all-null values.
+    """
+    before = before or {}
+    after = after or {}
+    return {
+        key: [before.get(key), after.get(key)]
+        for key in sorted(before.keys() | after.keys())
+        if before.get(key) != after.get(key)
+    }
+
 
 def record_audit_event(
     *,
@@ -16,17 +98,26 @@ def record_audit_event(
     before: Optional[dict[str, Any]] = None,
     after: Optional[dict[str, Any]] = None,
 ) -> AuditLog:
-    """Persist a single audit log entry."""
-
-    with transaction.atomic():
-        log = AuditLog.objects.create(
-            actor_user=actor,
-            entity_table=entity_table,
-            entity_id=entity_id,
-            action=action,
-            before=before or None,
-            after=after or None,
-        )
+    """
+    Record an audit log entry, including the field-level delta of the snapshots.
+    Inside buffered_audit_events() the entry is queued for the batch write once
+    the current transaction commits; otherwise it is saved immediately.
+    """
+    log = AuditLog(
+        actor_user=actor,
+        entity_table=entity_table,
+        entity_id=entity_id,
+        action=action,
+        before=before or None,
+        after=after or None,
+        changes=compute_changes(before, after) or None,
+    )
+    buffer = _active_buffer.get()
+    if buffer is None:
+        log.save()
+    else:
+        # Runs immediately in autocommit mode; discarded if the transaction rolls back.
+        transaction.on_commit(partial(buffer.add, log))
     return log
 
 
@@ -41,6 +132,8 @@ def format_deadline_snapshot(deadline) -> dict[str, Any]:
         'trigger_source_id': str(deadline.trigger_source_id) if deadline.trigger_source_id else None,
         'basis': deadline.basis,
         'holiday_calendar_id': str(deadline.holiday_calendar_id) if deadline.holiday_calendar_id else None,
+        'trigger_date': deadline.trigger_date.isoformat() if deadline.trigger_date else None,
+        'offset_days': deadline.offset_days,
         'due_at': deadline.due_at.isoformat() if deadline.due_at else None,
         'timezone': deadline.timezone,
         'owner_id': str(deadline.owner_id) if deadline.owner_id else None,
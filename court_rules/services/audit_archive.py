@@ -0,0 +1,274 @@
+"""
+Monthly partitions of the audit_log table and their archival.
+
+On Postgres ``audit_log`` is range-partitioned by ``created_at`` into one
+table per calendar month (``audit_log_p2026_01``) plus a default partition
+that catches anything outside the known months. Partitions older than the
+retention window are detached, written to ``audit_log-2026-01.jsonl.gz`` in
+the archive directory and dropped. Archived months remain readable through
+iter_archived_audit_log() and can be re-attached with
+restore_audit_partition().
+"""
+
+from __future__ import annotations
+
+import gzip
+import json
+import os
+import re
+import uuid
+from datetime import date, datetime
+from pathlib import Path
+from typing import Any, Iterator, Optional
+
+from django.conf import settings
+from django.db import connection, models, transaction
+
+from court_rules.models import AuditLog
+
+PARENT_TABLE = AuditLog._meta.db_table
+DEFAULT_PARTITION = f'{PARENT_TABLE}_default'
+PARTITION_PATTERN = re.compile(rf'^{PARENT_TABLE}_p(\d{{4}})_(\d{{2}})$')
+ARCHIVE_PATTERN = re.compile(rf'^{PARENT_TABLE}-(\d{{4}})-(\d{{2}})\.jsonl\.gz$')
+ARCHIVE_FETCH_SIZE = 2000
+
+COLUMNS = [field.column for field in AuditLog._meta.concrete_fields]
+JSON_COLUMNS = [field.column for field in AuditLog._meta.concrete_fields if isinstance(field, models.JSONField)]
+
+
+class AuditArchiveError(Exception):
+    """Raised when a partition cannot be archived or restored safely."""
+
+
+def partitioning_supported() -> bool:
+    return connection.vendor == 'postgresql'
+
+
+def month_start(value: date) -> date:
+    return date(value.year, value.month, 1)
+
+
+def add_months(month: date, count: int) -> date:
+    index = month.year * 12 + month.month - 1 + count
+    return date(index // 12, index % 12 + 1, 1)
+
+
+def parse_month(value: str) -> date:
+    """Parse ``YYYY-MM``."""
+
+    try:
+        return datetime.strptime(value, '%Y-%m').date()
+    except ValueError:
+        raise ValueError(f'Expected a month as YYYY-MM, got {value!r}')
+
+
+def partition_name(month: date) -> str:
+    return f'{PARENT_TABLE}_p{month.year:04d}_{month.month:02d}'
+
+
+def archive_directory() -> Path:
+    return Path(settings.AUDIT_LOG_ARCHIVE_DIR)
+
+
+def archive_path(month: date, directory: Optional[Path] = None) -> Path:
+    directory = Path(directory) if directory else archive_directory()
+    return directory / f'{PARENT_TABLE}-{month.year:04d}-{month.month:02d}.jsonl.gz'
+
+
+def _month_of(table: str) -> Optional[date]:
+    match = PARTITION_PATTERN.match(table)
+    return date(int(match.group(1)), int(match.group(2)), 1) if match else None
+
+
+def _bounds(month: date) -> tuple[str, str]:
+    return f'{month.isoformat()} 00:00:00+00', f'{add_months(month, 1).isoformat()} 00:00:00+00'
+
+
+def attached_partitions() -> dict[date, str]:
+    """Monthly partitions currently attached to audit_log, keyed by month."""
+
+    with connection.cursor() as cursor:
+        cursor.execute(
+            """
+            SELECT child.relname
+            FROM pg_inherits
+            JOIN pg_class parent ON parent.oid = pg_inherits.inhparent
+            JOIN pg_class child ON child.oid = pg_inherits.inhrelid
+            WHERE parent.relname = %s
+            """,
+            [PARENT_TABLE],
+        )
+        names = [row[0] for row in cursor.fetchall()]
+    return {month: name for name in names if (month := _month_of(name))}
+
+
+def detached_partitions() -> dict[date, str]:
+    """Partition tables left detached by an interrupted archive run."""
+
+    with connection.cursor() as cursor:
+        cursor.execute(
+            """
+            SELECT tablename FROM pg_tables
+            WHERE schemaname = current_schema() AND tablename LIKE %s
+            """,
+            [f'{PARENT_TABLE}\\_p%'],
+        )
+        names = [row[0] for row in cursor.fetchall()]
+    attached = set(attached_partitions().values())
+    return {month: name for name in names if (month := _month_of(name)) and name not in attached}
+
+
+def _create_and_attach(cursor, month: date, table: str) -> None:
+    lower, upper = _bounds(month)
+    # Rows for this month may already sit in the default partition; move them
+    # before attaching, otherwise Postgres refuses the new bounds.
+    cursor.execute(
+        f'INSERT INTO {table} SELECT * FROM {DEFAULT_PARTITION} WHERE created_at >= %s AND created_at < %s',
+        [lower, upper],
+    )
+    cursor.execute(
+        f'DELETE FROM {DEFAULT_PARTITION} WHERE created_at >= %s AND created_at < %s',
+        [lower, upper],
+    )
+    cursor.execute(f'ALTER TABLE {PARENT_TABLE} ATTACH PARTITION {table} FOR VALUES FROM (%s) TO (%s)', [lower, upper])
+
+
+def ensure_audit_partitions(*, start: Optional[date] = None, months_ahead: int = 3) -> list[str]:
+    """
+    Create any missing monthly partitions from ``start`` (default: the current
+    month) through ``months_ahead`` months from now. Returns the names created.
+    """
+    if not partitioning_supported():
+        return []
+    current = month_start(date.today())
+    first = month_start(start) if start else current
+    last = add_months(current, months_ahead)
+    existing = attached_partitions()
+    created = []
+    month = first
+    while month <= last:
+        if month not in existing:
+            table = partition_name(month)
+            with transaction.atomic(), connection.cursor() as cursor:
+                cursor.execute(f'CREATE TABLE {table} (LIKE {PARENT_TABLE} INCLUDING DEFAULTS)')
+                _create_and_attach(cursor, month, table)
+            created.append(table)
+        month = add_months(month, 1)
+    return created
+
+
+def _encode(value: Any) -> Any:
+    if isinstance(value, (datetime, date)):
+        return value.isoformat()
+    if isinstance(value, uuid.UUID):
+        return str(value)
+    return value
+
+
+def _write_archive(table: str, path: Path) -> int:
+    """Stream ``table`` into ``path`` as gzip'd JSONL. Returns rows written."""
+
+    path.parent.mkdir(parents=True, exist_ok=True)
+    partial = path.with_name(path.name + '.partial')
+    written = 0
+    columns = ', '.join(COLUMNS)
+    with transaction.atomic(), connection.chunked_cursor() as cursor, gzip.open(partial, 'wt', encoding='utf-8') as handle:
+        cursor.execute(f'SELECT {columns} FROM {table} ORDER BY created_at, id')
+        while rows := cursor.fetchmany(ARCHIVE_FETCH_SIZE):
+            for row in rows:
+                record = {column: _encode(value) for column, value in zip(COLUMNS, row)}
+                for column in JSON_COLUMNS:
+                    if isinstance(record[column], str):
+                        record[column] = json.loads(record[column])
+                handle.write(json.dumps(record, sort_keys=True))
+                handle.write('\n')
+                written += 1
+    os.replace(partial, path)
+    return written
+
+
+def archive_audit_partition(month: date, *, directory: Optional[Path] = None) -> int:
+    """
+    Detach the partition for ``month``, write it to the archive and drop it.
+    Safe to re-run: a partition left detached by an earlier failure is picked
+    up again. Returns the number of rows archived.
+    """
+    table = partition_name(month)
+    path = archive_path(month, directory)
+    if month in attached_partitions():
+        with connection.cursor() as cursor:
+            cursor.execute(f'ALTER TABLE {PARENT_TABLE} DETACH PARTITION {table}')
+    elif month not in detached_partitions():
+        raise AuditArchiveError(f'No audit partition for {month:%Y-%m}')
+
+    written = _write_archive(table, path)
+    with connection.cursor() as cursor:
+        cursor.execute(f'SELECT COUNT(*) FROM {table}')
+        expected = cursor.fetchone()[0]
+    if written != expected:
+        raise AuditArchiveError(f'{table}: wrote {written} of {expected} rows; partition kept detached')
+
+    with connection.cursor() as cursor:
+        cursor.execute(f'DROP TABLE {table}')
+    return written
+
+
+def partitions_past_retention(*, retention_months: int, today: Optional[date] = None) -> list[date]:
+    """Months (attached or left detached) older than the retention window, oldest first."""
+
+    cutoff = add_months(month_start(today or date.today()), -retention_months)
+    months = set(attached_partitions()) | set(detached_partitions())
+    return sorted(month for month in months if month < cutoff)
+
+
+def archived_audit_months(directory: Optional[Path] = None) -> list[date]:
+    directory = Path(directory) if directory else archive_directory()
+    if not directory.is_dir():
+        return []
+    months = []
+    for entry in directory.iterdir():
+        match = ARCHIVE_PATTERN.match(entry.name)
+        if match:
+            months.append(date(int(match.group(1)), int(match.group(2)), 1))
+    return sorted(months)
+
+
+def iter_archived_audit_log(month: date, *, directory: Optional[Path] = None) -> Iterator[AuditLog]:
+    """
+    Yield the archived entries of ``month`` as unsaved AuditLog instances,
+    oldest first. Raises FileNotFoundError when the month is not archived.
+    """
+    with gzip.open(archive_path(month, directory), 'rt', encoding='utf-8') as handle:
+        for line in handle:
+            record = json.loads(line)
+            yield AuditLog(**{
+                field.attname: field.to_python(record.get(field.column))
+                for field in AuditLog._meta.concrete_fields
+            })
+
+
+def restore_audit_partition(month: date, *, directory: Optional[Path] = None) -> int:
+    """
+    Load an archived month back into audit_log as an attached partition.
+    The archive file is left in place. Returns the number of rows restored.
+    """
+    if month in attached_partitions():
+        raise AuditArchiveError(f'Audit partition for {month:%Y-%m} is already attached')
+    table = partition_name(month)
+    restored = 0
+    columns = ', '.join(COLUMNS)
+    placeholders = ', '.join(['%s'] * len(COLUMNS))
+    with transaction.atomic(), connection.cursor() as cursor:
+        cursor.execute(f'CREATE TABLE {table} (LIKE {PARENT_TABLE} INCLUDING DEFAULTS)')
+        batch = []
+        for entry in iter_archived_audit_log(month, directory=directory):
+            batch.append([field.get_db_prep_save(getattr(entry, field.attname), connection) for field in AuditLog._meta.concrete_fields])
+            if len(batch) >= ARCHIVE_FETCH_SIZE:
+                cursor.executemany(f'INSERT INTO {table} ({columns}) VALUES ({placeholders})', batch)
+                restored += len(batch)
+                batch = []
+        if batch:
+            cursor.executemany(f'INSERT INTO {table} ({columns}) VALUES ({placeholders})', batch)
+            restored += len(batch)
+        _create_and_attach(cursor, month, table)
+    return restored
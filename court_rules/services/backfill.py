@@ -0,0 +1,138 @@
+"""
+Resumable, batched backfills for data-fix commands.
+
+run_backfill() walks a queryset in primary-key order, one chunk at a time
+(``pk > last seen`` keyset pagination, streamed with .iterator()). Each row
+goes through the pass's transform, which returns the new values of the
+pass's fields; rows whose values differ are written with one bulk_update per
+chunk, touching only the changed columns, so auto_now fields and model signals
+are left alone. The chunk's last primary key is saved to a
+BackfillCheckpoint in the same transaction, so a crashed or interrupted run
+resumes after the last committed chunk. Dry runs report the diffs without
+writing rows or checkpoints.
+"""
+
+from __future__ import annotations
+
+import time
+from dataclasses import dataclass
+from typing import Any, Callable, Optional, Sequence
+
+from django.db import transaction
+from django.db.models import Model, QuerySet
+from django.utils import timezone
+
+from court_rules.models import BackfillCheckpoint
+
+DEFAULT_CHUNK_SIZE = 500
+
+Diff = dict[str, tuple[Any, Any]]
+
+
+@dataclass
+class BackfillPass:
+    """
+    One backfill over ``queryset``. ``transform(row)`` returns the new values
+    of (some of) ``fields``, or None to leave the row alone.
+    """
+
+    name: str
+    queryset: QuerySet
+    fields: Sequence[str]
+    transform: Callable[[Model], Optional[dict[str, Any]]]
+
+
+@dataclass
+class BackfillResult:
+    name: str
+    processed: int = 0
+    changed: int = 0
+    chunks: int = 0
+    resumed_after: str = ''
+
+
+def row_diff(row: Model, values: Optional[dict[str, Any]], fields: Sequence[str]) -> Diff:
+    """Apply ``values`` to ``row``; returns {field: (old, new)} for the fields that changed."""
+
+    diff = {}
+    for name, value in (values or {}).items():
+        if name not in fields:
+            raise ValueError(f'{name!r} is not one of the backfill fields {tuple(fields)}')
+        old = getattr(row, name)
+        if old != value:
+            setattr(row, name, value)
+            diff[name] = (old, value)
+    return diff
+
+
+def _start_checkpoint(name: str, restart: bool) -> BackfillCheckpoint:
+    checkpoint, _ = BackfillCheckpoint.objects.get_or_create(name=name)
+    if restart or checkpoint.completed_at:
+        checkpoint.last_pk = ''
+        checkpoint.processed = checkpoint.changed = 0
+        checkpoint.started_at = timezone.now()
+        checkpoint.completed_at = None
+        checkpoint.save()
+    return checkpoint
+
+
+def run_backfill(
+    backfill: BackfillPass,
+    *,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    dry_run: bool = False,
+    throttle: float = 0.0,
+    restart: bool = False,
+    on_change: Optional[Callable[[Model, Diff], None]] = None,
+) -> BackfillResult:
+    """
+    Run ``backfill`` to completion, resuming after its checkpoint unless
+    ``restart``. Sleeps ``throttle`` seconds between chunks. Dry runs
+    always start from the beginning and write nothing.
+    """
+    result = BackfillResult(name=backfill.name)
+    checkpoint = None if dry_run else _start_checkpoint(backfill.name, restart)
+    last_pk = checkpoint.last_pk if checkpoint else ''
+    result.resumed_after = last_pk
+    model = backfill.queryset.model
+    pk_field = model._meta.pk
+
+    while True:
+        chunk = backfill.queryset.order_by('pk')
+        if last_pk:
+            chunk = chunk.filter(pk__gt=pk_field.to_python(last_pk))
+        rows = []
+        changed = []
+        changed_fields = set()
+        for row in chunk[:chunk_size].iterator(chunk_size=chunk_size):
+            rows.append(row)
+            diff = row_diff(row, backfill.transform(row), backfill.fields)
+            if diff:
+                changed.append(row)
+                changed_fields.update(diff)
+                if on_change:
+                    on_change(row, diff)
+        if not rows:
+            break
+
+        last_pk = str(rows[-1].pk)
+        result.chunks += 1
+        result.processed += len(rows)
+        result.changed += len(changed)
+        if not dry_run:
+            with transaction.atomic():
+                if changed:
+                    model.objects.bulk_update(changed, sorted(changed_fields))
+                checkpoint.last_pk = last_pk
+                checkpoint.processed += len(rows)
+                checkpoint.changed += len(changed)
+                checkpoint.save(update_fields=['last_pk', 'processed', 'changed', 'updated_at'])
+        if len(rows) < chunk_size:
+            break
+        if throttle:
+            time.sleep(throttle)
+
+    if checkpoint is not None:
+        checkpoint.completed_at = timezone.now()
+        checkpoint.save(update_fields=['completed_at', 'updated_at'])
+    return result
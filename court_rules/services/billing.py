@@ -0,0 +1,101 @@
+from __future__ import annotations
+
+from decimal import Decimal
+from typing import Any, Optional
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db.models import Count, Q, Sum
+from django.utils import timezone
+
+from court_rules.models import BillingRecord, PaymentStatus
+from court_rules.services.metrics import record_cache_lookups
+
+OVERDUE_LIMIT = 10
+OVERDUE_STATUSES = (PaymentStatus.PENDING, PaymentStatus.PARTIALLY_PAID)
+ALL_ORGANIZATIONS = 'all'
+
+
+def _cache_key(scope, today) -> str:
+    return f'billing_dashboard:{scope}:{today.isoformat()}'
+
+
+def build_billing_dashboard(organization_id, *, now=None) -> dict[str, Any]:
+    """
+    Billing metrics for one organization, or every tenant when
+    ``organization_id`` is ALL_ORGANIZATIONS, in three queries regardless of volume.
+    """
+    now = now or timezone.now()
+    today = now.date()
+    current_month_start = now.replace(day=1, hour=0, minute=0, second=0, microsecond=0)
+
+    records = BillingRecord.objects.all()
+    if organization_id != ALL_ORGANIZATIONS:
+        records = records.filter(subscription__organization_id=organization_id)
+    overdue_filter = Q(payment_status__in=OVERDUE_STATUSES, payment_due_date__lt=today)
+
+    totals = records.order_by().aggregate(
+        current_month_records=Count('id', filter=Q(billing_period_start__gte=current_month_start)),
+        total_outstanding=Sum('balance_due', filter=Q(balance_due__gt=0)),
+        overdue_count=Count('id', filter=overdue_filter),
+    )
+
+    overdue_list = [
+        {
+            'id': str(record.id),
+            'organization': record.subscription.organization.name,
+            'amount_due': float(record.balance_due),
+            'due_date': record.payment_due_date.isoformat() if record.payment_due_date else None,
+            'billing_period': f"{record.billing_period_start} to {record.billing_period_end}",
+        }
+        for record in records.filter(overdue_filter).select_related('subscription__organization')[:OVERDUE_LIMIT]
+    ]
+
+    counts = dict(
+        records.order_by().values('payment_status').annotate(count=Count('id')).values_list('payment_status', 'count')
+    )
+    status_breakdown = {
+        label: counts[value]
+        for value, label in PaymentStatus.choices
+        if counts.get(value)
+    }
+
+    return {
+        'current_month_records': totals['current_month_records'],
+        'total_outstanding': float(totals['total_outstanding'] or Decimal('0')),
+        'overdue_count': totals['overdue_count'],
+        'overdue_records': overdue_list,
+        'payment_status_breakdown': status_breakdown,
+    }
+
+
+def billing_dashboard_snapshot(organization_id, *, now=None) -> dict[str, Any]:
+    """
+    Cached ``build_billing_dashboard``. Snapshots are keyed by organization and
+    day and dropped whenever a billing record of that organization changes.
+    Caching is off unless BILLING_DASHBOARD_CACHE_TIMEOUT is set.
+    """
+    timeout: Optional[int] = getattr(settings, 'BILLING_DASHBOARD_CACHE_TIMEOUT', None)
+    if not timeout:
+        return build_billing_dashboard(organization_id, now=now)
+
+    now = now or timezone.now()
+    key = _cache_key(organization_id, now.date())
+    snapshot = cache.get(key)
+    if snapshot is None:
+        record_cache_lookups('billing_dashboard', misses=1)
+        snapshot = build_billing_dashboard(organization_id, now=now)
+        cache.set(key, snapshot, timeout)
+    else:
+        record_cache_lookups('billing_dashboard', hits=1)
+    return snapshot
+
+
+def invalidate_billing_dashboard(organization_id) -> None:
+    """Drop today's snapshots for ``organization_id`` and the all-tenants view."""
+
+    today = timezone.now().date()
+    cache.delete_many([
+        _cache_key(organization_id, today),
+        _cache_key(ALL_ORGANIZATIONS, today),
+    ])
@@ -2,12 +2,21 @@
 
 from __future__ import annotations
 
+import hashlib
 from datetime import datetime, timezone as dt_timezone
-from typing import Iterable, Optional
+from itertools import islice
+from typing import Iterable, Iterator, Optional
 
+from django.conf import settings
+from django.core.cache import cache
+from django.db.models import Count, Max
 from django.utils import timezone
 
 from court_rules.models import Deadline
+from court_rules.services.metrics import record_cache_lookups
+
+FRAGMENT_BATCH_SIZE = 200
+
 
 def _format_dt(dt) -> str:
     """
@@ -58,71 +67,156 @@ def _fold_ics_line(line: str) -> str:
     return "\r\n".join(parts)
 
 
-def generate_deadlines_ics(
+def _event_lines(deadline: Deadline, dtstamp: str) -> list[str]:
+    """Folded VEVENT lines for one deadline, or an empty list if it has no due date."""
+
+    # Adjust these three attributes if your model uses different names
+    due = getattr(deadline, "due_at", None) or getattr(deadline, "due_date", None)
+    title = getattr(deadline, "title", None) or getattr(deadline, "name", None) or "Court deadline"
+    notes = getattr(deadline, "notes", "") or ""
+
+    if not due:
+        # Skip malformed deadlines rather than breaking the whole export
+        return []
+
+    uid = f"deadline-{deadline.pk}@precedentum"
+    dtstart = _format_dt(due)
+
+    summary = _escape_ics_text(title)
+    description = _escape_ics_text(notes)
+
+    event_lines = [
+        "BEGIN:VEVENT",
+        f"UID:{uid}",
+        f"DTSTAMP:{dtstamp}",
+        f"DTSTART:{dtstart}",
+        f"SUMMARY:{summary}",
+    ]
+    if description:
+        event_lines.append(f"DESCRIPTION:{description}")
+
+    event_lines.append("END:VEVENT")
+    return [_fold_ics_line(line) for line in event_lines]
+
+
+def _fragment_key(deadline: Deadline) -> Optional[str]:
+    updated_at = getattr(deadline, "updated_at", None)
+    if deadline.pk is None or updated_at is None:
+        return None
+    return f"ics:vevent:{deadline.pk}:{updated_at.timestamp()}"
+
+
+def render_event_fragment(deadline: Deadline, *, now=None) -> str:
+    """The CRLF-terminated VEVENT block for one deadline ("" if it has no due date)."""
+
+    dtstamp = _format_dt(getattr(deadline, "updated_at", None) or now or timezone.now())
+    return "".join(line + "\r\n" for line in _event_lines(deadline, dtstamp))
+
+
+def _render_batch(batch: list[Deadline]) -> tuple[list[str], int]:
+    """Return the fragments for ``batch`` in order and how many had to be rendered."""
+
+    keys = [_fragment_key(deadline) for deadline in batch]
+    cached = cache.get_many([key for key in keys if key])
+    fragments = []
+    rendered = {}
+    for deadline, key in zip(batch, keys):
+        fragment = cached.get(key) if key else None
+        if fragment is None:
+            fragment = render_event_fragment(deadline)
+            if key:
+                rendered[key] = fragment
+        fragments.append(fragment)
+    if rendered:
+        cache.set_many(rendered, getattr(settings, "CALENDAR_FRAGMENT_CACHE_TIMEOUT", None))
+    record_cache_lookups("calendar_fragments", hits=len(cached), misses=len(rendered))
+    return fragments, len(rendered)
+
+
+def iter_event_fragments(deadlines: Iterable[Deadline]) -> Iterator[str]:
+    """
+    Yield VEVENT blocks for ``deadlines``, reusing cached renders. Fragments are
+    keyed by (deadline id, updated_at), so saving a deadline moves it to a new
+    key and the stale block is never served again.
+    """
+    deadlines = iter(deadlines)
+    while True:
+        batch = list(islice(deadlines, FRAGMENT_BATCH_SIZE))
+        if not batch:
+            return
+        fragments, _ = _render_batch(batch)
+        yield from fragments
+
+
+def warm_event_fragments(deadlines: Iterable[Deadline]) -> tuple[int, int]:
+    """Pre-render fragments for ``deadlines``. Returns (deadlines seen, fragments rendered)."""
+
+    seen = rendered = 0
+    deadlines = iter(deadlines)
+    while True:
+        batch = list(islice(deadlines, FRAGMENT_BATCH_SIZE))
+        if not batch:
+            return seen, rendered
+        _, batch_rendered = _render_batch(batch)
+        seen += len(batch)
+        rendered += batch_rendered
+
+
+def iter_deadlines_ics(
     deadlines: Iterable[Deadline],
     *,
     calendar_name: str = "Precedentum Deadlines",
     owner_identifier: Optional[str] = None,
-) -> str:
+) -> Iterator[str]:
     """
-    Build an ICS calendar containing the given deadlines.
+    Yield an ICS calendar for the given deadlines piece by piece, so large
+    calendars can be streamed from a queryset iterator. Events come from the
+    per-deadline fragment cache.
 
-    :param deadlines: iterable of Deadline objects
-    :param calendar_name: human readable calendar name
-    :param owner_identifier: optional string to include in PRODID / metadata
-    :return: ICS file content as a string
+    DTSTAMP is each deadline's updated_at, which keeps the output stable
+    between requests while nothing changes.
     """
-    now = timezone.now()
     prod_owner = owner_identifier or "Precedentum"
 
-    lines = [
-        "BEGIN:VCALENDAR",
-        "VERSION:2.0",
-        f"PRODID:-//{_escape_ics_text(prod_owner)}//Court Deadlines//EN",
-        f"X-WR-CALNAME:{_escape_ics_text(calendar_name)}",
-        "CALSCALE:GREGORIAN",
-        "METHOD:PUBLISH",
-    ]
-
-    for deadline in deadlines:
-        # Adjust these three attributes if your model uses different names
-        due = getattr(deadline, "due_at", None) or getattr(deadline, "due_date", None)
-        title = getattr(deadline, "title", None) or getattr(deadline, "name", None) or "Court deadline"
-        notes = getattr(deadline, "notes", "") or ""
+    yield "BEGIN:VCALENDAR\r\n"
+    yield "VERSION:2.0\r\n"
+    yield f"PRODID:-//{_escape_ics_text(prod_owner)}//Court Deadlines//EN\r\n"
+    yield _fold_ics_line(f"X-WR-CALNAME:{_escape_ics_text(calendar_name)}") + "\r\n"
+    yield "CALSCALE:GREGORIAN\r\n"
+    yield "METHOD:PUBLISH\r\n"
 
-        if not due:
-            # Skip malformed deadlines rather than breaking the whole export
-            continue
+    yield from iter_event_fragments(deadlines)
 
-        uid = f"deadline-{deadline.pk}@precedentum"
-        dtstamp = _format_dt(now)
-        dtstart = _format_dt(due)
+    yield "END:VCALENDAR\r\n"
 
-        summary = _escape_ics_text(title)
-        description = _escape_ics_text(notes)
 
-        # Optional: if Deadline is linked to a Case, you can enrich the description
-        # Example:
-        # case = getattr(deadline, "case", None)
-        # if case:
-        #     description = f"Case: {case.number} - {case.title}\\n{description}"
-
-        event_lines = [
-            "BEGIN:VEVENT",
-            f"UID:{uid}",
-            f"DTSTAMP:{dtstamp}",
-            f"DTSTART:{dtstart}",
-            f"SUMMARY:{summary}",
-        ]
-        if description:
-            event_lines.append(f"DESCRIPTION:{description}")
-
-        event_lines.append("END:VEVENT")
+def generate_deadlines_ics(
+    deadlines: Iterable[Deadline],
+    *,
+    calendar_name: str = "Precedentum Deadlines",
+    owner_identifier: Optional[str] = None,
+) -> str:
+    """
+    Build an ICS calendar containing the given deadlines.
 
-        for l in event_lines:
-            lines.append(_fold_ics_line(l))
+    :param deadlines: iterable of Deadline objects
+    :param calendar_name: human readable calendar name
+    :param owner_identifier: optional string to include in PRODID / metadata
+    :return: ICS file content as a string
+    """
+    return "".join(
+        iter_deadlines_ics(deadlines, calendar_name=calendar_name, owner_identifier=owner_identifier)
+    )
 
-    lines.append("END:VCALENDAR")
 
-    ics = "\r\n".join(lines) + "\r\n"
-    return ics
\ No newline at end of file
+def deadline_feed_validators(deadlines, *, scope: str) -> tuple[str, Optional[datetime]]:
+    """
+    Return (ETag, Last-Modified) for a feed over ``deadlines`` from a single
+    aggregate query. The row count is part of the ETag so deletions, which do
+    not move max(updated_at), still change it; ``scope`` covers feed metadata
+    such as the calendar name.
+    """
+    stats = deadlines.order_by().aggregate(last_modified=Max("updated_at"), total=Count("id"))
+    last_modified = stats["last_modified"]
+    fingerprint = f"{scope}|{stats['total']}|{last_modified.isoformat() if last_modified else ''}"
+    return hashlib.sha256(fingerprint.encode()).hexdigest()[:32], last_modified
@@ -0,0 +1,197 @@
+"""
+Single-pass extraction of chamber staff from ILND judge chambers pages.
+
+extract_chambers_staff() parses the page once and walks the document once,
+splitting text into lines at <br> and text newlines. A line naming a staff
+role (``**Court Reporter**``, ``<strong>Courtroom Deputy</strong>``,
+``Law Clerks:`` ...) opens that role's section, and the section runs until
+the next role, an <hr> or ``---`` rule, or the site footer. Sections are then
+turned into a typed ChambersStaff record: the first line of a contact section
+is the name, followed by phone and room lines in any order.
+"""
+
+from __future__ import annotations
+
+import re
+from dataclasses import dataclass, field
+from typing import Optional
+
+from bs4 import BeautifulSoup, NavigableString, Tag
+
+COURT_REPORTER = 'court_reporter'
+COURTROOM_DEPUTY = 'courtroom_deputy'
+EXECUTIVE_LAW_CLERK = 'executive_law_clerk'
+JUDICIAL_ASSISTANT = 'judicial_assistant'
+LAW_CLERKS = 'law_clerks'
+
+SECTION_LABELS = {
+    'court reporter': COURT_REPORTER,
+    'courtroom deputy': COURTROOM_DEPUTY,
+    'executive law clerk': EXECUTIVE_LAW_CLERK,
+    'judicial assistant': JUDICIAL_ASSISTANT,
+    'law clerk': LAW_CLERKS,
+    'law clerks': LAW_CLERKS,
+}
+# A role heading, optionally followed by ":" and the first value ("Court Reporter: Jane Roe").
+LABEL_PATTERN = re.compile(
+    r'^\**\s*(%s)\s*\**\s*(?::\s*\**\s*(.*?)[\s*]*)?$' % '|'.join(sorted(SECTION_LABELS, key=len, reverse=True)),
+    re.IGNORECASE,
+)
+FOOTER_PATTERN = re.compile(r'Northern District Logo|Court Telephone|©')
+PHONE_PATTERN = re.compile(r'\(?\d{3}\)?[-.\s]?\d{3}[-.\s]?\d{4}')
+ROOM_PATTERN = re.compile(r'\bRoom\b\s*:?\s*(\w+)')
+ROOM_NUMBER_PATTERN = re.compile(r'^\d{3,5}[A-Z]?$')
+NOT_A_NAME_PATTERN = re.compile(r'Northern District|Court Telephone|©|chevron|@|Room \d')
+BREAK_TAGS = frozenset({'br', 'p', 'div', 'li', 'tr', 'h1', 'h2', 'h3', 'h4', 'h5', 'h6'})
+SKIPPED_TAGS = frozenset({'script', 'style', 'noscript', 'template'})
+MAX_LAW_CLERK_LINES = 10
+
+# Judge (name, phone, room) fields for each contact role.
+JUDGE_CONTACT_FIELDS = {
+    COURT_REPORTER: ('court_reporter_name', 'court_reporter_phone', 'court_reporter_room'),
+    COURTROOM_DEPUTY: ('clerk_name', 'clerk_phone', 'clerk_room'),
+    EXECUTIVE_LAW_CLERK: ('executive_law_clerk', 'executive_law_clerk_phone', 'executive_law_clerk_room'),
+    JUDICIAL_ASSISTANT: ('judicial_assistant', 'judicial_assistant_phone', 'judicial_assistant_room'),
+}
+
+
+@dataclass
+class StaffContact:
+    name: str = ''
+    phone: str = ''
+    room: str = ''
+
+
+@dataclass
+class ChambersStaff:
+    """Staff listed on one chambers page; roles not on the page are None / empty."""
+
+    court_reporter: Optional[StaffContact] = None
+    courtroom_deputy: Optional[StaffContact] = None
+    executive_law_clerk: Optional[StaffContact] = None
+    judicial_assistant: Optional[StaffContact] = None
+    law_clerks: list[str] = field(default_factory=list)
+
+    def judge_fields(self) -> dict[str, str]:
+        """Non-empty values keyed by Judge field name."""
+
+        values = {}
+        for role, field_names in JUDGE_CONTACT_FIELDS.items():
+            contact = getattr(self, role)
+            if contact is None:
+                continue
+            for field_name, value in zip(field_names, (contact.name, contact.phone, contact.room)):
+                if value:
+                    values[field_name] = value
+        if self.law_clerks:
+            values['apprentices'] = '\n'.join(self.law_clerks)
+        return values
+
+    def summary_lines(self) -> list[str]:
+        """Human-readable summary, as stored in Judge.additional_staff."""
+
+        lines = []
+        for label, contact in (('Court Reporter', self.court_reporter), ('Courtroom Deputy', self.courtroom_deputy)):
+            if contact is None:
+                continue
+            lines.append(f'{label}: {contact.name}')
+            if contact.phone:
+                lines.append(f'  Phone: {contact.phone}')
+            if contact.room:
+                lines.append(f'  Room: {contact.room}')
+        return lines
+
+
+def _page_lines(soup: BeautifulSoup):
+    """
+    Yield the page's text lines in document order, with None for each
+    horizontal rule, in one walk over the parsed tree.
+    """
+    buffer = []
+    for node in soup.descendants:
+        if isinstance(node, Tag):
+            if node.name in BREAK_TAGS or node.name == 'hr':
+                line = ''.join(buffer).strip()
+                buffer = []
+                if line:
+                    yield line
+                if node.name == 'hr':
+                    yield None
+            continue
+        if type(node) is not NavigableString or node.parent.name in SKIPPED_TAGS:
+            continue
+        parts = str(node).split('\n')
+        for part in parts[:-1]:
+            buffer.append(part)
+            line = ''.join(buffer).strip()
+            buffer = []
+            if line:
+                yield line
+        buffer.append(parts[-1])
+    line = ''.join(buffer).strip()
+    if line:
+        yield line
+
+
+def _collect_sections(html: str) -> dict[str, list[str]]:
+    sections: dict[str, list[str]] = {}
+    current = None
+    for line in _page_lines(BeautifulSoup(html, 'html.parser')):
+        if line is None or line == '---':
+            current = None
+            continue
+        line = ' '.join(line.split())
+        label = LABEL_PATTERN.match(line)
+        if label:
+            current = SECTION_LABELS[label.group(1).lower()]
+            sections.setdefault(current, [])
+            if label.group(2):
+                sections[current].append(label.group(2))
+            continue
+        if FOOTER_PATTERN.search(line):
+            current = None
+            continue
+        if current is not None:
+            sections[current].append(line)
+    return sections
+
+
+def _room(line: str) -> str:
+    room = ROOM_PATTERN.search(line)
+    if room:
+        return f'Room {room.group(1)}'
+    if ROOM_NUMBER_PATTERN.match(line):
+        return f'Room {line}'
+    return ''
+
+
+def _contact(lines: list[str]) -> Optional[StaffContact]:
+    if not lines:
+        return None
+    contact = StaffContact(name=lines[0])
+    for line in lines[1:]:
+        phone = PHONE_PATTERN.search(line)
+        if phone:
+            contact.phone = contact.phone or phone.group(0)
+            continue
+        contact.room = contact.room or _room(line)
+    return contact
+
+
+def _law_clerks(lines: list[str]) -> list[str]:
+    # Names are short; contact details and site chrome are not names.
+    return [
+        line for line in lines[:MAX_LAW_CLERK_LINES]
+        if 2 < len(line) < 50 and not NOT_A_NAME_PATTERN.search(line)
+    ]
+
+
+def extract_chambers_staff(html: str) -> ChambersStaff:
+    sections = _collect_sections(html)
+    return ChambersStaff(
+        court_reporter=_contact(sections.get(COURT_REPORTER, [])),
+        courtroom_deputy=_contact(sections.get(COURTROOM_DEPUTY, [])),
+        executive_law_clerk=_contact(sections.get(EXECUTIVE_LAW_CLERK, [])),
+        judicial_assistant=_contact(sections.get(JUDICIAL_ASSISTANT, [])),
+        law_clerks=_law_clerks(sections.get(LAW_CLERKS, [])),
+    )
@@ -0,0 +1,221 @@
+from __future__ import annotations
+
+from datetime import datetime, time, timedelta
+from typing import Any, Iterable
+
+from django.db import DatabaseError, transaction
+from django.db.models import Count, Q
+from django.db.models.functions import TruncDate
+from django.utils import timezone
+
+from court_rules.models import User
+from court_rules.services.access import scope_cases, scope_deadlines
+from court_rules.services.rollups import (
+    rollup_case_breakdown,
+    rollup_daily_created,
+    rollup_filters,
+    rollup_window_counts,
+)
+
+ACTIVITY_RANGES = (7, 30, 90, 365)
+DEFAULT_ACTIVITY_RANGE = 30
+UPCOMING_WINDOWS = (7, 30, 60)
+TIMELINE_DAYS = 60
+TIMELINE_LIMIT = 50
+RECENT_LIMIT = 10
+RECENT_ACTIVITY_LIMIT = 20
+
+
+def _daily_counts(queryset, start) -> dict:
+    """Return {date: count} of rows created on or after ``start``, bucketed per day."""
+
+    rows = (
+        queryset.filter(created_at__gte=start)
+        .annotate(day=TruncDate('created_at'))
+        .values('day')
+        .annotate(count=Count('id'))
+        .order_by()
+    )
+    return {row['day']: row['count'] for row in rows}
+
+
+def activity_trend(cases, deadlines, *, range_days: int, now, rollups=None) -> list[dict[str, Any]]:
+    """
+    Daily case/deadline creation counts for the ``range_days`` days before today.
+    When ``rollups`` filters are given the counts come from the rollup tables.
+    """
+    first_day = (timezone.localtime(now) - timedelta(days=range_days)).date()
+    if rollups is not None:
+        case_counts, deadline_counts = rollup_daily_created(rollups, first_day=first_day)
+    else:
+        start = timezone.make_aware(datetime.combine(first_day, time.min))
+        case_counts = _daily_counts(cases, start)
+        deadline_counts = _daily_counts(deadlines, start)
+
+    trend = []
+    for offset in range(range_days):
+        day = first_day + timedelta(days=offset)
+        cases_count = case_counts.get(day, 0)
+        deadlines_count = deadline_counts.get(day, 0)
+        trend.append({
+            'date': day.strftime('%Y-%m-%d'),
+            'cases': cases_count,
+            'deadlines': deadlines_count,
+            'total': cases_count + deadlines_count,
+        })
+    return trend
+
+
+def deadline_window_counts(deadlines, *, now) -> dict[str, int]:
+    """Count open upcoming deadlines per window plus overdue ones in a single query."""
+
+    windows = {
+        f'next_{days}_days': Count(
+            'id',
+            filter=Q(status='open', due_at__gte=now, due_at__lte=now + timedelta(days=days)),
+        )
+        for days in UPCOMING_WINDOWS
+    }
+    windows['overdue'] = Count('id', filter=Q(status='open', due_at__lt=now))
+    return deadlines.order_by().aggregate(**windows)
+
+
+def resolve_change_event_titles(events: Iterable) -> list[dict[str, Any]]:
+    """
+    Build activity entries for POC change events, resolving every referenced
+    rule node and judge procedure with one bulk query per entity kind.
+    """
+    from court_rules.poc_models import PocJudgeProcNode, PocRuleNode
+
+    events = list(events)
+    rule_ids = {event.entity_id for event in events if event.entity_kind == 'rule_node'}
+    proc_ids = {event.entity_id for event in events if event.entity_kind == 'judge_proc_node'}
+    rules = PocRuleNode.objects.in_bulk(rule_ids) if rule_ids else {}
+    procs = PocJudgeProcNode.objects.select_related('judge').in_bulk(proc_ids) if proc_ids else {}
+
+    entries = []
+    for change in events:
+        if change.entity_kind == 'rule_node':
+            rule = rules.get(change.entity_id)
+            if rule:
+                title = f"Rule {change.change_type}: {rule.rule_code} - {rule.heading[:50] if rule.heading else 'Court Rule'}"
+            else:
+                title = f"Rule {change.change_type}: ID {change.entity_id}"
+            entry_type = 'rule'
+        elif change.entity_kind == 'judge_proc_node':
+            proc = procs.get(change.entity_id)
+            if proc:
+                title = f"Procedure {change.change_type}: {proc.judge.display_name} - {proc.heading[:50] if proc.heading else 'Procedure'}"
+            else:
+                title = f"Procedure {change.change_type}: ID {change.entity_id}"
+            entry_type = 'procedure'
+        else:
+            continue
+
+        entries.append({
+            'type': entry_type,
+            'title': title,
+            'date': change.detected_at.isoformat(),
+            'id': str(change.entity_id),
+        })
+    return entries
+
+
+def recent_change_events() -> list[dict[str, Any]]:
+    """Latest rule and judge procedure changes; empty when the POC tables are unavailable."""
+    from court_rules.poc_models import PocChangeEvent
+
+    try:
+        with transaction.atomic():
+            events = list(
+                PocChangeEvent.objects.filter(entity_kind='rule_node').order_by('-detected_at')[:RECENT_LIMIT]
+            ) + list(
+                PocChangeEvent.objects.filter(entity_kind='judge_proc_node').order_by('-detected_at')[:RECENT_LIMIT]
+            )
+            return resolve_change_event_titles(events)
+    except DatabaseError:
+        # The POC schema is loaded separately and may be missing in some environments
+        return []
+
+
+def build_dashboard_metrics(
+    user: User,
+    *,
+    range_days: int = DEFAULT_ACTIVITY_RANGE,
+    now=None,
+) -> dict[str, Any]:
+    """
+    Assemble the dashboard payload for ``user``.
+    The number of queries is fixed and does not depend on ``range_days``.
+    Counters come from the dashboard rollup tables when they are enabled and
+    cover the user's scope; otherwise they are aggregated live.
+    """
+    now = now or timezone.now()
+    cases = scope_cases(user)
+    deadlines = scope_deadlines(user)
+    rollups = rollup_filters(user)
+
+    if rollups is not None:
+        windows = rollup_window_counts(rollups, today=timezone.localtime(now).date(), windows=UPCOMING_WINDOWS)
+        cases_by_status = rollup_case_breakdown(rollups, 'status')
+        cases_by_court = rollup_case_breakdown(rollups, 'court__name')
+    else:
+        windows = deadline_window_counts(deadlines, now=now)
+        cases_by_status = list(
+            cases.values('status')
+            .annotate(count=Count('id'))
+            .order_by('-count')
+        )
+        cases_by_court = list(
+            cases.values('court__name')
+            .annotate(count=Count('id'))
+            .order_by('-count')
+        )
+
+    deadline_timeline = [
+        {
+            'id': str(deadline.id),
+            'title': str(deadline),
+            'due_date': deadline.due_at.isoformat(),
+            'status': deadline.status,
+            'case_name': deadline.case.caption if deadline.case else None,
+        }
+        for deadline in deadlines.select_related('case')
+        .filter(due_at__gte=now, due_at__lte=now + timedelta(days=TIMELINE_DAYS))
+        .order_by('due_at')[:TIMELINE_LIMIT]
+    ]
+
+    recent_activity = [
+        {
+            'type': 'case',
+            'title': f"New case: {case.caption}",
+            'date': case.created_at.isoformat(),
+            'id': str(case.id),
+        }
+        for case in cases.order_by('-created_at')[:RECENT_LIMIT]
+    ]
+    recent_activity += [
+        {
+            'type': 'deadline',
+            'title': f"Deadline: {deadline.trigger_type} - {deadline.case.caption}",
+            'date': deadline.created_at.isoformat(),
+            'id': str(deadline.id),
+        }
+        for deadline in deadlines.select_related('case').order_by('-created_at')[:RECENT_LIMIT]
+    ]
+    recent_activity += recent_change_events()
+    recent_activity.sort(key=lambda x: x['date'], reverse=True)
+
+    return {
+        'range_days': range_days,
+        'upcoming_deadlines': {
+            f'next_{days}_days': windows[f'next_{days}_days'] for days in UPCOMING_WINDOWS
+        },
+        'overdue_deadlines': windows['overdue'],
+        'total_active_cases': sum(row['count'] for row in cases_by_status if row['status'] == 'active'),
+        'cases_by_status': cases_by_status,
+        'cases_by_court': cases_by_court,
+        'deadline_timeline': deadline_timeline,
+        'activity_trend': activity_trend(cases, deadlines, range_days=range_days, now=now, rollups=rollups),
+        'recent_activity': recent_activity[:RECENT_ACTIVITY_LIMIT],
+    }
@@ -0,0 +1,143 @@
+"""
+Incremental recomputation of computed deadlines after calendar changes.
+
+A deadline with ``trigger_date`` and ``offset_days`` is computed from its
+holiday calendar; adding, moving or removing a holiday (a court closure is
+entered as a holiday too) can only change deadlines whose computation
+window, trigger date to due date, covers that day. affected_deadlines()
+finds exactly those through idx_deadline_calendar_window, and
+recompute_deadlines() recomputes them per calendar in one batched call,
+writes the changed rows with bulk_update and records one COMPUTE audit entry
+per change in a single insert.
+"""
+
+from __future__ import annotations
+
+from collections import defaultdict
+from datetime import date, datetime, time, timedelta, timezone as dt_timezone
+from typing import Iterable, Optional
+
+from django.db import transaction
+from django.db.models import Q, QuerySet
+from django.utils import timezone
+
+from court_rules.models import AuditAction, Deadline, DeadlineBasis, DeadlineStatus, User
+from court_rules.services.audit import buffered_audit_events, format_deadline_snapshot, record_audit_event
+from court_rules.services.business_days import add_business_days, add_calendar_days, compile_calendar
+from court_rules.services.rollups import apply_deadline_deltas, merge_contributions, stored_deadline_contributions
+from court_rules.utils.timezones import zone_or_utc
+
+RECOMPUTE_STATUSES = (DeadlineStatus.OPEN, DeadlineStatus.SNOOZED)
+RECOMPUTE_BATCH_SIZE = 500
+
+
+def affected_deadlines(calendar_id, days: Iterable[date]) -> QuerySet:
+    """
+    Open or snoozed computed deadlines on ``calendar_id`` whose window covers
+    any of ``days``. Due times are compared with a day of slack on each side
+    so deadlines in any timezone are caught; extra rows simply recompute to
+    the same date.
+    """
+    window = Q()
+    for day in set(days):
+        after = datetime.combine(day - timedelta(days=1), time.min, tzinfo=dt_timezone.utc)
+        before = datetime.combine(day + timedelta(days=2), time.min, tzinfo=dt_timezone.utc)
+        window |= Q(trigger_date__lte=day, due_at__gte=after)
+        # Periods counted backwards (negative offsets) run from due date to trigger.
+        window |= Q(trigger_date__gte=day, due_at__lt=before)
+    if not window:
+        return Deadline.objects.none()
+    return Deadline.objects.filter(
+        window,
+        holiday_calendar_id=calendar_id,
+        trigger_date__isnull=False,
+        offset_days__isnull=False,
+        status__in=RECOMPUTE_STATUSES,
+    )
+
+
+def computed_due_dates(deadlines: list[Deadline], calendar_id) -> list[date]:
+    """Due dates of ``deadlines`` (all on ``calendar_id``), computed in batch per basis."""
+
+    calendar = compile_calendar(calendar_id)
+    results: list[Optional[date]] = [None] * len(deadlines)
+    by_basis = defaultdict(list)
+    for index, deadline in enumerate(deadlines):
+        by_basis[deadline.basis].append(index)
+    for basis, indexes in by_basis.items():
+        compute = add_business_days if basis == DeadlineBasis.BUSINESS_DAYS else add_calendar_days
+        dates = compute(
+            [deadlines[index].trigger_date for index in indexes],
+            [deadlines[index].offset_days for index in indexes],
+            calendar=calendar,
+        )
+        for index, due_date in zip(indexes, dates):
+            results[index] = due_date
+    return results
+
+
+def computed_due_date(*, trigger_date: date, offset_days: int, basis: str, calendar_id) -> date:
+    """The due date recomputation would give a deadline with these inputs."""
+
+    deadline = Deadline(trigger_date=trigger_date, offset_days=offset_days, basis=basis)
+    return computed_due_dates([deadline], calendar_id)[0]
+
+
+def recompute_deadlines(deadlines: Iterable[Deadline], *, actor: Optional[User] = None) -> list[Deadline]:
+    """
+    Recompute ``deadlines`` and save those whose due date moved, keeping the
+    local time of day. Returns the changed deadlines.
+    """
+    by_calendar = defaultdict(list)
+    for deadline in deadlines:
+        if deadline.trigger_date is not None and deadline.offset_days is not None:
+            by_calendar[deadline.holiday_calendar_id].append(deadline)
+
+    changed = []
+    before = {}
+    now = timezone.now()
+    for calendar_id, group in by_calendar.items():
+        for deadline, due_date in zip(group, computed_due_dates(group, calendar_id)):
+            zone = zone_or_utc(deadline.timezone)
+            local_due = deadline.due_at.astimezone(zone)
+            if local_due.date() == due_date:
+                continue
+            before[deadline.pk] = format_deadline_snapshot(deadline)
+            deadline.due_at = datetime.combine(due_date, local_due.timetz().replace(tzinfo=None), tzinfo=zone)
+            deadline.updated_at = now
+            changed.append(deadline)
+    if not changed:
+        return changed
+
+    with transaction.atomic(), buffered_audit_events():
+        # bulk_update skips the model signals, so move the dashboard rollups here.
+        queryset = Deadline.objects.filter(pk__in=[deadline.pk for deadline in changed])
+        rollups_before = stored_deadline_contributions(queryset)
+        Deadline.objects.bulk_update(changed, ['due_at', 'updated_at'], batch_size=RECOMPUTE_BATCH_SIZE)
+        apply_deadline_deltas(merge_contributions(stored_deadline_contributions(queryset), rollups_before, sign=-1))
+        for deadline in changed:
+            record_audit_event(
+                actor=actor,
+                entity_table=Deadline._meta.db_table,
+                entity_id=deadline.pk,
+                action=AuditAction.COMPUTE,
+                before=before[deadline.pk],
+                after=format_deadline_snapshot(deadline),
+            )
+    return changed
+
+
+def recompute_for_calendar_change(calendar_id, days: Iterable[date], *, actor: Optional[User] = None) -> int:
+    """Recompute the deadlines affected by holidays changing on ``days``. Returns how many moved."""
+
+    moved = 0
+    batch = []
+    deadlines = affected_deadlines(calendar_id, days).order_by('id')
+    for deadline in deadlines.iterator(chunk_size=RECOMPUTE_BATCH_SIZE):
+        batch.append(deadline)
+        if len(batch) >= RECOMPUTE_BATCH_SIZE:
+            moved += len(recompute_deadlines(batch, actor=actor))
+            batch = []
+    if batch:
+        moved += len(recompute_deadlines(batch, actor=actor))
+    return moved
@@ -0,0 +1,82 @@
+from __future__ import annotations
+
+from collections import Counter
+from typing import Optional
+
+from django.db import transaction
+from django.db.models import Count, F, IntegerField, OuterRef, Subquery, Value
+from django.db.models.functions import Coalesce
+
+from court_rules.models import Organization, Subscription, User
+
+
+def lock_subscription(organization: Optional[Organization]) -> Optional[Subscription]:
+    """
+    Return the organization's subscription with its row locked until the
+    surrounding transaction ends, or ``None`` when it has no subscription.
+    Concurrent seat checks for the same organization serialize on this lock.
+    """
+    if organization is None:
+        return None
+    return Subscription.objects.select_for_update().filter(organization=organization).first()
+
+
+def seat_contributions(*, organization_id, is_active: bool) -> Counter:
+    """Seats a single user occupies, keyed by organization id."""
+
+    if organization_id and is_active:
+        return Counter({organization_id: 1})
+    return Counter()
+
+
+def apply_seat_deltas(deltas: Counter) -> None:
+    """Add ``deltas`` to the stored active_user_count of each organization's subscription."""
+
+    with transaction.atomic():
+        for organization_id, delta in deltas.items():
+            if not delta:
+                continue
+            subscriptions = Subscription.objects.filter(organization_id=organization_id)
+            if delta < 0:
+                subscriptions = subscriptions.filter(active_user_count__gte=-delta)
+            subscriptions.update(active_user_count=F('active_user_count') + delta)
+
+
+def count_active_users(organization_id) -> int:
+    return User.objects.filter(organization_id=organization_id, is_active=True).count()
+
+
+def seat_count_drift() -> list[tuple[Subscription, int]]:
+    """Return (subscription, actual active users) for every subscription whose counter is wrong."""
+
+    actual = dict(
+        User.objects.filter(is_active=True, organization__isnull=False)
+        .order_by()
+        .values('organization_id')
+        .annotate(count=Count('id'))
+        .values_list('organization_id', 'count')
+    )
+    return [
+        (subscription, actual.get(subscription.organization_id, 0))
+        for subscription in Subscription.objects.select_related('organization').order_by('organization__name')
+        if subscription.active_user_count != actual.get(subscription.organization_id, 0)
+    ]
+
+
+def repair_seat_counts() -> list[tuple[Subscription, int]]:
+    """Reset drifted counters to the actual number of active users. Returns the drift fixed."""
+
+    drift = seat_count_drift()
+    if drift:
+        counts = (
+            User.objects.filter(organization_id=OuterRef('organization_id'), is_active=True)
+            .order_by()
+            .values('organization_id')
+            .annotate(count=Count('id'))
+            .values('count')
+        )
+        # Recount inside the UPDATE so users added meanwhile are not lost.
+        Subscription.objects.filter(pk__in=[subscription.pk for subscription, _ in drift]).update(
+            active_user_count=Coalesce(Subquery(counts, output_field=IntegerField()), Value(0))
+        )
+    return drift
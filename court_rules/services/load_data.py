@@ -0,0 +1,555 @@
+"""
+Synthetic load data for capacity, query-plan and benchmark runs.
+
+generate_load_data() creates organizations, each with a subscription, users
+in a realistic role mix, access grants, cases with their teams, deadlines,
+reminders and audit rows. Everything is drawn from a seeded random.Random,
+ids included, so the same arguments and anchor date always produce the same
+rows. Rows are streamed to the database in batches with Postgres COPY
+(bulk_create on other backends, where auto_now_add stamps created_at with the
+current time), one transaction per organization, so memory stays flat however
+many deadlines are asked for.
+
+Bulk writes skip model signals, so the case_access rows and dashboard
+rollups of the new organizations are rebuilt once their rows are in; seat
+counters are written correctly up front.
+"""
+
+from __future__ import annotations
+
+import json
+import random
+import time as time_module
+import uuid
+from dataclasses import dataclass, field
+from datetime import date, datetime, time, timedelta, timezone as dt_timezone
+from decimal import Decimal
+from types import SimpleNamespace
+from typing import Any, Callable, Optional
+from zoneinfo import ZoneInfo
+
+from django.contrib.auth.hashers import make_password
+from django.db import connection, transaction
+from django.db.models import BooleanField, CharField, DateField, DateTimeField, JSONField, Model, TextField
+
+from court_rules.models import (
+    AuditAction,
+    AuditLog,
+    Case,
+    CaseStatus,
+    CaseTeam,
+    CaseTeamRole,
+    Court,
+    Deadline,
+    DeadlineBasis,
+    DeadlineReminder,
+    DeadlineStatus,
+    DeadlineTriggerType,
+    Organization,
+    ReminderChannel,
+    Subscription,
+    SubscriptionStatus,
+    User,
+    UserAccessGrant,
+    UserRole,
+)
+from court_rules.services.access import REBUILD_BATCH_SIZE, refresh_case_access
+from court_rules.services.audit import compute_changes, format_deadline_snapshot
+from court_rules.services.audit_archive import ensure_audit_partitions
+from court_rules.services.rollups import reconcile_rollups
+
+DEFAULT_USERS_PER_ORG = 12
+DEFAULT_BATCH_SIZE = 10_000
+LOAD_PASSWORD = 'load-test-password'
+
+# (court name, timezone); ids are derived from the name so reruns reuse them.
+LOAD_COURTS = (
+    ('Load Test District Court (Chicago)', 'America/Chicago'),
+    ('Load Test District Court (New York)', 'America/New_York'),
+    ('Load Test District Court (Los Angeles)', 'America/Los_Angeles'),
+    ('Load Test District Court (Houston)', 'America/Chicago'),
+    ('Load Test District Court (Denver)', 'America/Denver'),
+)
+
+# (city, state, zip prefix, timezone)
+ORG_LOCATIONS = (
+    ('Chicago', 'IL', '606', 'America/Chicago'),
+    ('New York', 'NY', '100', 'America/New_York'),
+    ('Los Angeles', 'CA', '900', 'America/Los_Angeles'),
+    ('Houston', 'TX', '770', 'America/Chicago'),
+    ('Denver', 'CO', '802', 'America/Denver'),
+    ('Miami', 'FL', '331', 'America/New_York'),
+)
+
+FIRST_NAMES = (
+    'Avery', 'Blake', 'Casey', 'Dana', 'Elliot', 'Frances', 'Gale', 'Harper', 'Indra', 'Jordan',
+    'Kendall', 'Logan', 'Morgan', 'Noel', 'Oakley', 'Parker', 'Quinn', 'Reese', 'Sasha', 'Taylor',
+)
+LAST_NAMES = (
+    'Abbott', 'Becker', 'Castillo', 'Duarte', 'Ellison', 'Fischer', 'Greer', 'Hollis', 'Ibarra', 'Jensen',
+    'Keller', 'Lindqvist', 'Moreau', 'Nakamura', 'Okafor', 'Pruitt', 'Quintero', 'Rasmussen', 'Sato', 'Thorne',
+)
+PRACTICE_AREAS = ('Commercial Litigation', 'Employment', 'Intellectual Property', 'Antitrust', 'Securities', 'Insurance')
+STAGES = ('Pleadings', 'Discovery', 'Expert Discovery', 'Summary Judgment', 'Trial', 'Post-Trial')
+
+# Relative weights; everything after the first (firm admin) user is drawn from STAFF_ROLES.
+STAFF_ROLES = {UserRole.MANAGING_LAWYER: 15, UserRole.LAWYER: 50, UserRole.PARALEGAL: 35}
+CASE_STATUSES = {
+    CaseStatus.OPEN: 70,
+    CaseStatus.STAYED: 5,
+    CaseStatus.CLOSED: 20,
+    CaseStatus.APPEAL: 4,
+    CaseStatus.OTHER: 1,
+}
+TRIGGER_TYPES = {DeadlineTriggerType.RULE: 60, DeadlineTriggerType.COURT_ORDER: 25, DeadlineTriggerType.USER: 15}
+PAST_DEADLINE_STATUSES = {DeadlineStatus.DONE: 85, DeadlineStatus.MISSED: 8, DeadlineStatus.OPEN: 7}
+FUTURE_DEADLINE_STATUSES = {DeadlineStatus.OPEN: 88, DeadlineStatus.SNOOZED: 6, DeadlineStatus.DONE: 6}
+PRIORITIES = {1: 5, 2: 15, 3: 50, 4: 20, 5: 10}
+REMINDER_CHANNELS = {ReminderChannel.EMAIL: 55, ReminderChannel.IN_APP: 35, ReminderChannel.SMS: 5, ReminderChannel.PUSH: 5}
+RULE_OFFSETS = (7, 14, 21, 28, 30, 35, 60, 90)
+REMINDER_LEAD_DAYS = (14, 7, 3, 1)
+ACTIVE_CASE_STATUSES = (CaseStatus.OPEN, CaseStatus.STAYED, CaseStatus.APPEAL)
+
+# Emitted in this order so parents are written before their children.
+LOAD_MODELS = (Organization, Subscription, User, UserAccessGrant, Case, CaseTeam, Deadline, DeadlineReminder, AuditLog)
+
+
+@dataclass
+class LoadDataResult:
+    counts: dict[str, int] = field(default_factory=dict)
+    case_access_rows: int = 0
+    elapsed: float = 0.0
+
+
+def _weighted(choices: dict) -> tuple[list, list]:
+    return list(choices), list(choices.values())
+
+
+def court_id(name: str) -> uuid.UUID:
+    return uuid.uuid5(uuid.NAMESPACE_URL, f'qgavel-load-court:{name}')
+
+
+def case_id_prefix(seed: int) -> str:
+    """internal_case_id prefix of every case generated from ``seed``."""
+
+    return f'LOAD{seed}-'
+
+
+def _copy_text(value: str) -> str:
+    return value.replace('\\', '\\\\').replace('\t', '\\t').replace('\n', '\\n').replace('\r', '\\r')
+
+
+def _copy_encoder(model_field) -> Callable[[Any], str]:
+    """Return the COPY text-format encoder for one column (None becomes NULL separately)."""
+
+    if isinstance(model_field, JSONField):
+        return lambda value: _copy_text(json.dumps(value))
+    if isinstance(model_field, BooleanField):
+        return lambda value: 't' if value else 'f'
+    if isinstance(model_field, (DateField, DateTimeField)):
+        return lambda value: value.isoformat()
+    if isinstance(model_field, (CharField, TextField)):
+        return _copy_text
+    return str
+
+
+class _TableWriter:
+    """
+    Buffers rows (dicts of attname -> value) for one model and writes them
+    with COPY, or bulk_create where COPY is unavailable. Columns a row leaves
+    out get the field's default.
+    """
+
+    def __init__(self, model: type[Model], *, batch_size: int, use_copy: bool):
+        self.model = model
+        self.batch_size = batch_size
+        self.use_copy = use_copy
+        self.fields = list(model._meta.concrete_fields)
+        self.defaults = {f.attname: f.get_default() for f in self.fields if not f.primary_key}
+        self.encoders = [(f.attname, _copy_encoder(f)) for f in self.fields]
+        self.rows: list[dict[str, Any]] = []
+        self.written = 0
+
+    def add(self, row: dict[str, Any]) -> None:
+        self.rows.append(row)
+        if len(self.rows) >= self.batch_size:
+            self.flush()
+
+    def flush(self) -> None:
+        rows, self.rows = self.rows, []
+        if not rows:
+            return
+        if self.use_copy:
+            self._copy(rows)
+        else:
+            self.model.objects.bulk_create(
+                [self.model(**{**self.defaults, **row}) for row in rows],
+                batch_size=1000,
+            )
+        self.written += len(rows)
+
+    def _copy(self, rows: list[dict[str, Any]]) -> None:
+        # Encoding the text format here is several times faster than
+        # psycopg's per-value adaptation in copy.write_row().
+        lines = []
+        for row in rows:
+            values = {**self.defaults, **row}
+            lines.append('\t'.join(
+                '\\N' if values[name] is None else encode(values[name])
+                for name, encode in self.encoders
+            ))
+        lines.append('')
+        quote = connection.ops.quote_name
+        columns = ', '.join(quote(f.column) for f in self.fields)
+        with connection.cursor() as cursor:
+            with cursor.copy(f'COPY {quote(self.model._meta.db_table)} ({columns}) FROM STDIN') as copy:
+                copy.write('\n'.join(lines))
+
+
+def copy_supported() -> bool:
+    if connection.vendor != 'postgresql':
+        return False
+    from django.db.backends.postgresql.psycopg_any import is_psycopg3
+
+    return is_psycopg3
+
+
+class _Generator:
+    def __init__(self, *, seed: int, anchor: date, cases_per_org: int, deadlines_per_case: int,
+                 users_per_org: int, writers: dict):
+        self.rng = random.Random(seed)
+        self.seed = seed
+        self.anchor = anchor
+        self.now = datetime.combine(anchor, time(12), tzinfo=dt_timezone.utc)
+        self.cases_per_org = cases_per_org
+        self.deadlines_per_case = deadlines_per_case
+        self.users_per_org = max(users_per_org, 2)
+        self.writers = writers
+        self.password = make_password(LOAD_PASSWORD)
+        self.court_ids = [court_id(name) for name, _ in LOAD_COURTS]
+        self.zones = {tz: ZoneInfo(tz) for *_, tz in ORG_LOCATIONS}
+        self.case_statuses = _weighted(CASE_STATUSES)
+        self.staff_roles = _weighted(STAFF_ROLES)
+        self.trigger_types = _weighted(TRIGGER_TYPES)
+        self.past_statuses = _weighted(PAST_DEADLINE_STATUSES)
+        self.future_statuses = _weighted(FUTURE_DEADLINE_STATUSES)
+        self.priorities = _weighted(PRIORITIES)
+        self.channels = _weighted(REMINDER_CHANNELS)
+
+    def uuid(self) -> uuid.UUID:
+        return uuid.UUID(int=self.rng.getrandbits(128), version=4)
+
+    def pick(self, weighted: tuple[list, list]):
+        return self.rng.choices(weighted[0], weights=weighted[1])[0]
+
+    def moment(self, days_ago: float) -> datetime:
+        return self.now - timedelta(days=days_ago)
+
+    def emit(self, model: type[Model], row: dict[str, Any]) -> None:
+        self.writers[model].add(row)
+
+    def organization(self, index: int) -> tuple[uuid.UUID, list]:
+        """Generate one organization and everything under it; returns its id and case ids."""
+
+        rng = self.rng
+        city, state, zip_prefix, tz = rng.choice(ORG_LOCATIONS)
+        org_id = self.uuid()
+        org_created = self.moment(rng.uniform(400, 1500))
+        self.emit(Organization, {
+            'id': org_id,
+            'name': f'Load Firm {self.seed}-{index:05d}',
+            'address_line1': f'{rng.randint(1, 999)} {rng.choice(LAST_NAMES)} Street',
+            'city': city,
+            'state': state,
+            'zip_code': f'{zip_prefix}{rng.randint(0, 99):02d}',
+            'phone': f'({rng.randint(201, 989)}) 555-{rng.randint(0, 9999):04d}',
+            'created_at': org_created,
+            'updated_at': org_created,
+        })
+
+        users = self.users(org_id, index, tz, org_created)
+        active_users = [user for user in users if user['is_active']]
+        licensed = len(active_users) + rng.randint(0, 5)
+        self.emit(Subscription, {
+            'id': self.uuid(),
+            'organization_id': org_id,
+            'licensed_users': licensed,
+            'monthly_rate': Decimal(licensed * rng.choice((99, 149, 199))),
+            'contract_start_date': org_created.date(),
+            'status': SubscriptionStatus.ACTIVE if rng.random() < 0.95 else SubscriptionStatus.TRIAL,
+            'active_user_count': len(active_users),
+            'created_at': org_created,
+            'updated_at': org_created,
+        })
+
+        admin = users[0]
+        attorneys = [u['id'] for u in active_users if u['role'] in (UserRole.MANAGING_LAWYER, UserRole.LAWYER)]
+        paralegals = [u['id'] for u in active_users if u['role'] == UserRole.PARALEGAL]
+        self.grants(org_id, admin, active_users, org_created)
+
+        case_ids = []
+        for number in range(self.cases_per_org):
+            case_ids.append(self.case(org_id, index, number, tz, attorneys or [admin['id']], paralegals))
+        return org_id, case_ids
+
+    def users(self, org_id, index: int, tz: str, org_created: datetime) -> list[dict[str, Any]]:
+        rng = self.rng
+        users = []
+        for number in range(self.users_per_org):
+            role = UserRole.FIRM_ADMIN if number == 0 else self.pick(self.staff_roles)
+            created = org_created + timedelta(days=rng.uniform(0, 300)) if number else org_created
+            user = {
+                'id': self.uuid(),
+                'email': f'load{self.seed}.org{index}.user{number}@example.com',
+                'first_name': rng.choice(FIRST_NAMES),
+                'last_name': rng.choice(LAST_NAMES),
+                'organization_id': org_id,
+                'role': role,
+                'timezone': tz,
+                'password': self.password,
+                'created_by_id': users[0]['id'] if users else None,
+                'is_active': number == 0 or rng.random() >= 0.03,
+                'created_at': created,
+                'updated_at': created,
+            }
+            users.append(user)
+            self.emit(User, user)
+        return users
+
+    def grants(self, org_id, admin: dict, active_users: list[dict], org_created: datetime) -> None:
+        """Managing lawyers see most of the firm; some lawyers see a paralegal or colleague."""
+
+        rng = self.rng
+        staff = [u for u in active_users if u['role'] in (UserRole.LAWYER, UserRole.PARALEGAL)]
+        for user in active_users:
+            if user['role'] == UserRole.MANAGING_LAWYER:
+                targets = [u for u in staff if rng.random() < 0.6]
+            elif user['role'] == UserRole.LAWYER:
+                others = [u for u in staff if u['id'] != user['id']]
+                targets = rng.sample(others, min(len(others), rng.choice((0, 0, 1, 2))))
+            else:
+                continue
+            for target in targets:
+                created = max(user['created_at'], target['created_at'])
+                self.emit(UserAccessGrant, {
+                    'id': self.uuid(),
+                    'organization_id': org_id,
+                    'granted_by_id': admin['id'],
+                    'granted_to_id': user['id'],
+                    'can_access_user_id': target['id'],
+                    'is_active': rng.random() >= 0.05,
+                    'created_at': created,
+                    'updated_at': created,
+                })
+
+    def case(self, org_id, index: int, number: int, tz: str, attorneys: list, paralegals: list):
+        rng = self.rng
+        status = self.pick(self.case_statuses)
+        active = status in ACTIVE_CASE_STATUSES
+        age = rng.uniform(0, 900) if active else rng.uniform(120, 1500)
+        created = self.moment(age)
+        lead = rng.choice(attorneys)
+        case_id = self.uuid()
+        self.emit(Case, {
+            'id': case_id,
+            'organization_id': org_id,
+            'internal_case_id': f'{case_id_prefix(self.seed)}{index:05d}-{number:06d}',
+            'case_number': f'1:{created:%y}-cv-{rng.randint(1, 99999):05d}',
+            'caption': f'{rng.choice(LAST_NAMES)} v. {rng.choice(LAST_NAMES)} {rng.choice(("Inc.", "LLC", "Corp.", "Holdings"))}',
+            'practice_area': rng.choice(PRACTICE_AREAS),
+            'court_id': rng.choice(self.court_ids),
+            'filing_date': (created - timedelta(days=rng.randint(0, 30))).date(),
+            'status': status,
+            'stage': rng.choice(STAGES),
+            'lead_attorney_id': lead,
+            'timezone': tz,
+            'created_at': created,
+            'updated_at': created,
+        })
+
+        team = [(lead, CaseTeamRole.OWNER)]
+        team += [(user_id, CaseTeamRole.CONTRIBUTOR) for user_id in rng.sample(paralegals, min(len(paralegals), rng.randint(0, 2)))]
+        reviewers = [user_id for user_id in attorneys if user_id != lead]
+        if reviewers and rng.random() < 0.2:
+            team.append((rng.choice(reviewers), CaseTeamRole.REVIEWER))
+        for user_id, role in team:
+            self.emit(CaseTeam, {'id': self.uuid(), 'case_id': case_id, 'user_id': user_id, 'role': role, 'added_at': created})
+
+        self.emit(AuditLog, {
+            'id': self.uuid(),
+            'actor_user_id': lead,
+            'entity_table': 'cases',
+            'entity_id': case_id,
+            'action': AuditAction.CREATE,
+            'after': {'status': status, 'lead_attorney_id': str(lead)},
+            'changes': {'status': [None, status], 'lead_attorney_id': [None, str(lead)]},
+            'created_at': created,
+        })
+
+        owners = [user_id for user_id, _ in team]
+        for _ in range(self.deadlines_per_case):
+            self.deadline(case_id, created, active, tz, lead, owners)
+        return case_id
+
+    def deadline(self, case_id, case_created: datetime, active: bool, tz: str, lead, owners: list) -> None:
+        rng = self.rng
+        zone = self.zones[tz]
+        if active:
+            # Most deadlines of a live case cluster in the next few weeks.
+            due_in = round(rng.triangular(-120, 240, 10))
+        else:
+            due_in = -round(rng.uniform(30, (self.now - case_created).days or 30))
+        due_day = self.anchor + timedelta(days=due_in)
+        due_at = datetime.combine(due_day, time(17), tzinfo=zone)
+        created = max(case_created, min(due_at - timedelta(days=rng.uniform(3, 90)), self.now - timedelta(hours=1)))
+
+        past = due_at < self.now
+        status = self.pick(self.past_statuses if past else self.future_statuses)
+        trigger_type = self.pick(self.trigger_types)
+        trigger_date = offset_days = None
+        basis = DeadlineBasis.CALENDAR_DAYS
+        rationale = ''
+        if trigger_type == DeadlineTriggerType.RULE:
+            offset_days = rng.choice(RULE_OFFSETS)
+            basis = DeadlineBasis.BUSINESS_DAYS if rng.random() < 0.2 else DeadlineBasis.CALENDAR_DAYS
+            trigger_date = due_day - timedelta(days=offset_days)
+            rationale = f'{offset_days} {basis.label.lower()} after {trigger_date.isoformat()}'
+        elif trigger_type == DeadlineTriggerType.COURT_ORDER:
+            trigger_date = (created - timedelta(days=rng.randint(0, 3))).date()
+
+        owner = lead if rng.random() < 0.7 else rng.choice(owners)
+        updated = created
+        if status in (DeadlineStatus.DONE, DeadlineStatus.MISSED):
+            updated = min(due_at + timedelta(hours=rng.uniform(-72, 24)), self.now)
+            updated = max(updated, created)
+        row = {
+            'id': self.uuid(),
+            'case_id': case_id,
+            'trigger_type': trigger_type,
+            'trigger_source_type': '',
+            'trigger_source_id': None,
+            'basis': basis,
+            'holiday_calendar_id': None,
+            'trigger_date': trigger_date,
+            'offset_days': offset_days,
+            'due_at': due_at,
+            'timezone': tz,
+            'owner_id': owner,
+            'priority': self.pick(self.priorities),
+            'status': status,
+            'snooze_until': self.now + timedelta(days=rng.randint(1, 7)) if status == DeadlineStatus.SNOOZED else None,
+            'extension_notes': '',
+            'outcome': '',
+            'computation_rationale': rationale,
+            'created_by_id': owner,
+            'updated_by_id': owner if updated != created else None,
+            'created_at': created,
+            'updated_at': updated,
+        }
+        self.emit(Deadline, row)
+        self.reminders(row)
+        self.audit(row)
+
+    def reminders(self, deadline: dict[str, Any]) -> None:
+        rng = self.rng
+        for lead_days in sorted(rng.sample(REMINDER_LEAD_DAYS, rng.randint(0, 3)), reverse=True):
+            notify_at = deadline['due_at'] - timedelta(days=lead_days)
+            if notify_at < deadline['created_at']:
+                continue
+            sent = notify_at <= self.now
+            self.emit(DeadlineReminder, {
+                'id': self.uuid(),
+                'deadline_id': deadline['id'],
+                'notify_at': notify_at,
+                'channel': self.pick(self.channels),
+                'sent': sent,
+                'sent_at': notify_at + timedelta(seconds=rng.randint(5, 600)) if sent else None,
+            })
+
+    def audit(self, deadline: dict[str, Any]) -> None:
+        """A create entry per deadline, plus the status change for closed-out ones."""
+
+        after = format_deadline_snapshot(SimpleNamespace(**deadline))
+        opened = {**after, 'status': DeadlineStatus.OPEN, 'snooze_until': None}
+        entries = [(deadline['created_at'], AuditAction.CREATE, None, opened)]
+        if deadline['status'] != DeadlineStatus.OPEN:
+            entries.append((deadline['updated_at'], AuditAction.UPDATE, opened, after))
+        for created_at, action, before, snapshot in entries:
+            self.emit(AuditLog, {
+                'id': self.uuid(),
+                'actor_user_id': deadline['owner_id'],
+                'entity_table': 'deadlines',
+                'entity_id': deadline['id'],
+                'action': action,
+                'before': before,
+                'after': snapshot,
+                'changes': compute_changes(before, snapshot) or None,
+                'created_at': created_at,
+            })
+
+
+def _ensure_courts() -> None:
+    existing = set(Court.objects.filter(id__in=[court_id(name) for name, _ in LOAD_COURTS]).values_list('id', flat=True))
+    Court.objects.bulk_create([
+        Court(id=court_id(name), name=name, district='Load Test', timezone=tz)
+        for name, tz in LOAD_COURTS
+        if court_id(name) not in existing
+    ])
+
+
+def generate_load_data(
+    *,
+    orgs: int,
+    cases_per_org: int,
+    deadlines_per_case: int,
+    users_per_org: int = DEFAULT_USERS_PER_ORG,
+    seed: int = 1,
+    anchor: Optional[date] = None,
+    batch_size: int = DEFAULT_BATCH_SIZE,
+    progress: Optional[Callable[[int, LoadDataResult], None]] = None,
+) -> LoadDataResult:
+    """
+    Generate ``orgs`` organizations of ``cases_per_org`` cases with
+    ``deadlines_per_case`` deadlines each. Due dates and timestamps are laid
+    out around ``anchor`` (default: today). Raises ValueError when rows from
+    the same seed already exist. ``progress(orgs_done, result)`` is called
+    after each organization commits.
+    """
+    if Case.objects.filter(internal_case_id__startswith=case_id_prefix(seed)).exists():
+        raise ValueError(f'Load data for seed {seed} already exists; pick another seed')
+
+    started = time_module.perf_counter()
+    anchor = anchor or date.today()
+    use_copy = copy_supported()
+    writers = {model: _TableWriter(model, batch_size=batch_size, use_copy=use_copy) for model in LOAD_MODELS}
+    generator = _Generator(
+        seed=seed,
+        anchor=anchor,
+        cases_per_org=cases_per_org,
+        deadlines_per_case=deadlines_per_case,
+        users_per_org=users_per_org,
+        writers=writers,
+    )
+    result = LoadDataResult()
+
+    _ensure_courts()
+    # Closed cases reach back about four years; give their audit rows real partitions.
+    ensure_audit_partitions(start=anchor - timedelta(days=1600))
+
+    org_ids = []
+    for index in range(orgs):
+        with transaction.atomic():
+            org_id, case_ids = generator.organization(index)
+            for writer in writers.values():
+                writer.flush()
+        org_ids.append(org_id)
+        for start in range(0, len(case_ids), REBUILD_BATCH_SIZE):
+            added, _ = refresh_case_access(case_ids[start:start + REBUILD_BATCH_SIZE])
+            result.case_access_rows += added
+        result.counts = {model._meta.db_table: writer.written for model, writer in writers.items()}
+        if progress:
+            progress(index + 1, result)
+
+    reconcile_rollups(organization_ids=org_ids)
+    result.elapsed = time_module.perf_counter() - started
+    return result
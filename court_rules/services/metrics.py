@@ -0,0 +1,150 @@
+"""
+Prometheus metrics for the web workers, served at /metrics.
+
+MetricsMiddleware records every request's latency and SQL query count per
+route and DRF action, and the caches count their hits and misses, in
+prometheus_client counters and histograms. Under Gunicorn the
+PROMETHEUS_MULTIPROC_DIR environment variable must name an empty directory
+before the workers start. Each worker then writes its samples to mmap'd files
+there, and whichever worker serves /metrics merges the files of all of them.
+Without it (runserver, tests) the metrics live in process memory.
+
+Reminder dispatcher lag and outbox depth are gauges read from the database at
+scrape time, so they do not depend on which worker answers.
+"""
+
+from __future__ import annotations
+
+import ipaddress
+import os
+from functools import lru_cache
+from typing import Iterable, Optional
+
+from django.conf import settings
+from django.utils import timezone
+from prometheus_client import CONTENT_TYPE_LATEST, REGISTRY, CollectorRegistry, Counter, Histogram, generate_latest
+from prometheus_client.core import GaugeMetricFamily
+from prometheus_client.multiprocess import MultiProcessCollector
+
+from court_rules.services.outbox import outbox_backlog
+from court_rules.services.reminders import reminder_backlog
+
+MULTIPROC_DIR_ENV = 'PROMETHEUS_MULTIPROC_DIR'
+UNMATCHED_ROUTE = 'unmatched'
+KNOWN_METHODS = frozenset({'GET', 'HEAD', 'POST', 'PUT', 'PATCH', 'DELETE', 'OPTIONS'})
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+QUERY_BUCKETS = (0, 1, 2, 5, 10, 20, 50, 100, 200, 500)
+FORWARDING_HEADERS = ('HTTP_X_FORWARDED_FOR', 'HTTP_X_REAL_IP', 'HTTP_FORWARDED')
+
+REQUEST_LATENCY = Histogram(
+    'qgavel_http_request_duration_seconds',
+    'Time to build the response, by route and DRF action.',
+    ['route', 'action', 'method'],
+    buckets=LATENCY_BUCKETS,
+)
+REQUEST_QUERIES = Histogram(
+    'qgavel_http_request_db_queries',
+    'SQL queries per request, by route and DRF action.',
+    ['route', 'action'],
+    buckets=QUERY_BUCKETS,
+)
+RESPONSES = Counter(
+    'qgavel_http_responses',
+    'Responses by route and status class.',
+    ['route', 'method', 'status'],
+)
+CACHE_LOOKUPS = Counter(
+    'qgavel_cache_lookups',
+    'Cache lookups by cache and result (hit or miss).',
+    ['cache', 'result'],
+)
+
+
+class QueryCounter:
+    """execute_wrapper hook that only counts queries."""
+
+    def __init__(self):
+        self.queries = 0
+
+    def __call__(self, execute, sql, params, many, context):
+        self.queries += 1
+        return execute(sql, params, many, context)
+
+
+def observe_request(*, route: str, action: str, method: str, status: int, seconds: float, queries: int) -> None:
+    route = route or UNMATCHED_ROUTE
+    method = method if method in KNOWN_METHODS else 'OTHER'
+    REQUEST_LATENCY.labels(route, action, method).observe(seconds)
+    REQUEST_QUERIES.labels(route, action).observe(queries)
+    RESPONSES.labels(route, method, f'{status // 100}xx').inc()
+
+
+def record_cache_lookups(cache: str, *, hits: int = 0, misses: int = 0) -> None:
+    if hits:
+        CACHE_LOOKUPS.labels(cache, 'hit').inc(hits)
+    if misses:
+        CACHE_LOOKUPS.labels(cache, 'miss').inc(misses)
+
+
+class BacklogCollector:
+    """Reminder and outbox backlog gauges, queried on every scrape."""
+
+    def collect(self):
+        now = timezone.now()
+        reminders = reminder_backlog(now=now)
+        yield GaugeMetricFamily(
+            'qgavel_reminders_due', 'Reminders past notify_at that are not sent yet.', value=reminders['pending'],
+        )
+        yield GaugeMetricFamily(
+            'qgavel_reminder_dispatch_lag_seconds', 'How long the oldest due reminder has waited.',
+            value=reminders['lag'].total_seconds(),
+        )
+        outbox = outbox_backlog(now=now)
+        yield GaugeMetricFamily(
+            'qgavel_outbox_queued', 'Queued outbox emails, including those waiting to retry.', value=outbox['queued'],
+        )
+        yield GaugeMetricFamily('qgavel_outbox_due', 'Queued outbox emails ready to send.', value=outbox['due'])
+        yield GaugeMetricFamily(
+            'qgavel_outbox_lag_seconds', 'How long the oldest due outbox email has waited.',
+            value=outbox['lag'].total_seconds(),
+        )
+
+
+def render_metrics() -> tuple[bytes, str]:
+    """The exposition body and its content type."""
+
+    if os.environ.get(MULTIPROC_DIR_ENV):
+        registry = CollectorRegistry()
+        MultiProcessCollector(registry)
+    else:
+        registry = REGISTRY
+    backlog = CollectorRegistry()
+    backlog.register(BacklogCollector())
+    return generate_latest(registry) + generate_latest(backlog), CONTENT_TYPE_LATEST
+
+
+@lru_cache(maxsize=8)
+def _allowed_networks(networks: tuple[str, ...]) -> tuple:
+    return tuple(ipaddress.ip_network(network, strict=False) for network in networks)
+
+
+def scrape_allowed(request) -> bool:
+    """
+    Whether ``request`` comes straight from an allowed collector. Requests
+    relayed by a proxy are refused whatever their REMOTE_ADDR: a proxy on
+    the same host makes every outside client look local.
+    """
+    if any(header in request.META for header in FORWARDING_HEADERS):
+        return False
+    return client_allowed(request.META.get('REMOTE_ADDR'))
+
+
+def client_allowed(address: Optional[str], networks: Optional[Iterable[str]] = None) -> bool:
+    """Whether ``address`` is inside METRICS_ALLOWED_NETWORKS."""
+
+    try:
+        ip = ipaddress.ip_address(address or '')
+    except ValueError:
+        return False
+    allowed = _allowed_networks(tuple(networks if networks is not None else settings.METRICS_ALLOWED_NETWORKS))
+    return any(ip in network for network in allowed)
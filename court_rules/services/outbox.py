@@ -0,0 +1,160 @@
+"""
+Database-backed email outbox.
+
+enqueue_email() stores an OutboundEmail row in the caller's transaction, so
+the email becomes visible to the worker only once the request commits and
+disappears with it on rollback. send_outbox_batch() claims queued rows with
+FOR UPDATE SKIP LOCKED and leases them by pushing available_at out by
+CLAIM_LEASE, then commits. It renders them from cached compiled templates,
+sends the whole batch over one backend connection with no transaction
+open, and records the outcomes and NotificationLog entries in a second
+transaction. Failed sends are retried with exponential backoff until
+EMAIL_OUTBOX_MAX_ATTEMPTS; rows of a worker that dies mid-batch are picked
+up again once their lease runs out.
+"""
+
+from __future__ import annotations
+
+from datetime import timedelta
+from functools import lru_cache
+from typing import Any, Optional
+
+from django.conf import settings
+from django.core.mail import EmailMultiAlternatives, get_connection
+from django.db import transaction
+from django.db.models import Count, Min, Q
+from django.template.loader import get_template
+from django.utils import timezone
+from django.utils.html import strip_tags
+
+from court_rules.models import NotificationChannel, NotificationLog, NotificationStatus, OutboundEmail, User
+
+DEFAULT_BATCH_SIZE = 100
+CLAIM_LEASE = timedelta(minutes=15)
+RETRY_BASE_DELAY = timedelta(minutes=1)
+
+
+def enqueue_email(
+    *,
+    to: list[str],
+    subject: str,
+    template_name: str = '',
+    context: Optional[dict[str, Any]] = None,
+    body: str = '',
+    user: Optional[User] = None,
+    from_email: Optional[str] = None,
+) -> OutboundEmail:
+    """Queue an email. ``context`` must be JSON-serializable."""
+
+    return OutboundEmail.objects.create(
+        user=user,
+        to=list(to),
+        from_email=from_email or settings.DEFAULT_FROM_EMAIL,
+        subject=subject,
+        template_name=template_name,
+        context=context or {},
+        body=body,
+    )
+
+
+@lru_cache(maxsize=64)
+def compiled_template(name: str):
+    """Compiled template, parsed once per worker process."""
+
+    return get_template(name)
+
+
+def build_message(email: OutboundEmail) -> EmailMultiAlternatives:
+    if email.template_name:
+        html = compiled_template(email.template_name).render(email.context)
+        message = EmailMultiAlternatives(email.subject, strip_tags(html), email.from_email, email.to)
+        message.attach_alternative(html, 'text/html')
+        return message
+    return EmailMultiAlternatives(email.subject, email.body, email.from_email, email.to)
+
+
+def claim_outbox(*, now, batch_size: int = DEFAULT_BATCH_SIZE) -> list[OutboundEmail]:
+    """Lock up to ``batch_size`` queued emails that are due. Must run inside a transaction."""
+
+    return list(
+        OutboundEmail.objects.select_for_update(skip_locked=True)
+        .filter(status=NotificationStatus.QUEUED, available_at__lte=now)
+        .order_by('available_at')[:batch_size]
+    )
+
+
+def _record_failure(email: OutboundEmail, error: str, now) -> None:
+    email.attempts += 1
+    email.last_error = error
+    if email.attempts >= settings.EMAIL_OUTBOX_MAX_ATTEMPTS:
+        email.status = NotificationStatus.FAILED
+    else:
+        email.available_at = now + RETRY_BASE_DELAY * 2 ** (email.attempts - 1)
+
+
+def send_outbox_batch(*, batch_size: int = DEFAULT_BATCH_SIZE) -> dict[str, int]:
+    """Send one batch of due emails. Returns counts of claimed, sent and failed emails."""
+
+    now = timezone.now()
+    with transaction.atomic():
+        emails = claim_outbox(now=now, batch_size=batch_size)
+        if not emails:
+            return {'claimed': 0, 'sent': 0, 'failed': 0}
+        OutboundEmail.objects.filter(pk__in=[email.pk for email in emails]).update(available_at=now + CLAIM_LEASE)
+
+    # Sending runs after the claim commits, so no row locks are held over SMTP.
+    connection = get_connection()
+    try:
+        connection.open()
+    except Exception as exc:  # noqa: BLE001 - retried later like any other send failure
+        for email in emails:
+            _record_failure(email, str(exc), now)
+    else:
+        try:
+            for email in emails:
+                try:
+                    message = build_message(email)
+                    message.connection = connection
+                    message.send()
+                except Exception as exc:  # noqa: BLE001 - one bad email must not stop the batch
+                    _record_failure(email, str(exc), now)
+                else:
+                    email.status = NotificationStatus.SENT
+                    email.sent_at = now
+                    email.attempts += 1
+        finally:
+            connection.close()
+
+    sent = failed = 0
+    logs = []
+    for email in emails:
+        if email.status == NotificationStatus.SENT:
+            sent += 1
+        elif email.status == NotificationStatus.FAILED:
+            failed += 1
+        else:
+            continue
+        if email.user_id:
+            logs.append(NotificationLog(
+                user_id=email.user_id,
+                channel=NotificationChannel.EMAIL,
+                payload={'outbox_id': str(email.pk), 'subject': email.subject, 'error': email.last_error or None},
+                status=email.status,
+                delivered_at=email.sent_at,
+            ))
+    with transaction.atomic():
+        OutboundEmail.objects.bulk_update(emails, ['status', 'attempts', 'last_error', 'available_at', 'sent_at'])
+        NotificationLog.objects.bulk_create(logs)
+    return {'claimed': len(emails), 'sent': sent, 'failed': failed}
+
+
+def outbox_backlog(*, now=None) -> dict:
+    """Queued emails, how many of them are due, and how late the oldest due one is."""
+
+    now = now or timezone.now()
+    due = Q(available_at__lte=now)
+    backlog = OutboundEmail.objects.filter(status=NotificationStatus.QUEUED).aggregate(
+        queued=Count('id'), due=Count('id', filter=due), oldest=Min('available_at', filter=due),
+    )
+    backlog['lag'] = now - backlog['oldest'] if backlog['oldest'] else timedelta(0)
+    return backlog
@@ -0,0 +1,107 @@
+"""
+Disk-backed HTTP page cache shared by the scraper commands.
+
+Each URL gets two files under SCRAPER_CACHE_DIR, named by the SHA-256 of the
+URL: the last body and a JSON record of its ETag, Last-Modified, content hash
+and, per consumer (one per scraper command), the content hash that consumer
+last processed. fetch_page() sends If-None-Match / If-Modified-Since from the
+record and serves the cached body on a 304, and unchanged_for() lets a
+command skip parsing and writing when it has already handled the exact
+content, so an unchanged nightly re-scrape costs one conditional GET per page.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+from pathlib import Path
+from threading import Lock
+from typing import Optional
+
+from django.conf import settings
+from django.utils import timezone
+
+
+def content_hash(text: str) -> str:
+    return hashlib.sha256(text.encode('utf-8')).hexdigest()
+
+
+def _write_atomic(path: Path, data: str) -> None:
+    partial = path.with_name(f'{path.name}.partial')
+    partial.write_text(data, encoding='utf-8')
+    os.replace(partial, path)
+
+
+class PageCache:
+    """Cached bodies and validators keyed by URL. Safe to share between fetch threads."""
+
+    def __init__(self, directory=None):
+        self.directory = Path(directory or settings.SCRAPER_CACHE_DIR)
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self._lock = Lock()
+
+    def _paths(self, url: str) -> tuple[Path, Path]:
+        key = hashlib.sha256(url.encode('utf-8')).hexdigest()
+        return self.directory / f'{key}.json', self.directory / f'{key}.html'
+
+    def entry(self, url: str) -> dict:
+        record_path, _ = self._paths(url)
+        try:
+            return json.loads(record_path.read_text(encoding='utf-8'))
+        except (FileNotFoundError, ValueError):
+            return {}
+
+    def body(self, url: str) -> Optional[str]:
+        _, body_path = self._paths(url)
+        try:
+            return body_path.read_text(encoding='utf-8')
+        except FileNotFoundError:
+            return None
+
+    def conditional_headers(self, url: str) -> dict[str, str]:
+        """Validators for a conditional GET, only when the body is still on disk."""
+
+        entry = self.entry(url)
+        if not entry or self.body(url) is None:
+            return {}
+        headers = {}
+        if entry.get('etag'):
+            headers['If-None-Match'] = entry['etag']
+        if entry.get('last_modified'):
+            headers['If-Modified-Since'] = entry['last_modified']
+        return headers
+
+    def store(self, url: str, text: str, *, etag: str = '', last_modified: str = '') -> str:
+        """Save a freshly downloaded body; returns its content hash."""
+
+        record_path, body_path = self._paths(url)
+        digest = content_hash(text)
+        with self._lock:
+            entry = self.entry(url)
+            if entry.get('content_hash') != digest:
+                _write_atomic(body_path, text)
+            entry.update(
+                url=url,
+                etag=etag,
+                last_modified=last_modified,
+                content_hash=digest,
+                fetched_at=timezone.now().isoformat(),
+            )
+            entry.setdefault('processed', {})
+            _write_atomic(record_path, json.dumps(entry, sort_keys=True))
+        return digest
+
+    def unchanged_for(self, url: str, consumer: str, digest: str) -> bool:
+        """True when ``consumer`` already processed content with hash ``digest``."""
+
+        return bool(digest) and self.entry(url).get('processed', {}).get(consumer) == digest
+
+    def mark_processed(self, url: str, consumer: str, digest: str) -> None:
+        record_path, _ = self._paths(url)
+        with self._lock:
+            entry = self.entry(url)
+            if not entry:
+                return
+            entry.setdefault('processed', {})[consumer] = digest
+            _write_atomic(record_path, json.dumps(entry, sort_keys=True))
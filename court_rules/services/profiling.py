@@ -0,0 +1,170 @@
+"""
+Per-request sampling profiler for SamplingProfilerMiddleware.
+
+A StackSampler thread snapshots the request thread's Python stack every
+PROFILER_INTERVAL_MS via sys._current_frames() and counts identical stacks,
+so the request itself runs unmodified (no tracing hooks). Each profiled
+request is written to PROFILER_DIR/<route>/ in collapsed-stack format, one
+``frame;frame;frame count`` line per distinct stack, which flamegraph.pl and
+speedscope read directly. File names carry the worker pid, so every gunicorn
+worker writes its own files; read_profiles() and hottest_functions() merge
+them for the profile_report command.
+"""
+
+from __future__ import annotations
+
+import os
+import re
+import sys
+import threading
+import uuid
+from collections import Counter
+from dataclasses import dataclass, field
+from datetime import datetime
+from pathlib import Path
+from types import CodeType, FrameType
+from typing import Iterator, Optional
+
+from django.conf import settings
+from django.utils import timezone
+
+PROFILE_SUFFIX = '.folded'
+ROUTE_NAME_PATTERN = re.compile(r'[^\w.-]+')
+UNRESOLVED_ROUTE = '_unresolved'
+
+
+def _frame_label(code: CodeType, labels: dict) -> str:
+    label = labels.get(code)
+    if label is None:
+        path = code.co_filename
+        parts = Path(path).parts
+        # Keep paths short but unambiguous: package-relative where possible.
+        for anchor in ('site-packages', 'court_rules', 'config'):
+            if anchor in parts:
+                index = parts.index(anchor)
+                path = '/'.join(parts[index + 1:] if anchor == 'site-packages' else parts[index:])
+                break
+        label = labels[code] = f'{code.co_name} ({path}:{code.co_firstlineno})'.replace(';', ':')
+    return label
+
+
+class StackSampler:
+    """
+    Counts the stacks of one thread, sampled from a helper thread. Frames at
+    and above ``root`` (the caller's frame by default) are left out, so
+    stacks start at the profiled code rather than the server loop.
+    """
+
+    def __init__(self, *, interval: float, thread_id: Optional[int] = None, root: Optional[FrameType] = None):
+        self.interval = interval
+        self.thread_id = thread_id if thread_id is not None else threading.get_ident()
+        self.root = root if root is not None else sys._getframe(1)
+        self.stacks: Counter = Counter()
+        self._labels: dict = {}
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._run, name='stack-sampler', daemon=True)
+
+    def __enter__(self) -> 'StackSampler':
+        self._thread.start()
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self._stop.set()
+        self._thread.join()
+
+    @property
+    def samples(self) -> int:
+        return sum(self.stacks.values())
+
+    def _run(self) -> None:
+        while not self._stop.wait(self.interval):
+            frame = sys._current_frames().get(self.thread_id)
+            stack = []
+            while frame is not None and frame is not self.root:
+                stack.append(_frame_label(frame.f_code, self._labels))
+                frame = frame.f_back
+            if stack:
+                stack.reverse()
+                self.stacks[';'.join(stack)] += 1
+
+
+def route_directory_name(route: str) -> str:
+    return ROUTE_NAME_PATTERN.sub('_', route).strip('_') or UNRESOLVED_ROUTE
+
+
+def write_profile(route: str, stacks: Counter, *, directory=None) -> Optional[Path]:
+    """Write one request's stacks under ``directory/<route>/``. Returns the file, or None if empty."""
+
+    if not stacks:
+        return None
+    route_dir = Path(directory or settings.PROFILER_DIR) / route_directory_name(route)
+    route_dir.mkdir(parents=True, exist_ok=True)
+    name = f'{timezone.now():%Y%m%dT%H%M%S}-{os.getpid()}-{uuid.uuid4().hex[:8]}{PROFILE_SUFFIX}'
+    path = route_dir / name
+    body = ''.join(f'{stack} {count}\n' for stack, count in stacks.most_common())
+    partial = path.with_name(f'{name}.partial')
+    partial.write_text(body, encoding='utf-8')
+    os.replace(partial, path)
+    return path
+
+
+@dataclass
+class ProfileSet:
+    """Merged stacks of every profile file read, with per-route and per-worker tallies."""
+
+    stacks: Counter = field(default_factory=Counter)
+    route_samples: Counter = field(default_factory=Counter)
+    route_requests: Counter = field(default_factory=Counter)
+    workers: set = field(default_factory=set)
+    files: int = 0
+
+    @property
+    def samples(self) -> int:
+        return sum(self.route_samples.values())
+
+
+def _profile_files(directory: Path, route: Optional[str]) -> Iterator[tuple[str, Path]]:
+    if not directory.is_dir():
+        return
+    routes = [directory / route_directory_name(route)] if route else sorted(p for p in directory.iterdir() if p.is_dir())
+    for route_dir in routes:
+        if route_dir.is_dir():
+            for path in sorted(route_dir.glob(f'*{PROFILE_SUFFIX}')):
+                yield route_dir.name, path
+
+
+def read_profiles(*, directory=None, route: Optional[str] = None, since: Optional[datetime] = None) -> ProfileSet:
+    """Merge the profile files under ``directory``, optionally one route's or those newer than ``since``."""
+
+    profiles = ProfileSet()
+    for route_name, path in _profile_files(Path(directory or settings.PROFILER_DIR), route):
+        if since is not None and path.stat().st_mtime < since.timestamp():
+            continue
+        profiles.files += 1
+        profiles.route_requests[route_name] += 1
+        profiles.workers.add(path.name.split('-')[1])
+        for line in path.read_text(encoding='utf-8').splitlines():
+            stack, _, count = line.rpartition(' ')
+            if not stack or not count.isdigit():
+                continue
+            profiles.stacks[f'{route_name};{stack}'] += int(count)
+            profiles.route_samples[route_name] += int(count)
+    return profiles
+
+
+def hottest_functions(stacks: Counter) -> tuple[Counter, Counter]:
+    """
+    Return (self, inclusive) sample counts per frame. Self counts the frame
+    at the top of the stack; inclusive counts every stack the frame is on
+    once, so recursion is not double counted. The leading route is skipped.
+    """
+    own: Counter = Counter()
+    inclusive: Counter = Counter()
+    for stack, count in stacks.items():
+        frames = stack.split(';')[1:]
+        if not frames:
+            continue
+        own[frames[-1]] += count
+        for frame in set(frames):
+            inclusive[frame] += count
+    return own, inclusive
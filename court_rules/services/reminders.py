@@ -0,0 +1,264 @@
+"""
+Delivery of due DeadlineReminder rows.
+
+dispatch_due_reminders() claims a batch of unsent reminders whose notify_at
+has passed with ``SELECT ... FOR UPDATE SKIP LOCKED``, so any number of
+worker processes can run side by side without sending a reminder twice. The
+claim leases the batch (next_attempt_at) and commits, so no row locks are
+held while the batch is delivered per channel (email over one SMTP
+connection, in-app as NotificationLog rows). Every attempt is logged to
+NotificationLog. Delivered reminders are marked sent; failed ones are
+retried with exponential backoff until REMINDER_MAX_ATTEMPTS. A dispatcher
+that dies mid-batch leaves its reminders to be claimed again once the
+lease runs out.
+"""
+
+from __future__ import annotations
+
+import time as monotonic_time
+from collections import defaultdict
+from dataclasses import dataclass, field
+from datetime import timedelta
+from typing import Callable, Optional
+
+from django.conf import settings
+from django.core.mail import EmailMessage, get_connection
+from django.db import transaction
+from django.db.models import Count, Min, Q
+from django.utils import timezone
+
+from court_rules.models import (
+    DeadlineReminder,
+    NotificationChannel,
+    NotificationLog,
+    NotificationStatus,
+    ReminderChannel,
+)
+from court_rules.utils.timezones import zone_or_utc
+
+DEFAULT_BATCH_SIZE = 200
+CLAIM_LEASE = timedelta(minutes=15)
+RETRY_BASE_DELAY = timedelta(minutes=1)
+
+# A delivery outcome: the reminder and its NotificationLog, or None when there
+# is no one to deliver to (the reminder is done all the same).
+Outcome = tuple[DeadlineReminder, Optional[NotificationLog]]
+
+
+def _recipient(reminder: DeadlineReminder):
+    deadline = reminder.deadline
+    return deadline.owner or deadline.created_by
+
+
+def _payload(reminder: DeadlineReminder) -> dict:
+    deadline = reminder.deadline
+    return {
+        'reminder_id': str(reminder.pk),
+        'deadline_id': str(deadline.pk),
+        'case_id': str(deadline.case_id),
+        'case_caption': deadline.case.caption,
+        'due_at': deadline.due_at.isoformat(),
+    }
+
+
+def _log(reminder: DeadlineReminder, channel: str, status: str, now, error: str = '') -> Optional[NotificationLog]:
+    recipient = _recipient(reminder)
+    if recipient is None:
+        return None
+    payload = _payload(reminder)
+    if error:
+        payload['error'] = error
+    return NotificationLog(
+        user=recipient,
+        channel=channel,
+        payload=payload,
+        status=status,
+        delivered_at=now if status == NotificationStatus.SENT else None,
+    )
+
+
+def _reminder_email(reminder: DeadlineReminder, recipient) -> EmailMessage:
+    deadline = reminder.deadline
+    due = deadline.due_at.astimezone(zone_or_utc(deadline.timezone))
+    subject = f'Deadline reminder: {deadline.case.caption} due {due:%b %d, %Y %H:%M}'
+    body = (
+        f'Hello {recipient.full_name or recipient.email},\n\n'
+        f'A deadline in {deadline.case.caption} is due {due:%A, %B %d, %Y at %H:%M} ({deadline.timezone}).\n'
+    )
+    if deadline.computation_rationale:
+        body += f'\n{deadline.computation_rationale}\n'
+    body += '\n---\nPrecedentum - Federal Court Compliance Platform\n'
+    return EmailMessage(subject, body, settings.DEFAULT_FROM_EMAIL, [recipient.email])
+
+
+def deliver_email(reminders: list[DeadlineReminder], now) -> list[Outcome]:
+    """Send reminder emails over a single backend connection."""
+
+    outcomes = []
+    deliverable = []
+    for reminder in reminders:
+        recipient = _recipient(reminder)
+        if recipient is None or not recipient.email:
+            outcomes.append((reminder, None))
+        else:
+            deliverable.append((reminder, recipient))
+    if not deliverable:
+        return outcomes
+
+    connection = get_connection()
+    try:
+        connection.open()
+    except Exception as exc:  # noqa: BLE001 - an unreachable server fails the batch, not the worker
+        return outcomes + [
+            (reminder, _log(reminder, NotificationChannel.EMAIL, NotificationStatus.FAILED, now, str(exc)))
+            for reminder, _ in deliverable
+        ]
+
+    try:
+        for reminder, recipient in deliverable:
+            message = _reminder_email(reminder, recipient)
+            message.connection = connection
+            try:
+                message.send()
+            except Exception as exc:  # noqa: BLE001 - one bad address must not stop the batch
+                status, error = NotificationStatus.FAILED, str(exc)
+            else:
+                status, error = NotificationStatus.SENT, ''
+            outcomes.append((reminder, _log(reminder, NotificationChannel.EMAIL, status, now, error)))
+    finally:
+        connection.close()
+    return outcomes
+
+
+def deliver_in_app(reminders: list[DeadlineReminder], now) -> list[Outcome]:
+    """In-app reminders are the NotificationLog rows themselves."""
+
+    return [
+        (reminder, _log(reminder, NotificationChannel.IN_APP, NotificationStatus.SENT, now))
+        for reminder in reminders
+    ]
+
+
+def _undeliverable(channel: str) -> Callable:
+    def deliver(reminders: list[DeadlineReminder], now) -> list[Outcome]:
+        return [
+            (reminder, _log(reminder, channel, NotificationStatus.FAILED, now, f'No {channel} provider configured'))
+            for reminder in reminders
+        ]
+    return deliver
+
+
+CHANNEL_SENDERS: dict[str, Callable] = {
+    ReminderChannel.EMAIL: deliver_email,
+    ReminderChannel.IN_APP: deliver_in_app,
+    ReminderChannel.SMS: _undeliverable(NotificationChannel.SMS),
+    ReminderChannel.PUSH: _undeliverable(NotificationChannel.PUSH),
+}
+
+
+@dataclass
+class DispatchStats:
+    """Running totals for one dispatcher process."""
+
+    started: float = field(default_factory=monotonic_time.monotonic)
+    batches: int = 0
+    claimed: int = 0
+    failed: int = 0
+    abandoned: int = 0
+    by_channel: dict[str, int] = field(default_factory=lambda: defaultdict(int))
+    max_lag: timedelta = timedelta(0)
+    total_lag: timedelta = timedelta(0)
+
+    @property
+    def throughput(self) -> float:
+        """Reminders dispatched per second since start."""
+
+        elapsed = monotonic_time.monotonic() - self.started
+        return self.claimed / elapsed if elapsed > 0 else 0.0
+
+    @property
+    def mean_lag(self) -> timedelta:
+        return self.total_lag / self.claimed if self.claimed else timedelta(0)
+
+
+def claim_due_reminders(*, now, batch_size: int = DEFAULT_BATCH_SIZE) -> list[DeadlineReminder]:
+    """
+    Lock and return up to ``batch_size`` due, unsent reminders, oldest first.
+    Rows locked by another worker, leased or waiting out a retry backoff are
+    skipped. Must run inside a transaction.
+    """
+    return list(
+        DeadlineReminder.objects.select_for_update(skip_locked=True, of=('self',))
+        .select_related('deadline', 'deadline__case', 'deadline__owner', 'deadline__created_by')
+        .filter(Q(next_attempt_at__isnull=True) | Q(next_attempt_at__lte=now), sent=False, notify_at__lte=now)
+        .order_by('notify_at')[:batch_size]
+    )
+
+
+def _record_failure(reminder: DeadlineReminder, error: str, now) -> None:
+    reminder.attempts += 1
+    reminder.last_error = error
+    if reminder.attempts >= settings.REMINDER_MAX_ATTEMPTS:
+        reminder.sent = True
+        reminder.next_attempt_at = None
+    else:
+        reminder.next_attempt_at = now + RETRY_BASE_DELAY * 2 ** (reminder.attempts - 1)
+
+
+def dispatch_due_reminders(
+    *, batch_size: int = DEFAULT_BATCH_SIZE, stats: Optional[DispatchStats] = None
+) -> int:
+    """Claim, deliver and record one batch. Returns the number of reminders handled."""
+
+    now = timezone.now()
+    with transaction.atomic():
+        reminders = claim_due_reminders(now=now, batch_size=batch_size)
+        if not reminders:
+            return 0
+        DeadlineReminder.objects.filter(pk__in=[reminder.pk for reminder in reminders]).update(
+            next_attempt_at=now + CLAIM_LEASE,
+        )
+
+    # Delivery runs after the claim commits, so no row locks are held over SMTP.
+    by_channel = defaultdict(list)
+    for reminder in reminders:
+        by_channel[reminder.channel].append(reminder)
+    outcomes: list[Outcome] = []
+    for channel, group in by_channel.items():
+        outcomes.extend(CHANNEL_SENDERS.get(channel, _undeliverable(channel))(group, now))
+
+    logs = [log for _, log in outcomes if log is not None]
+    delivered = [reminder.pk for reminder, log in outcomes if log is None or log.status == NotificationStatus.SENT]
+    failed = []
+    for reminder, log in outcomes:
+        if log is not None and log.status == NotificationStatus.FAILED:
+            _record_failure(reminder, log.payload.get('error', ''), now)
+            failed.append(reminder)
+
+    with transaction.atomic():
+        NotificationLog.objects.bulk_create(logs)
+        DeadlineReminder.objects.filter(pk__in=delivered).update(sent=True, sent_at=now, next_attempt_at=None)
+        DeadlineReminder.objects.bulk_update(failed, ['attempts', 'last_error', 'next_attempt_at', 'sent'])
+
+    if stats is not None:
+        stats.batches += 1
+        stats.claimed += len(reminders)
+        stats.failed += len(failed)
+        stats.abandoned += sum(1 for reminder in failed if reminder.sent)
+        for channel, group in by_channel.items():
+            stats.by_channel[channel] += len(group)
+        lags = [now - reminder.notify_at for reminder in reminders]
+        stats.max_lag = max(stats.max_lag, *lags)
+        stats.total_lag += sum(lags, timedelta(0))
+    return len(reminders)
+
+
+def reminder_backlog(*, now=None) -> dict:
+    """Due-but-unsent reminders and how late the oldest one is."""
+
+    now = now or timezone.now()
+    backlog = DeadlineReminder.objects.filter(sent=False, notify_at__lte=now).aggregate(
+        pending=Count('id'), oldest=Min('notify_at'),
+    )
+    backlog['lag'] = now - backlog['oldest'] if backlog['oldest'] else timedelta(0)
+    return backlog
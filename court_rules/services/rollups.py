@@ -0,0 +1,324 @@
+from __future__ import annotations
+
+from collections import Counter, defaultdict
+from dataclasses import dataclass, field
+from datetime import timedelta
+from typing import Any, Iterable, Optional
+
+from django.conf import settings
+from django.db import transaction
+from django.db.models import Count, F, Q, QuerySet, Sum
+from django.db.models.functions import Coalesce, TruncDate
+from django.utils import timezone
+
+from court_rules.models import (
+    Case,
+    CaseRollup,
+    Deadline,
+    DeadlineRollup,
+    DeadlineStatus,
+    Organization,
+    User,
+    UserRole,
+)
+
+DEADLINE_STATUS_FIELDS = {
+    DeadlineStatus.OPEN: 'open_count',
+    DeadlineStatus.SNOOZED: 'snoozed_count',
+    DeadlineStatus.DONE: 'done_count',
+    DeadlineStatus.MISSED: 'missed_count',
+}
+DEADLINE_COUNT_FIELDS = (*DEADLINE_STATUS_FIELDS.values(), 'created_count')
+
+DEADLINE_KEY_FIELDS = ('organization_id', 'owner_id', 'day')
+CASE_KEY_FIELDS = ('organization_id', 'owner_id', 'day', 'status', 'court_id')
+
+RECONCILE_BATCH_SIZE = 50
+
+# Contributions map a rollup key to the counter increments one row adds to it.
+Contributions = dict[tuple, Counter]
+
+
+def _day(value):
+    return timezone.localtime(value).date()
+
+
+def deadline_contributions(
+    *,
+    organization_id,
+    owner_id,
+    status: str,
+    due_at,
+    created_at,
+) -> Contributions:
+    """Counter increments a single deadline adds to the deadline rollups."""
+
+    contributions: Contributions = defaultdict(Counter)
+    status_field = DEADLINE_STATUS_FIELDS.get(status)
+    if status_field:
+        contributions[(organization_id, owner_id, _day(due_at))][status_field] += 1
+    contributions[(organization_id, owner_id, _day(created_at))]['created_count'] += 1
+    return contributions
+
+
+def case_contributions(*, organization_id, owner_id, status: str, court_id, created_at) -> Contributions:
+    """Counter increments a single case adds to the case rollups."""
+
+    return {(organization_id, owner_id, _day(created_at), status, court_id): Counter(case_count=1)}
+
+
+def stored_deadline_contributions(deadlines: QuerySet) -> Contributions:
+    """Contributions of the given deadlines as they currently exist in the database."""
+
+    contributions: Contributions = defaultdict(Counter)
+    rows = deadlines.order_by().values(
+        'owner_id', 'status', 'due_at', 'created_at', organization_id=F('case__organization_id'),
+    )
+    for row in rows:
+        merge_contributions(contributions, deadline_contributions(**row))
+    return contributions
+
+
+def stored_case_contributions(cases: QuerySet) -> Contributions:
+    """Contributions of the given cases as they currently exist in the database."""
+
+    contributions: Contributions = defaultdict(Counter)
+    rows = cases.order_by().values(
+        'organization_id', 'status', 'court_id', 'created_at', owner_id=F('lead_attorney_id'),
+    )
+    for row in rows:
+        merge_contributions(contributions, case_contributions(**row))
+    return contributions
+
+
+def merge_contributions(target: Contributions, source: Contributions, *, sign: int = 1) -> Contributions:
+    for key, counts in source.items():
+        bucket = target.setdefault(key, Counter())
+        for name, value in counts.items():
+            bucket[name] += sign * value
+    return target
+
+
+def _apply(model, key_fields: tuple[str, ...], deltas: Contributions) -> int:
+    """Add ``deltas`` to the rollup rows of ``model``, creating rows as needed."""
+
+    touched = 0
+    with transaction.atomic():
+        for key, counts in deltas.items():
+            increments = {name: F(name) + value for name, value in counts.items() if value}
+            if not increments:
+                continue
+            lookup = dict(zip(key_fields, key))
+            row, _ = model.objects.get_or_create(**lookup)
+            model.objects.filter(pk=row.pk).update(**increments)
+            touched += 1
+    return touched
+
+
+def apply_deadline_deltas(deltas: Contributions) -> int:
+    return _apply(DeadlineRollup, DEADLINE_KEY_FIELDS, deltas)
+
+
+def apply_case_deltas(deltas: Contributions) -> int:
+    return _apply(CaseRollup, CASE_KEY_FIELDS, deltas)
+
+
+def rollup_filters(user: User) -> Optional[dict[str, Any]]:
+    """
+    Rollup filter kwargs matching the user's dashboard scope, or ``None`` when
+    rollups should not be used.
+    - Super Admins read every rollup row
+    - Site Admins read their organization's rows
+    - Other users are scoped through case_access, which rollups cannot express
+    """
+    if not getattr(settings, 'DASHBOARD_ROLLUPS_ENABLED', False):
+        return None
+    if user.role == UserRole.SUPER_ADMIN:
+        return {}
+    if user.role == UserRole.FIRM_ADMIN:
+        return {'organization_id': user.organization_id}
+    return None
+
+
+def rollup_window_counts(filters: dict[str, Any], *, today, windows: Iterable[int]) -> dict[str, int]:
+    """
+    Open deadline counts per upcoming window plus overdue, at day resolution:
+    a deadline due today counts as upcoming until the day is over.
+    """
+    aggregates = {
+        f'next_{days}_days': Coalesce(
+            Sum('open_count', filter=Q(day__gte=today, day__lte=today + timedelta(days=days))), 0,
+        )
+        for days in windows
+    }
+    aggregates['overdue'] = Coalesce(Sum('open_count', filter=Q(day__lt=today)), 0)
+    return DeadlineRollup.objects.filter(**filters).aggregate(**aggregates)
+
+
+def rollup_daily_created(filters: dict[str, Any], *, first_day) -> tuple[dict, dict]:
+    """Return ({day: cases created}, {day: deadlines created}) from ``first_day`` on."""
+
+    case_rows = (
+        CaseRollup.objects.filter(day__gte=first_day, **filters)
+        .values('day')
+        .annotate(count=Sum('case_count'))
+        .order_by()
+    )
+    deadline_rows = (
+        DeadlineRollup.objects.filter(day__gte=first_day, **filters)
+        .values('day')
+        .annotate(count=Sum('created_count'))
+        .order_by()
+    )
+    return (
+        {row['day']: row['count'] for row in case_rows},
+        {row['day']: row['count'] for row in deadline_rows},
+    )
+
+
+def rollup_case_breakdown(filters: dict[str, Any], field_name: str) -> list[dict[str, Any]]:
+    """Case totals grouped by ``field_name`` (``status`` or ``court__name``)."""
+
+    return list(
+        CaseRollup.objects.filter(**filters)
+        .values(field_name)
+        .annotate(count=Sum('case_count'))
+        .filter(count__gt=0)
+        .order_by('-count')
+    )
+
+
+@dataclass
+class RollupDrift:
+    """Differences found between stored rollups and the source tables."""
+
+    organizations: int = 0
+    deadline_rows_fixed: int = 0
+    case_rows_fixed: int = 0
+    deadline_count_drift: int = 0
+    case_count_drift: int = 0
+    drifted_organizations: list = field(default_factory=list)
+
+    @property
+    def has_drift(self) -> bool:
+        return bool(self.deadline_rows_fixed or self.case_rows_fixed)
+
+
+def _expected_deadline_rows(organization_id) -> Contributions:
+    expected: Contributions = defaultdict(Counter)
+    deadlines = Deadline.objects.filter(case__organization_id=organization_id).order_by()
+    by_due = (
+        deadlines.annotate(day=TruncDate('due_at'))
+        .values('owner_id', 'day', 'status')
+        .annotate(count=Count('id'))
+    )
+    for row in by_due:
+        status_field = DEADLINE_STATUS_FIELDS.get(row['status'])
+        if status_field:
+            expected[(organization_id, row['owner_id'], row['day'])][status_field] += row['count']
+    by_created = (
+        deadlines.annotate(day=TruncDate('created_at'))
+        .values('owner_id', 'day')
+        .annotate(count=Count('id'))
+    )
+    for row in by_created:
+        expected[(organization_id, row['owner_id'], row['day'])]['created_count'] += row['count']
+    return expected
+
+
+def _expected_case_rows(organization_id) -> Contributions:
+    rows = (
+        Case.objects.filter(organization_id=organization_id)
+        .annotate(day=TruncDate('created_at'))
+        .values('lead_attorney_id', 'day', 'status', 'court_id')
+        .annotate(count=Count('id'))
+        .order_by()
+    )
+    return {
+        (organization_id, row['lead_attorney_id'], row['day'], row['status'], row['court_id']): Counter(
+            case_count=row['count']
+        )
+        for row in rows
+    }
+
+
+def _reconcile(model, key_fields, count_fields, queryset: QuerySet, expected: Contributions, *, dry_run: bool):
+    """Make ``queryset`` match ``expected``. Returns (rows changed, absolute count drift)."""
+
+    stored = {
+        tuple(row[name] for name in key_fields): row
+        for row in queryset.values('id', *key_fields, *count_fields)
+    }
+    changed_rows = 0
+    count_drift = 0
+    to_create = []
+    to_update = []
+    for key in set(stored) | set(expected):
+        want = expected.get(key, Counter())
+        row = stored.get(key)
+        have = {name: row[name] for name in count_fields} if row else {}
+        diff = sum(abs(want.get(name, 0) - have.get(name, 0)) for name in count_fields)
+        if not diff:
+            continue
+        changed_rows += 1
+        count_drift += diff
+        values = {name: want.get(name, 0) for name in count_fields}
+        if row:
+            to_update.append(model(id=row['id'], **dict(zip(key_fields, key)), **values))
+        else:
+            to_create.append(model(**dict(zip(key_fields, key)), **values))
+
+    if not dry_run:
+        if to_update:
+            model.objects.bulk_update(to_update, list(count_fields))
+        if to_create:
+            model.objects.bulk_create(to_create)
+        # Rows whose counters all reached zero carry no information.
+        queryset.filter(**{name: 0 for name in count_fields}).delete()
+    return changed_rows, count_drift
+
+
+def reconcile_rollups(
+    *,
+    batch_size: int = RECONCILE_BATCH_SIZE,
+    dry_run: bool = False,
+    organization_ids: Optional[Iterable] = None,
+) -> RollupDrift:
+    """
+    Recompute dashboard rollups from the deadline and case tables, one
+    transaction per batch of organizations, and report the drift found.
+    Pass ``organization_ids`` to reconcile only those organizations.
+    """
+    drift = RollupDrift()
+    if organization_ids is None:
+        org_ids = [None] + list(Organization.objects.order_by('id').values_list('id', flat=True))
+    else:
+        org_ids = list(organization_ids)
+
+    for start in range(0, len(org_ids), batch_size):
+        with transaction.atomic():
+            for organization_id in org_ids[start:start + batch_size]:
+                drift.organizations += 1
+                deadline_rows, deadline_diff = _reconcile(
+                    DeadlineRollup,
+                    DEADLINE_KEY_FIELDS,
+                    DEADLINE_COUNT_FIELDS,
+                    DeadlineRollup.objects.filter(organization_id=organization_id),
+                    _expected_deadline_rows(organization_id),
+                    dry_run=dry_run,
+                )
+                case_rows, case_diff = _reconcile(
+                    CaseRollup,
+                    CASE_KEY_FIELDS,
+                    ('case_count',),
+                    CaseRollup.objects.filter(organization_id=organization_id),
+                    _expected_case_rows(organization_id),
+                    dry_run=dry_run,
+                )
+                drift.deadline_rows_fixed += deadline_rows
+                drift.case_rows_fixed += case_rows
+                drift.deadline_count_drift += deadline_diff
+                drift.case_count_drift += case_diff
+                if deadline_rows or case_rows:
+                    drift.drifted_organizations.append(organization_id)
+    return drift
@@ -0,0 +1,206 @@
+"""
+Concurrent fetching of court web pages for the scraper commands.
+
+fetch_pages() downloads a list of URLs on a bounded thread pool through one
+pooled requests.Session, so connections to the court site are kept alive and
+reused instead of being opened per page. A HostThrottle keeps at most
+``per_host`` requests in flight against any one host and spaces them
+``delay`` seconds apart. Connection errors, 429s and 5xx responses are
+retried with exponential backoff, honouring Retry-After. With a PageCache
+requests are conditional and a 304 is served from disk. Callers parse the
+returned pages, collect changed fields with assign_changes() and write all
+of them with a single bulk_update.
+"""
+
+from __future__ import annotations
+
+import time
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from dataclasses import dataclass
+from threading import BoundedSemaphore, Lock
+from typing import Any, Iterable, Optional
+from urllib.parse import urlsplit
+
+import requests
+from requests.adapters import HTTPAdapter
+
+from court_rules.services.page_cache import PageCache, content_hash
+
+DEFAULT_WORKERS = 8
+DEFAULT_PER_HOST = 4
+DEFAULT_DELAY = 0.25
+DEFAULT_RETRIES = 3
+DEFAULT_BACKOFF = 0.5
+DEFAULT_TIMEOUT = 10
+MAX_RETRY_AFTER = 60.0
+RETRY_STATUSES = frozenset({429, 500, 502, 503, 504})
+USER_AGENT = 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36'
+
+
+@dataclass
+class FetchResult:
+    """Outcome of fetching one URL."""
+
+    url: str
+    status: Optional[int] = None
+    text: str = ''
+    error: str = ''
+    attempts: int = 0
+    elapsed: float = 0.0
+    content_hash: str = ''
+    not_modified: bool = False
+
+    @property
+    def ok(self) -> bool:
+        if self.error or self.status is None:
+            return False
+        return self.not_modified or 200 <= self.status < 300
+
+
+class HostThrottle:
+    """Per-host concurrency limit and minimum spacing between request starts."""
+
+    def __init__(self, *, per_host: int = DEFAULT_PER_HOST, delay: float = DEFAULT_DELAY):
+        self.per_host = per_host
+        self.delay = delay
+        self._lock = Lock()
+        self._slots: dict[str, BoundedSemaphore] = {}
+        self._next_start: dict[str, float] = {}
+
+    @contextmanager
+    def slot(self, url: str):
+        host = urlsplit(url).netloc.lower()
+        with self._lock:
+            semaphore = self._slots.setdefault(host, BoundedSemaphore(self.per_host))
+        with semaphore:
+            with self._lock:
+                now = time.monotonic()
+                start = max(now, self._next_start.get(host, now))
+                self._next_start[host] = start + self.delay
+            if start > now:
+                time.sleep(start - now)
+            yield
+
+
+def build_session(*, pool_size: int = DEFAULT_WORKERS) -> requests.Session:
+    """Session with a keep-alive pool large enough for ``pool_size`` workers."""
+
+    session = requests.Session()
+    adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size, max_retries=0)
+    session.mount('http://', adapter)
+    session.mount('https://', adapter)
+    session.headers['User-Agent'] = USER_AGENT
+    return session
+
+
+def _retry_delay(response: Optional[requests.Response], attempt: int, backoff: float) -> float:
+    if response is not None:
+        retry_after = response.headers.get('Retry-After', '')
+        if retry_after.isdigit():
+            return min(float(retry_after), MAX_RETRY_AFTER)
+    return backoff * 2 ** (attempt - 1)
+
+
+def fetch_page(
+    session: requests.Session,
+    url: str,
+    *,
+    throttle: HostThrottle,
+    retries: int = DEFAULT_RETRIES,
+    backoff: float = DEFAULT_BACKOFF,
+    timeout: float = DEFAULT_TIMEOUT,
+    cache: Optional[PageCache] = None,
+) -> FetchResult:
+    """
+    GET ``url``, retrying transient failures up to ``retries`` times. With a
+    ``cache`` the request is conditional and a 304 returns the cached body.
+    """
+    result = FetchResult(url=url)
+    headers = cache.conditional_headers(url) if cache else {}
+    started = time.monotonic()
+    while True:
+        result.attempts += 1
+        response = None
+        try:
+            with throttle.slot(url):
+                response = session.get(url, headers=headers, timeout=timeout)
+        except requests.RequestException as exc:
+            result.error = str(exc)
+        else:
+            result.status = response.status_code
+            if response.status_code not in RETRY_STATUSES:
+                cached = cache.body(url) if cache and response.status_code == 304 else None
+                if cached is not None:
+                    result.text = cached
+                    result.content_hash = cache.entry(url).get('content_hash') or content_hash(cached)
+                    result.not_modified = True
+                    result.error = ''
+                elif 200 <= response.status_code < 300:
+                    result.text = response.text
+                    result.error = ''
+                    if cache:
+                        result.content_hash = cache.store(
+                            url,
+                            result.text,
+                            etag=response.headers.get('ETag', ''),
+                            last_modified=response.headers.get('Last-Modified', ''),
+                        )
+                    else:
+                        result.content_hash = content_hash(result.text)
+                else:
+                    result.error = f'HTTP {response.status_code}'
+                break
+            result.error = f'HTTP {response.status_code}'
+        if result.attempts > retries:
+            break
+        time.sleep(_retry_delay(response, result.attempts, backoff))
+    result.elapsed = time.monotonic() - started
+    return result
+
+
+def fetch_pages(
+    urls: Iterable[str],
+    *,
+    workers: int = DEFAULT_WORKERS,
+    per_host: int = DEFAULT_PER_HOST,
+    delay: float = DEFAULT_DELAY,
+    retries: int = DEFAULT_RETRIES,
+    backoff: float = DEFAULT_BACKOFF,
+    timeout: float = DEFAULT_TIMEOUT,
+    session: Optional[requests.Session] = None,
+    cache: Optional[PageCache] = None,
+) -> dict[str, FetchResult]:
+    """
+    Fetch each distinct URL once, ``workers`` at a time. Returns results
+    keyed by URL in first-seen order.
+    """
+    unique = list(dict.fromkeys(url for url in urls if url))
+    if not unique:
+        return {}
+    throttle = HostThrottle(per_host=per_host, delay=delay)
+    owns_session = session is None
+    session = session or build_session(pool_size=workers)
+    try:
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix='scrape') as pool:
+            results = pool.map(
+                lambda url: fetch_page(
+                    session, url, throttle=throttle, retries=retries, backoff=backoff, timeout=timeout, cache=cache,
+                ),
+                unique,
+            )
+            return {result.url: result for result in results}
+    finally:
+        if owns_session:
+            session.close()
+
+
+def assign_changes(instance, values: dict[str, Any]) -> list[str]:
+    """Set the ``values`` that differ from ``instance``; returns the changed field names."""
+
+    changed = []
+    for name, value in values.items():
+        if getattr(instance, name) != value:
+            setattr(instance, name, value)
+            changed.append(name)
+    return changed
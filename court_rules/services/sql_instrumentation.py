@@ -0,0 +1,177 @@
+"""
+Per-request SQL accounting for SqlInstrumentationMiddleware.
+
+A QueryRecorder is installed with connection.execute_wrapper() for the
+duration of a sampled request. It counts queries and their time per query
+template (the SQL with IN-lists collapsed; Django already passes parameters
+separately), so a template that runs many times in one request stands out as
+the N+1 signature. Slow, query-heavy or N+1 requests are written as one JSON
+line each to a size-rotated log with their most expensive templates. Each
+worker process writes its own file, so rotation never races.
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import os
+import re
+import time
+from dataclasses import dataclass, field
+from functools import lru_cache
+from logging.handlers import RotatingFileHandler
+from pathlib import Path
+from threading import Lock
+from typing import Any, Optional
+
+from django.conf import settings
+from django.utils import timezone
+
+SLOW_REQUEST_LOGGER = 'court_rules.slow_requests'
+TOP_TEMPLATES = 5
+TEMPLATE_DISPLAY_LENGTH = 500
+
+IN_LIST_PATTERN = re.compile(r'\bIN\s*\((?:\s*%s\s*,)+\s*%s\s*\)', re.IGNORECASE)
+VALUES_LIST_PATTERN = re.compile(r'\bVALUES\s*(\([^()]*\))(?:\s*,\s*\([^()]*\))+', re.IGNORECASE)
+WHITESPACE_PATTERN = re.compile(r'\s+')
+
+_handler_lock = Lock()
+
+
+@lru_cache(maxsize=2048)
+def query_template(sql: str) -> str:
+    """Normalize SQL so the same statement with different list lengths groups together."""
+
+    sql = IN_LIST_PATTERN.sub('IN (...)', sql)
+    sql = VALUES_LIST_PATTERN.sub(r'VALUES \1, ...', sql)
+    return WHITESPACE_PATTERN.sub(' ', sql).strip()
+
+
+@dataclass
+class TemplateStats:
+    count: int = 0
+    seconds: float = 0.0
+
+
+@dataclass
+class QueryRecorder:
+    """execute_wrapper hook that tallies queries and time per template."""
+
+    queries: int = 0
+    seconds: float = 0.0
+    templates: dict[str, TemplateStats] = field(default_factory=dict)
+
+    def __call__(self, execute, sql, params, many, context):
+        started = time.perf_counter()
+        try:
+            return execute(sql, params, many, context)
+        finally:
+            elapsed = time.perf_counter() - started
+            self.queries += 1
+            self.seconds += elapsed
+            stats = self.templates.get(sql)
+            if stats is None:
+                stats = self.templates[sql] = TemplateStats()
+            stats.count += 1
+            stats.seconds += elapsed
+
+    def by_template(self) -> dict[str, TemplateStats]:
+        """Merge the raw statements by query_template()."""
+
+        merged: dict[str, TemplateStats] = {}
+        for sql, stats in self.templates.items():
+            target = merged.setdefault(query_template(sql), TemplateStats())
+            target.count += stats.count
+            target.seconds += stats.seconds
+        return merged
+
+    def repeated(self, threshold: int) -> list[tuple[str, TemplateStats]]:
+        """Templates run at least ``threshold`` times, most frequent first."""
+
+        return sorted(
+            ((template, stats) for template, stats in self.by_template().items() if stats.count >= threshold),
+            key=lambda item: (-item[1].count, -item[1].seconds),
+        )
+
+    def top(self, limit: int = TOP_TEMPLATES) -> list[tuple[str, TemplateStats]]:
+        return sorted(self.by_template().items(), key=lambda item: -item[1].seconds)[:limit]
+
+
+def _template_rows(items: list[tuple[str, TemplateStats]]) -> list[dict[str, Any]]:
+    return [
+        {'template': template[:TEMPLATE_DISPLAY_LENGTH], 'count': stats.count, 'sql_ms': round(stats.seconds * 1000, 2)}
+        for template, stats in items
+    ]
+
+
+def server_timing(recorder: QueryRecorder, total_seconds: float) -> str:
+    """Server-Timing header value with the request's SQL and total time."""
+
+    return (
+        f'db;dur={recorder.seconds * 1000:.1f};desc="{recorder.queries} queries", '
+        f'total;dur={total_seconds * 1000:.1f}'
+    )
+
+
+def slow_request_record(
+    recorder: QueryRecorder,
+    *,
+    method: str,
+    path: str,
+    route: str,
+    status: int,
+    total_seconds: float,
+    repeat_threshold: int,
+) -> dict[str, Any]:
+    return {
+        'ts': timezone.now().isoformat(),
+        'method': method,
+        'path': path,
+        'route': route,
+        'status': status,
+        'duration_ms': round(total_seconds * 1000, 2),
+        'queries': recorder.queries,
+        'sql_ms': round(recorder.seconds * 1000, 2),
+        'repeated': _template_rows(recorder.repeated(repeat_threshold)),
+        'top': _template_rows(recorder.top()),
+    }
+
+
+def worker_log_path(path) -> Path:
+    """``path`` with this process id before the suffix: slow_requests.<pid>.jsonl."""
+
+    path = Path(path)
+    return path.with_name(f'{path.stem}.{os.getpid()}{path.suffix}')
+
+
+def slow_request_logger() -> logging.Logger:
+    """
+    The JSON-lines logger, writing to this worker's own SQL_INSTRUMENTATION_LOG
+    file with size rotation. RotatingFileHandlers in several Gunicorn workers
+    must not share one file: each rotates it behind the others' backs.
+    """
+    logger = logging.getLogger(SLOW_REQUEST_LOGGER)
+    path = worker_log_path(settings.SQL_INSTRUMENTATION_LOG)
+    with _handler_lock:
+        current = next((h for h in logger.handlers if isinstance(h, RotatingFileHandler)), None)
+        if current is None or Path(current.baseFilename) != path.resolve():
+            if current is not None:
+                logger.removeHandler(current)
+                current.close()
+            path.parent.mkdir(parents=True, exist_ok=True)
+            handler = RotatingFileHandler(
+                path,
+                maxBytes=settings.SQL_INSTRUMENTATION_LOG_MAX_BYTES,
+                backupCount=settings.SQL_INSTRUMENTATION_LOG_BACKUPS,
+                encoding='utf-8',
+                delay=True,
+            )
+            handler.setFormatter(logging.Formatter('%(message)s'))
+            logger.addHandler(handler)
+            logger.setLevel(logging.INFO)
+            logger.propagate = False
+    return logger
+
+
+def log_slow_request(record: dict[str, Any], logger: Optional[logging.Logger] = None) -> None:
+    (logger or slow_request_logger()).info(json.dumps(record, default=str))
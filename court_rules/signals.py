@@ -0,0 +1,223 @@
+"""Model signal handlers that keep derived tables in sync with their sources."""
+
+from collections import Counter
+from functools import partial
+
+from django.db import transaction
+from django.db.models.signals import post_delete, post_save, pre_delete, pre_save
+from django.dispatch import receiver
+
+from court_rules.models import (
+    BillingRecord,
+    Case,
+    CasePermission,
+    CaseTeam,
+    Deadline,
+    Holiday,
+    Subscription,
+    User,
+    UserAccessGrant,
+)
+from court_rules.services.access import refresh_case_access, refresh_user_access
+from court_rules.services.billing import invalidate_billing_dashboard
+from court_rules.services.deadline_recompute import recompute_for_calendar_change
+from court_rules.services.licensing import apply_seat_deltas, count_active_users, seat_contributions
+from court_rules.services.rollups import (
+    apply_case_deltas,
+    apply_deadline_deltas,
+    case_contributions,
+    deadline_contributions,
+    merge_contributions,
+    stored_case_contributions,
+    stored_deadline_contributions,
+)
+
+ACCESS_USER_FIELDS = {'organization', 'organization_id', 'is_active'}
+
+
+@receiver(pre_save, sender=Case)
+def case_saving(sender, instance, raw=False, **kwargs):
+    instance._rollup_before = {}
+    instance._rollup_deadlines_before = None
+    if raw or instance._state.adding:
+        return
+    instance._rollup_before = stored_case_contributions(Case.objects.filter(pk=instance.pk))
+    previous_org_ids = {key[0] for key in instance._rollup_before}
+    if previous_org_ids and instance.organization_id not in previous_org_ids:
+        # Deadline rollups are keyed by the case's organization, so they move with it.
+        instance._rollup_deadlines_before = stored_deadline_contributions(instance.deadlines.all())
+
+
+@receiver(post_save, sender=Case)
+def case_saved(sender, instance, raw=False, **kwargs):
+    if raw:
+        return
+    refresh_case_access([instance.pk])
+
+    deltas = case_contributions(
+        organization_id=instance.organization_id,
+        owner_id=instance.lead_attorney_id,
+        status=instance.status,
+        court_id=instance.court_id,
+        created_at=instance.created_at,
+    )
+    apply_case_deltas(merge_contributions(dict(deltas), getattr(instance, '_rollup_before', {}), sign=-1))
+
+    deadlines_before = getattr(instance, '_rollup_deadlines_before', None)
+    if deadlines_before:
+        deadline_deltas = stored_deadline_contributions(instance.deadlines.all())
+        apply_deadline_deltas(merge_contributions(deadline_deltas, deadlines_before, sign=-1))
+
+
+@receiver(pre_delete, sender=Case)
+def case_deleting(sender, instance, **kwargs):
+    instance._rollup_before = stored_case_contributions(Case.objects.filter(pk=instance.pk))
+
+
+@receiver(post_delete, sender=Case)
+def case_deleted(sender, instance, **kwargs):
+    apply_case_deltas(merge_contributions({}, getattr(instance, '_rollup_before', {}), sign=-1))
+
+
+@receiver(pre_save, sender=Deadline)
+def deadline_saving(sender, instance, raw=False, **kwargs):
+    instance._rollup_before = {}
+    if raw or instance._state.adding:
+        return
+    instance._rollup_before = stored_deadline_contributions(Deadline.objects.filter(pk=instance.pk))
+
+
+@receiver(post_save, sender=Deadline)
+def deadline_saved(sender, instance, raw=False, **kwargs):
+    if raw:
+        return
+    deltas = deadline_contributions(
+        organization_id=instance.case.organization_id,
+        owner_id=instance.owner_id,
+        status=instance.status,
+        due_at=instance.due_at,
+        created_at=instance.created_at,
+    )
+    apply_deadline_deltas(merge_contributions(deltas, getattr(instance, '_rollup_before', {}), sign=-1))
+
+
+@receiver(pre_delete, sender=Deadline)
+def deadline_deleting(sender, instance, **kwargs):
+    instance._rollup_before = stored_deadline_contributions(Deadline.objects.filter(pk=instance.pk))
+
+
+@receiver(post_delete, sender=Deadline)
+def deadline_deleted(sender, instance, **kwargs):
+    apply_deadline_deltas(merge_contributions({}, getattr(instance, '_rollup_before', {}), sign=-1))
+
+
+@receiver(post_save, sender=CaseTeam)
+@receiver(post_delete, sender=CaseTeam)
+@receiver(post_save, sender=CasePermission)
+@receiver(post_delete, sender=CasePermission)
+def case_membership_changed(sender, instance, raw=False, **kwargs):
+    if raw:
+        return
+    refresh_case_access([instance.case_id])
+
+
+@receiver(pre_save, sender=UserAccessGrant)
+def access_grant_saving(sender, instance, raw=False, **kwargs):
+    instance._previous_granted_to_id = None
+    if raw or instance._state.adding:
+        return
+    instance._previous_granted_to_id = (
+        UserAccessGrant.objects.filter(pk=instance.pk).values_list('granted_to_id', flat=True).first()
+    )
+
+
+@receiver(post_save, sender=UserAccessGrant)
+@receiver(post_delete, sender=UserAccessGrant)
+def access_grant_changed(sender, instance, raw=False, **kwargs):
+    if raw:
+        return
+    user_ids = {instance.granted_to_id, getattr(instance, '_previous_granted_to_id', None)}
+    refresh_user_access([user_id for user_id in user_ids if user_id])
+
+
+@receiver(pre_save, sender=User)
+def user_saving(sender, instance, raw=False, update_fields=None, **kwargs):
+    instance._seats_before = None
+    if raw or instance._state.adding:
+        return
+    if update_fields is not None and not ACCESS_USER_FIELDS.intersection(update_fields):
+        return
+    previous = User.objects.filter(pk=instance.pk).values('organization_id', 'is_active').first()
+    if previous:
+        instance._seats_before = seat_contributions(**previous)
+
+
+@receiver(post_save, sender=User)
+def user_saved(sender, instance, created=False, raw=False, update_fields=None, **kwargs):
+    if raw:
+        return
+    if update_fields is not None and not ACCESS_USER_FIELDS.intersection(update_fields):
+        return
+
+    seats = seat_contributions(organization_id=instance.organization_id, is_active=instance.is_active)
+    seats.subtract(getattr(instance, '_seats_before', None) or {})
+    apply_seat_deltas(seats)
+
+    if not created:
+        refresh_user_access([instance.pk])
+
+
+@receiver(post_delete, sender=User)
+def user_deleted(sender, instance, **kwargs):
+    seats = seat_contributions(organization_id=instance.organization_id, is_active=instance.is_active)
+    apply_seat_deltas(Counter({organization_id: -count for organization_id, count in seats.items()}))
+
+
+@receiver(pre_save, sender=Subscription)
+def subscription_saving(sender, instance, raw=False, **kwargs):
+    if raw or not instance._state.adding:
+        return
+    instance.active_user_count = count_active_users(instance.organization_id)
+
+
+@receiver(post_save, sender=BillingRecord)
+@receiver(post_delete, sender=BillingRecord)
+def billing_record_changed(sender, instance, raw=False, **kwargs):
+    if raw:
+        return
+    organization_id = (
+        Subscription.objects.filter(pk=instance.subscription_id).values_list('organization_id', flat=True).first()
+    )
+    transaction.on_commit(partial(invalidate_billing_dashboard, organization_id))
+
+
+@receiver(pre_save, sender=Holiday)
+def holiday_saving(sender, instance, raw=False, **kwargs):
+    instance._previous_calendar_day = None
+    if raw or instance._state.adding:
+        return
+    instance._previous_calendar_day = (
+        Holiday.objects.filter(pk=instance.pk).values_list('calendar_id', 'date').first()
+    )
+
+
+def _recompute_after_commit(calendar_days):
+    days_by_calendar = {}
+    for calendar_id, day in calendar_days:
+        if calendar_id and day:
+            days_by_calendar.setdefault(calendar_id, set()).add(day)
+    for calendar_id, days in days_by_calendar.items():
+        transaction.on_commit(partial(recompute_for_calendar_change, calendar_id, days))
+
+
+@receiver(post_save, sender=Holiday)
+def holiday_saved(sender, instance, raw=False, **kwargs):
+    if raw:
+        return
+    previous = getattr(instance, '_previous_calendar_day', None) or (None, None)
+    _recompute_after_commit([(instance.calendar_id, instance.date), previous])
+
+
+@receiver(post_delete, sender=Holiday)
+def holiday_deleted(sender, instance, **kwargs):
+    _recompute_after_commit([(instance.calendar_id, instance.date)])
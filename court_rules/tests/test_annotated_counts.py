@@ -0,0 +1,89 @@
+from __future__ import annotations
+
+from datetime import timedelta
+
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.utils import timezone
+from rest_framework import status
+from rest_framework.authtoken.models import Token
+from rest_framework.test import APITestCase
+
+from court_rules.api.v1.serializers import DeadlineSerializer
+from court_rules.models import (
+    Case,
+    CaseStatus,
+    Deadline,
+    DeadlineBasis,
+    DeadlineReminder,
+    DeadlineTriggerType,
+    Organization,
+    ReminderChannel,
+    User,
+    UserRole,
+)
+
+
+class AnnotatedCountTests(APITestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.org = Organization.objects.create(name='Counting Firm')
+        cls.admin = User.objects.create_user(
+            email='count-admin@example.com', password='password123',
+            first_name='Count', last_name='Admin', role=UserRole.FIRM_ADMIN, organization=cls.org,
+        )
+        User.objects.create_user(
+            email='count-former@example.com', password='password123',
+            first_name='Former', last_name='Member', role=UserRole.LAWYER, organization=cls.org,
+            is_active=False,
+        )
+        cls.token = Token.objects.create(user=cls.admin)
+        cls.case = Case.objects.create(
+            organization=cls.org,
+            internal_case_id='COUNT-1',
+            caption='Count v. Rows',
+            status=CaseStatus.OPEN,
+            timezone='America/Chicago',
+        )
+
+    def add_deadline(self, reminders=2):
+        deadline = Deadline.objects.create(
+            case=self.case,
+            trigger_type=DeadlineTriggerType.USER,
+            basis=DeadlineBasis.CALENDAR_DAYS,
+            due_at=timezone.now() + timedelta(days=10),
+            timezone='America/Chicago',
+        )
+        for index in range(reminders):
+            DeadlineReminder.objects.create(
+                deadline=deadline,
+                notify_at=timezone.now() + timedelta(days=index + 1),
+                channel=ReminderChannel.EMAIL,
+                sent=index == 0,
+            )
+        return deadline
+
+    def get(self, url):
+        return self.client.get(url, HTTP_AUTHORIZATION=f'Token {self.token.key}')
+
+    def test_deadline_list_query_count_is_flat(self):
+        self.add_deadline()
+        with CaptureQueriesContext(connection) as one:
+            response = self.get('/api/v1/deadlines/')
+        self.assertEqual(response.data['results'][0]['pending_reminders'], 1)
+
+        for _ in range(4):
+            self.add_deadline()
+        with CaptureQueriesContext(connection) as five:
+            response = self.get('/api/v1/deadlines/')
+        self.assertEqual([row['pending_reminders'] for row in response.data['results']], [1] * 5)
+        self.assertEqual(len(one.captured_queries), len(five.captured_queries))
+
+    def test_falls_back_without_annotation(self):
+        deadline = self.add_deadline(reminders=3)
+        self.assertEqual(DeadlineSerializer(deadline).data['pending_reminders'], 2)
+
+    def test_organization_user_count_counts_active_users(self):
+        response = self.get('/api/v1/admin/organizations/')
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data['results'][0]['user_count'], 1)
@@ -0,0 +1,364 @@
+"""
+Query-count and latency budgets for every /api/v1/ route.
+
+Each endpoint in ENDPOINTS is requested as each role in ROLES against a fixed
+data set (generate_load_data with a pinned seed plus reference rows). Every
+request records its number of SQL queries, total SQL time and wall time,
+and the run fails when any of them exceeds the budget stored in
+fixtures/api_budgets.json. Query budgets are exact, so an N+1 shows up as
+soon as it lands; time budgets are recorded with headroom for slower
+machines.
+
+Environment:
+    API_BENCHMARK_REPORT=path.json   also write every measurement as JSON
+    API_BENCHMARK_RECORD=1           rewrite the budgets from this run
+"""
+
+from __future__ import annotations
+
+import json
+import math
+import os
+import statistics
+import tempfile
+import time
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+from typing import Any, Callable, Optional, Union
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db import connection
+from django.test import override_settings
+from django.test.utils import CaptureQueriesContext
+from django.urls import URLPattern, URLResolver, reverse
+from django.utils import timezone
+from django.utils.encoding import force_bytes
+from django.utils.http import urlsafe_base64_encode
+from rest_framework.authtoken.models import Token
+from rest_framework.test import APITestCase
+
+from court_rules.api.v1 import urls as api_urls
+from court_rules.models import (
+    AuditLog,
+    BillingRecord,
+    Case,
+    Court,
+    Deadline,
+    DeadlineReminder,
+    Judge,
+    Organization,
+    Rule,
+    RuleSourceType,
+    Subscription,
+    SubscriptionChangeType,
+    SubscriptionHistory,
+    User,
+    UserAccessGrant,
+    UserRole,
+)
+from court_rules.poc_models import (
+    PocChangeEvent,
+    PocComplianceCheck,
+    PocCourt,
+    PocJudge,
+    PocJudgeProcNode,
+    PocRequirement,
+    PocRuleNode,
+)
+from court_rules.services.audit_archive import add_months, archive_audit_partition, month_start
+from court_rules.services.load_data import LOAD_PASSWORD, generate_load_data
+from court_rules.utils.tokens import make_calendar_feed_token
+
+BUDGETS_PATH = Path(__file__).resolve().parent / 'fixtures' / 'api_budgets.json'
+REPORT_ENV = 'API_BENCHMARK_REPORT'
+RECORD_ENV = 'API_BENCHMARK_RECORD'
+
+ROLES = (UserRole.SUPER_ADMIN, UserRole.FIRM_ADMIN, UserRole.LAWYER, UserRole.PARALEGAL)
+REPEAT = 3
+TIME_HEADROOM = 5
+MIN_SQL_BUDGET_MS = 100
+MIN_WALL_BUDGET_MS = 250
+
+LOAD_VOLUME = dict(orgs=2, cases_per_org=12, deadlines_per_case=6, users_per_org=10, seed=2022)
+POC_MODELS = (PocCourt, PocRuleNode, PocJudge, PocJudgeProcNode, PocRequirement, PocComplianceCheck, PocChangeEvent)
+
+# A kwarg is either a key of the benchmark's reference objects or a function of the requesting user.
+KwargSource = Union[str, Callable[[User], Any]]
+
+
+@dataclass(frozen=True)
+class Endpoint:
+    name: str
+    method: str = 'get'
+    kwargs: dict[str, KwargSource] = field(default_factory=dict)
+    data: Optional[Callable[[User], dict]] = None
+
+    def path(self, objects: dict[str, Any], user: User) -> str:
+        kwargs = {
+            key: source(user) if callable(source) else objects[source]
+            for key, source in self.kwargs.items()
+        }
+        return reverse(self.name, kwargs=kwargs)
+
+
+ENDPOINTS = (
+    Endpoint('api-root'),
+    Endpoint('api-token-auth', 'post', data=lambda user: {'email': user.email, 'password': LOAD_PASSWORD}),
+    Endpoint('dashboard-metrics'),
+    Endpoint('billing-dashboard'),
+    Endpoint('deadline-calendar-export'),
+    Endpoint('deadline-calendar-feed-url'),
+    Endpoint('deadline-calendar-feed', kwargs={'token': make_calendar_feed_token}),
+    Endpoint('case-calendar-export', kwargs={'case_id': 'case'}),
+    Endpoint('organization-calendar-export'),
+    Endpoint('judge-list'),
+    Endpoint('judge-detail', kwargs={'pk': 'judge'}),
+    Endpoint('case-list'),
+    Endpoint('case-detail', kwargs={'pk': 'case'}),
+    Endpoint('deadline-list'),
+    Endpoint('deadline-detail', kwargs={'pk': 'deadline'}),
+    Endpoint('rule-list'),
+    Endpoint('rule-detail', kwargs={'pk': 'rule'}),
+    Endpoint('deadline-reminder-list'),
+    Endpoint('deadline-reminder-detail', kwargs={'pk': 'reminder'}),
+    Endpoint('audit-log-list'),
+    Endpoint('audit-log-detail', kwargs={'pk': 'audit'}),
+    Endpoint('audit-log-archives'),
+    Endpoint('audit-log-archived', kwargs={'month': 'archived_month'}),
+    Endpoint('user-list'),
+    Endpoint('user-detail', kwargs={'pk': 'lawyer'}),
+    Endpoint('organization-list'),
+    Endpoint('organization-detail', kwargs={'pk': 'organization'}),
+    Endpoint('user-management-list'),
+    Endpoint('user-management-detail', kwargs={'pk': 'lawyer'}),
+    Endpoint('user-management-change-password', 'post', data=lambda user: {
+        'old_password': 'not-the-password', 'new_password': 'Benchmark123!', 'confirm_password': 'Benchmark123!',
+    }),
+    Endpoint('user-management-reset-password', 'post', data=lambda user: {'email': user.email}),
+    Endpoint('user-management-confirm-reset-password', 'post', data=lambda user: {
+        'uid': urlsafe_base64_encode(force_bytes(user.pk)), 'token': 'invalid', 'new_password': 'Benchmark123!', 'confirm_password': 'Benchmark123!',
+    }),
+    Endpoint('access-grant-list'),
+    Endpoint('access-grant-detail', kwargs={'pk': 'grant'}),
+    Endpoint('access-grant-for-user', kwargs={'user_id': 'lawyer'}),
+    Endpoint('subscription-list'),
+    Endpoint('subscription-detail', kwargs={'pk': 'subscription'}),
+    Endpoint('subscription-history-list'),
+    Endpoint('subscription-history-detail', kwargs={'pk': 'subscription_history'}),
+    Endpoint('billing-record-list'),
+    Endpoint('billing-record-detail', kwargs={'pk': 'billing_record'}),
+    Endpoint('poc-court-list'),
+    Endpoint('poc-court-detail', kwargs={'pk': 'poc_court'}),
+    Endpoint('poc-rule-node-list'),
+    Endpoint('poc-rule-node-detail', kwargs={'pk': 'poc_rule_node'}),
+    Endpoint('poc-judge-list'),
+    Endpoint('poc-judge-detail', kwargs={'pk': 'poc_judge'}),
+    Endpoint('poc-judge-proc-node-list'),
+    Endpoint('poc-judge-proc-node-detail', kwargs={'pk': 'poc_judge_proc_node'}),
+    Endpoint('poc-requirement-list'),
+    Endpoint('poc-requirement-detail', kwargs={'pk': 'poc_requirement'}),
+    Endpoint('poc-compliance-check-list'),
+    Endpoint('poc-compliance-check-detail', kwargs={'pk': 'poc_compliance_check'}),
+    Endpoint('poc-change-event-list'),
+    Endpoint('poc-change-event-detail', kwargs={'pk': 'poc_change_event'}),
+)
+
+
+@dataclass
+class Measurement:
+    endpoint: str
+    role: str
+    method: str
+    path: str
+    status: int
+    queries: int
+    sql_ms: float
+    wall_ms: float
+    over_budget: list[str] = field(default_factory=list)
+
+    @property
+    def key(self) -> str:
+        return f'{self.endpoint} {self.role}'
+
+
+def route_names(patterns) -> set[str]:
+    names = set()
+    for pattern in patterns:
+        if isinstance(pattern, URLResolver):
+            names |= route_names(pattern.url_patterns)
+        elif isinstance(pattern, URLPattern) and pattern.name:
+            names.add(pattern.name)
+    return names
+
+
+def recorded_budget(measurement: Measurement) -> dict[str, Any]:
+    return {
+        'queries': measurement.queries,
+        'sql_ms': max(math.ceil(measurement.sql_ms * TIME_HEADROOM), MIN_SQL_BUDGET_MS),
+        'wall_ms': max(math.ceil(measurement.wall_ms * TIME_HEADROOM), MIN_WALL_BUDGET_MS),
+    }
+
+
+class ApiBudgetTests(APITestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.archive_dir = cls.enterClassContext(tempfile.TemporaryDirectory())
+        cls.enterClassContext(override_settings(AUDIT_LOG_ARCHIVE_DIR=cls.archive_dir))
+        super().setUpClass()
+
+    @classmethod
+    def setUpTestData(cls):
+        today = timezone.localdate()
+        generate_load_data(anchor=today, **LOAD_VOLUME)
+        organization = Organization.objects.filter(name__startswith='Load Firm').order_by('name').first()
+
+        cls.users = {
+            role: User.objects.filter(organization=organization, role=role, is_active=True).order_by('email').first()
+            for role in ROLES[1:]
+        }
+        cls.users[UserRole.SUPER_ADMIN] = User.objects.create_user(
+            email='benchmark-super@example.com', password=LOAD_PASSWORD,
+            first_name='Bench', last_name='Super', role=UserRole.SUPER_ADMIN,
+        )
+        cls.tokens = {role: Token.objects.create(user=user).key for role, user in cls.users.items()}
+
+        court = Court.objects.order_by('name').first()
+        for number in range(5):
+            Judge.objects.create(full_name=f'Benchmark Judge {number}', court=court, clerk_name=f'Deputy {number}')
+            Rule.objects.create(source_type=RuleSourceType.FRCP, citation=f'Fed. R. Civ. P. {number + 1}', text='...')
+        subscription = Subscription.objects.get(organization=organization)
+        for number in range(3):
+            SubscriptionHistory.objects.create(
+                subscription=subscription, change_type=SubscriptionChangeType.LICENSE_CHANGE,
+                old_value=str(number), new_value=str(number + 1), changed_by=cls.users[UserRole.SUPER_ADMIN],
+            )
+            month = add_months(month_start(today), -number - 1)
+            BillingRecord.objects.create(
+                subscription=subscription, billing_period_start=month,
+                billing_period_end=add_months(month, 1), amount_billed=subscription.monthly_rate,
+                amount_paid=subscription.monthly_rate, balance_due=0,
+            )
+
+        cls.create_poc_tables()
+        poc_court = PocCourt.objects.create(code='ILND', name='Northern District of Illinois')
+        poc_rule = PocRuleNode.objects.create(court=poc_court, rule_code='LR5.2', node_type='rule', heading='Form')
+        poc_judge = PocJudge.objects.create(court=poc_court, display_name='Benchmark Judge')
+        poc_proc = PocJudgeProcNode.objects.create(judge=poc_judge, node_type='section', heading='Motions')
+        poc_requirement = PocRequirement.objects.create(
+            source_type='rule_node', source_id=poc_rule.pk, requirement_type='page_limit', requirement_text='15 pages',
+        )
+        poc_check = PocComplianceCheck.objects.create(
+            court_code='ILND', judge=poc_judge, case_metadata={'pages': 12}, overall_status='pass',
+        )
+        poc_event = PocChangeEvent.objects.create(entity_kind='rule_node', entity_id=poc_rule.pk, change_type='created')
+
+        archived_month = add_months(month_start(today), -24)
+        with connection.cursor() as cursor:
+            # Run the load's deferred FK checks now; a partition with pending
+            # trigger events cannot be dropped by the archiver.
+            cursor.execute('SET CONSTRAINTS ALL IMMEDIATE')
+        archive_audit_partition(archived_month)
+
+        lawyer = cls.users[UserRole.LAWYER]
+        cls.objects = {
+            'organization': organization.pk,
+            'lawyer': lawyer.pk,
+            'case': Case.objects.filter(lead_attorney=lawyer).order_by('internal_case_id').first().pk,
+            'deadline': Deadline.objects.filter(owner=lawyer).order_by('id').first().pk,
+            'reminder': DeadlineReminder.objects.filter(deadline__owner=lawyer).order_by('id').first().pk,
+            'audit': AuditLog.objects.filter(actor_user=lawyer).order_by('id').first().pk,
+            'archived_month': f'{archived_month:%Y-%m}',
+            'grant': UserAccessGrant.objects.filter(organization=organization).order_by('id').first().pk,
+            'judge': Judge.objects.order_by('full_name').first().pk,
+            'rule': Rule.objects.order_by('citation').first().pk,
+            'subscription': subscription.pk,
+            'subscription_history': SubscriptionHistory.objects.order_by('old_value').first().pk,
+            'billing_record': BillingRecord.objects.order_by('billing_period_start').first().pk,
+            'poc_court': poc_court.pk,
+            'poc_rule_node': poc_rule.pk,
+            'poc_judge': poc_judge.pk,
+            'poc_judge_proc_node': poc_proc.pk,
+            'poc_requirement': poc_requirement.pk,
+            'poc_compliance_check': poc_check.pk,
+            'poc_change_event': poc_event.pk,
+        }
+
+    @classmethod
+    def create_poc_tables(cls):
+        # The ILND POC tables are unmanaged, so the test database lacks them.
+        existing = set(connection.introspection.table_names())
+        with connection.schema_editor() as editor:
+            for model in POC_MODELS:
+                if model._meta.db_table not in existing:
+                    editor.create_model(model)
+
+    def send(self, endpoint: Endpoint, role: str):
+        user = self.users[role]
+        path = endpoint.path(self.objects, user)
+        headers = {'HTTP_AUTHORIZATION': f'Token {self.tokens[role]}'}
+        if endpoint.method == 'post':
+            return path, self.client.post(path, endpoint.data(user), format='json', **headers)
+        return path, self.client.get(path, **headers)
+
+    def measure(self, endpoint: Endpoint, role: str) -> Measurement:
+        # One warm-up request absorbs lazy imports and first-use caches; the
+        # dashboard cache is cleared so every timed request does the full work.
+        self.send(endpoint, role)
+        walls, sql_times = [], []
+        for _ in range(REPEAT):
+            cache.clear()
+            with CaptureQueriesContext(connection) as captured:
+                started = time.perf_counter()
+                path, response = self.send(endpoint, role)
+                walls.append(1000 * (time.perf_counter() - started))
+            sql_times.append(1000 * sum(float(query['time']) for query in captured.captured_queries))
+        return Measurement(
+            endpoint=endpoint.name,
+            role=str(role),
+            method=endpoint.method.upper(),
+            path=path,
+            status=response.status_code,
+            queries=len(captured.captured_queries),
+            sql_ms=round(statistics.median(sql_times), 2),
+            wall_ms=round(statistics.median(walls), 2),
+        )
+
+    def test_every_route_is_benchmarked(self):
+        self.assertEqual(route_names(api_urls.urlpatterns), {endpoint.name for endpoint in ENDPOINTS})
+
+    def test_endpoints_stay_within_budget(self):
+        recording = os.environ.get(RECORD_ENV) == '1'
+        budgets = {} if recording else json.loads(BUDGETS_PATH.read_text(encoding='utf-8'))
+        measurements = []
+        for endpoint in ENDPOINTS:
+            for role in ROLES:
+                measurement = self.measure(endpoint, role)
+                measurements.append(measurement)
+                if measurement.status >= 500:
+                    measurement.over_budget.append(f'status {measurement.status}')
+                if recording:
+                    budgets[measurement.key] = recorded_budget(measurement)
+                    continue
+                budget = budgets.get(measurement.key)
+                if budget is None:
+                    measurement.over_budget.append(f'no budget recorded (run with {RECORD_ENV}=1)')
+                    continue
+                for metric in ('queries', 'sql_ms', 'wall_ms'):
+                    if getattr(measurement, metric) > budget[metric]:
+                        measurement.over_budget.append(f'{metric} {getattr(measurement, metric)} > {budget[metric]}')
+
+        if recording:
+            BUDGETS_PATH.write_text(json.dumps(budgets, indent=2, sort_keys=True) + '\n', encoding='utf-8')
+        report_path = os.environ.get(REPORT_ENV)
+        if report_path:
+            Path(report_path).write_text(json.dumps({
+                'generated_at': timezone.now().isoformat(),
+                'database': settings.DATABASES['default']['ENGINE'],
+                'volume': LOAD_VOLUME,
+                'repeat': REPEAT,
+                'results': [asdict(measurement) for measurement in measurements],
+            }, indent=2) + '\n', encoding='utf-8')
+
+        failures = [f'{m.key} ({m.path}): {", ".join(m.over_budget)}' for m in measurements if m.over_budget]
+        self.assertFalse(failures, 'API budgets exceeded:\n' + '\n'.join(failures))
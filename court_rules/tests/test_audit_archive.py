@@ -0,0 +1,110 @@
+from __future__ import annotations
+
+import gzip
+import json
+import tempfile
+import uuid
+from datetime import date, datetime, timezone as dt_timezone
+from io import StringIO
+
+from django.core.management import call_command
+from django.db import connection
+from django.test import TestCase, override_settings
+from rest_framework import status
+from rest_framework.authtoken.models import Token
+
+from court_rules.models import AuditAction, AuditLog, User, UserRole
+from court_rules.services.audit_archive import (
+    add_months,
+    archive_path,
+    attached_partitions,
+    ensure_audit_partitions,
+    iter_archived_audit_log,
+    month_start,
+    partition_name,
+)
+
+
+class AuditArchiveTests(TestCase):
+    def setUp(self):
+        self.archive_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(self.archive_dir.cleanup)
+        override = override_settings(AUDIT_LOG_ARCHIVE_DIR=self.archive_dir.name, AUDIT_LOG_RETENTION_MONTHS=24)
+        override.enable()
+        self.addCleanup(override.disable)
+
+        self.user = User.objects.create_user(
+            email='archive-admin@example.com', password='password123',
+            first_name='Archive', last_name='Admin', role=UserRole.SUPER_ADMIN,
+        )
+        self.current = month_start(date.today())
+        self.old_month = add_months(self.current, -30)
+
+    def create_entry(self, month, action=AuditAction.UPDATE):
+        entry = AuditLog.objects.create(
+            actor_user=self.user,
+            entity_table='deadlines',
+            entity_id=uuid.uuid4(),
+            action=action,
+            after={'status': 'open'},
+        )
+        created_at = datetime(month.year, month.month, 15, 12, tzinfo=dt_timezone.utc)
+        AuditLog.objects.filter(pk=entry.pk).update(created_at=created_at)
+        # Fire the deferred FK checks now; Postgres won't drop a table with pending ones.
+        connection.check_constraints()
+        return entry
+
+    def partition_of(self, entry):
+        with connection.cursor() as cursor:
+            cursor.execute('SELECT tableoid::regclass::text FROM audit_log WHERE id = %s', [entry.pk])
+            return cursor.fetchone()[0]
+
+    def test_rows_routed_to_monthly_partitions(self):
+        self.assertIn(self.current, attached_partitions())
+        current_entry = self.create_entry(self.current)
+        old_entry = self.create_entry(self.old_month)
+        self.assertEqual(self.partition_of(current_entry), partition_name(self.current))
+        self.assertEqual(self.partition_of(old_entry), 'audit_log_default')
+
+        ensure_audit_partitions(start=self.old_month)
+        self.assertEqual(self.partition_of(old_entry), partition_name(self.old_month))
+
+    def test_archive_and_restore(self):
+        ensure_audit_partitions(start=self.old_month)
+        archived = [self.create_entry(self.old_month) for _ in range(3)]
+        kept = self.create_entry(self.current)
+
+        call_command('archive_audit_log', stdout=StringIO())
+
+        self.assertNotIn(self.old_month, attached_partitions())
+        self.assertEqual(list(AuditLog.objects.values_list('id', flat=True)), [kept.pk])
+        with gzip.open(archive_path(self.old_month), 'rt') as handle:
+            lines = [json.loads(line) for line in handle]
+        self.assertEqual({line['id'] for line in lines}, {str(entry.pk) for entry in archived})
+        self.assertEqual(lines[0]['after'], {'status': 'open'})
+        self.assertEqual(len(list(iter_archived_audit_log(self.old_month))), 3)
+
+        call_command('archive_audit_log', restore=f'{self.old_month:%Y-%m}', stdout=StringIO())
+        self.assertEqual(AuditLog.objects.count(), 4)
+        self.assertEqual(self.partition_of(archived[0]), partition_name(self.old_month))
+
+    def test_archived_month_served_by_api(self):
+        ensure_audit_partitions(start=self.old_month)
+        self.create_entry(self.old_month, AuditAction.CREATE)
+        self.create_entry(self.old_month, AuditAction.DELETE)
+        call_command('archive_audit_log', stdout=StringIO())
+
+        token = Token.objects.create(user=self.user)
+        auth = {'HTTP_AUTHORIZATION': f'Token {token.key}'}
+        months = self.client.get('/api/v1/audit-log/archives/', **auth).json()['months']
+        self.assertIn(f'{self.old_month:%Y-%m}', months)
+
+        response = self.client.get(
+            f'/api/v1/audit-log/archives/{self.old_month:%Y-%m}/', {'action': AuditAction.DELETE}, **auth
+        )
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual([row['action'] for row in response.json()['results']], [AuditAction.DELETE])
+        self.assertEqual(response.json()['results'][0]['actor_user'], str(self.user.pk))
+
+        missing = self.client.get(f'/api/v1/audit-log/archives/{self.current:%Y-%m}/', **auth)
+        self.assertEqual(missing.status_code, status.HTTP_404_NOT_FOUND)
@@ -0,0 +1,122 @@
+from __future__ import annotations
+
+import uuid
+
+from django.db import connection, transaction
+from django.http import HttpResponse
+from django.test import RequestFactory, TestCase, TransactionTestCase
+from django.test.utils import CaptureQueriesContext
+
+from court_rules.middleware import AuditBufferMiddleware
+from court_rules.models import AuditAction, AuditLog
+from court_rules.services.audit import (
+    AuditBuffer,
+    buffered_audit_events,
+    flush_audit_events,
+    record_audit_event,
+)
+
+
+def record(action=AuditAction.UPDATE):
+    return record_audit_event(
+        actor=None,
+        entity_table='deadlines',
+        entity_id=uuid.uuid4(),
+        action=action,
+        after={'status': 'open'},
+    )
+
+
+class AuditBufferTests(TestCase):
+    def test_without_buffer_writes_immediately(self):
+        log = record()
+        self.assertTrue(AuditLog.objects.filter(pk=log.pk).exists())
+
+    def test_committed_events_written_in_one_insert(self):
+        with buffered_audit_events() as buffer:
+            with self.captureOnCommitCallbacks(execute=True):
+                with transaction.atomic():
+                    for _ in range(5):
+                        record()
+                self.assertEqual(buffer.entries, [])
+            self.assertEqual(len(buffer.entries), 5)
+            self.assertEqual(AuditLog.objects.count(), 0)
+
+            with CaptureQueriesContext(connection) as queries:
+                self.assertEqual(flush_audit_events(), 5)
+        inserts = [q for q in queries.captured_queries if q['sql'].startswith('INSERT INTO "audit_log"')]
+        self.assertEqual(len(inserts), 1)
+        self.assertEqual(AuditLog.objects.count(), 5)
+
+    def test_rolled_back_events_are_dropped(self):
+        with self.captureOnCommitCallbacks(execute=True):
+            with buffered_audit_events():
+                record(AuditAction.CREATE)
+                try:
+                    with transaction.atomic():
+                        record(AuditAction.DELETE)
+                        raise RuntimeError('abort')
+                except RuntimeError:
+                    pass
+        self.assertEqual(list(AuditLog.objects.values_list('action', flat=True)), [AuditAction.CREATE])
+
+    def test_nested_blocks_share_buffer_and_flush_after_commit(self):
+        with self.captureOnCommitCallbacks(execute=True) as callbacks:
+            with buffered_audit_events() as outer:
+                with buffered_audit_events() as inner:
+                    record()
+                self.assertIs(inner, outer)
+                record()
+        self.assertEqual(len(callbacks), 3)
+        self.assertEqual(AuditLog.objects.count(), 2)
+
+    def test_flushes_when_full(self):
+        buffer = AuditBuffer(max_size=2)
+        for _ in range(3):
+            buffer.add(AuditLog(entity_table='deadlines', entity_id=uuid.uuid4(), action=AuditAction.UPDATE))
+        self.assertEqual(AuditLog.objects.count(), 2)
+        self.assertEqual(len(buffer.entries), 1)
+
+
+class AuditBufferMiddlewareTests(TransactionTestCase):
+    def test_request_events_flushed_after_commit(self):
+        def view(request):
+            with transaction.atomic():
+                record()
+                record()
+                self.assertEqual(AuditLog.objects.count(), 0)
+            return HttpResponse('ok')
+
+        middleware = AuditBufferMiddleware(view)
+        with CaptureQueriesContext(connection) as queries:
+            middleware(RequestFactory().post('/'))
+        inserts = [q for q in queries.captured_queries if q['sql'].startswith('INSERT INTO "audit_log"')]
+        self.assertEqual(len(inserts), 1)
+        self.assertEqual(AuditLog.objects.count(), 2)
+
+    def test_job_nested_in_request_flushes_with_the_request(self):
+        def view(request):
+            with transaction.atomic(), buffered_audit_events():
+                record()
+            record()
+            self.assertEqual(AuditLog.objects.count(), 0)
+            return HttpResponse('ok')
+
+        AuditBufferMiddleware(view)(RequestFactory().post('/'))
+        self.assertEqual(AuditLog.objects.count(), 2)
+
+    def test_block_exited_in_transaction_flushes_on_commit(self):
+        with transaction.atomic():
+            with buffered_audit_events():
+                record()
+            self.assertEqual(AuditLog.objects.count(), 0)
+        self.assertEqual(AuditLog.objects.count(), 1)
+
+        try:
+            with transaction.atomic():
+                with buffered_audit_events():
+                    record()
+                raise RuntimeError('abort')
+        except RuntimeError:
+            pass
+        self.assertEqual(AuditLog.objects.count(), 1)
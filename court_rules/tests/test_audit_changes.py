@@ -0,0 +1,69 @@
+from __future__ import annotations
+
+import uuid
+from datetime import datetime, timedelta, timezone as dt_timezone
+
+from django.utils import timezone
+from rest_framework import status
+from rest_framework.authtoken.models import Token
+from rest_framework.test import APITestCase
+
+from court_rules.models import AuditAction, AuditLog, User, UserRole
+from court_rules.services.audit import compute_changes, record_audit_event
+
+
+class ComputeChangesTests(APITestCase):
+    def test_only_changed_keys(self):
+        before = {'due_at': '2026-01-01', 'status': 'open', 'priority': 3}
+        after = {'due_at': '2026-01-05', 'status': 'open', 'priority': 3}
+        self.assertEqual(compute_changes(before, after), {'due_at': ['2026-01-01', '2026-01-05']})
+
+    def test_create_and_delete(self):
+        self.assertEqual(compute_changes(None, {'status': 'open', 'outcome': None}), {'status': [None, 'open']})
+        self.assertEqual(compute_changes({'status': 'done'}, None), {'status': ['done', None]})
+
+
+class AuditLogChangeFilterTests(APITestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.admin = User.objects.create_user(
+            email='audit-admin@example.com', password='password123',
+            first_name='Audit', last_name='Admin', role=UserRole.SUPER_ADMIN,
+        )
+        cls.other = User.objects.create_user(
+            email='audit-other@example.com', password='password123',
+            first_name='Other', last_name='User', role=UserRole.LAWYER,
+        )
+        cls.token = Token.objects.create(user=cls.admin)
+        cls.deadline_id = uuid.uuid4()
+        cls.moved = record_audit_event(
+            actor=cls.admin, entity_table='deadlines', entity_id=cls.deadline_id, action=AuditAction.UPDATE,
+            before={'due_at': '2026-01-01', 'status': 'open'}, after={'due_at': '2026-01-08', 'status': 'open'},
+        )
+        cls.closed = record_audit_event(
+            actor=cls.other, entity_table='deadlines', entity_id=cls.deadline_id, action=AuditAction.UPDATE,
+            before={'due_at': '2026-01-08', 'status': 'open'}, after={'due_at': '2026-01-08', 'status': 'done'},
+        )
+
+    def get_ids(self, **params):
+        response = self.client.get('/api/v1/audit-log/', params, HTTP_AUTHORIZATION=f'Token {self.token.key}')
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        return {row['id'] for row in response.data['results']}
+
+    def test_changes_stored(self):
+        self.assertEqual(AuditLog.objects.get(pk=self.moved.pk).changes, {'due_at': ['2026-01-01', '2026-01-08']})
+
+    def test_filter_by_changed_field(self):
+        self.assertEqual(self.get_ids(changed_field='due_at'), {str(self.moved.pk)})
+        self.assertEqual(self.get_ids(changed_field='status'), {str(self.closed.pk)})
+        self.assertEqual(self.get_ids(changed_field='priority'), set())
+
+    def test_filter_by_actor_and_time_range(self):
+        self.assertEqual(self.get_ids(actor=str(self.other.pk)), {str(self.closed.pk)})
+        now = timezone.now()
+        self.assertEqual(
+            self.get_ids(actor=str(self.admin.pk), created_after=(now - timedelta(hours=1)).isoformat()),
+            {str(self.moved.pk)},
+        )
+        past = datetime(2020, 1, 1, tzinfo=dt_timezone.utc).isoformat()
+        self.assertEqual(self.get_ids(created_before=past), set())
@@ -0,0 +1,139 @@
+from __future__ import annotations
+
+import re
+from io import StringIO
+
+from django.core.management import call_command
+from django.test import TestCase
+
+from court_rules.models import BackfillCheckpoint, Judge, Organization, User, UserRole
+from court_rules.services.backfill import BackfillPass, run_backfill
+
+
+class Crash(Exception):
+    pass
+
+
+class BackfillTests(TestCase):
+    def setUp(self):
+        self.judges = [
+            Judge.objects.create(full_name=f'Judge {n}', contact_phone=f'312555{n:04d}') for n in range(7)
+        ]
+
+    def phone_pass(self, transform=None):
+        def normalize(judge):
+            digits = re.sub(r'\D', '', judge.contact_phone)
+            return {'contact_phone': f'({digits[:3]}) {digits[3:6]}-{digits[6:]}'}
+        return BackfillPass(
+            name='test.judge_phones',
+            queryset=Judge.objects.all(),
+            fields=['contact_phone'],
+            transform=transform or normalize,
+        )
+
+    def test_writes_changed_rows_in_chunks_without_touching_auto_now(self):
+        updated_at = {judge.pk: judge.updated_at for judge in Judge.objects.all()}
+        Judge.objects.filter(pk=self.judges[0].pk).update(contact_phone='(312) 555-0000')
+
+        # Checkpoint get_or_create (4), then per chunk of 3: SELECT, SAVEPOINT,
+        # UPDATE, checkpoint UPDATE, RELEASE; finally the completion UPDATE.
+        with self.assertNumQueries(4 + 3 * 5 + 1):
+            result = run_backfill(self.phone_pass(), chunk_size=3)
+
+        self.assertEqual((result.processed, result.changed, result.chunks), (7, 6, 3))
+        for judge in Judge.objects.all():
+            self.assertRegex(judge.contact_phone, r'^\(312\) 555-\d{4}$')
+            self.assertEqual(judge.updated_at, updated_at[judge.pk])
+        checkpoint = BackfillCheckpoint.objects.get(name='test.judge_phones')
+        self.assertIsNotNone(checkpoint.completed_at)
+        self.assertEqual((checkpoint.processed, checkpoint.changed), (7, 6))
+
+    def test_resumes_after_the_last_committed_chunk(self):
+        seen = []
+
+        def crash_on_sixth_row(judge):
+            seen.append(judge.pk)
+            if len(seen) == 6:
+                raise Crash
+            return {'contact_phone': 'fixed'}
+
+        with self.assertRaises(Crash):
+            run_backfill(self.phone_pass(crash_on_sixth_row), chunk_size=2)
+
+        checkpoint = BackfillCheckpoint.objects.get(name='test.judge_phones')
+        self.assertEqual(checkpoint.processed, 4)
+        self.assertIsNone(checkpoint.completed_at)
+        self.assertEqual(Judge.objects.filter(contact_phone='fixed').count(), 4)
+
+        resumed = []
+
+        def fix(judge):
+            resumed.append(judge.pk)
+            return {'contact_phone': 'fixed'}
+
+        result = run_backfill(self.phone_pass(fix), chunk_size=2)
+
+        self.assertEqual(result.resumed_after, checkpoint.last_pk)
+        self.assertEqual(len(resumed), 3)
+        self.assertEqual(Judge.objects.filter(contact_phone='fixed').count(), 7)
+
+        # A completed backfill starts over on the next run.
+        self.assertEqual(run_backfill(self.phone_pass(fix), chunk_size=2).processed, 7)
+
+    def test_dry_run_reports_diffs_and_writes_nothing(self):
+        diffs = []
+
+        result = run_backfill(self.phone_pass(), dry_run=True, on_change=lambda row, diff: diffs.append(diff))
+
+        self.assertEqual(result.changed, 7)
+        self.assertEqual(diffs[0]['contact_phone'][1][:6], '(312) ')
+        self.assertFalse(Judge.objects.filter(contact_phone__startswith='(').exists())
+        self.assertFalse(BackfillCheckpoint.objects.exists())
+
+    def test_transform_may_only_return_declared_fields(self):
+        with self.assertRaises(ValueError):
+            run_backfill(self.phone_pass(lambda judge: {'clerk_phone': 'x'}))
+
+
+class BackfillCommandTests(TestCase):
+    def test_normalize_data(self):
+        judge = Judge.objects.create(full_name='Judge Format', clerk_phone='312.555.1212',
+                                     additional_staff='Courtroom Deputy: A\n  Phone: 3125559999')
+        org = Organization.objects.create(name='Format Firm', phone='1-312-555-0100', state='il', zip_code='bad')
+        user = User.objects.create_user(
+            email='format@example.com', password='password123', first_name='F', last_name='M',
+            role=UserRole.LAWYER, organization=org, phone='3125550101',
+        )
+
+        out = StringIO()
+        call_command('normalize_data', '--chunk-size', '1', stdout=out)
+
+        judge.refresh_from_db()
+        self.assertEqual(judge.clerk_phone, '(312) 555-1212')
+        self.assertIn('Phone: (312) 555-9999', judge.additional_staff)
+        org.refresh_from_db()
+        self.assertEqual((org.phone, org.state), ('(312) 555-0100', 'IL'))
+        user.refresh_from_db()
+        self.assertEqual(user.phone, '(312) 555-0101')
+        output = out.getvalue()
+        self.assertIn("Judge Format clerk_phone: '312.555.1212' → '(312) 555-1212'", output)
+        self.assertIn('Phone numbers formatted: 4', output)
+        self.assertIn('Invalid zip codes found: 1', output)
+
+    def test_fix_chamber_staff_data_dry_run_then_apply(self):
+        judge = Judge.objects.create(
+            full_name='Judge Mixed', clerk_name='Pat Court Reporter', clerk_phone='(312) 555-0100', clerk_room='Room 1',
+        )
+
+        out = StringIO()
+        call_command('fix_chamber_staff_data', '--dry-run', stdout=out)
+        judge.refresh_from_db()
+        self.assertEqual(judge.court_reporter_name, '')
+        self.assertIn("clerk_name: 'Pat Court Reporter' → ''", out.getvalue())
+
+        call_command('fix_chamber_staff_data', stdout=StringIO())
+        judge.refresh_from_db()
+        self.assertEqual(
+            (judge.court_reporter_name, judge.court_reporter_room, judge.clerk_name),
+            ('Pat Court Reporter', 'Room 1', ''),
+        )
@@ -0,0 +1,96 @@
+from __future__ import annotations
+
+from datetime import date, timedelta
+from decimal import Decimal
+
+from django.core.cache import cache
+from django.db import connection
+from django.test import override_settings
+from django.test.utils import CaptureQueriesContext
+from django.utils import timezone
+from rest_framework import status
+from rest_framework.authtoken.models import Token
+from rest_framework.test import APITestCase
+
+from court_rules.models import (
+    BillingRecord,
+    Organization,
+    PaymentStatus,
+    Subscription,
+    User,
+    UserRole,
+)
+
+
+class BillingDashboardTests(APITestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.super_admin = User.objects.create_user(
+            email='billing-super@example.com', password='password123',
+            first_name='Super', last_name='Admin', role=UserRole.SUPER_ADMIN,
+        )
+        cls.token = Token.objects.create(user=cls.super_admin)
+        cls.today = timezone.now().date()
+        for index in range(3):
+            cls.create_tenant(index)
+
+    @classmethod
+    def create_tenant(cls, index):
+        org = Organization.objects.create(name=f'Billing Firm {index}')
+        subscription = Subscription.objects.create(
+            organization=org,
+            licensed_users=5,
+            monthly_rate=Decimal('100.00'),
+            contract_start_date=date(2024, 1, 1),
+        )
+        for payment_status, balance in ((PaymentStatus.PENDING, '100.00'), (PaymentStatus.PAID, '0.00')):
+            BillingRecord.objects.create(
+                subscription=subscription,
+                billing_period_start=cls.today.replace(day=1) - timedelta(days=31),
+                billing_period_end=cls.today.replace(day=1) - timedelta(days=1),
+                amount_billed=Decimal('100.00'),
+                balance_due=Decimal(balance),
+                payment_due_date=cls.today - timedelta(days=5),
+                payment_status=payment_status,
+            )
+        return org
+
+    def get_dashboard(self):
+        return self.client.get('/api/v1/billing/dashboard/', HTTP_AUTHORIZATION=f'Token {self.token.key}')
+
+    def test_aggregates_across_tenants(self):
+        response = self.get_dashboard()
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data['total_outstanding'], 300.0)
+        self.assertEqual(response.data['overdue_count'], 3)
+        self.assertEqual(len(response.data['overdue_records']), 3)
+        self.assertEqual(response.data['payment_status_breakdown'], {'Pending': 3, 'Paid': 3})
+
+    @override_settings(BILLING_DASHBOARD_CACHE_TIMEOUT=0)
+    def test_query_count_is_constant_in_tenants(self):
+        with CaptureQueriesContext(connection) as before:
+            self.get_dashboard()
+        for index in range(3, 8):
+            self.create_tenant(index)
+        with CaptureQueriesContext(connection) as after:
+            response = self.get_dashboard()
+        self.assertEqual(response.data['overdue_count'], 8)
+        self.assertEqual(len(before.captured_queries), len(after.captured_queries))
+
+    @override_settings(
+        BILLING_DASHBOARD_CACHE_TIMEOUT=60,
+        CACHES={'default': {'BACKEND': 'django.core.cache.backends.locmem.LocMemCache'}},
+    )
+    def test_snapshot_invalidated_by_billing_writes(self):
+        cache.clear()
+        self.assertEqual(self.get_dashboard().data['overdue_count'], 3)
+
+        record = BillingRecord.objects.filter(payment_status=PaymentStatus.PENDING).first()
+        record.payment_status = PaymentStatus.PAID
+        record.balance_due = Decimal('0.00')
+        with self.captureOnCommitCallbacks(execute=True):
+            record.save()
+
+        response = self.get_dashboard()
+        self.assertEqual(response.data['overdue_count'], 2)
+        self.assertEqual(response.data['total_outstanding'], 200.0)
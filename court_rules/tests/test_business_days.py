@@ -0,0 +1,87 @@
+from __future__ import annotations
+
+import random
+from datetime import date, timedelta
+
+from django.test import SimpleTestCase, TestCase
+
+from court_rules.models import Holiday, HolidayCalendar
+from court_rules.services.business_days import (
+    CompiledCalendar,
+    add_business_days,
+    add_calendar_days,
+    compile_calendar,
+    count_court_days,
+    roll_forward,
+)
+
+HOLIDAYS = [
+    date(2026, 1, 1), date(2026, 1, 19), date(2026, 2, 16), date(2026, 5, 25),
+    date(2026, 7, 3), date(2026, 7, 4), date(2026, 9, 7), date(2026, 11, 26),
+    date(2026, 12, 25), date(2027, 1, 1),
+]
+
+
+def naive_add(start, offset, holidays):
+    def business(day):
+        return day.weekday() < 5 and day not in holidays
+
+    day = start
+    if offset == 0:
+        while not business(day):
+            day += timedelta(days=1)
+        return day
+    step = timedelta(days=1 if offset > 0 else -1)
+    remaining = abs(offset)
+    while remaining:
+        day += step
+        if business(day):
+            remaining -= 1
+    return day
+
+
+class BusinessDayArithmeticTests(SimpleTestCase):
+    calendar = CompiledCalendar.from_dates(HOLIDAYS)
+
+    def test_matches_day_by_day_reference(self):
+        rng = random.Random(6)
+        starts = [date(2025, 12, 1) + timedelta(days=rng.randrange(400)) for _ in range(500)]
+        offsets = [rng.randrange(-40, 41) for _ in starts]
+        expected = [naive_add(start, offset, set(HOLIDAYS)) for start, offset in zip(starts, offsets)]
+        self.assertEqual(add_business_days(starts, offsets, calendar=self.calendar), expected)
+
+    def test_skips_consecutive_holidays_and_weekend(self):
+        # Thu 2 Jul 2026 + 1 business day: Fri 3rd and Sat 4th are holidays.
+        self.assertEqual(add_business_days([date(2026, 7, 2)], 1, calendar=self.calendar), [date(2026, 7, 6)])
+
+    def test_count_court_days_excludes_start(self):
+        starts = [date(2026, 1, 16), date(2026, 3, 2)]
+        ends = [date(2026, 1, 23), date(2026, 3, 2)]
+        self.assertEqual(count_court_days(starts, ends, calendar=self.calendar), [4, 0])
+
+    def test_frcp_roll_forward(self):
+        self.assertEqual(
+            roll_forward([date(2026, 12, 25), date(2026, 12, 23)], calendar=self.calendar),
+            [date(2026, 12, 28), date(2026, 12, 23)],
+        )
+        # 14 days after Fri 11 Dec 2026 lands on Christmas; the period runs to Monday.
+        self.assertEqual(add_calendar_days([date(2026, 12, 11)], 14, calendar=self.calendar), [date(2026, 12, 28)])
+
+
+class CompileCalendarTests(TestCase):
+    def test_merges_calendars_and_tracks_changes(self):
+        federal = HolidayCalendar.objects.create(name='Federal', timezone='America/Chicago')
+        state = HolidayCalendar.objects.create(name='Illinois', timezone='America/Chicago')
+        Holiday.objects.create(calendar=federal, date=date(2026, 1, 19), name='MLK Day')
+        Holiday.objects.create(calendar=state, date=date(2026, 2, 12), name="Lincoln's Birthday")
+
+        merged = compile_calendar(federal.pk, state.pk)
+        self.assertFalse(merged.is_business_day(date(2026, 1, 19)))
+        self.assertFalse(merged.is_business_day(date(2026, 2, 12)))
+        self.assertTrue(compile_calendar(federal.pk).is_business_day(date(2026, 2, 12)))
+
+        with self.assertNumQueries(1):
+            self.assertIs(compile_calendar(state.pk, federal.pk), merged)
+
+        Holiday.objects.create(calendar=state, date=date(2026, 3, 2), name='Pulaski Day')
+        self.assertFalse(compile_calendar(federal.pk, state.pk).is_business_day(date(2026, 3, 2)))
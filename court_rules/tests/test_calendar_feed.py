@@ -0,0 +1,125 @@
+from __future__ import annotations
+
+from datetime import timedelta
+
+from django.core.cache import cache
+from django.utils import timezone
+from rest_framework import status
+from rest_framework.authtoken.models import Token
+from rest_framework.test import APITestCase
+
+from court_rules.models import (
+    Case,
+    CaseStatus,
+    CaseTeam,
+    CaseTeamRole,
+    Deadline,
+    DeadlineBasis,
+    DeadlineTriggerType,
+    Organization,
+    User,
+    UserRole,
+)
+from court_rules.services.calendar_export import _format_dt, generate_deadlines_ics, warm_event_fragments
+
+
+class CalendarTestCase(APITestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.org = Organization.objects.create(name='Calendar Firm')
+        cls.user = User.objects.create_user(
+            email='calendar@example.com', password='password123',
+            first_name='Cal', last_name='Endar', role=UserRole.LAWYER, organization=cls.org,
+        )
+        cls.token = Token.objects.create(user=cls.user)
+        cls.case = Case.objects.create(
+            organization=cls.org,
+            internal_case_id='CAL-1',
+            caption='Calendar v. Feed',
+            status=CaseStatus.OPEN,
+            timezone='America/Chicago',
+        )
+        cls.deadlines = [
+            Deadline.objects.create(
+                case=cls.case,
+                trigger_type=DeadlineTriggerType.USER,
+                basis=DeadlineBasis.CALENDAR_DAYS,
+                due_at=timezone.now() + timedelta(days=days),
+                timezone='America/Chicago',
+                created_by=cls.user,
+            )
+            for days in (3, 10)
+        ]
+
+
+class CalendarFeedTests(CalendarTestCase):
+    def export(self, **headers):
+        return self.client.get(
+            '/api/v1/calendar/deadlines.ics',
+            HTTP_AUTHORIZATION=f'Token {self.token.key}',
+            **headers,
+        )
+
+    def test_streams_calendar_with_validators(self):
+        response = self.export()
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertTrue(response.streaming)
+        body = b''.join(response.streaming_content).decode()
+        self.assertTrue(body.startswith('BEGIN:VCALENDAR\r\n'))
+        self.assertEqual(body.count('BEGIN:VEVENT'), 2)
+        self.assertIn('ETag', response)
+        self.assertIn('Last-Modified', response)
+
+    def test_not_modified_until_deadlines_change(self):
+        etag = self.export()['ETag']
+        response = self.export(HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, status.HTTP_304_NOT_MODIFIED)
+
+        self.deadlines[0].delete()
+        response = self.export(HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertNotEqual(response['ETag'], etag)
+
+    def test_signed_feed_url(self):
+        response = self.client.get('/api/v1/calendar/feed-url/', HTTP_AUTHORIZATION=f'Token {self.token.key}')
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertTrue(response.data['webcal_url'].startswith('webcal://'))
+
+        feed_path = response.data['url'].split('testserver', 1)[1]
+        feed = self.client.get(feed_path)
+        self.assertEqual(feed.status_code, status.HTTP_200_OK)
+        self.assertEqual(b''.join(feed.streaming_content).decode().count('BEGIN:VEVENT'), 2)
+
+        self.user.set_password('another-password')
+        self.user.save()
+        self.assertEqual(self.client.get(feed_path).status_code, status.HTTP_404_NOT_FOUND)
+
+    def test_tampered_token_is_rejected(self):
+        response = self.client.get('/api/v1/calendar/feed/not-a-token.ics')
+        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
+
+
+class CalendarFragmentCacheTests(CalendarTestCase):
+    def setUp(self):
+        cache.clear()
+
+    def test_fragments_are_reused_until_deadline_changes(self):
+        deadlines = list(Deadline.objects.order_by('due_at'))
+        self.assertEqual(warm_event_fragments(deadlines), (2, 2))
+        self.assertEqual(warm_event_fragments(deadlines), (2, 0))
+
+        deadline = deadlines[0]
+        deadline.due_at += timedelta(days=1)
+        deadline.save()
+        self.assertEqual(warm_event_fragments(Deadline.objects.order_by('due_at')), (2, 1))
+        self.assertIn(_format_dt(deadline.due_at), generate_deadlines_ics(Deadline.objects.all()))
+
+    def test_case_and_organization_feeds(self):
+        CaseTeam.objects.create(case=self.case, user=self.user, role=CaseTeamRole.REVIEWER)
+        for url in (
+            f'/api/v1/calendar/cases/{self.case.id}/deadlines.ics',
+            '/api/v1/calendar/organization/deadlines.ics',
+        ):
+            response = self.client.get(url, HTTP_AUTHORIZATION=f'Token {self.token.key}')
+            self.assertEqual(response.status_code, status.HTTP_200_OK)
+            self.assertEqual(b''.join(response.streaming_content).decode().count('BEGIN:VEVENT'), 2)
@@ -0,0 +1,169 @@
+from __future__ import annotations
+
+from datetime import timedelta
+from io import StringIO
+
+from django.core.management import call_command
+from django.utils import timezone
+from rest_framework import status
+from rest_framework.authtoken.models import Token
+from rest_framework.test import APITestCase
+
+from court_rules.models import (
+    Case,
+    CaseAccess,
+    CaseCapability,
+    CasePermission,
+    CaseStatus,
+    CaseTeam,
+    CaseTeamRole,
+    Deadline,
+    DeadlineBasis,
+    DeadlineTriggerType,
+    Organization,
+    User,
+    UserAccessGrant,
+    UserRole,
+)
+
+
+class CaseAccessTests(APITestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.org = Organization.objects.create(name='Access Firm')
+        cls.other_org = Organization.objects.create(name='Other Firm')
+        cls.admin = User.objects.create_user(
+            email='admin@example.com', password='password123',
+            first_name='Site', last_name='Admin', role=UserRole.FIRM_ADMIN, organization=cls.org,
+        )
+        cls.lead = User.objects.create_user(
+            email='lead@example.com', password='password123',
+            first_name='Lead', last_name='Lawyer', role=UserRole.LAWYER, organization=cls.org,
+        )
+        cls.paralegal = User.objects.create_user(
+            email='para@example.com', password='password123',
+            first_name='Para', last_name='Legal', role=UserRole.PARALEGAL, organization=cls.org,
+        )
+        cls.outsider = User.objects.create_user(
+            email='outsider@example.com', password='password123',
+            first_name='Out', last_name='Sider', role=UserRole.LAWYER, organization=cls.other_org,
+        )
+        cls.case = Case.objects.create(
+            organization=cls.org,
+            internal_case_id='ACL-1',
+            caption='Lead v. Case',
+            status=CaseStatus.OPEN,
+            lead_attorney=cls.lead,
+            timezone='America/Chicago',
+        )
+        cls.unrelated_case = Case.objects.create(
+            organization=cls.org,
+            internal_case_id='ACL-2',
+            caption='Unrelated v. Case',
+            status=CaseStatus.OPEN,
+            timezone='America/Chicago',
+        )
+
+    def capabilities(self, user, case):
+        return set(CaseAccess.objects.filter(user=user, case=case).values_list('capability', flat=True))
+
+    def list_case_ids(self, user):
+        token, _ = Token.objects.get_or_create(user=user)
+        response = self.client.get('/api/v1/cases/', HTTP_AUTHORIZATION=f'Token {token.key}')
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        return {row['id'] for row in response.data['results']}
+
+    def test_lead_attorney_holds_every_capability(self):
+        self.assertEqual(self.capabilities(self.lead, self.case), set(CaseCapability.values))
+        self.assertEqual(self.list_case_ids(self.lead), {str(self.case.id)})
+
+    def test_access_grant_adds_and_revokes_view(self):
+        grant = UserAccessGrant.objects.create(
+            organization=self.org, granted_by=self.admin,
+            granted_to=self.paralegal, can_access_user=self.lead,
+        )
+        self.assertEqual(self.capabilities(self.paralegal, self.case), {CaseCapability.VIEW})
+        self.assertEqual(self.list_case_ids(self.paralegal), {str(self.case.id)})
+
+        grant.is_active = False
+        grant.save()
+        self.assertEqual(self.capabilities(self.paralegal, self.case), set())
+        self.assertEqual(self.list_case_ids(self.paralegal), set())
+
+    def test_team_membership_and_permissions(self):
+        member = CaseTeam.objects.create(case=self.unrelated_case, user=self.paralegal, role=CaseTeamRole.REVIEWER)
+        self.assertEqual(self.capabilities(self.paralegal, self.unrelated_case), {CaseCapability.VIEW})
+
+        CasePermission.objects.create(case=self.unrelated_case, user=self.paralegal, can_edit=True)
+        self.assertEqual(
+            self.capabilities(self.paralegal, self.unrelated_case),
+            {CaseCapability.VIEW, CaseCapability.EDIT},
+        )
+
+        member.delete()
+        CasePermission.objects.filter(case=self.unrelated_case, user=self.paralegal).delete()
+        self.assertEqual(self.capabilities(self.paralegal, self.unrelated_case), set())
+
+    def test_access_never_crosses_organizations(self):
+        CaseTeam.objects.create(case=self.case, user=self.outsider, role=CaseTeamRole.OWNER)
+        self.assertEqual(self.capabilities(self.outsider, self.case), set())
+
+    def test_lead_change_moves_access(self):
+        self.case.lead_attorney = self.paralegal
+        self.case.save()
+        self.assertEqual(self.capabilities(self.lead, self.case), set())
+        self.assertEqual(self.capabilities(self.paralegal, self.case), set(CaseCapability.values))
+
+    def test_deadlines_scoped_through_case_access(self):
+        Deadline.objects.create(
+            case=self.case,
+            trigger_type=DeadlineTriggerType.USER,
+            basis=DeadlineBasis.CALENDAR_DAYS,
+            due_at=timezone.now() + timedelta(days=3),
+            timezone='America/Chicago',
+        )
+        token, _ = Token.objects.get_or_create(user=self.lead)
+        response = self.client.get('/api/v1/deadlines/', HTTP_AUTHORIZATION=f'Token {token.key}')
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(len(response.data['results']), 1)
+
+        token, _ = Token.objects.get_or_create(user=self.paralegal)
+        response = self.client.get('/api/v1/deadlines/', HTTP_AUTHORIZATION=f'Token {token.key}')
+        self.assertEqual(len(response.data['results']), 0)
+
+    def test_grant_from_paralegal_shows_their_owned_deadlines(self):
+        CaseTeam.objects.create(case=self.case, user=self.paralegal, role=CaseTeamRole.REVIEWER)
+        Deadline.objects.create(
+            case=self.case,
+            owner=self.paralegal,
+            trigger_type=DeadlineTriggerType.USER,
+            basis=DeadlineBasis.CALENDAR_DAYS,
+            due_at=timezone.now() + timedelta(days=3),
+            timezone='America/Chicago',
+        )
+        viewer = User.objects.create_user(
+            email='viewer@example.com', password='password123',
+            first_name='View', last_name='Er', role=UserRole.LAWYER, organization=self.org,
+        )
+        token, _ = Token.objects.get_or_create(user=viewer)
+        response = self.client.get('/api/v1/deadlines/', HTTP_AUTHORIZATION=f'Token {token.key}')
+        self.assertEqual(len(response.data['results']), 0)
+
+        grant = UserAccessGrant.objects.create(
+            organization=self.org, granted_by=self.admin,
+            granted_to=viewer, can_access_user=self.paralegal,
+        )
+        response = self.client.get('/api/v1/deadlines/', HTTP_AUTHORIZATION=f'Token {token.key}')
+        self.assertEqual(len(response.data['results']), 1)
+        # The paralegal leads no cases, so the grant adds no case rows.
+        self.assertEqual(self.capabilities(viewer, self.case), set())
+
+        grant.is_active = False
+        grant.save()
+        response = self.client.get('/api/v1/deadlines/', HTTP_AUTHORIZATION=f'Token {token.key}')
+        self.assertEqual(len(response.data['results']), 0)
+
+    def test_rebuild_command_restores_missing_rows(self):
+        CaseAccess.objects.all().delete()
+        call_command('rebuild_case_access', stdout=StringIO())
+        self.assertEqual(self.capabilities(self.lead, self.case), set(CaseCapability.values))
@@ -0,0 +1,58 @@
+from __future__ import annotations
+
+from io import StringIO
+
+from django.core.management import call_command
+from django.core.management.base import CommandError
+from django.test import SimpleTestCase
+
+from court_rules.management.commands.benchmark_chambers_extractor import DEFAULT_CORPUS
+from court_rules.services.chambers import StaffContact, extract_chambers_staff
+
+
+def corpus_page(name):
+    return (DEFAULT_CORPUS / name).read_text(encoding='utf-8')
+
+
+class ChambersExtractorTests(SimpleTestCase):
+    def test_corpus_is_extracted_without_field_errors(self):
+        out = StringIO()
+        call_command('benchmark_chambers_extractor', '--repeat', '1', '--fail-under', '100', stdout=out)
+
+        self.assertIn('Field accuracy: 104/104 (100.0%)', out.getvalue())
+        self.assertIn('pages/s', out.getvalue())
+
+    def test_all_roles_map_to_judge_fields(self):
+        staff = extract_chambers_staff(corpus_page('kennelly.html'))
+
+        self.assertEqual(staff.judicial_assistant, StaffContact('Gloria Mendez', '(312) 435-5619', ''))
+        fields = staff.judge_fields()
+        self.assertEqual(fields['executive_law_clerk'], 'Rachel Abernathy')
+        self.assertEqual(fields['executive_law_clerk_room'], 'Room 2188')
+        self.assertEqual(fields['clerk_name'], 'Sofia Kowalczyk')
+        self.assertEqual(fields['court_reporter_room'], 'Room 2524A')
+        self.assertEqual(fields['apprentices'], 'Ethan Barlow\nNaomi Castellanos')
+        self.assertNotIn('judicial_assistant_room', fields)
+
+    def test_scripts_and_footer_do_not_leak_into_sections(self):
+        html = (
+            '<script>var x = "**Court Reporter**";</script>'
+            '<p>**Law Clerk**<br>\nAda Quill<br>\nada@example.com</p>'
+            '<div>Court Telephone Numbers</div><div>Clerk Office</div>'
+        )
+
+        staff = extract_chambers_staff(html)
+
+        self.assertIsNone(staff.court_reporter)
+        self.assertEqual(staff.law_clerks, ['Ada Quill'])
+
+    def test_missing_roles_stay_empty(self):
+        staff = extract_chambers_staff(corpus_page('blakey.html'))
+
+        self.assertIsNone(staff.court_reporter)
+        self.assertNotIn('court_reporter_name', staff.judge_fields())
+        self.assertEqual(staff.summary_lines()[0], 'Courtroom Deputy: Gwendolyn Pryce')
+
+    def test_benchmark_requires_a_corpus(self):
+        with self.assertRaises(CommandError):
+            call_command('benchmark_chambers_extractor', '--corpus', '/nonexistent', stdout=StringIO())
@@ -0,0 +1,269 @@
+from __future__ import annotations
+
+import hashlib
+import tempfile
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from io import StringIO
+
+from django.core.management import call_command
+from django.test import SimpleTestCase, TestCase, override_settings
+
+from court_rules.models import Judge
+from court_rules.services.page_cache import PageCache
+from court_rules.services.scraping import HostThrottle, fetch_pages
+
+CHAMBERS_PAGE = """<html><body>
+<p>**Court Reporter**<br>
+{reporter}<br>
+(312) 555-0100<br>
+Room 1234
+</p><hr>
+<p>**Courtroom Deputy**<br>
+{deputy}<br>
+(312) 555-0142<br>
+Room 2050
+</p><hr>
+<p>**Law Clerk**<br>
+Alex Clerk<br>
+Sam Clerk
+</p>
+<footer>Northern District Logo</footer>
+</body></html>"""
+
+
+class FixtureHandler(BaseHTTPRequestHandler):
+    def do_GET(self):
+        server = self.server
+        with server.lock:
+            server.requests += 1
+            server.in_flight += 1
+            server.max_in_flight = max(server.max_in_flight, server.in_flight)
+            failures = server.failures.get(self.path, 0)
+            if failures:
+                server.failures[self.path] = failures - 1
+        try:
+            time.sleep(server.latency)
+            body = server.pages.get(self.path)
+            if failures:
+                self.send_response(503)
+                self.send_header('Retry-After', '0')
+                body = 'busy'
+            elif body is None:
+                self.send_response(404)
+                body = 'missing'
+            else:
+                etag = '"%s"' % hashlib.md5(body.encode()).hexdigest()
+                if self.headers.get('If-None-Match') == etag:
+                    with server.lock:
+                        server.not_modified += 1
+                    self.send_response(304)
+                    self.end_headers()
+                    return
+                self.send_response(200)
+                self.send_header('ETag', etag)
+            payload = body.encode()
+            self.send_header('Content-Type', 'text/html; charset=utf-8')
+            self.send_header('Content-Length', str(len(payload)))
+            self.end_headers()
+            self.wfile.write(payload)
+        finally:
+            with server.lock:
+                server.in_flight -= 1
+
+    def log_message(self, format, *args):
+        pass
+
+
+class FixtureServerMixin:
+    """Serves ``pages`` (path -> HTML) from a local threaded HTTP server."""
+
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        cls.server = ThreadingHTTPServer(('127.0.0.1', 0), FixtureHandler)
+        cls.server.daemon_threads = True
+        cls.server.lock = threading.Lock()
+        cls.server_thread = threading.Thread(target=cls.server.serve_forever, daemon=True)
+        cls.server_thread.start()
+        cls.base_url = f'http://127.0.0.1:{cls.server.server_address[1]}'
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.server.shutdown()
+        cls.server.server_close()
+        super().tearDownClass()
+
+    def serve(self, pages, *, failures=None, latency=0.0):
+        self.server.pages = pages
+        self.server.failures = dict(failures or {})
+        self.server.latency = latency
+        self.server.requests = 0
+        self.server.in_flight = 0
+        self.server.max_in_flight = 0
+        self.server.not_modified = 0
+
+
+class FetchPagesTests(FixtureServerMixin, SimpleTestCase):
+    def test_fetches_concurrently_within_the_per_host_limit(self):
+        self.serve({f'/judge-{n}': f'page {n}' for n in range(12)}, latency=0.05)
+        urls = [f'{self.base_url}/judge-{n}' for n in range(12)]
+
+        started = time.monotonic()
+        pages = fetch_pages(urls, workers=6, per_host=3, delay=0)
+        elapsed = time.monotonic() - started
+
+        self.assertEqual(list(pages), urls)
+        self.assertTrue(all(page.ok for page in pages.values()))
+        self.assertEqual(pages[urls[5]].text, 'page 5')
+        self.assertEqual(self.server.max_in_flight, 3)
+        self.assertLess(elapsed, 12 * 0.05)
+
+    def test_retries_transient_errors_and_reports_permanent_ones(self):
+        self.serve({'/flaky': 'recovered'}, failures={'/flaky': 2})
+
+        pages = fetch_pages(
+            [f'{self.base_url}/flaky', f'{self.base_url}/missing', f'{self.base_url}/flaky'],
+            retries=3, backoff=0, delay=0,
+        )
+
+        flaky = pages[f'{self.base_url}/flaky']
+        self.assertTrue(flaky.ok)
+        self.assertEqual((flaky.attempts, flaky.text), (3, 'recovered'))
+        missing = pages[f'{self.base_url}/missing']
+        self.assertFalse(missing.ok)
+        self.assertEqual((missing.status, missing.attempts, missing.error), (404, 1, 'HTTP 404'))
+        self.assertEqual(self.server.requests, 4)
+
+    def test_gives_up_after_the_retry_budget(self):
+        self.serve({'/down': 'never'}, failures={'/down': 10})
+
+        page = fetch_pages([f'{self.base_url}/down'], retries=2, backoff=0, delay=0)[f'{self.base_url}/down']
+
+        self.assertFalse(page.ok)
+        self.assertEqual((page.status, page.attempts), (503, 3))
+
+    def test_throttle_spaces_requests_to_one_host(self):
+        throttle = HostThrottle(per_host=4, delay=0.05)
+        starts = []
+        for _ in range(3):
+            with throttle.slot('http://court.example/a'):
+                starts.append(time.monotonic())
+        with throttle.slot('http://other.example/a'):
+            other = time.monotonic()
+
+        self.assertGreaterEqual(starts[2] - starts[0], 0.09)
+        self.assertLess(other - starts[2], 0.04)
+
+
+class ChambersScrapeCommandTests(FixtureServerMixin, TestCase):
+    def setUp(self):
+        cache_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(cache_dir.cleanup)
+        settings_override = override_settings(SCRAPER_CACHE_DIR=cache_dir.name)
+        settings_override.enable()
+        self.addCleanup(settings_override.disable)
+        self.serve({
+            '/alpha': CHAMBERS_PAGE.format(reporter='Jane Roe, CSR', deputy='Dana Deputy'),
+            '/beta': CHAMBERS_PAGE.format(reporter='Someone Else', deputy='Bo Deputy'),
+        })
+        self.alpha = Judge.objects.create(
+            full_name='Alpha Judge', chambers_url=f'{self.base_url}/alpha', court_reporter_name='Jane Roe',
+        )
+        self.beta = Judge.objects.create(
+            full_name='Beta Judge', chambers_url=f'{self.base_url}/beta', court_reporter_name='Pat Reporter',
+        )
+        self.missing = Judge.objects.create(full_name='Gamma Judge', chambers_url=f'{self.base_url}/gone')
+        self.no_url = Judge.objects.create(full_name='Delta Judge')
+
+    def test_clerk_scraper_bulk_updates_changed_judges(self):
+        out = StringIO()
+        with self.assertNumQueries(2):
+            call_command('scrape_judge_clerks', '--delay', '0', '--retries', '0', stdout=out)
+
+        self.alpha.refresh_from_db()
+        self.assertEqual(
+            (self.alpha.clerk_name, self.alpha.clerk_phone, self.alpha.clerk_room),
+            ('Dana Deputy', '(312) 555-0142', 'Room 2050'),
+        )
+        self.assertEqual(self.alpha.apprentices, 'Alex Clerk\nSam Clerk')
+        self.beta.refresh_from_db()
+        self.assertEqual(self.beta.clerk_name, 'Bo Deputy')
+        self.assertIn('updated 2, unchanged 0, failed 1', out.getvalue())
+        self.assertIn('Skipping Delta Judge', out.getvalue())
+
+    def test_unchanged_pages_are_revalidated_and_skipped(self):
+        call_command('scrape_judge_clerks', '--delay', '0', '--retries', '0', stdout=StringIO())
+
+        out = StringIO()
+        with self.assertNumQueries(1):
+            call_command('scrape_judge_clerks', '--delay', '0', '--retries', '0', stdout=out)
+        self.assertEqual(self.server.not_modified, 2)
+        self.assertIn('2 not modified', out.getvalue())
+        self.assertIn('updated 0, unchanged 2, failed 1', out.getvalue())
+
+        # --force parses again; nothing differs, so there is still no UPDATE.
+        out = StringIO()
+        with self.assertNumQueries(1):
+            call_command('scrape_judge_clerks', '--force', '--delay', '0', '--retries', '0', stdout=out)
+        self.assertIn('updated 0, unchanged 0, failed 1', out.getvalue())
+
+    def test_changed_page_is_parsed_again(self):
+        call_command('scrape_judge_clerks', '--delay', '0', '--retries', '0', stdout=StringIO())
+        self.server.pages['/alpha'] = CHAMBERS_PAGE.format(reporter='Jane Roe, CSR', deputy='New Deputy')
+
+        out = StringIO()
+        call_command('scrape_judge_clerks', '--delay', '0', '--retries', '0', stdout=out)
+
+        self.alpha.refresh_from_db()
+        self.assertEqual(self.alpha.clerk_name, 'New Deputy')
+        self.assertIn('updated 1, unchanged 1, failed 1', out.getvalue())
+
+    def test_each_command_tracks_its_own_processed_pages(self):
+        call_command('scrape_judge_clerks', '--delay', '0', '--retries', '0', stdout=StringIO())
+        call_command('scrape_court_reporter_details', '--delay', '0', '--retries', '0', stdout=StringIO())
+
+        # The reporter scraper revalidated the cached pages but still parsed them once.
+        self.assertEqual(self.server.not_modified, 2)
+        self.alpha.refresh_from_db()
+        self.assertEqual(self.alpha.court_reporter_phone, '(312) 555-0100')
+
+    def test_page_cache_round_trip(self):
+        cache = PageCache()
+        url = f'{self.base_url}/alpha'
+        self.assertEqual(cache.conditional_headers(url), {})
+
+        digest = cache.store(url, '<p>hi</p>', etag='"v1"', last_modified='Mon, 01 Jan 2024 00:00:00 GMT')
+        self.assertEqual(cache.body(url), '<p>hi</p>')
+        self.assertEqual(
+            cache.conditional_headers(url),
+            {'If-None-Match': '"v1"', 'If-Modified-Since': 'Mon, 01 Jan 2024 00:00:00 GMT'},
+        )
+        self.assertFalse(cache.unchanged_for(url, 'clerks', digest))
+        cache.mark_processed(url, 'clerks', digest)
+        self.assertTrue(cache.unchanged_for(url, 'clerks', digest))
+        self.assertFalse(cache.unchanged_for(url, 'reporters', digest))
+        self.assertEqual(cache.store(url, '<p>hi</p>', etag='"v2"'), digest)
+        self.assertTrue(cache.unchanged_for(url, 'clerks', digest))
+
+    def test_reporter_scraper_only_updates_matching_reporters(self):
+        call_command('scrape_court_reporter_details', '--delay', '0', '--retries', '0', stdout=StringIO())
+
+        self.alpha.refresh_from_db()
+        self.assertEqual(
+            (self.alpha.court_reporter_phone, self.alpha.court_reporter_room), ('(312) 555-0100', 'Room 1234'),
+        )
+        self.beta.refresh_from_db()
+        self.assertEqual(self.beta.court_reporter_phone, '')
+
+    def test_dry_run_saves_nothing(self):
+        call_command('scrape_judge_clerks', '--dry-run', '--delay', '0', '--retries', '0', stdout=StringIO())
+
+        self.alpha.refresh_from_db()
+        self.assertEqual(self.alpha.clerk_name, '')
+
+        # Dry runs do not mark pages processed.
+        call_command('scrape_judge_clerks', '--delay', '0', '--retries', '0', stdout=StringIO())
+        self.alpha.refresh_from_db()
+        self.assertEqual(self.alpha.clerk_name, 'Dana Deputy')
@@ -0,0 +1,82 @@
+from __future__ import annotations
+
+from datetime import timedelta
+
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.utils import timezone
+from rest_framework import status
+from rest_framework.authtoken.models import Token
+from rest_framework.test import APITestCase
+
+from court_rules.models import (
+    Case,
+    CaseStatus,
+    Deadline,
+    DeadlineBasis,
+    DeadlineTriggerType,
+    Organization,
+    User,
+    UserRole,
+)
+
+
+class DashboardMetricsTests(APITestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.org = Organization.objects.create(name='Dashboard Firm')
+        cls.user = User.objects.create_user(
+            email='dash@example.com', password='password123',
+            first_name='Dash', last_name='Board', role=UserRole.FIRM_ADMIN, organization=cls.org,
+        )
+        cls.token = Token.objects.create(user=cls.user)
+        now = timezone.now()
+        for index in range(3):
+            case = Case.objects.create(
+                organization=cls.org,
+                internal_case_id=f'DASH-{index}',
+                caption=f'Dashboard v. {index}',
+                status=CaseStatus.OPEN,
+                timezone='America/Chicago',
+            )
+            for due_in in (-2, 3, 20, 45):
+                Deadline.objects.create(
+                    case=case,
+                    trigger_type=DeadlineTriggerType.USER,
+                    basis=DeadlineBasis.CALENDAR_DAYS,
+                    due_at=now + timedelta(days=due_in),
+                    timezone='America/Chicago',
+                )
+
+    def get_metrics(self, **params):
+        return self.client.get(
+            '/api/v1/dashboard/metrics/',
+            params,
+            HTTP_AUTHORIZATION=f'Token {self.token.key}',
+        )
+
+    def test_window_counts(self):
+        response = self.get_metrics()
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(
+            response.data['upcoming_deadlines'],
+            {'next_7_days': 3, 'next_30_days': 6, 'next_60_days': 9},
+        )
+        self.assertEqual(response.data['overdue_deadlines'], 3)
+        self.assertEqual(len(response.data['activity_trend']), 30)
+        self.assertEqual(response.data['cases_by_status'], [{'status': 'open', 'count': 3}])
+
+    def test_query_count_does_not_grow_with_range(self):
+        query_counts = []
+        for range_days in (7, 365):
+            with CaptureQueriesContext(connection) as ctx:
+                response = self.get_metrics(range=range_days)
+            self.assertEqual(response.status_code, status.HTTP_200_OK)
+            self.assertEqual(len(response.data['activity_trend']), range_days)
+            query_counts.append(len(ctx.captured_queries))
+        self.assertEqual(query_counts[0], query_counts[1])
+        self.assertLessEqual(query_counts[0], 15)
+
+    def test_rejects_unsupported_range(self):
+        response = self.get_metrics(range=14)
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
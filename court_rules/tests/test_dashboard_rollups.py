@@ -0,0 +1,108 @@
+from __future__ import annotations
+
+from datetime import timedelta
+from io import StringIO
+
+from django.core.management import call_command
+from django.db.models import Sum
+from django.test import override_settings
+from django.utils import timezone
+from rest_framework import status
+from rest_framework.authtoken.models import Token
+from rest_framework.test import APITestCase
+
+from court_rules.models import (
+    Case,
+    CaseRollup,
+    CaseStatus,
+    Deadline,
+    DeadlineBasis,
+    DeadlineRollup,
+    DeadlineStatus,
+    DeadlineTriggerType,
+    Organization,
+    User,
+    UserRole,
+)
+from court_rules.services.rollups import reconcile_rollups
+
+
+class DashboardRollupTests(APITestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.org = Organization.objects.create(name='Rollup Firm')
+        cls.admin = User.objects.create_user(
+            email='rollup-admin@example.com', password='password123',
+            first_name='Roll', last_name='Up', role=UserRole.FIRM_ADMIN, organization=cls.org,
+        )
+        cls.token = Token.objects.create(user=cls.admin)
+        now = timezone.now()
+        for index in range(2):
+            case = Case.objects.create(
+                organization=cls.org,
+                internal_case_id=f'ROLL-{index}',
+                caption=f'Rollup v. {index}',
+                status=CaseStatus.OPEN,
+                lead_attorney=cls.admin,
+                timezone='America/Chicago',
+            )
+            for due_in in (-2, 3, 20, 45):
+                Deadline.objects.create(
+                    case=case,
+                    trigger_type=DeadlineTriggerType.USER,
+                    basis=DeadlineBasis.CALENDAR_DAYS,
+                    due_at=now + timedelta(days=due_in),
+                    owner=cls.admin,
+                    timezone='America/Chicago',
+                )
+
+    def totals(self):
+        return DeadlineRollup.objects.filter(organization=self.org).aggregate(
+            open=Sum('open_count'), done=Sum('done_count'), created=Sum('created_count'),
+        )
+
+    def test_saves_and_deletes_adjust_rollups(self):
+        self.assertEqual(self.totals(), {'open': 8, 'done': 0, 'created': 8})
+
+        deadline = Deadline.objects.filter(case__organization=self.org).first()
+        deadline.status = DeadlineStatus.DONE
+        deadline.save()
+        self.assertEqual(self.totals(), {'open': 7, 'done': 1, 'created': 8})
+
+        deadline.delete()
+        self.assertEqual(self.totals(), {'open': 7, 'done': 0, 'created': 7})
+
+        case = Case.objects.get(internal_case_id='ROLL-0')
+        case.status = CaseStatus.CLOSED
+        case.save()
+        by_status = dict(
+            CaseRollup.objects.filter(organization=self.org, case_count__gt=0).values_list('status', 'case_count')
+        )
+        self.assertEqual(by_status, {CaseStatus.OPEN: 1, CaseStatus.CLOSED: 1})
+
+    @override_settings(DASHBOARD_ROLLUPS_ENABLED=True)
+    def test_dashboard_reads_rollups(self):
+        response = self.client.get('/api/v1/dashboard/metrics/', HTTP_AUTHORIZATION=f'Token {self.token.key}')
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(
+            response.data['upcoming_deadlines'],
+            {'next_7_days': 2, 'next_30_days': 4, 'next_60_days': 6},
+        )
+        self.assertEqual(response.data['overdue_deadlines'], 2)
+        self.assertEqual(response.data['cases_by_status'], [{'status': 'open', 'count': 2}])
+        self.assertEqual(sum(day['deadlines'] for day in response.data['activity_trend']), 0)
+
+    def test_reconcile_reports_and_repairs_drift(self):
+        DeadlineRollup.objects.all().delete()
+        Deadline.objects.filter(case__organization=self.org).update(status=DeadlineStatus.MISSED)
+
+        drift = reconcile_rollups(dry_run=True)
+        self.assertTrue(drift.has_drift)
+        self.assertFalse(DeadlineRollup.objects.exists())
+
+        call_command('reconcile_dashboard_rollups', stdout=StringIO())
+        self.assertEqual(
+            DeadlineRollup.objects.filter(organization=self.org).aggregate(missed=Sum('missed_count'))['missed'],
+            8,
+        )
+        self.assertFalse(reconcile_rollups().has_drift)
@@ -0,0 +1,152 @@
+from __future__ import annotations
+
+from datetime import date, datetime
+from zoneinfo import ZoneInfo
+
+from rest_framework import status
+from rest_framework.authtoken.models import Token
+from rest_framework.test import APITestCase
+
+from court_rules.models import (
+    AuditAction,
+    AuditLog,
+    Case,
+    CaseStatus,
+    Deadline,
+    DeadlineBasis,
+    DeadlineRollup,
+    DeadlineStatus,
+    DeadlineTriggerType,
+    Holiday,
+    HolidayCalendar,
+    Organization,
+    User,
+    UserRole,
+)
+from court_rules.services.deadline_recompute import affected_deadlines, recompute_deadlines
+
+CHICAGO = ZoneInfo('America/Chicago')
+
+
+class DeadlineRecomputeTests(APITestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.org = Organization.objects.create(name='Recompute Firm')
+        cls.admin = User.objects.create_user(
+            email='recompute-admin@example.com', password='password123',
+            first_name='Recompute', last_name='Admin', role=UserRole.FIRM_ADMIN, organization=cls.org,
+        )
+        cls.calendar = HolidayCalendar.objects.create(name='N.D. Ill.', timezone='America/Chicago')
+        cls.other_calendar = HolidayCalendar.objects.create(name='Other', timezone='America/Chicago')
+        cls.case = Case.objects.create(
+            organization=cls.org,
+            internal_case_id='RECOMP-1',
+            caption='Recompute v. Holidays',
+            status=CaseStatus.OPEN,
+            timezone='America/Chicago',
+        )
+        # Mon 2 Mar 2026 + 5 business days = Mon 9 Mar.
+        cls.business = cls.create_deadline(date(2026, 3, 2), 5, date(2026, 3, 9), DeadlineBasis.BUSINESS_DAYS)
+        # Fri 6 Mar 2026 + 3 calendar days = Mon 9 Mar.
+        cls.calendar_days = cls.create_deadline(date(2026, 3, 6), 3, date(2026, 3, 9), DeadlineBasis.CALENDAR_DAYS)
+        # Window ends before the closure.
+        cls.earlier = cls.create_deadline(date(2026, 2, 2), 5, date(2026, 2, 9), DeadlineBasis.BUSINESS_DAYS)
+        cls.elsewhere = cls.create_deadline(
+            date(2026, 3, 2), 5, date(2026, 3, 9), DeadlineBasis.BUSINESS_DAYS, calendar=cls.other_calendar,
+        )
+        cls.closed = cls.create_deadline(
+            date(2026, 3, 2), 5, date(2026, 3, 9), DeadlineBasis.BUSINESS_DAYS, status=DeadlineStatus.DONE,
+        )
+
+    @classmethod
+    def create_deadline(cls, trigger, offset, due, basis, *, calendar=None, status=DeadlineStatus.OPEN):
+        return Deadline.objects.create(
+            case=cls.case,
+            trigger_type=DeadlineTriggerType.RULE,
+            basis=basis,
+            holiday_calendar=calendar or cls.calendar,
+            trigger_date=trigger,
+            offset_days=offset,
+            due_at=datetime.combine(due, datetime.min.time().replace(hour=17), tzinfo=CHICAGO),
+            timezone='America/Chicago',
+            status=status,
+        )
+
+    def api(self, method, path, data):
+        token, _ = Token.objects.get_or_create(user=self.admin)
+        return getattr(self.client, method)(path, data, format='json', HTTP_AUTHORIZATION=f'Token {token.key}')
+
+    def due_date(self, deadline):
+        deadline.refresh_from_db()
+        return deadline.due_at.astimezone(CHICAGO).date()
+
+    def test_impact_query_is_limited_to_covering_windows(self):
+        affected = set(affected_deadlines(self.calendar.pk, [date(2026, 3, 4)]).values_list('id', flat=True))
+        self.assertEqual(affected, {self.business.pk})
+        affected = set(affected_deadlines(self.calendar.pk, [date(2026, 3, 9)]).values_list('id', flat=True))
+        self.assertEqual(affected, {self.business.pk, self.calendar_days.pk})
+
+    def test_closure_moves_only_affected_deadlines(self):
+        with self.captureOnCommitCallbacks(execute=True):
+            Holiday.objects.create(calendar=self.calendar, date=date(2026, 3, 4), name='Court closed: weather')
+
+        self.assertEqual(self.due_date(self.business), date(2026, 3, 10))
+        self.assertEqual(self.business.due_at.astimezone(CHICAGO).hour, 17)
+        for untouched in (self.calendar_days, self.earlier, self.elsewhere, self.closed):
+            self.assertEqual(self.due_date(untouched), untouched.due_at.astimezone(CHICAGO).date())
+
+        entry = AuditLog.objects.get(entity_id=self.business.pk, action=AuditAction.COMPUTE)
+        self.assertIn('due_at', entry.changes)
+        self.assertEqual(AuditLog.objects.filter(action=AuditAction.COMPUTE).count(), 1)
+
+    def test_roll_forward_and_holiday_removal(self):
+        with self.captureOnCommitCallbacks(execute=True):
+            holiday = Holiday.objects.create(calendar=self.calendar, date=date(2026, 3, 9), name='Closure')
+        self.assertEqual(self.due_date(self.calendar_days), date(2026, 3, 10))
+        self.assertEqual(self.due_date(self.business), date(2026, 3, 10))
+
+        with self.captureOnCommitCallbacks(execute=True):
+            holiday.delete()
+        self.assertEqual(self.due_date(self.calendar_days), date(2026, 3, 9))
+        self.assertEqual(self.due_date(self.business), date(2026, 3, 9))
+
+    def test_bulk_recompute_keeps_rollups_in_step(self):
+        Holiday.objects.create(calendar=self.calendar, date=date(2026, 3, 5), name='Closure')
+        changed = recompute_deadlines(Deadline.objects.filter(pk__in=[self.business.pk, self.earlier.pk]))
+        self.assertEqual([deadline.pk for deadline in changed], [self.business.pk])
+        open_by_day = dict(DeadlineRollup.objects.filter(organization=self.org).values_list('day', 'open_count'))
+        self.assertEqual(open_by_day[date(2026, 3, 9)], 2)
+        self.assertEqual(open_by_day[date(2026, 3, 10)], 1)
+
+    def test_manual_due_date_survives_holiday_change(self):
+        manual = datetime(2026, 3, 12, 17, tzinfo=CHICAGO)
+        response = self.api('patch', f'/api/v1/deadlines/{self.business.pk}/', {'due_at': manual.isoformat()})
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertIsNone(response.data['trigger_date'])
+
+        with self.captureOnCommitCallbacks(execute=True):
+            Holiday.objects.create(calendar=self.calendar, date=date(2026, 3, 4), name='Court closed: weather')
+
+        self.assertEqual(self.due_date(self.business), date(2026, 3, 12))
+
+    def test_due_at_sent_with_inputs_must_match_the_computation(self):
+        payload = {
+            'case': str(self.case.pk),
+            'trigger_type': DeadlineTriggerType.RULE,
+            'basis': DeadlineBasis.BUSINESS_DAYS,
+            'holiday_calendar': str(self.calendar.pk),
+            # Mon 4 Mar 2030 + 5 business days = Mon 11 Mar.
+            'trigger_date': '2030-03-04',
+            'offset_days': 5,
+            'due_at': datetime(2030, 3, 13, 17, tzinfo=CHICAGO).isoformat(),
+            'timezone': 'America/Chicago',
+        }
+        response = self.api('post', '/api/v1/deadlines/', payload)
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertIn('2030-03-11', str(response.data['due_at']))
+
+        payload['due_at'] = datetime(2030, 3, 11, 17, tzinfo=CHICAGO).isoformat()
+        self.assertEqual(self.api('post', '/api/v1/deadlines/', payload).status_code, status.HTTP_201_CREATED)
+
+        response = self.api('patch', f'/api/v1/deadlines/{self.business.pk}/', {'offset_days': 6})
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
@@ -0,0 +1,132 @@
+from __future__ import annotations
+
+import threading
+from io import StringIO
+from unittest import mock
+
+from django.core import mail
+from django.core.management import call_command
+from django.db import connection, transaction
+from django.test import TestCase, TransactionTestCase, override_settings
+from django.utils import timezone
+from rest_framework import status
+from rest_framework.authtoken.models import Token
+from rest_framework.test import APITestCase
+
+from court_rules.models import NotificationLog, NotificationStatus, Organization, OutboundEmail, User, UserRole
+from court_rules.services.outbox import claim_outbox, send_outbox_batch
+from court_rules.utils.email import send_password_reset_email, send_welcome_email
+
+
+class EmailOutboxTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.org = Organization.objects.create(name='Outbox Firm')
+        cls.user = User.objects.create_user(
+            email='outbox-user@example.com', password='password123',
+            first_name='Out', last_name='Box', role=UserRole.LAWYER, organization=cls.org,
+        )
+
+    def test_senders_enqueue_instead_of_sending(self):
+        send_welcome_email(self.user, None)
+        send_password_reset_email(self.user, 'https://app.example.com/reset?token=x')
+        self.assertEqual(len(mail.outbox), 0)
+        self.assertEqual(OutboundEmail.objects.filter(status=NotificationStatus.QUEUED).count(), 2)
+
+    def test_batch_uses_one_connection_and_logs_delivery(self):
+        send_welcome_email(self.user, None)
+        send_password_reset_email(self.user, 'https://app.example.com/reset?token=x')
+
+        with mock.patch('court_rules.services.outbox.get_connection', wraps=mail.get_connection) as get_connection:
+            result = send_outbox_batch()
+        self.assertEqual(get_connection.call_count, 1)
+        self.assertEqual(result, {'claimed': 2, 'sent': 2, 'failed': 0})
+
+        self.assertEqual(len(mail.outbox), 2)
+        welcome = next(message for message in mail.outbox if 'Welcome' in message.subject)
+        self.assertIn('Out', welcome.body)
+        self.assertIn('Outbox Firm', welcome.alternatives[0][0])
+        self.assertEqual(
+            list(NotificationLog.objects.filter(user=self.user).values_list('status', flat=True)),
+            [NotificationStatus.SENT, NotificationStatus.SENT],
+        )
+        self.assertEqual(send_outbox_batch()['claimed'], 0)
+
+    @override_settings(EMAIL_OUTBOX_MAX_ATTEMPTS=2)
+    def test_failures_back_off_then_fail(self):
+        send_welcome_email(self.user, None)
+        email = OutboundEmail.objects.get()
+        with mock.patch('django.core.mail.EmailMessage.send', side_effect=OSError('relay refused')):
+            send_outbox_batch()
+            email.refresh_from_db()
+            self.assertEqual(email.status, NotificationStatus.QUEUED)
+            self.assertGreater(email.available_at, timezone.now())
+
+            OutboundEmail.objects.update(available_at=timezone.now())
+            self.assertEqual(send_outbox_batch()['failed'], 1)
+        email.refresh_from_db()
+        self.assertEqual(email.status, NotificationStatus.FAILED)
+        self.assertEqual(email.last_error, 'relay refused')
+        self.assertEqual(NotificationLog.objects.get().status, NotificationStatus.FAILED)
+
+    def test_command_once(self):
+        send_welcome_email(self.user, None)
+        out = StringIO()
+        call_command('send_outbox', once=True, stdout=out)
+        self.assertIn('sent: 1', out.getvalue())
+
+
+class OutboxLeaseTests(TransactionTestCase):
+    def test_sending_runs_after_the_claim_commits(self):
+        email = OutboundEmail.objects.create(to=['lease@example.com'], subject='Lease', body='Hello')
+        seen = {}
+
+        def other_worker():
+            try:
+                with transaction.atomic():
+                    # No row lock is held over SMTP, and the lease keeps others off it.
+                    OutboundEmail.objects.select_for_update(nowait=True).get(pk=email.pk)
+                    seen['claimed'] = claim_outbox(now=timezone.now())
+            finally:
+                connection.close()
+
+        def send(message):
+            worker = threading.Thread(target=other_worker)
+            worker.start()
+            worker.join()
+            return 1
+
+        with mock.patch('django.core.mail.EmailMessage.send', autospec=True, side_effect=send):
+            self.assertEqual(send_outbox_batch()['sent'], 1)
+
+        self.assertEqual(seen['claimed'], [])
+        email.refresh_from_db()
+        self.assertEqual(email.status, NotificationStatus.SENT)
+
+
+class GrantNotificationTests(APITestCase):
+    def test_grant_creation_queues_notification(self):
+        org = Organization.objects.create(name='Grant Outbox Firm')
+        admin = User.objects.create_user(
+            email='grant-admin@example.com', password='password123',
+            first_name='Grant', last_name='Admin', role=UserRole.FIRM_ADMIN, organization=org,
+        )
+        paralegal = User.objects.create_user(
+            email='grant-paralegal@example.com', password='password123',
+            first_name='Para', last_name='Legal', role=UserRole.PARALEGAL, organization=org,
+        )
+        colleague = User.objects.create_user(
+            email='grant-colleague@example.com', password='password123',
+            first_name='Col', last_name='League', role=UserRole.PARALEGAL, organization=org,
+        )
+        token = Token.objects.create(user=admin)
+        response = self.client.post(
+            '/api/v1/admin/access-grants/',
+            {'granted_to': str(paralegal.pk), 'can_access_user': str(colleague.pk)},
+            format='json',
+            HTTP_AUTHORIZATION=f'Token {token.key}',
+        )
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED, response.data)
+        email = OutboundEmail.objects.get(user=paralegal)
+        self.assertEqual(email.context['target_user']['full_name'], colleague.full_name)
+        self.assertEqual(len(mail.outbox), 0)
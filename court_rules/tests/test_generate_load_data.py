@@ -0,0 +1,75 @@
+from __future__ import annotations
+
+from datetime import date
+from io import StringIO
+
+from django.core.management import call_command
+from django.core.management.base import CommandError
+from django.db import transaction
+from django.test import TestCase
+
+from court_rules.models import (
+    AuditLog,
+    Case,
+    CaseAccess,
+    Deadline,
+    DeadlineReminder,
+    DeadlineRollup,
+    Organization,
+    Subscription,
+    User,
+    UserRole,
+)
+from court_rules.services.load_data import generate_load_data
+
+ANCHOR = date(2026, 3, 2)
+
+
+class GenerateLoadDataTests(TestCase):
+    def generate(self, **kwargs):
+        options = dict(orgs=2, cases_per_org=4, deadlines_per_case=5, users_per_org=6, seed=11, anchor=ANCHOR, batch_size=7)
+        options.update(kwargs)
+        return generate_load_data(**options)
+
+    def test_generates_the_requested_volume_with_derived_tables(self):
+        result = self.generate()
+
+        self.assertEqual(Organization.objects.count(), 2)
+        self.assertEqual(Case.objects.count(), 8)
+        self.assertEqual(Deadline.objects.count(), 40)
+        self.assertEqual(result.counts['deadlines'], 40)
+        self.assertEqual(result.counts['deadline_reminders'], DeadlineReminder.objects.count())
+        self.assertEqual(AuditLog.objects.filter(entity_table='deadlines', action='create').count(), 40)
+        self.assertEqual(
+            User.objects.filter(role=UserRole.FIRM_ADMIN, email__startswith='load11.').count(), 2,
+        )
+        for subscription in Subscription.objects.all():
+            self.assertEqual(
+                subscription.active_user_count,
+                subscription.organization.users.filter(is_active=True).count(),
+            )
+        self.assertEqual(CaseAccess.objects.count(), result.case_access_rows)
+        self.assertTrue(CaseAccess.objects.exists())
+        self.assertTrue(DeadlineRollup.objects.exists())
+        self.assertTrue(User.objects.filter(email__startswith='load11.').first().check_password('load-test-password'))
+
+    def test_same_seed_produces_the_same_rows(self):
+        with transaction.atomic():
+            self.generate()
+            first = list(Deadline.objects.order_by('id').values_list('id', 'due_at', 'status', 'owner_id'))
+            transaction.set_rollback(True)
+        self.assertFalse(Deadline.objects.exists())
+
+        self.generate()
+
+        self.assertEqual(list(Deadline.objects.order_by('id').values_list('id', 'due_at', 'status', 'owner_id')), first)
+
+    def test_command_refuses_to_reload_a_seed(self):
+        out = StringIO()
+        call_command('generate_load_data', '--orgs', '1', '--cases-per-org', '2', '--deadlines-per-case', '3',
+                     '--seed', '5', '--anchor', '2026-03-02', stdout=out)
+        self.assertIn('deadlines: 6', out.getvalue())
+
+        with self.assertRaises(CommandError):
+            call_command('generate_load_data', '--orgs', '1', '--cases-per-org', '1', '--deadlines-per-case', '1',
+                         '--seed', '5', stdout=StringIO())
@@ -0,0 +1,124 @@
+from __future__ import annotations
+
+import base64
+import json
+from datetime import date, timedelta
+from unittest import mock
+
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.utils import timezone
+from rest_framework import status
+from rest_framework.authtoken.models import Token
+from rest_framework.test import APITestCase
+
+from court_rules.api.v1.pagination import KeysetPagination
+from court_rules.models import (
+    Case,
+    CaseStatus,
+    Deadline,
+    DeadlineBasis,
+    DeadlineTriggerType,
+    Organization,
+    User,
+    UserRole,
+)
+
+
+class KeysetPaginationTests(APITestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.org = Organization.objects.create(name='Keyset Firm')
+        cls.admin = User.objects.create_user(
+            email='keyset@example.com', password='password123',
+            first_name='Key', last_name='Set', role=UserRole.FIRM_ADMIN, organization=cls.org,
+        )
+        cls.token = Token.objects.create(user=cls.admin)
+        filing_dates = [date(2024, 1, 1), date(2024, 1, 1), None, date(2023, 6, 1), None, date(2025, 2, 2), date(2024, 1, 1)]
+        cls.cases = [
+            Case.objects.create(
+                organization=cls.org,
+                internal_case_id=f'KEY-{index}',
+                caption=f'Keyset v. {index % 3}',
+                filing_date=filing_date,
+                status=CaseStatus.OPEN,
+                timezone='America/Chicago',
+            )
+            for index, filing_date in enumerate(filing_dates)
+        ]
+        due_at = timezone.now() + timedelta(days=5)
+        for index in range(7):
+            Deadline.objects.create(
+                case=cls.cases[0],
+                trigger_type=DeadlineTriggerType.USER,
+                basis=DeadlineBasis.CALENDAR_DAYS,
+                # Pairs of deadlines share a due time so the id tie-breaker is exercised.
+                due_at=due_at + timedelta(hours=index // 2),
+                timezone='America/Chicago',
+            )
+
+    def get(self, url):
+        response = self.client.get(url, HTTP_AUTHORIZATION=f'Token {self.token.key}')
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        return response.data
+
+    def walk(self, url):
+        pages = []
+        while url:
+            data = self.get(url)
+            pages.append(data)
+            url = data['next']
+        return pages
+
+    @mock.patch.object(KeysetPagination, 'page_size', 3)
+    def test_walks_cases_forward_and_back(self):
+        pages = self.walk('/api/v1/cases/')
+        walked = [row['id'] for page in pages for row in page['results']]
+        expected = [
+            str(case.id)
+            for case in Case.objects.raw('SELECT * FROM cases ORDER BY filing_date DESC, caption, id')
+        ]
+        self.assertEqual(walked, expected)
+        self.assertIsNone(pages[0]['previous'])
+        self.assertNotIn('count', pages[0])
+
+        back = self.get(pages[-1]['previous'])
+        self.assertEqual(back['results'], pages[-2]['results'])
+
+    @mock.patch.object(KeysetPagination, 'page_size', 2)
+    def test_deadline_ties_are_not_skipped(self):
+        pages = self.walk('/api/v1/deadlines/')
+        walked = [row['id'] for page in pages for row in page['results']]
+        expected = [str(pk) for pk in Deadline.objects.order_by('due_at', 'id').values_list('id', flat=True)]
+        self.assertEqual(walked, expected)
+
+    @mock.patch.object(KeysetPagination, 'page_size', 2)
+    def test_deep_page_costs_the_same_as_first(self):
+        with CaptureQueriesContext(connection) as first:
+            data = self.get('/api/v1/deadlines/')
+        url = data['next']
+        while True:
+            with CaptureQueriesContext(connection) as deep:
+                data = self.get(url)
+            if not data['next']:
+                break
+            url = data['next']
+        self.assertEqual(len(first.captured_queries), len(deep.captured_queries))
+        self.assertFalse(any(query['sql'].upper().startswith('SELECT COUNT(') for query in deep.captured_queries))
+
+    def test_approximate_count_is_opt_in(self):
+        data = self.get('/api/v1/deadlines/?approximate_count=true')
+        self.assertIsInstance(data['approximate_count'], int)
+
+    def test_invalid_cursor_is_not_found(self):
+        response = self.client.get('/api/v1/deadlines/?cursor=garbage', HTTP_AUTHORIZATION=f'Token {self.token.key}')
+        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
+
+    def test_tampered_cursor_with_bad_values_is_not_found(self):
+        due_at = timezone.now().isoformat()
+        for position in (['not-a-date', 'not-a-uuid'], [due_at, 'not-a-uuid']):
+            token = base64.urlsafe_b64encode(json.dumps({'p': position, 'r': 0}).encode()).decode()
+            response = self.client.get(
+                f'/api/v1/deadlines/?cursor={token}', HTTP_AUTHORIZATION=f'Token {self.token.key}',
+            )
+            self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND, position)
@@ -0,0 +1,123 @@
+from __future__ import annotations
+
+import os
+import subprocess
+import sys
+import tempfile
+import textwrap
+
+from django.conf import settings
+from django.test import SimpleTestCase, override_settings
+from prometheus_client import REGISTRY, CollectorRegistry
+from prometheus_client.multiprocess import MultiProcessCollector
+from rest_framework.authtoken.models import Token
+from rest_framework.test import APITestCase
+
+from court_rules.models import Organization, User, UserRole
+from court_rules.services.billing import billing_dashboard_snapshot
+from court_rules.services.metrics import client_allowed
+from court_rules.services.outbox import enqueue_email
+
+WORKER_SCRIPT = textwrap.dedent('''
+    import django
+    django.setup()
+    from court_rules.services.metrics import observe_request
+    observe_request(route='user-list', action='list', method='GET', status=200, seconds=0.03, queries=4)
+''')
+
+
+def sample(name, **labels):
+    return REGISTRY.get_sample_value(name, labels) or 0
+
+
+class MetricsEndpointTests(APITestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.org = Organization.objects.create(name='Metrics Firm')
+        cls.admin = User.objects.create_user(
+            email='metrics-admin@example.com', password='password123',
+            first_name='Metrics', last_name='Admin', role=UserRole.FIRM_ADMIN, organization=cls.org,
+        )
+        cls.token = Token.objects.create(user=cls.admin)
+
+    def test_requests_are_recorded_per_route_and_action(self):
+        labels = {'route': 'user-list', 'action': 'list', 'method': 'GET'}
+        before = sample('qgavel_http_request_duration_seconds_count', **labels)
+        queries_before = sample('qgavel_http_request_db_queries_sum', route='user-list', action='list')
+
+        response = self.client.get('/api/v1/users/', HTTP_AUTHORIZATION=f'Token {self.token.key}')
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(sample('qgavel_http_request_duration_seconds_count', **labels), before + 1)
+        self.assertGreater(sample('qgavel_http_request_db_queries_sum', route='user-list', action='list'), queries_before)
+        self.assertGreaterEqual(sample('qgavel_http_responses_total', route='user-list', method='GET', status='2xx'), 1)
+
+    def test_exposition_includes_backlog_gauges(self):
+        enqueue_email(to=['someone@example.com'], subject='Queued', body='Hello')
+        self.client.get('/health/')
+
+        response = self.client.get('/metrics')
+
+        self.assertEqual(response.status_code, 200)
+        self.assertTrue(response['Content-Type'].startswith('text/plain; version=0.0.4'))
+        body = response.content.decode()
+        self.assertIn('qgavel_http_request_duration_seconds_count{action="",method="GET",route="health_check"}', body)
+        self.assertIn('qgavel_reminders_due 0.0', body)
+        self.assertIn('qgavel_outbox_queued 1.0', body)
+        self.assertIn('qgavel_outbox_due 1.0', body)
+
+    def test_only_allowed_networks_can_scrape(self):
+        self.assertEqual(self.client.get('/metrics', REMOTE_ADDR='203.0.113.9').status_code, 404)
+        with override_settings(METRICS_ALLOWED_NETWORKS=['203.0.113.0/24']):
+            self.assertEqual(self.client.get('/metrics', REMOTE_ADDR='203.0.113.9').status_code, 200)
+
+    def test_proxied_requests_are_refused_even_from_loopback(self):
+        # A reverse proxy on the same host connects from 127.0.0.1 on behalf of outside clients.
+        for header in ('HTTP_X_FORWARDED_FOR', 'HTTP_X_REAL_IP', 'HTTP_FORWARDED'):
+            response = self.client.get('/metrics', REMOTE_ADDR='127.0.0.1', **{header: '203.0.113.9'})
+            self.assertEqual(response.status_code, 404, header)
+        self.assertEqual(self.client.get('/metrics', REMOTE_ADDR='127.0.0.1').status_code, 200)
+
+    @override_settings(ALLOWED_HOSTS=['app.example.com', 'backend', 'localhost', '127.0.0.1'])
+    def test_collector_can_scrape_by_internal_host_name(self):
+        self.assertEqual(self.client.get('/metrics', HTTP_HOST='backend:8000').status_code, 200)
+        self.assertEqual(self.client.get('/metrics', HTTP_HOST='127.0.0.1:8000').status_code, 200)
+        self.assertEqual(self.client.get('/metrics', HTTP_HOST='metrics.internal:8000').status_code, 400)
+
+    @override_settings(BILLING_DASHBOARD_CACHE_TIMEOUT=60)
+    def test_billing_dashboard_cache_lookups_are_counted(self):
+        hits = sample('qgavel_cache_lookups_total', cache='billing_dashboard', result='hit')
+        misses = sample('qgavel_cache_lookups_total', cache='billing_dashboard', result='miss')
+
+        billing_dashboard_snapshot(self.org.pk)
+        billing_dashboard_snapshot(self.org.pk)
+
+        self.assertEqual(sample('qgavel_cache_lookups_total', cache='billing_dashboard', result='miss'), misses + 1)
+        self.assertEqual(sample('qgavel_cache_lookups_total', cache='billing_dashboard', result='hit'), hits + 1)
+
+
+class MultiprocessMetricsTests(SimpleTestCase):
+    def test_samples_from_several_worker_processes_are_merged(self):
+        with tempfile.TemporaryDirectory() as directory:
+            env = {**os.environ, 'PROMETHEUS_MULTIPROC_DIR': directory, 'DJANGO_SETTINGS_MODULE': settings.SETTINGS_MODULE}
+            for _ in range(2):
+                subprocess.run([sys.executable, '-c', WORKER_SCRIPT], env=env, check=True, cwd=settings.BASE_DIR)
+
+            registry = CollectorRegistry()
+            MultiProcessCollector(registry, path=directory)
+            labels = {'route': 'user-list', 'action': 'list', 'method': 'GET'}
+
+            self.assertEqual(registry.get_sample_value('qgavel_http_request_duration_seconds_count', labels), 2)
+            self.assertEqual(
+                registry.get_sample_value('qgavel_http_request_duration_seconds_bucket', {**labels, 'le': '0.05'}), 2,
+            )
+            self.assertEqual(
+                registry.get_sample_value('qgavel_http_request_db_queries_sum', {'route': 'user-list', 'action': 'list'}),
+                8,
+            )
+
+    def test_client_allowed(self):
+        self.assertTrue(client_allowed('127.0.0.1', ['127.0.0.0/8']))
+        self.assertTrue(client_allowed('::1', ['127.0.0.0/8', '::1/128']))
+        self.assertFalse(client_allowed('10.0.0.1', ['127.0.0.0/8']))
+        self.assertFalse(client_allowed('', ['127.0.0.0/8']))
@@ -0,0 +1,120 @@
+from __future__ import annotations
+
+import tempfile
+import time
+from collections import Counter
+from io import StringIO
+from pathlib import Path
+from unittest import mock
+
+from django.core.management import call_command
+from django.test import SimpleTestCase, override_settings
+from rest_framework.authtoken.models import Token
+from rest_framework.test import APITestCase
+
+from court_rules.models import Organization, User, UserRole
+from court_rules.services.profiling import StackSampler, hottest_functions, read_profiles, write_profile
+
+
+def busy_leaf(seconds):
+    deadline = time.perf_counter() + seconds
+    while time.perf_counter() < deadline:
+        pass
+
+
+def busy_caller(seconds):
+    busy_leaf(seconds)
+
+
+class ProfilingTests(SimpleTestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmp.cleanup)
+        self.directory = Path(self.tmp.name)
+
+    def test_sampler_records_stacks_below_the_caller(self):
+        with StackSampler(interval=0.001) as sampler:
+            busy_caller(0.05)
+
+        self.assertGreater(sampler.samples, 5)
+        stack, _ = sampler.stacks.most_common(1)[0]
+        frames = stack.split(';')
+        self.assertRegex(frames[0], r'^busy_caller \(.*test_profiling\.py:\d+\)$')
+        self.assertTrue(frames[-1].startswith('busy_leaf '))
+        self.assertFalse(any('test_sampler_records' in frame for frame in frames))
+
+    def test_profiles_from_several_workers_are_merged_per_route(self):
+        write_profile('api:v1:user-list', Counter({'view;serialize': 3, 'view': 1}), directory=self.directory)
+        write_profile('api:v1:user-list', Counter({'view;serialize': 2}), directory=self.directory)
+        write_profile('api:v1:deadline-list', Counter({'view;query;query': 4}), directory=self.directory)
+        self.assertIsNone(write_profile('empty', Counter(), directory=self.directory))
+
+        profiles = read_profiles(directory=self.directory)
+
+        self.assertEqual((profiles.files, profiles.samples), (3, 10))
+        self.assertEqual(profiles.route_requests, Counter({'api_v1_user-list': 2, 'api_v1_deadline-list': 1}))
+        self.assertEqual(profiles.stacks['api_v1_user-list;view;serialize'], 5)
+        own, inclusive = hottest_functions(profiles.stacks)
+        self.assertEqual(own, Counter({'serialize': 5, 'query': 4, 'view': 1}))
+        # Recursive frames count once per stack.
+        self.assertEqual(inclusive, Counter({'view': 10, 'serialize': 5, 'query': 4}))
+        self.assertEqual(read_profiles(directory=self.directory, route='api:v1:deadline-list').samples, 4)
+
+    def test_profile_report_command(self):
+        write_profile('api:v1:user-list', Counter({'view;serialize': 3, 'view': 1}), directory=self.directory)
+        merged = self.directory / 'merged.folded'
+
+        out = StringIO()
+        call_command('profile_report', '--dir', str(self.directory), '--since', '1h',
+                     '--collapsed', str(merged), stdout=out)
+
+        output = out.getvalue()
+        self.assertIn('1 profiled request(s), 1 route(s), 4 sample(s) from 1 worker(s)', output)
+        self.assertIn('3   75.0%  serialize', output)
+        self.assertEqual(merged.read_text().splitlines(), ['api_v1_user-list;view;serialize 3', 'api_v1_user-list;view 1'])
+
+
+class SamplingProfilerMiddlewareTests(APITestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.org = Organization.objects.create(name='Profile Firm')
+        cls.staff = User.objects.create_user(
+            email='profile-staff@example.com', password='password123',
+            first_name='Profile', last_name='Staff', role=UserRole.SUPER_ADMIN,
+        )
+        cls.lawyer = User.objects.create_user(
+            email='profile-lawyer@example.com', password='password123',
+            first_name='Profile', last_name='Lawyer', role=UserRole.LAWYER, organization=cls.org,
+        )
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmp.cleanup)
+        self.directory = Path(self.tmp.name)
+
+    def get(self, user, **headers):
+        token = Token.objects.get_or_create(user=user)[0]
+        with override_settings(PROFILER_SAMPLE_RATE=0, PROFILER_INTERVAL_MS=0.2, PROFILER_DIR=self.directory):
+            return self.client.get('/api/v1/users/', HTTP_AUTHORIZATION=f'Token {token.key}', **headers)
+
+    def test_header_profiles_requests_from_staff_only(self):
+        self.assertEqual(self.get(self.lawyer, HTTP_X_PROFILE='1').status_code, 200)
+        self.assertEqual(self.get(self.staff).status_code, 200)
+        self.assertEqual(list(self.directory.iterdir()), [])
+
+        self.assertEqual(self.get(self.staff, HTTP_X_PROFILE='1').status_code, 200)
+
+        [route_dir] = self.directory.iterdir()
+        self.assertEqual(route_dir.name, 'user-list')
+        [profile] = route_dir.glob('*.folded')
+        self.assertRegex(profile.read_text().splitlines()[0], r'^\S.*;.* \d+$')
+
+    def test_header_from_anonymous_or_non_staff_starts_no_sampler(self):
+        with mock.patch('court_rules.middleware.StackSampler') as sampler, \
+                override_settings(PROFILER_SAMPLE_RATE=0, PROFILER_DIR=self.directory):
+            self.assertEqual(self.client.get('/api/v1/users/', HTTP_X_PROFILE='1').status_code, 401)
+            self.assertEqual(self.client.get('/health/', HTTP_X_PROFILE='1').status_code, 200)
+            self.get(self.lawyer, HTTP_X_PROFILE='1')
+
+        sampler.assert_not_called()
+        self.assertEqual(list(self.directory.iterdir()), [])
@@ -0,0 +1,207 @@
+from __future__ import annotations
+
+import threading
+from datetime import timedelta
+from io import StringIO
+from unittest import mock
+
+from django.core import mail
+from django.core.mail.backends.locmem import EmailBackend
+from django.core.management import call_command
+from django.db import connection, transaction
+from django.test import TestCase, TransactionTestCase, override_settings
+from django.utils import timezone
+
+from court_rules.models import (
+    Case,
+    CaseStatus,
+    Deadline,
+    DeadlineReminder,
+    DeadlineTriggerType,
+    NotificationLog,
+    NotificationStatus,
+    Organization,
+    ReminderChannel,
+    User,
+    UserRole,
+)
+from court_rules.services import reminders as reminder_service
+from court_rules.services.reminders import DispatchStats, claim_due_reminders, dispatch_due_reminders
+
+
+def create_deadline(suffix):
+    org = Organization.objects.create(name=f'Reminder Firm {suffix}')
+    owner = User.objects.create_user(
+        email=f'reminder-owner-{suffix}@example.com', password='password123',
+        first_name='Rem', last_name='Inder', role=UserRole.LAWYER, organization=org,
+    )
+    case = Case.objects.create(
+        organization=org,
+        internal_case_id=f'REM-{suffix}',
+        caption=f'Reminder v. {suffix}',
+        status=CaseStatus.OPEN,
+        timezone='America/Chicago',
+    )
+    return Deadline.objects.create(
+        case=case,
+        trigger_type=DeadlineTriggerType.USER,
+        due_at=timezone.now() + timedelta(days=3),
+        owner=owner,
+        timezone='America/Chicago',
+    )
+
+
+class ReminderDispatchTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.deadline = create_deadline('dispatch')
+        past = timezone.now() - timedelta(minutes=5)
+        cls.email, cls.in_app, cls.sms = (
+            DeadlineReminder.objects.create(deadline=cls.deadline, notify_at=past, channel=channel)
+            for channel in (ReminderChannel.EMAIL, ReminderChannel.IN_APP, ReminderChannel.SMS)
+        )
+        cls.future = DeadlineReminder.objects.create(
+            deadline=cls.deadline, notify_at=timezone.now() + timedelta(days=1), channel=ReminderChannel.EMAIL,
+        )
+
+    def test_delivers_due_reminders_per_channel(self):
+        stats = DispatchStats()
+        self.assertEqual(dispatch_due_reminders(stats=stats), 3)
+        self.assertEqual(dispatch_due_reminders(stats=stats), 0)
+
+        self.assertEqual(len(mail.outbox), 1)
+        self.assertEqual(mail.outbox[0].to, [self.deadline.owner.email])
+        self.assertIn('Reminder v. dispatch', mail.outbox[0].subject)
+
+        statuses = dict(NotificationLog.objects.values_list('channel', 'status'))
+        self.assertEqual(statuses, {
+            'email': NotificationStatus.SENT,
+            'in_app': NotificationStatus.SENT,
+            'sms': NotificationStatus.FAILED,
+        })
+        self.assertEqual(set(DeadlineReminder.objects.filter(sent=True).values_list('id', flat=True)),
+                         {self.email.pk, self.in_app.pk})
+        self.assertFalse(DeadlineReminder.objects.get(pk=self.future.pk).sent)
+
+        # The undeliverable SMS reminder waits out a backoff instead of being dropped.
+        sms = DeadlineReminder.objects.get(pk=self.sms.pk)
+        self.assertEqual((sms.sent, sms.attempts), (False, 1))
+        self.assertIn('No sms provider', sms.last_error)
+        self.assertGreater(sms.next_attempt_at, timezone.now())
+
+        self.assertEqual(stats.claimed, 3)
+        self.assertEqual(stats.failed, 1)
+        self.assertGreaterEqual(stats.max_lag, timedelta(minutes=5))
+
+    def test_smtp_outage_leaves_email_reminders_unsent(self):
+        with mock.patch.object(EmailBackend, 'open', side_effect=ConnectionRefusedError('smtp down')):
+            self.assertEqual(dispatch_due_reminders(), 3)
+
+        self.assertEqual(mail.outbox, [])
+        email = DeadlineReminder.objects.get(pk=self.email.pk)
+        self.assertEqual((email.sent, email.sent_at, email.attempts, email.last_error), (False, None, 1, 'smtp down'))
+        self.assertEqual(
+            NotificationLog.objects.get(channel='email').status, NotificationStatus.FAILED,
+        )
+        backlog = reminder_service.reminder_backlog()
+        self.assertEqual(backlog['pending'], 2)
+        self.assertGreaterEqual(backlog['lag'], timedelta(minutes=5))
+
+        # Once the backoff has passed and SMTP is back, the reminder goes out.
+        DeadlineReminder.objects.filter(pk=self.email.pk).update(next_attempt_at=timezone.now())
+        dispatch_due_reminders()
+        email.refresh_from_db()
+        self.assertTrue(email.sent)
+        self.assertIsNotNone(email.sent_at)
+        self.assertEqual(len(mail.outbox), 1)
+
+    @override_settings(REMINDER_MAX_ATTEMPTS=2)
+    def test_gives_up_after_max_attempts(self):
+        stats = DispatchStats()
+        for _ in range(2):
+            DeadlineReminder.objects.filter(pk=self.sms.pk).update(next_attempt_at=None)
+            dispatch_due_reminders(stats=stats)
+
+        sms = DeadlineReminder.objects.get(pk=self.sms.pk)
+        self.assertEqual((sms.sent, sms.sent_at, sms.attempts, sms.next_attempt_at), (True, None, 2, None))
+        self.assertEqual(stats.abandoned, 1)
+        self.assertEqual(NotificationLog.objects.filter(channel='sms').count(), 2)
+
+    def test_recipient_without_email_is_done(self):
+        User.objects.filter(pk=self.deadline.owner_id).update(email='')
+
+        dispatch_due_reminders()
+
+        self.assertTrue(DeadlineReminder.objects.get(pk=self.email.pk).sent)
+        self.assertEqual(mail.outbox, [])
+
+    def test_command_once(self):
+        out = StringIO()
+        call_command('dispatch_reminders', once=True, stdout=out)
+        self.assertIn('Dispatched: 3 in 1 batches', out.getvalue())
+        self.assertIn('failed: 1 (0 given up)', out.getvalue())
+        self.assertIn('backlog: 1 due', out.getvalue())
+
+
+class ReminderClaimConcurrencyTests(TransactionTestCase):
+    def test_locked_rows_are_skipped(self):
+        deadline = create_deadline('concurrency')
+        past = timezone.now() - timedelta(minutes=1)
+        for _ in range(4):
+            DeadlineReminder.objects.create(deadline=deadline, notify_at=past, channel=ReminderChannel.IN_APP)
+
+        claimed_by_other = []
+        locked, release = threading.Event(), threading.Event()
+
+        def other_worker():
+            try:
+                with transaction.atomic():
+                    claimed_by_other.extend(claim_due_reminders(now=timezone.now(), batch_size=3))
+                    locked.set()
+                    release.wait(10)
+            finally:
+                connection.close()
+
+        worker = threading.Thread(target=other_worker)
+        worker.start()
+        try:
+            self.assertTrue(locked.wait(10))
+            with transaction.atomic():
+                mine = claim_due_reminders(now=timezone.now(), batch_size=10)
+        finally:
+            release.set()
+            worker.join()
+
+        self.assertEqual(len(claimed_by_other), 3)
+        self.assertEqual(len(mine), 1)
+        self.assertNotIn(mine[0].pk, {reminder.pk for reminder in claimed_by_other})
+
+    def test_delivery_runs_after_the_claim_commits(self):
+        deadline = create_deadline('lease')
+        reminder = DeadlineReminder.objects.create(
+            deadline=deadline, notify_at=timezone.now() - timedelta(minutes=1), channel=ReminderChannel.IN_APP,
+        )
+        seen = {}
+
+        def other_worker():
+            try:
+                with transaction.atomic():
+                    # No row lock is held during delivery, and the lease keeps others off it.
+                    DeadlineReminder.objects.select_for_update(nowait=True).get(pk=reminder.pk)
+                    seen['claimed'] = claim_due_reminders(now=timezone.now())
+            finally:
+                connection.close()
+
+        def deliver(reminders, now):
+            worker = threading.Thread(target=other_worker)
+            worker.start()
+            worker.join()
+            return reminder_service.deliver_in_app(reminders, now)
+
+        with mock.patch.dict(reminder_service.CHANNEL_SENDERS, {ReminderChannel.IN_APP: deliver}):
+            self.assertEqual(dispatch_due_reminders(), 1)
+
+        self.assertEqual(seen['claimed'], [])
+        reminder.refresh_from_db()
+        self.assertTrue(reminder.sent)
+        self.assertIsNone(reminder.next_attempt_at)
@@ -0,0 +1,109 @@
+from __future__ import annotations
+
+from datetime import date
+from decimal import Decimal
+from io import StringIO
+
+from django.core.management import call_command
+from rest_framework import status
+from rest_framework.authtoken.models import Token
+from rest_framework.test import APITestCase
+
+from court_rules.models import Organization, Subscription, User, UserRole
+
+
+class SeatCounterTests(APITestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.org = Organization.objects.create(name='Seat Firm')
+        cls.other_org = Organization.objects.create(name='Other Seat Firm')
+        cls.admin = User.objects.create_user(
+            email='seat-admin@example.com', password='password123',
+            first_name='Seat', last_name='Admin', role=UserRole.FIRM_ADMIN, organization=cls.org,
+        )
+        cls.token = Token.objects.create(user=cls.admin)
+        cls.subscription = Subscription.objects.create(
+            organization=cls.org,
+            licensed_users=2,
+            monthly_rate=Decimal('50.00'),
+            contract_start_date=date(2024, 1, 1),
+        )
+        cls.other_subscription = Subscription.objects.create(
+            organization=cls.other_org,
+            licensed_users=5,
+            monthly_rate=Decimal('50.00'),
+            contract_start_date=date(2024, 1, 1),
+        )
+
+    def seats(self, subscription):
+        subscription.refresh_from_db()
+        return subscription.active_user_count
+
+    def create_user_via_api(self, email):
+        return self.client.post(
+            '/api/v1/admin/users/',
+            {
+                'email': email,
+                'first_name': 'New',
+                'last_name': 'Lawyer',
+                'role': UserRole.LAWYER,
+                'timezone': 'America/Chicago',
+                'password': 'password123',
+                'confirm_password': 'password123',
+            },
+            HTTP_AUTHORIZATION=f'Token {self.token.key}',
+        )
+
+    def test_subscription_starts_from_existing_users(self):
+        self.assertEqual(self.seats(self.subscription), 1)
+        self.assertEqual(self.seats(self.other_subscription), 0)
+
+    def test_counter_follows_create_deactivate_and_move(self):
+        user = User.objects.create_user(
+            email='seat-user@example.com', password='password123',
+            first_name='Seat', last_name='User', role=UserRole.LAWYER, organization=self.org,
+        )
+        self.assertEqual(self.seats(self.subscription), 2)
+
+        user.organization = self.other_org
+        user.save()
+        self.assertEqual(self.seats(self.subscription), 1)
+        self.assertEqual(self.seats(self.other_subscription), 1)
+
+        user.is_active = False
+        user.save()
+        self.assertEqual(self.seats(self.other_subscription), 0)
+
+    def test_stale_subscription_save_keeps_counter(self):
+        stale = Subscription.objects.get(pk=self.other_subscription.pk)
+        User.objects.create_user(
+            email='seat-stale@example.com', password='password123',
+            first_name='Seat', last_name='Stale', role=UserRole.LAWYER, organization=self.other_org,
+        )
+        self.assertEqual(self.seats(self.other_subscription), 1)
+
+        stale.notes = 'Renewal call booked'
+        stale.save()
+
+        self.assertEqual(self.seats(self.other_subscription), 1)
+        self.other_subscription.refresh_from_db()
+        self.assertEqual(self.other_subscription.notes, 'Renewal call booked')
+
+    def test_license_limit_uses_counter(self):
+        response = self.create_user_via_api('seat-one@example.com')
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        self.assertEqual(self.seats(self.subscription), 2)
+
+        response = self.create_user_via_api('seat-two@example.com')
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertIn('2/2', str(response.data['organization']))
+
+    def test_verify_command_repairs_drift(self):
+        Subscription.objects.filter(pk=self.subscription.pk).update(active_user_count=7)
+        out = StringIO()
+        call_command('verify_seat_counts', stdout=out)
+        self.assertIn('stored 7, actual 1', out.getvalue())
+        self.assertEqual(self.seats(self.subscription), 7)
+
+        call_command('verify_seat_counts', '--repair', stdout=StringIO())
+        self.assertEqual(self.seats(self.subscription), 1)
@@ -0,0 +1,140 @@
+from __future__ import annotations
+
+import json
+import os
+import tempfile
+from pathlib import Path
+
+from django.http import HttpResponse, StreamingHttpResponse
+from django.test import RequestFactory, SimpleTestCase, override_settings
+from rest_framework.authtoken.models import Token
+from rest_framework.test import APITestCase
+
+from court_rules.middleware import SqlInstrumentationMiddleware
+from court_rules.models import Organization, User, UserRole
+from court_rules.services.sql_instrumentation import QueryRecorder, TemplateStats, query_template, worker_log_path
+
+
+class QueryTemplateTests(SimpleTestCase):
+    def test_in_lists_and_whitespace_collapse(self):
+        self.assertEqual(
+            query_template('SELECT * FROM "users"\n  WHERE "id" IN (%s, %s, %s)'),
+            query_template('SELECT * FROM "users" WHERE "id" IN (%s, %s)'),
+        )
+        self.assertEqual(
+            query_template('INSERT INTO "t" ("a") VALUES (%s), (%s), (%s)'),
+            'INSERT INTO "t" ("a") VALUES (%s), ...',
+        )
+
+    def test_repeated_templates_are_merged_and_ranked(self):
+        recorder = QueryRecorder()
+        recorder.templates = {
+            'SELECT 1 WHERE id IN (%s, %s)': TemplateStats(6, 0.01),
+            'SELECT 1 WHERE id IN (%s, %s, %s)': TemplateStats(6, 0.02),
+            'SELECT 2': TemplateStats(3, 0.5),
+        }
+
+        repeated = recorder.repeated(10)
+
+        self.assertEqual([(template, stats.count) for template, stats in repeated], [('SELECT 1 WHERE id IN (...)', 12)])
+        self.assertEqual(recorder.top(1)[0][0], 'SELECT 2')
+
+    def test_each_worker_logs_to_its_own_file(self):
+        self.assertEqual(
+            worker_log_path('/var/log/slow_requests.jsonl'),
+            Path(f'/var/log/slow_requests.{os.getpid()}.jsonl'),
+        )
+
+
+class SqlInstrumentationMiddlewareTests(APITestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.org = Organization.objects.create(name='Timing Firm')
+        cls.admin = User.objects.create_user(
+            email='timing-admin@example.com', password='password123',
+            first_name='Timing', last_name='Admin', role=UserRole.FIRM_ADMIN, organization=cls.org,
+        )
+        for number in range(4):
+            User.objects.create_user(
+                email=f'timing-{number}@example.com', password='password123',
+                first_name='Timing', last_name=str(number), role=UserRole.LAWYER, organization=cls.org,
+            )
+        cls.token = Token.objects.create(user=cls.admin)
+
+    def setUp(self):
+        self.log_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(self.log_dir.cleanup)
+        self.log_path = Path(self.log_dir.name) / 'slow.jsonl'
+
+    def get(self, url):
+        return self.client.get(url, HTTP_AUTHORIZATION=f'Token {self.token.key}')
+
+    def log_records(self):
+        path = worker_log_path(self.log_path)
+        if not path.exists():
+            return []
+        return [json.loads(line) for line in path.read_text(encoding='utf-8').splitlines()]
+
+    def test_unsampled_requests_are_untouched(self):
+        with override_settings(SQL_INSTRUMENTATION_SAMPLE_RATE=0, SQL_INSTRUMENTATION_LOG=self.log_path):
+            response = self.get('/api/v1/users/')
+
+        self.assertNotIn('Server-Timing', response)
+        self.assertEqual(self.log_records(), [])
+
+    def test_sampled_request_reports_timing_and_logs_repeated_templates(self):
+        with override_settings(
+            SQL_INSTRUMENTATION_SAMPLE_RATE=1.0,
+            SQL_SLOW_REQUEST_MS=60_000,
+            SQL_SLOW_REQUEST_QUERIES=1_000,
+            SQL_REPEATED_QUERY_THRESHOLD=3,
+            SQL_INSTRUMENTATION_LOG=self.log_path,
+        ):
+            response = self.get('/api/v1/users/')
+
+        self.assertEqual(response.status_code, 200)
+        self.assertRegex(response['Server-Timing'], r'^db;dur=[\d.]+;desc="\d+ queries", total;dur=[\d.]+$')
+        [record] = self.log_records()
+        self.assertEqual((record['route'], record['status']), ('user-list', 200))
+        self.assertGreaterEqual(record['repeated'][0]['count'], 3)
+        self.assertIn('FROM "organizations"', record['repeated'][0]['template'])
+        self.assertLessEqual(len(record['top']), 5)
+
+    def test_fast_requests_are_not_logged(self):
+        with override_settings(
+            SQL_INSTRUMENTATION_SAMPLE_RATE=1.0,
+            SQL_SLOW_REQUEST_MS=60_000,
+            SQL_SLOW_REQUEST_QUERIES=1_000,
+            SQL_REPEATED_QUERY_THRESHOLD=1_000,
+            SQL_INSTRUMENTATION_LOG=self.log_path,
+        ):
+            response = self.get('/api/v1/users/')
+
+        self.assertIn('Server-Timing', response)
+        self.assertEqual(self.log_records(), [])
+
+    def test_recorder_is_attached_before_the_view_runs(self):
+        seen = []
+
+        def view(request):
+            Organization.objects.count()
+            seen.append(request.sql_recorder.queries)
+            return HttpResponse()
+
+        with override_settings(SQL_INSTRUMENTATION_SAMPLE_RATE=1.0, SQL_INSTRUMENTATION_LOG=self.log_path):
+            response = SqlInstrumentationMiddleware(view)(RequestFactory().get('/'))
+
+        self.assertEqual(seen, [1])
+        self.assertIn('desc="1 queries"', response['Server-Timing'])
+
+    def test_streaming_responses_are_not_reported(self):
+        def view(request):
+            return StreamingHttpResponse(str(n) for n in range(Organization.objects.count()))
+
+        with override_settings(
+            SQL_INSTRUMENTATION_SAMPLE_RATE=1.0, SQL_SLOW_REQUEST_QUERIES=0, SQL_INSTRUMENTATION_LOG=self.log_path,
+        ):
+            response = SqlInstrumentationMiddleware(view)(RequestFactory().get('/'))
+
+        self.assertNotIn('Server-Timing', response)
+        self.assertEqual(self.log_records(), [])
@@ -1,11 +1,23 @@
 """
 Email utility functions for sending various notification emails.
+
+Emails are queued in the outbox (court_rules.services.outbox) and delivered
+by the `send_outbox` worker once the current transaction commits, so
+requests never wait on SMTP. Template contexts are stored as JSON.
 """
 
-from django.core.mail import send_mail
-from django.template.loader import render_to_string
-from django.conf import settings
-from django.utils.html import strip_tags
+from court_rules.services.outbox import enqueue_email
+
+
+def _user_context(user):
+    if user is None:
+        return None
+    return {
+        'email': user.email,
+        'first_name': user.first_name,
+        'full_name': user.full_name,
+        'organization': {'name': user.organization.name} if user.organization else None,
+    }
 
 
 def send_password_reset_email(user, reset_url, expiry_hours=24):
@@ -19,22 +31,17 @@ def send_password_reset_email(user, reset_url, expiry_hours=24):
     """
     subject = 'Reset Your Precedentum Password'
     
-    html_message = render_to_string('emails/password_reset_email.html', {
-        'user': user,
-        'reset_url': reset_url,
-        'expiry_hours': expiry_hours,
-        'organization_name': user.organization.name if user.organization else 'Precedentum',
-    })
-    
-    plain_message = strip_tags(html_message)
-    
-    send_mail(
+    enqueue_email(
+        to=[user.email],
         subject=subject,
-        message=plain_message,
-        from_email=settings.DEFAULT_FROM_EMAIL,
-        recipient_list=[user.email],
-        html_message=html_message,
-        fail_silently=False,
+        template_name='emails/password_reset_email.html',
+        context={
+            'user': _user_context(user),
+            'reset_url': reset_url,
+            'expiry_hours': expiry_hours,
+            'organization_name': user.organization.name if user.organization else 'Precedentum',
+        },
+        user=user,
     )
 
 
@@ -59,22 +66,17 @@ def send_welcome_email(user, created_by, login_url='http://localhost:5173'):
     
     subject = f'Welcome to Precedentum - Your Account is Ready'
     
-    html_message = render_to_string('emails/welcome_email.html', {
-        'user': user,
-        'role_display': role_display,
-        'login_url': login_url,
-        'created_by_name': created_by.full_name if created_by else 'Administrator',
-    })
-    
-    plain_message = strip_tags(html_message)
-    
-    send_mail(
+    enqueue_email(
+        to=[user.email],
         subject=subject,
-        message=plain_message,
-        from_email=settings.DEFAULT_FROM_EMAIL,
-        recipient_list=[user.email],
-        html_message=html_message,
-        fail_silently=False,
+        template_name='emails/welcome_email.html',
+        context={
+            'user': _user_context(user),
+            'role_display': role_display,
+            'login_url': login_url,
+            'created_by_name': created_by.full_name if created_by else 'Administrator',
+        },
+        user=user,
     )
 
 
@@ -86,28 +88,21 @@ def send_access_grant_notification(grant, dashboard_url='http://localhost:5173')
         grant: UserAccessGrant instance
         dashboard_url: URL for dashboard (default: localhost)
     """
-    from datetime import datetime
-    
     subject = f'New Access Granted - Precedentum'
     
-    html_message = render_to_string('emails/access_grant_notification.html', {
-        'recipient': grant.granted_to,
-        'target_user': grant.can_access_user,
-        'granted_by': grant.granted_by,
-        'organization': grant.organization,
-        'grant_date': grant.created_at.strftime('%B %d, %Y'),
-        'dashboard_url': dashboard_url,
-    })
-    
-    plain_message = strip_tags(html_message)
-    
-    send_mail(
+    enqueue_email(
+        to=[grant.granted_to.email],
         subject=subject,
-        message=plain_message,
-        from_email=settings.DEFAULT_FROM_EMAIL,
-        recipient_list=[grant.granted_to.email],
-        html_message=html_message,
-        fail_silently=False,
+        template_name='emails/access_grant_notification.html',
+        context={
+            'recipient': _user_context(grant.granted_to),
+            'target_user': _user_context(grant.can_access_user),
+            'granted_by': _user_context(grant.granted_by),
+            'organization': {'name': grant.organization.name} if grant.organization else None,
+            'grant_date': grant.created_at.strftime('%B %d, %Y'),
+            'dashboard_url': dashboard_url,
+        },
+        user=grant.granted_to,
     )
 
 
@@ -137,13 +132,7 @@ Precedentum - Federal Court Compliance Platform
 This is an automated message. Please do not reply to this email.
     """.strip()
     
-    send_mail(
-        subject=subject,
-        message=message,
-        from_email=settings.DEFAULT_FROM_EMAIL,
-        recipient_list=[recipient_email],
-        fail_silently=False,
-    )
+    enqueue_email(to=[recipient_email], subject=subject, body=message)
 
 
 
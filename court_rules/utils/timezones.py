@@ -0,0 +1,13 @@
+"""Timezone helpers."""
+
+from datetime import timezone as dt_timezone
+from zoneinfo import ZoneInfo, ZoneInfoNotFoundError
+
+
+def zone_or_utc(name):
+    """ZoneInfo for an IANA name stored on a model, falling back to UTC when blank or unknown."""
+
+    try:
+        return ZoneInfo(name) if name else dt_timezone.utc
+    except (ZoneInfoNotFoundError, ValueError):
+        return dt_timezone.utc
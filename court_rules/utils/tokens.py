@@ -1,8 +1,10 @@
 """
-Token generation and validation for password resets.
+Token generation and validation for password resets and calendar feeds.
 """
 
 from django.contrib.auth.tokens import PasswordResetTokenGenerator
+from django.core import signing
+from django.utils.crypto import constant_time_compare, salted_hmac
 from django.utils.http import urlsafe_base64_encode, urlsafe_base64_decode
 from django.utils.encoding import force_bytes, force_str
 from court_rules.models import User
@@ -62,3 +64,48 @@ def validate_password_reset_token(uid, token):
 
 
 
+
+
+CALENDAR_FEED_SALT = 'court_rules.calendar-feed'
+
+
+def _calendar_feed_fingerprint(user):
+    """Changes whenever the user's password does, revoking outstanding feed URLs."""
+    return salted_hmac(CALENDAR_FEED_SALT, f"{user.pk}{user.password}").hexdigest()[:16]
+
+
+def make_calendar_feed_token(user):
+    """
+    Generate a signed token identifying the user's calendar feed.
+    
+    Args:
+        user: User instance
+        
+    Returns:
+        URL-safe token string
+    """
+    return signing.dumps(
+        {'u': str(user.pk), 'f': _calendar_feed_fingerprint(user)},
+        salt=CALENDAR_FEED_SALT,
+        compress=True,
+    )
+
+
+def resolve_calendar_feed_token(token):
+    """
+    Validate a calendar feed token and return its active user.
+    
+    Args:
+        token: Token from make_calendar_feed_token
+        
+    Returns:
+        User instance if valid, None otherwise
+    """
+    try:
+        payload = signing.loads(token, salt=CALENDAR_FEED_SALT)
+        user = User.objects.get(pk=payload['u'], is_active=True)
+    except (signing.BadSignature, KeyError, TypeError, ValueError, User.DoesNotExist):
+        return None
+    if not constant_time_compare(payload.get('f', ''), _calendar_feed_fingerprint(user)):
+        return None
+    return user
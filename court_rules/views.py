@@ -1,3 +1,15 @@
-from django.shortcuts import render
+from django.http import Http404, HttpResponse
 
-# Create your views here.
+from court_rules.services.metrics import render_metrics, scrape_allowed
+
+
+def metrics(request):
+    """
+    Prometheus exposition for a local collector. Clients outside
+    METRICS_ALLOWED_NETWORKS, and any request relayed by a proxy, get a 404
+    so the endpoint is not advertised.
+    """
+    if not scrape_allowed(request):
+        raise Http404
+    body, content_type = render_metrics()
+    return HttpResponse(body, content_type=content_type)
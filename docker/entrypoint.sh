@@ -1,6 +1,13 @@
 #!/bin/sh
 set -e
 
+# Gunicorn workers share Prometheus metrics through files in this directory;
+# stale files from a previous run would be merged in, so start empty.
+if [ -n "$PROMETHEUS_MULTIPROC_DIR" ]; then
+    rm -rf "$PROMETHEUS_MULTIPROC_DIR"
+    mkdir -p "$PROMETHEUS_MULTIPROC_DIR"
+fi
+
 python manage.py collectstatic --noinput --settings=config.settings.production
 
 exec "$@"
@@ -1,5 +1,7 @@
 export interface PaginatedResponse<T> {
-  count: number;
+  // Absent on cursor-paginated endpoints (cases, deadlines, audit log)
+  count?: number;
+  approximate_count?: number;
   next: string | null;
   previous: string | null;
   results: T[];
@@ -76,6 +78,8 @@ export interface Deadline {
   basis: 'calendar_days' | 'business_days';
   holiday_calendar: string | null;
   holiday_calendar_name: string | null;
+  trigger_date: string | null;
+  offset_days: number | null;
   due_at: string;
   timezone: string;
   owner: string | null;
@@ -147,6 +151,8 @@ export interface AuditLogEntry {
   action: 'create' | 'update' | 'delete' | 'compute';
   before: Record<string, unknown> | null;
   after: Record<string, unknown> | null;
+  // Changed fields only: { field: [old, new] }
+  changes: Record<string, [unknown, unknown]> | null;
   created_at: string;
 }
 